@@ -0,0 +1,116 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""
+Benchmark building and searching a large menu tree.
+
+This builds a menu bar with the requested number of actions spread over
+nested sub-menus, inserting each action next to the previous one found by
+path, as schema additions are merged.  It then looks up every action by
+path, and reports the time taken by each phase.
+
+Usage::
+
+    python benchmarks/action_manager.py [--items 5000] [--fanout 10]
+
+No toolkit is needed: only the toolkit-independent managers are exercised.
+"""
+
+import argparse
+import json
+import time
+
+from pyface.action.api import Action, ActionManager, Group
+
+
+class _Manager(ActionManager):
+    """ A toolkit-independent manager for a sub-menu. """
+
+    def add_to_menu(self, parent, menu, controller):
+        pass
+
+
+def build_tree(items, fanout):
+    """ Build a menu tree with ``items`` actions and return their paths. """
+    root = ActionManager(id="root")
+    paths = []
+
+    # Create enough nested sub-menus to hold the items, ``fanout`` wide.
+    menus = [("", root)]
+    while len(menus) * fanout < items:
+        parent_path, parent = menus.pop(0)
+        for i in range(fanout):
+            menu = _Manager(id=f"menu{i}")
+            parent.append(menu)
+            menus.append((f"{parent_path}menu{i}/", menu))
+
+    previous = {}
+    for i in range(items):
+        path, menu = menus[i % len(menus)]
+        action = Action(id=f"action{i}", name=f"Action {i}")
+        if path in previous:
+            # Insert after the previous item found by path.
+            anchor = root.find_item(path + previous[path])
+            group = anchor.parent
+            group.insert_after(anchor, action)
+        else:
+            menu.append(Group(action, id="group"))
+        previous[path] = f"action{i}"
+        paths.append(f"{path}action{i}")
+
+    return root, paths
+
+
+def run(items, fanout):
+    start = time.perf_counter()
+    root, paths = build_tree(items, fanout)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path in paths:
+        assert root.find_item(path) is not None
+    lookup_time = time.perf_counter() - start
+
+    return {
+        "items": items,
+        "depth": max(path.count("/") for path in paths) + 1,
+        "build_time": build_time,
+        "lookup_time": lookup_time,
+        "lookup_per_item": lookup_time / items,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--items", type=int, nargs="+", default=[500, 1000, 5000]
+    )
+    parser.add_argument("--fanout", type=int, default=10)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [run(items, args.fanout) for items in args.items]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"{'items':>7} {'depth':>6} {'build (s)':>10} {'lookup (s)':>11} "
+            f"{'us/lookup':>10}"
+        )
+        for result in results:
+            print(
+                f"{result['items']:7d} {result['depth']:6d} "
+                f"{result['build_time']:10.4f} {result['lookup_time']:11.4f} "
+                f"{result['lookup_per_item'] * 1e6:10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""
+Benchmark data view models, the Qt item model, widget and exporters.
+
+For each number of cells this builds an array data model and a row table data
+model with that many cells, and times:
+
+- ``model``: ``get_value`` and ``get_values`` calls on each data model;
+- ``item_model``: ``DataViewItemModel.data()`` for each role, and
+  ``flags()``, over the cells of a screenful of rows;
+- ``repaint``: synchronous repaints of the viewport of a ``DataViewWidget``
+  showing the array data model;
+- ``selection``: extracting the ``selection`` of a ``DataViewWidget`` from
+  the control with every row selected;
+- ``export``: ``RowExporter`` exporting every row as CSV, JSON and NPY, and
+  ``ItemExporter`` exporting single items in each format.
+
+Per-call benchmarks make at most ``--sample`` calls.  Each result records
+the number of items processed (calls, cells, rows or repaints), the best
+time of ``--repeat`` runs and the resulting rate, and ``--json`` prints the
+results together with the versions of the libraries used, so that runs can
+be compared between releases.
+
+Usage::
+
+    python benchmarks/data_view.py [--cells 10000 100000 1000000]
+        [--columns 10] [--benchmarks model export] [--json]
+
+Use ``QT_QPA_PLATFORM=offscreen`` to run without a display.  The
+``item_model``, ``repaint`` and ``selection`` benchmarks need the Qt
+toolkit; exporting 10 million cells needs several GB of memory.
+"""
+
+import argparse
+import json
+import platform
+import time
+
+import numpy as np
+
+try:
+    from importlib.metadata import version
+except ImportError:
+    from importlib_metadata import version
+
+from pyface.data_view.data_formats import (
+    csv_format, json_format, npy_format
+)
+from pyface.data_view.data_models.api import (
+    ArrayDataModel, IndexDataAccessor, RowTableDataModel
+)
+from pyface.data_view.exporters.api import ItemExporter, RowExporter
+from pyface.data_view.value_types.api import FloatValue, IntValue, TextValue
+
+BENCHMARKS = ["model", "item_model", "repaint", "selection", "export"]
+
+#: The formats exported by the exporter benchmarks.
+FORMATS = {"csv": csv_format, "json": json_format, "npy": npy_format}
+
+#: The number of rows in a screenful of a data view.
+SCREEN_ROWS = 50
+
+
+def timed(function, repeat):
+    """ Return the best time of several calls to a function. """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def result(benchmark, detail, cells, items, seconds, **extra):
+    """ Create a result record, with the rate of items per second. """
+    return dict(
+        benchmark=benchmark,
+        detail=detail,
+        cells=cells,
+        items=items,
+        seconds=seconds,
+        rate=items / seconds if seconds else None,
+        **extra
+    )
+
+
+def array_model(rows, columns):
+    data = np.arange(rows * columns, dtype=float).reshape(rows, columns)
+    return ArrayDataModel(data=data, value_type=FloatValue())
+
+
+def row_table_model(rows, columns):
+    data = [
+        [i] + [str(i * columns + j) for j in range(columns)]
+        for i in range(rows)
+    ]
+    return RowTableDataModel(
+        data=data,
+        row_header_data=IndexDataAccessor(index=0, value_type=IntValue()),
+        column_data=[
+            IndexDataAccessor(index=j + 1, value_type=TextValue())
+            for j in range(columns)
+        ],
+    )
+
+
+def sample_items(rows, columns, sample):
+    """ Spread up to ``sample`` (row, column) items across the model. """
+    step = max(1, rows * columns // sample)
+    return [
+        ((i // columns,), (i % columns,))
+        for i in range(0, rows * columns, step)
+    ][:sample]
+
+
+# Benchmarks ----------------------------------------------------------------
+
+def bench_model(rows, columns, sample, repeat):
+    cells = rows * columns
+    items = sample_items(rows, columns, sample)
+    column_rows = [(row,) for row in range(min(rows, sample))]
+    results = []
+    for model in [array_model(rows, columns), row_table_model(rows, columns)]:
+        name = type(model).__name__
+
+        def get_value():
+            for row, column in items:
+                model.get_value(row, column)
+
+        def get_values():
+            model.get_values(column_rows, (0,))
+
+        results.append(result(
+            "model", name + ".get_value", cells, len(items),
+            timed(get_value, repeat),
+        ))
+        results.append(result(
+            "model", name + ".get_values", cells, len(column_rows),
+            timed(get_values, repeat),
+        ))
+    return results
+
+
+def bench_item_model(rows, columns, sample, repeat):
+    from pyface.qt.QtCore import QModelIndex, Qt
+    from pyface.ui.qt.data_view.data_view_item_model import DataViewItemModel
+
+    roles = {
+        "display": Qt.ItemDataRole.DisplayRole,
+        "edit": Qt.ItemDataRole.EditRole,
+        "decoration": Qt.ItemDataRole.DecorationRole,
+        "background": Qt.ItemDataRole.BackgroundRole,
+        "foreground": Qt.ItemDataRole.ForegroundRole,
+        "check_state": Qt.ItemDataRole.CheckStateRole,
+        "tooltip": Qt.ItemDataRole.ToolTipRole,
+    }
+    model = array_model(rows, columns)
+    item_model = DataViewItemModel(model, "row", [])
+    root = QModelIndex()
+    screen = [
+        item_model.index(row, column, root)
+        for row in range(min(rows, SCREEN_ROWS))
+        for column in range(columns + 1)
+    ]
+    indexes = (screen * (sample // len(screen) + 1))[:sample]
+
+    results = []
+    for name, role in roles.items():
+
+        def data():
+            for index in indexes:
+                item_model.data(index, role)
+
+        results.append(result(
+            "item_model", "data." + name, rows * columns, len(indexes),
+            timed(data, repeat),
+        ))
+
+    def flags():
+        for index in indexes:
+            item_model.flags(index)
+
+    results.append(result(
+        "item_model", "flags", rows * columns, len(indexes),
+        timed(flags, repeat),
+    ))
+    return results
+
+
+def create_widget(rows, columns, **traits):
+    from pyface.api import GUI
+    from pyface.data_view.data_view_widget import DataViewWidget
+
+    gui = GUI()
+    widget = DataViewWidget(data_model=array_model(rows, columns), **traits)
+    widget.create()
+    widget.control.resize(1200, 800)
+    widget.control.show()
+    gui.process_events()
+    return gui, widget
+
+
+def bench_repaint(rows, columns, sample, repeat):
+    gui, widget = create_widget(rows, columns)
+    try:
+        viewport = widget.control.viewport()
+        repaints = 20
+
+        def repaint():
+            for _ in range(repaints):
+                viewport.repaint()
+
+        return [result(
+            "repaint", "viewport", rows * columns, repaints,
+            timed(repaint, repeat),
+        )]
+    finally:
+        widget.destroy()
+        gui.process_events()
+
+
+def bench_selection(rows, columns, sample, repeat):
+    gui, widget = create_widget(rows, columns, selection_mode="extended")
+    try:
+        widget.control.selectAll()
+        gui.process_events()
+        selected = len(widget.selection)
+
+        # the selection trait caches the extracted selection until the
+        # control's selection changes, so time the extraction itself
+        def selection():
+            widget._get_control_selection()
+
+        return [result(
+            "selection", "all_rows", rows * columns, selected,
+            timed(selection, repeat),
+        )]
+    finally:
+        widget.destroy()
+        gui.process_events()
+
+
+def bench_export(rows, columns, sample, repeat):
+    model = array_model(rows, columns)
+    cells = rows * columns
+    indices = [((row,), ()) for row in range(rows)]
+    items = sample_items(rows, columns, min(sample, 10000))
+    results = []
+    for name, format in FORMATS.items():
+        exporter = RowExporter(format=format)
+        data = exporter.get_data(model, indices)
+        raw_data = format.serialize(data)
+        results.append(result(
+            "export", "RowExporter.get_data." + name, cells, cells,
+            timed(lambda: exporter.get_data(model, indices), repeat),
+        ))
+        results.append(result(
+            "export", "RowExporter.serialize." + name, cells, cells,
+            timed(lambda: format.serialize(data), repeat),
+            bytes=len(raw_data),
+        ))
+        data = raw_data = None
+
+        item_exporter = ItemExporter(format=format)
+
+        def export_items():
+            for item in items:
+                item_exporter.format.serialize(
+                    item_exporter.get_data(model, [item])
+                )
+
+        results.append(result(
+            "export", "ItemExporter." + name, cells, len(items),
+            timed(export_items, repeat),
+        ))
+    return results
+
+
+def environment():
+    """ The versions of the libraries being benchmarked. """
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pyface": version("pyface"),
+        "numpy": np.__version__,
+    }
+    try:
+        from pyface.qt import qt_api
+        from pyface.qt.QtCore import __version__ as qt_version
+    except Exception:
+        pass
+    else:
+        info["qt_api"] = qt_api
+        info["qt"] = qt_version
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--cells", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--sample", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    functions = {
+        "model": bench_model,
+        "item_model": bench_item_model,
+        "repaint": bench_repaint,
+        "selection": bench_selection,
+        "export": bench_export,
+    }
+    results = []
+    for cells in args.cells:
+        rows = max(1, cells // args.columns)
+        for benchmark in args.benchmarks:
+            results.extend(
+                functions[benchmark](
+                    rows, args.columns, args.sample, args.repeat
+                )
+            )
+
+    if args.json:
+        print(json.dumps(
+            {"environment": environment(), "results": results}, indent=2
+        ))
+    else:
+        print(
+            f"{'benchmark':10} {'detail':34} {'cells':>9} {'items':>8} "
+            f"{'time (s)':>10} {'items/s':>11}"
+        )
+        for record in results:
+            rate = record["rate"]
+            print(
+                f"{record['benchmark']:10} {record['detail']:34} "
+                f"{record['cells']:9d} {record['items']:8d} "
+                f"{record['seconds']:10.6f} "
+                f"{rate if rate is not None else float('nan'):11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""
+Benchmark saving and restoring the layouts of many task windows.
+
+This builds layouts for the requested number of windows, each with several
+tasks with tabbed and split dock areas, and compares pickling them to a
+single file with a layout file, both for a full save and for saving after a
+single window has changed.  It reports the time taken by each phase and the
+size of each file.
+
+Usage::
+
+    python benchmarks/layout_persistence.py [--windows 50] [--tasks 4]
+
+No toolkit is needed: only the layout objects are exercised.
+"""
+
+import argparse
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+from pyface.tasks.task_layout import (
+    HSplitter, PaneItem, Tabbed, TaskLayout, VSplitter,
+)
+from pyface.tasks.task_window_layout import TaskWindowLayout
+from pyface.util.layout_format import LayoutStore
+
+
+def task_layout(window, task, panes):
+    """ Create a layout for a task with ``panes`` panes in each area. """
+
+    def pane(area, i):
+        return PaneItem(
+            f"w{window}.t{task}.{area}{i}", width=100 + i, height=50 + i
+        )
+
+    return TaskLayout(
+        id=f"task{task}",
+        left=Tabbed(*[pane("left", i) for i in range(panes)]),
+        right=VSplitter(
+            Tabbed(*[pane("right", i) for i in range(panes)]),
+            HSplitter(*[pane("split", i) for i in range(panes)]),
+        ),
+        bottom=Tabbed(
+            *[pane("bottom", i) for i in range(panes)],
+            active_tab=f"w{window}.t{task}.bottom0",
+        ),
+        top_left_corner="left",
+    )
+
+
+def window_layouts(windows, tasks, panes):
+    return {
+        f"window{w:04d}": TaskWindowLayout(
+            *[task_layout(w, t, panes) for t in range(tasks)],
+            active_task="task0",
+            position=(w * 10, w * 10),
+            size=(1024, 768),
+        )
+        for w in range(windows)
+    }
+
+
+def timed(function, repeat):
+    """ Return the best time of several calls to a function. """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(windows, tasks, panes, repeat):
+    directory = tempfile.mkdtemp()
+    try:
+        layouts = window_layouts(windows, tasks, panes)
+        changed = dict(layouts)
+        changed["window0000"] = window_layouts(1, tasks, panes + 1)[
+            "window0000"
+        ]
+        pickle_path = os.path.join(directory, "layouts.pkl")
+        layout_path = os.path.join(directory, "layouts.layout")
+
+        def pickle_save(values=layouts):
+            with open(pickle_path, "wb") as f:
+                pickle.dump(values, f)
+
+        def pickle_load():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        def layout_save():
+            if os.path.exists(layout_path):
+                os.remove(layout_path)
+            LayoutStore(layout_path).save(layouts)
+
+        def layout_diff_save():
+            store = LayoutStore(layout_path)
+            store.save(layouts)
+            start = time.perf_counter()
+            store.save(changed)
+            return time.perf_counter() - start
+
+        def layout_load():
+            return LayoutStore(layout_path).load()
+
+        results = {
+            "windows": windows,
+            "tasks": tasks,
+            "panes": panes * 4 * tasks,
+            "pickle_save": timed(pickle_save, repeat),
+            "pickle_diff_save": timed(lambda: pickle_save(changed), repeat),
+            "pickle_load": timed(pickle_load, repeat),
+            "pickle_size": os.path.getsize(pickle_path),
+            "layout_save": timed(layout_save, repeat),
+        }
+        results["layout_size"] = os.path.getsize(layout_path)
+        results["layout_diff_save"] = min(
+            layout_diff_save() for _ in range(repeat)
+        )
+        results["layout_load"] = timed(layout_load, repeat)
+        assert layout_load()["window0000"].pformat() == (
+            changed["window0000"].pformat()
+        )
+        return results
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--windows", type=int, nargs="+", default=[50])
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--panes", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [
+        run(windows, args.tasks, args.panes, args.repeat)
+        for windows in args.windows
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['windows']} windows, {result['tasks']} tasks, "
+                f"{result['panes']} panes per window"
+            )
+            print(f"{'':>8} {'save (s)':>9} {'diff (s)':>9} "
+                  f"{'load (s)':>9} {'bytes':>9}")
+            for name in ("pickle", "layout"):
+                print(
+                    f"{name:>8} {result[name + '_save']:9.4f} "
+                    f"{result[name + '_diff_save']:9.4f} "
+                    f"{result[name + '_load']:9.4f} "
+                    f"{result[name + '_size']:9d}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""
+Benchmark wheel timers against per-timer toolkit timers.
+
+For each number of timers this creates that many repeating timers with
+intervals spread between 10 and 100 milliseconds, runs the event loop for a
+fixed time and reports the time taken to start and stop the timers, the
+number of callbacks performed and the CPU time per callback.
+
+Usage::
+
+    python benchmarks/timer_wheel.py [--counts 100 1000 5000] [--run 2.0]
+
+Use ``QT_QPA_PLATFORM=offscreen`` to run without a display.
+"""
+
+import argparse
+import json
+import time
+
+from pyface.api import GUI
+from pyface.timer.api import CallbackTimer, TimerWheel, WheelCallbackTimer
+
+
+def run_timers(factory, count, run_time):
+    """ Start ``count`` timers from ``factory`` and run the event loop. """
+    gui = GUI()
+    calls = [0]
+
+    def callback():
+        calls[0] += 1
+
+    start = time.perf_counter()
+    timers = [
+        factory(interval=0.01 + 0.09 * (i % 10) / 10, callback=callback)
+        for i in range(count)
+    ]
+    for timer in timers:
+        timer.start()
+    start_time = time.perf_counter() - start
+
+    gui.invoke_after(int(run_time * 1000), gui.stop_event_loop)
+    loop_start = time.process_time()
+    gui.start_event_loop()
+    loop_time = time.process_time() - loop_start
+
+    start = time.perf_counter()
+    for timer in timers:
+        timer.stop()
+    stop_time = time.perf_counter() - start
+
+    return {
+        "timers": count,
+        "start_time": start_time,
+        "stop_time": stop_time,
+        "loop_cpu_time": loop_time,
+        "callbacks": calls[0],
+        "cpu_per_callback": loop_time / calls[0] if calls[0] else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1000, 5000]
+    )
+    parser.add_argument("--run", type=float, default=2.0)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.counts:
+        results.append(
+            dict(kind="toolkit", **run_timers(CallbackTimer, count, args.run))
+        )
+        wheel = TimerWheel()
+
+        def factory(**traits):
+            return WheelCallbackTimer(wheel=wheel, **traits)
+
+        result = run_timers(factory, count, args.run)
+        result["wheel"] = wheel.statistics()
+        results.append(dict(kind="wheel", **result))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"{'kind':8} {'timers':>7} {'start (s)':>10} {'stop (s)':>9} "
+            f"{'callbacks':>10} {'cpu us/call':>12}"
+        )
+        for result in results:
+            per_call = result["cpu_per_callback"]
+            print(
+                f"{result['kind']:8} {result['timers']:7d} "
+                f"{result['start_time']:10.4f} {result['stop_time']:9.4f} "
+                f"{result['callbacks']:10d} "
+                f"{per_call * 1e6 if per_call else float('nan'):12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
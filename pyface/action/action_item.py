@@ -32,7 +32,7 @@ class ActionItem(ActionManagerItem):
 
     #: The item's unique identifier ('unique' in this case means unique within
     #: its group).
-    id = Property(Str)
+    id = Property(Str, observe="action.id")
 
     # 'ActionItem' interface -----------------------------------------------
 
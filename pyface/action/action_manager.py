@@ -16,7 +16,7 @@ from traits.api import (
 )
 
 from pyface.action.action_controller import ActionController
-from pyface.action.group import Group
+from pyface.action.group import Group, _IdIndex
 
 
 class ActionManager(HasTraits):
@@ -63,6 +63,9 @@ class ActionManager(HasTraits):
     #: All of the contribution groups in the manager.
     _groups = List(Instance(Group))
 
+    #: The index of the groups by id.
+    _index = Instance(_IdIndex, ())
+
     # ------------------------------------------------------------------------
     # 'object' interface.
     # ------------------------------------------------------------------------
@@ -135,6 +138,10 @@ class ActionManager(HasTraits):
         for group in self._groups:
             group.visible = event.new
 
+    @observe('_groups.items.id')
+    def _update_index(self, event):
+        self._index.update(event, self._groups)
+
     # Methods -------------------------------------------------------------#
 
     def append(self, item):
@@ -216,11 +223,7 @@ class ActionManager(HasTraits):
         group : Group
             The group which matches the id, or None if no such group exists.
         """
-        for group in self._groups:
-            if group.id == id:
-                return group
-        else:
-            return None
+        return self._index.get(id)
 
     def find_item(self, path):
         """ Find an item using a path.
@@ -236,16 +239,17 @@ class ActionManager(HasTraits):
             Returns the matching ActionManagerItem, or None if any component
             of the path is not found.
         """
+        # Look up each component in the manager found for the previous one, so
+        # the cost only depends on the depth of the path.
         components = path.split("/")
-
-        # If there is only one component, then the path is just an Id so look
-        # it up in this manager.
-        if len(components) > 0:
-            item = self._find_item(components[0])
-            if len(components) > 1 and item is not None:
-                item = item.find_item("/".join(components[1:]))
-        else:
-            item = None
+        item = self
+        for index, component in enumerate(components):
+            if not isinstance(item, ActionManager):
+                # Let the item look up the rest of the path itself.
+                return item.find_item("/".join(components[index:]))
+            item = item._find_item(component)
+            if item is None:
+                return None
 
         return item
 
@@ -363,7 +367,7 @@ class ActionManager(HasTraits):
             Returns the item with the specified Id, or None if no such item
             exists.
         """
-        for group in self.groups:
+        for group in self._groups:
             item = group.find(id)
             if item is not None:
                 return item
@@ -0,0 +1,184 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Batched recomputation of the enabled and visible state of actions.
+
+A :class:`~pyface.action.listening_action.ListeningAction` normally observes
+its ``enabled_name`` and ``visible_name`` on its object itself, and
+recomputes its state, and so updates its toolkit items, on every change.
+When an action has a :class:`ActionStateScheduler`, a change instead marks
+the action dirty and its state is recomputed once, the next time the GUI
+event loop runs, however many changes there were in between.  Actions
+watching the same trait on the same object share a single observer.
+"""
+
+
+class ActionStateScheduler:
+    """ Recompute the state of dirty actions once per event loop iteration.
+
+    Parameters
+    ----------
+    invoke_later : callable or None
+        A callable taking a callable which arranges for it to be called
+        later from the GUI thread.  By default ``GUI.invoke_later`` is used.
+    """
+
+    def __init__(self, invoke_later=None):
+        if invoke_later is None:
+            from pyface.gui import GUI
+
+            invoke_later = GUI.invoke_later
+        self._invoke_later = invoke_later
+
+        # Shared observers, keyed by (id(object), name).  Each value is a
+        # list of [object, handler, {action: set of kinds}].
+        self._observers = {}
+
+        # The kinds of state which need recomputing for each dirty action,
+        # in the order in which the actions were first marked.
+        self._dirty = {}
+
+        # Whether a flush is outstanding.
+        self._scheduled = False
+
+        self.reset_statistics()
+
+    def subscribe(self, action, kind, obj, name):
+        """ Mark an action dirty whenever a trait on an object changes.
+
+        Parameters
+        ----------
+        action : ListeningAction
+            The action to mark dirty.
+        kind : str
+            The kind of state which depends on the trait, either "enabled" or
+            "visible".  The action's ``_<kind>_update`` method is called to
+            recompute it.
+        obj : HasTraits
+            The object to observe.
+        name : str
+            The (extended) name of the trait to observe.
+        """
+        key = (id(obj), name)
+        entry = self._observers.get(key)
+        if entry is None:
+
+            def handler(event):
+                self._changed(key)
+
+            obj.observe(handler, name)
+            entry = [obj, handler, {}]
+            self._observers[key] = entry
+        entry[2].setdefault(action, set()).add(kind)
+
+    def unsubscribe(self, action, kind, obj, name):
+        """ Stop marking an action dirty when a trait on an object changes.
+
+        The shared observer is removed once no action depends on it.  The
+        arguments are the same as for :meth:`subscribe`.
+        """
+        key = (id(obj), name)
+        entry = self._observers.get(key)
+        if entry is None:
+            return
+        subscribers = entry[2]
+        kinds = subscribers.get(action)
+        if kinds is None:
+            return
+        kinds.discard(kind)
+        if not kinds:
+            del subscribers[action]
+        if not subscribers:
+            del self._observers[key]
+            obj.observe(entry[1], name, remove=True)
+
+    def discard(self, action):
+        """ Forget any pending recomputation for an action. """
+        self._dirty.pop(action, None)
+
+    def mark_dirty(self, action, kind):
+        """ Mark the state of an action as needing recomputation.
+
+        Parameters
+        ----------
+        action : ListeningAction
+            The action.
+        kind : str
+            Either "enabled" or "visible".
+        """
+        self._marked += 1
+        kinds = self._dirty.get(action)
+        if kinds is None:
+            self._dirty[action] = {kind}
+        elif kind in kinds:
+            self._skipped += 1
+            return
+        else:
+            kinds.add(kind)
+        if not self._scheduled:
+            self._scheduled = True
+            self._invoke_later(self.flush)
+
+    def flush(self):
+        """ Recompute the state of all dirty actions now. """
+        self._scheduled = False
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        self._flushes += 1
+        for action, kinds in dirty.items():
+            for kind in sorted(kinds):
+                self._evaluations += 1
+                getattr(action, "_%s_update" % kind)()
+
+    def statistics(self):
+        """ Return a dictionary of scheduling statistics.
+
+        Returns
+        -------
+        statistics : dict
+            The number of trait ``notifications`` received by shared
+            observers, the number of times an action was ``marked`` dirty,
+            the number of ``evaluations`` of action state, the number of
+            evaluations ``skipped`` because the action was already dirty,
+            the number of ``flushes`` and the current number of shared
+            ``observers`` and ``pending`` actions.
+        """
+        return {
+            "notifications": self._notifications,
+            "marked": self._marked,
+            "evaluations": self._evaluations,
+            "skipped": self._skipped,
+            "flushes": self._flushes,
+            "observers": len(self._observers),
+            "pending": len(self._dirty),
+        }
+
+    def reset_statistics(self):
+        """ Reset the accumulated scheduling statistics. """
+        self._notifications = 0
+        self._marked = 0
+        self._evaluations = 0
+        self._skipped = 0
+        self._flushes = 0
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _changed(self, key):
+        """ Mark all actions depending on an observed trait dirty. """
+        self._notifications += 1
+        entry = self._observers.get(key)
+        if entry is None:
+            return
+        for action, kinds in list(entry[2].items()):
+            for kind in kinds:
+                self.mark_dirty(action, kind)
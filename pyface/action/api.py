@@ -28,6 +28,11 @@ Action Controller
 
 - :class:`~pyface.action.action_controller.ActionController`
 
+Action State Scheduling
+-----------------------
+
+- :class:`~.ActionStateScheduler`
+
 Action Event
 ------------
 
@@ -72,6 +77,7 @@ from .action_controller import ActionController
 from .action_event import ActionEvent
 from .action_manager import ActionManager
 from .action_manager_item import ActionManagerItem
+from .action_state_scheduler import ActionStateScheduler
 from .field_action import FieldAction
 from .group import Group, Separator
 from .gui_application_action import (
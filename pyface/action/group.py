@@ -13,13 +13,77 @@
 from functools import partial
 
 
-from traits.api import Any, Bool, HasTraits, List, observe, Property, Str
+from traits.api import (
+    Any, Bool, HasTraits, Instance, List, observe, Property, Str
+)
 from traits.trait_base import user_name_for
 
 
 from pyface.action.action import Action
 
 
+class _IdIndex(object):
+    """ An index of a sequence of objects by their 'id' trait.
+
+    Lookups return the first object in the sequence with a given id, as a
+    linear search would, but in constant time.  The owner of the sequence
+    keeps the index up to date by passing it the events of an observer of
+    the sequence and of the ids of its objects (see ``update``).
+    """
+
+    def __init__(self):
+        # The objects with each id, in sequence order.
+        self._by_id = {}
+
+    def get(self, id):
+        """ Return the first object with an id, or None. """
+        objects = self._by_id.get(id)
+        if objects is None:
+            return None
+        return objects[0]
+
+    def rebuild(self, sequence):
+        """ Index all of the objects in a sequence. """
+        self._by_id = {}
+        for obj in sequence:
+            self._by_id.setdefault(obj.id, []).append(obj)
+
+    def add(self, obj, sequence):
+        """ Index an object which has been added to a sequence. """
+        objects = self._by_id.setdefault(obj.id, [])
+        if objects:
+            # Several objects share the id, so find their order.
+            self._by_id[obj.id] = [
+                other for other in sequence if other.id == obj.id
+            ]
+        else:
+            objects.append(obj)
+
+    def remove(self, obj):
+        """ Stop indexing an object which has been removed from a sequence. """
+        objects = self._by_id.get(obj.id)
+        if objects is not None and obj in objects:
+            objects.remove(obj)
+            if not objects:
+                del self._by_id[obj.id]
+
+    def update(self, event, sequence):
+        """ Update the index from an event of an observer of the sequence.
+
+        The observer should observe the sequence, its items and their ids,
+        e.g. ``"_items.items.id"``.
+        """
+        if not hasattr(event, "added"):
+            # The whole sequence was replaced, or an id changed.
+            self.rebuild(sequence)
+            return
+
+        for obj in event.removed:
+            self.remove(obj)
+        for obj in event.added:
+            self.add(obj, sequence)
+
+
 class Group(HasTraits):
     """ A group of action manager items.
 
@@ -55,6 +119,9 @@ class Group(HasTraits):
     #: All of the items in the group.
     _items = List  # (ActionManagerItem)
 
+    #: The index of the items by id.
+    _index = Instance(_IdIndex, ())
+
     # ------------------------------------------------------------------------
     # 'object' interface.
     # ------------------------------------------------------------------------
@@ -90,6 +157,10 @@ class Group(HasTraits):
         for item in self.items:
             item.enabled = event.new
 
+    @observe("_items.items.id")
+    def _update_index(self, event):
+        self._index.update(event, self._items)
+
     # Methods -------------------------------------------------------------#
 
     def append(self, item):
@@ -241,11 +312,7 @@ class Group(HasTraits):
         item : ActionManagerItem
             The item with the specified Id, or None if no such item exists.
         """
-        for item in self._items:
-            if item.id == id:
-                return item
-        else:
-            return None
+        return self._index.get(id)
 
     @classmethod
     def factory(cls, *args, **kwargs):
@@ -16,7 +16,8 @@ import logging
 
 
 from pyface.action.action import Action
-from traits.api import Any, Str, observe, Undefined
+from pyface.action.action_state_scheduler import ActionStateScheduler
+from traits.api import Any, Instance, Str, observe, Undefined
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -44,6 +45,10 @@ class ListeningAction(Action):
     #: The object to which the names above apply.
     object = Any()
 
+    #: The scheduler used to batch updates of the enabled and visible state.
+    #: If None, the state is updated as soon as the object changes.
+    scheduler = Instance(ActionStateScheduler)
+
     # -------------------------------------------------------------------------
     # 'Action' interface.
     # -------------------------------------------------------------------------
@@ -56,13 +61,15 @@ class ListeningAction(Action):
 
         if self.object:
             if self.enabled_name:
-                self.object.observe(
-                    self._enabled_update, self.enabled_name, remove=True
+                self._observe_name(
+                    self.object, "enabled", self.enabled_name, remove=True
                 )
             if self.visible_name:
-                self.object.observe(
-                    self._visible_update, self.visible_name, remove=True
+                self._observe_name(
+                    self.object, "visible", self.visible_name, remove=True
                 )
+        if self.scheduler is not None:
+            self.scheduler.discard(self)
 
     def perform(self, event=None):
         """ Call the appropriate function.
@@ -98,6 +105,20 @@ class ListeningAction(Action):
             return default
         return obj
 
+    def _observe_name(self, obj, kind, name, remove=False):
+        """ Observe the name determining a kind of state on an object. """
+        self._observe_with(self.scheduler, obj, kind, name, remove)
+
+    def _observe_with(self, scheduler, obj, kind, name, remove=False):
+        """ Observe a name either directly or through a scheduler. """
+        if scheduler is None:
+            method = getattr(self, "_%s_update" % kind)
+            obj.observe(method, name, remove=remove)
+        elif remove:
+            scheduler.unsubscribe(self, kind, obj, name)
+        else:
+            scheduler.subscribe(self, kind, obj, name)
+
     # Trait change handlers --------------------------------------------------
 
     @observe('enabled_name')
@@ -106,9 +127,9 @@ class ListeningAction(Action):
         obj = self.object
         if obj is not None:
             if old:
-                obj.observe(self._enabled_update, old, remove=True)
+                self._observe_name(obj, "enabled", old, remove=True)
             if new:
-                obj.observe(self._enabled_update, new)
+                self._observe_name(obj, "enabled", new)
         self._enabled_update()
 
     @observe('visible_name')
@@ -117,9 +138,9 @@ class ListeningAction(Action):
         obj = self.object
         if obj is not None:
             if old:
-                obj.observe(self._visible_update, old, remove=True)
+                self._observe_name(obj, "visible", old, remove=True)
             if new:
-                obj.observe(self._visible_update, new)
+                self._observe_name(obj, "visible", new)
         self._visible_update()
 
     @observe('object')
@@ -130,11 +151,27 @@ class ListeningAction(Action):
             name = getattr(self, "%s_name" % kind)
             if name:
                 if old and old is not Undefined:
-                    old.observe(method, name, remove=True)
+                    self._observe_name(old, kind, name, remove=True)
                 if new:
-                    new.observe(method, name)
+                    self._observe_name(new, kind, name)
                 method()
 
+    @observe('scheduler')
+    def _scheduler_updated(self, event):
+        old, new = event.old, event.new
+        if old is Undefined:
+            old = None
+        if old is not None:
+            old.discard(self)
+        obj = self.object
+        if not obj:
+            return
+        for kind in ("enabled", "visible"):
+            name = getattr(self, "%s_name" % kind)
+            if name:
+                self._observe_with(old, obj, kind, name, remove=True)
+                self._observe_with(new, obj, kind, name)
+
     def _enabled_update(self, event=None):
         if self.enabled_name:
             if self.object:
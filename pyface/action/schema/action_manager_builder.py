@@ -13,13 +13,20 @@
 This module provides a base class that takes a schema for an action manager
 and builds the concrete action manager and its groups and items, folding in
 schema additions.
+
+Resolving the additions, ordering and merging of a schema is done once, into
+an immutable plan which is cached by schema identity and the additions used.
+Every manager built from the same schema and additions, for example one per
+window, is then created directly from the plan.
 """
 
 import logging
+import weakref
 
 from collections import defaultdict
 
-from traits.api import HasTraits, Instance, List
+from traits.api import Dict, HasTraits, Instance, List
+from traits.observation.api import trait
 
 from .schema import Schema, ToolBarSchema
 from .schema_addition import SchemaAddition
@@ -30,6 +37,109 @@ from ._topological_sort import before_after_sort
 logger = logging.getLogger(__name__)
 
 
+class SchemaPlan(object):
+    """ The resolved structure of a schema, with additions merged in.
+
+    Plans are created by :meth:`ActionManagerBuilder.compile_schema` and
+    should be treated as immutable.
+    """
+
+    __slots__ = ("schema", "path", "children")
+
+    def __init__(self, schema, path, children):
+        #: The schema to create the manager, group or menu from.  This may be
+        #: a merged copy of several schemas with the same id.
+        self.schema = schema
+
+        #: The path of the schema.
+        self.path = path
+
+        #: A tuple of SchemaPlan and ItemPlan for the children, in order.
+        self.children = children
+
+
+class ItemPlan(object):
+    """ A concrete item in a SchemaPlan.
+
+    Items which come from a schema are shared by all managers created from
+    the plan, as they are when building from the schema directly.  Items
+    created by a schema addition's factory are created afresh each time.
+    """
+
+    __slots__ = ("path", "item", "addition")
+
+    def __init__(self, path, item=None, addition=None):
+        #: The path of the item.
+        self.path = path
+
+        #: The item, if it comes from a schema.
+        self.item = item
+
+        #: The addition whose factory creates the item, otherwise.
+        self.addition = addition
+
+
+class _PlanCache(object):
+    """ A cache of schema plans.
+
+    Plans are stored on their root schema, so that they are discarded with
+    it, and keyed by the type of the builder and the additions which were
+    applied.  Changing the items or id of any schema used by a cached plan
+    clears the cache.  The schemas are only observed while they are used by
+    a cached plan.
+    """
+
+    def __init__(self):
+        #: The root schemas which have cached plans.
+        self._roots = weakref.WeakSet()
+
+    def get(self, schema, key):
+        entry = schema._plans.get(key)
+        return None if entry is None else entry[0]
+
+    def set(self, schema, key, plan, schemas):
+        for observed in schemas:
+            self._observe(observed)
+        # the other schemas stop being observed when the root schema is
+        # collected; the root schema must not be kept alive by the finalizer
+        others = [observed for observed in schemas if observed is not schema]
+        forget = weakref.finalize(schema, self._unobserve_all, others)
+        old_entry = schema._plans.get(key)
+        schema._plans[key] = (plan, forget)
+        self._roots.add(schema)
+        if old_entry is not None:
+            self._observe(schema, remove=True)
+            old_entry[1]()
+
+    def clear(self):
+        roots = list(self._roots)
+        self._roots.clear()
+        for root in roots:
+            entries = list(root._plans.values())
+            root._plans = {}
+            for plan, forget in entries:
+                self._observe(root, remove=True)
+                forget()
+
+    def _observe(self, schema, remove=False):
+        schema.observe(
+            self._schema_changed,
+            trait("items", notify=False).list_items(optional=True),
+            remove=remove,
+        )
+        schema.observe(self._schema_changed, "items,id", remove=remove)
+
+    def _unobserve_all(self, schemas):
+        for schema in schemas:
+            self._observe(schema, remove=True)
+
+    def _schema_changed(self, event):
+        self.clear()
+
+
+_plan_cache = _PlanCache()
+
+
 class ActionManagerBuilder(HasTraits):
     """ Builds action managers from schemas, merging schema additions.
     """
@@ -43,6 +153,12 @@ class ActionManagerBuilder(HasTraits):
     #: ignored.
     additions = List(Instance(SchemaAddition))
 
+    # Private interface ----------------------------------------------------
+
+    #: The items created by addition factories while compiling a plan, and
+    #: their additions, by item id.
+    _unpacked_additions = Dict()
+
     # ------------------------------------------------------------------------
     # 'ActionManagerBuilder' interface.
     # ------------------------------------------------------------------------
@@ -65,15 +181,41 @@ class ActionManagerBuilder(HasTraits):
             with addtions.  This does not yet have concrete toolkit widgets
             associated with it: usually those will be created separately.
         """
-        additions_map = defaultdict(list)
-        for addition in self.additions:
-            if addition.path:
-                additions_map[addition.path].append(addition)
-
-        manager = self._create_action_manager_recurse(schema, additions_map)
+        plan, created = self._get_plan(schema)
+        manager = self._create_from_plan(plan, created)
         manager.controller = self.controller
         return manager
 
+    def compile_schema(self, schema):
+        """ Resolve the additions, ordering and merges for a schema.
+
+        The plan is cached, so compiling the same schema object with the same
+        additions again, even from another builder of the same type, returns
+        the same plan.
+
+        Parameters
+        ----------
+        schema : Schema
+            An Schema for an ActionManager subclass (ie. one of MenuBarSchema,
+            MenuSchema, or ToolBarSchema).
+
+        Returns
+        -------
+        plan : SchemaPlan
+            The plan for the schema.
+        """
+        plan, created = self._get_plan(schema)
+        return plan
+
+    @staticmethod
+    def clear_plan_cache():
+        """ Discard all cached schema plans.
+
+        Plans are discarded automatically when the items of a schema change,
+        but not when a schema addition is modified in place.
+        """
+        _plan_cache.clear()
+
     def get_additional_toolbar_schemas(self):
         """ Get any top-level toolbars from additions.
 
@@ -198,7 +340,11 @@ class ActionManagerBuilder(HasTraits):
 
         for item in items:
             if isinstance(item, SchemaAddition):
-                unpacked_items.append(item.factory())
+                unpacked_item = item.factory()
+                self._unpacked_additions[id(unpacked_item)] = (
+                    unpacked_item, item
+                )
+                unpacked_items.append(unpacked_item)
             else:
                 unpacked_items.append(item)
 
@@ -267,8 +413,39 @@ class ActionManagerBuilder(HasTraits):
 
         return merged_items
 
-    def _create_action_manager_recurse(self, schema, additions, path=""):
-        """ Recursively create a manager for the given schema and additions map.
+    def _get_plan(self, schema):
+        """ Return the plan for a schema and the items created compiling it.
+
+        The items created while compiling are only returned when the plan has
+        just been compiled, so that the first manager created from it can
+        use them rather than calling the addition factories again.
+        """
+        additions = tuple(
+            addition for addition in self.additions if addition.path
+        )
+        key = (type(self), additions)
+        plan = _plan_cache.get(schema, key)
+        if plan is not None:
+            return plan, {}
+
+        additions_map = defaultdict(list)
+        for addition in additions:
+            additions_map[addition.path].append(addition)
+
+        created = {}
+        schemas = []
+        self._unpacked_additions = {}
+        try:
+            plan = self._compile_recurse(
+                schema, additions_map, "", created, schemas
+            )
+        finally:
+            self._unpacked_additions = {}
+        _plan_cache.set(schema, key, plan, schemas)
+        return plan, created
+
+    def _compile_recurse(self, schema, additions, path, created, schemas):
+        """ Recursively compile a plan for the given schema and additions map.
 
         Items with the same path are merged together in a single entry if
         possible (i.e., if they have the same class).
@@ -278,7 +455,7 @@ class ActionManagerBuilder(HasTraits):
         names etc. are inherited from the first item.
 
         """
-        from pyface.action.action_manager import ActionManager
+        schemas.append(schema)
 
         # Compute the new action path.
         if path:
@@ -288,15 +465,44 @@ class ActionManagerBuilder(HasTraits):
 
         preprocessed_items = self._preprocess_schemas(schema, additions, path)
 
-        # Create the actual children by calling factory items.
         children = []
         for item in preprocessed_items:
             if isinstance(item, Schema):
-                item = self._create_action_manager_recurse(
-                    item, additions, path
+                child = self._compile_recurse(
+                    item, additions, path, created, schemas
                 )
             else:
-                item = self.prepare_item(item, path + "/" + item.id)
+                # Items created by addition factories must be created again
+                # for each manager.
+                addition = self._unpacked_additions.get(id(item), (None,))
+                if addition[0] is not item:
+                    child = ItemPlan(path + "/" + item.id, item=item)
+                else:
+                    child = ItemPlan(
+                        path + "/" + item.id, addition=addition[1]
+                    )
+                    created[child] = item
+            children.append(child)
+
+        return SchemaPlan(schema, path, tuple(children))
+
+    def _create_from_plan(self, plan, created):
+        """ Recursively create a manager from a plan. """
+        from pyface.action.action_manager import ActionManager
+
+        # Create the actual children by calling factory items.
+        children = []
+        for child in plan.children:
+            if isinstance(child, SchemaPlan):
+                item = self._create_from_plan(child, created)
+            else:
+                if child.addition is None:
+                    item = child.item
+                elif child in created:
+                    item = created.pop(child)
+                else:
+                    item = child.addition.factory()
+                item = self.prepare_item(item, child.path)
 
             if isinstance(item, ActionManager):
                 # Give even non-root action managers a reference to the
@@ -307,4 +513,4 @@ class ActionManagerBuilder(HasTraits):
             children.append(item)
 
         # Finally, create the pyface.action instance for this schema.
-        return self.prepare_item(schema.create(children), path)
+        return self.prepare_item(plan.schema.create(children), plan.path)
@@ -16,6 +16,7 @@ This module defines the Schema
 from traits.api import (
     Bool,
     Callable,
+    Dict,
     Enum,
     HasTraits,
     Instance,
@@ -57,6 +58,12 @@ class Schema(HasTraits):
     #: (non-top-level) schema or concrete instances from the Pyface API.
     items = List(SubSchema)
 
+    # Private interface ----------------------------------------------------
+
+    #: The plans compiled from this schema by action manager builders, and
+    #: how to forget them, keyed by the builder type and additions.
+    _plans = Dict(transient=True)
+
     def __init__(self, *items, **traits):
         """ Creates a new schema.
         """
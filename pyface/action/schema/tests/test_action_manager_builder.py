@@ -9,7 +9,10 @@
 # Thanks for using Enthought open source!
 
 from contextlib import contextmanager
+import gc
 import unittest
+from unittest import mock
+import weakref
 
 
 from pyface.action.api import (
@@ -28,6 +31,7 @@ from pyface.action.schema.api import (
 )
 from ..action_manager_builder import (
     ActionManagerBuilder,
+    _plan_cache,
 )
 
 
@@ -441,3 +445,132 @@ class ActionManagerBuilderTestCase(unittest.TestCase):
             id="MenuBar",
         )
         self.assertActionElementsEqual(actual, desired)
+
+
+class CountingBuilder(ActionManagerBuilder):
+    """ A builder which counts how often schemas are preprocessed. """
+
+    preprocess_count = 0
+
+    def _preprocess_schemas(self, schema, additions, path):
+        CountingBuilder.preprocess_count += 1
+        return super()._preprocess_schemas(schema, additions, path)
+
+
+class SchemaPlanTestCase(unittest.TestCase):
+    def setUp(self):
+        CountingBuilder.preprocess_count = 0
+        self.factory_calls = 0
+        self.schema = MenuBarSchema(
+            MenuSchema(
+                GroupSchema(
+                    Action(id="action1", name="Action 1"), id="FileGroup"
+                ),
+                id="File",
+            )
+        )
+        self.additions = [
+            SchemaAddition(
+                factory=self.create_action, path="MenuBar/File/FileGroup"
+            )
+        ]
+
+    def tearDown(self):
+        ActionManagerBuilder.clear_plan_cache()
+
+    def create_action(self):
+        self.factory_calls += 1
+        return Action(id="added", name="Added")
+
+    def test_plan_shared_between_builders(self):
+        builder_1 = CountingBuilder(additions=self.additions)
+        builder_2 = CountingBuilder(additions=self.additions)
+
+        plan = builder_1.compile_schema(self.schema)
+        count = CountingBuilder.preprocess_count
+
+        self.assertIs(builder_2.compile_schema(self.schema), plan)
+        builder_2.create_action_manager(self.schema)
+        self.assertEqual(CountingBuilder.preprocess_count, count)
+
+    def test_plan_structure(self):
+        builder = ActionManagerBuilder(additions=self.additions)
+
+        plan = builder.compile_schema(self.schema)
+
+        self.assertEqual(plan.path, "MenuBar")
+        (menu_plan,) = plan.children
+        (group_plan,) = menu_plan.children
+        self.assertEqual(group_plan.path, "MenuBar/File/FileGroup")
+        schema_item, added_item = group_plan.children
+        self.assertEqual(schema_item.path, "MenuBar/File/FileGroup/action1")
+        self.assertIsNone(schema_item.addition)
+        self.assertIs(added_item.addition, self.additions[0])
+
+    def test_addition_factory_called_once_per_manager(self):
+        builder = ActionManagerBuilder(additions=self.additions)
+
+        manager_1 = builder.create_action_manager(self.schema)
+        self.assertEqual(self.factory_calls, 1)
+        manager_2 = builder.create_action_manager(self.schema)
+        self.assertEqual(self.factory_calls, 2)
+
+        item_1 = manager_1.find_item("File/added")
+        item_2 = manager_2.find_item("File/added")
+        self.assertIsNotNone(item_1)
+        self.assertIsNotNone(item_2)
+        self.assertIsNot(item_1.action, item_2.action)
+
+    def test_different_additions_compile_new_plan(self):
+        builder = ActionManagerBuilder(additions=self.additions)
+        plan = builder.compile_schema(self.schema)
+
+        builder.additions = []
+
+        self.assertIsNot(builder.compile_schema(self.schema), plan)
+        manager = builder.create_action_manager(self.schema)
+        self.assertIsNone(manager.find_item("File/added"))
+
+    def test_schema_change_invalidates_plan(self):
+        builder = ActionManagerBuilder(additions=self.additions)
+        plan = builder.compile_schema(self.schema)
+
+        self.schema.items.append(MenuSchema(id="Edit"))
+
+        self.assertIsNot(builder.compile_schema(self.schema), plan)
+        manager = builder.create_action_manager(self.schema)
+        self.assertIsNotNone(manager.find_item("Edit"))
+
+    def test_plan_cache_releases_schema(self):
+        builder = ActionManagerBuilder(additions=self.additions)
+        builder.create_action_manager(self.schema)
+        schema_ref = weakref.ref(self.schema)
+
+        del self.schema
+        gc.collect()
+
+        self.assertIsNone(schema_ref())
+
+    def test_evicted_schemas_not_observed(self):
+        group = self.schema.items[0].items[0]
+        builder = ActionManagerBuilder(additions=self.additions)
+        builder.compile_schema(self.schema)
+
+        ActionManagerBuilder.clear_plan_cache()
+
+        with mock.patch.object(_plan_cache, "clear") as clear:
+            group.items.append(Action(id="action2", name="Action 2"))
+            group.id = "renamed"
+        clear.assert_not_called()
+
+    def test_collected_schema_not_observed(self):
+        group = self.schema.items[0].items[0]
+        builder = ActionManagerBuilder(additions=self.additions)
+        builder.compile_schema(self.schema)
+
+        del self.schema
+        gc.collect()
+
+        with mock.patch.object(_plan_cache, "clear") as clear:
+            group.id = "renamed"
+        clear.assert_not_called()
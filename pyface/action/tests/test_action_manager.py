@@ -200,6 +200,29 @@ class TestActionItem(unittest.TestCase, UnittestTools):
         item = action_manager.find_item("test2/Test")
         self.assertEqual(item, self.action_item)
 
+    def test_find_item_hierarchy_missing(self):
+        action_manager = ActionManager(self.group)
+        action_manager_2 = ActionManager(self.action_item, id="test2")
+        self.group.append(action_manager_2)
+        self.assertIsNone(action_manager.find_item("test2/Not here"))
+        self.assertIsNone(action_manager.find_item("not here/Test"))
+
+    def test_find_group_after_id_changed(self):
+        action_manager = ActionManager(self.group)
+        self.group.id = "renamed"
+
+        self.assertIs(action_manager.find_group("renamed"), self.group)
+        self.assertIsNone(action_manager.find_group("test"))
+
+    def test_find_item_after_group_inserted(self):
+        action_manager = ActionManager(self.group)
+        group = Group(ActionItem(action=Action(name="Test")), id="first")
+        action_manager.insert(0, group)
+        self.group.append(self.action_item)
+
+        # Groups are searched in order.
+        self.assertIs(action_manager.find_item("Test"), group.items[0])
+
     def test_walk_hierarchy(self):
         action_manager = ActionManager(self.group)
         action_manager_2 = ActionManager(self.action_item, id="test2")
@@ -0,0 +1,175 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+
+import unittest
+
+from traits.api import Bool, HasTraits
+from traits.testing.api import UnittestTools
+
+from ..action_state_scheduler import ActionStateScheduler
+from ..listening_action import ListeningAction
+
+
+class WatchedObject(HasTraits):
+
+    #: Trait to watch for enabled state
+    is_enabled = Bool(True)
+
+    #: Trait to watch for visible state
+    is_visible = Bool(True)
+
+
+class TestActionStateScheduler(unittest.TestCase, UnittestTools):
+    def setUp(self):
+        self.object = WatchedObject()
+        self.pending = []
+        self.scheduler = ActionStateScheduler(
+            invoke_later=self.pending.append
+        )
+
+    def run_pending(self):
+        pending, self.pending[:] = list(self.pending), []
+        for callable in pending:
+            callable()
+
+    def create_action(self, **traits):
+        return ListeningAction(
+            object=self.object,
+            enabled_name="is_enabled",
+            visible_name="is_visible",
+            scheduler=self.scheduler,
+            **traits
+        )
+
+    def test_initial_state_is_synchronous(self):
+        self.object.is_enabled = False
+
+        action = self.create_action()
+
+        self.assertFalse(action.enabled)
+        self.assertTrue(action.visible)
+        self.assertEqual(self.pending, [])
+
+    def test_update_is_deferred(self):
+        action = self.create_action()
+
+        with self.assertTraitDoesNotChange(action, "enabled"):
+            self.object.is_enabled = False
+
+        self.assertTrue(action.enabled)
+        self.assertEqual(len(self.pending), 1)
+
+        with self.assertTraitChanges(action, "enabled", 1):
+            self.run_pending()
+
+        self.assertFalse(action.enabled)
+
+    def test_changes_are_batched(self):
+        actions = [self.create_action() for _ in range(3)]
+
+        for _ in range(5):
+            self.object.is_enabled = not self.object.is_enabled
+            self.object.is_visible = not self.object.is_visible
+
+        # only one flush is requested for all of the changes
+        self.assertEqual(len(self.pending), 1)
+        self.run_pending()
+
+        for action in actions:
+            self.assertFalse(action.enabled)
+            self.assertFalse(action.visible)
+        statistics = self.scheduler.statistics()
+        self.assertEqual(statistics["notifications"], 10)
+        self.assertEqual(statistics["marked"], 30)
+        self.assertEqual(statistics["evaluations"], 6)
+        self.assertEqual(statistics["skipped"], 24)
+        self.assertEqual(statistics["flushes"], 1)
+        self.assertEqual(statistics["pending"], 0)
+
+    def test_observers_are_shared(self):
+        actions = [self.create_action() for _ in range(10)]
+
+        self.assertEqual(self.scheduler.statistics()["observers"], 2)
+
+        for action in actions:
+            action.destroy()
+
+        self.assertEqual(self.scheduler.statistics()["observers"], 0)
+        self.object.is_enabled = False
+        self.assertEqual(self.pending, [])
+
+    def test_destroy_discards_pending(self):
+        action = self.create_action()
+        self.object.is_enabled = False
+
+        action.destroy()
+        self.run_pending()
+
+        self.assertTrue(action.enabled)
+        self.assertEqual(self.scheduler.statistics()["evaluations"], 0)
+
+    def test_object_change(self):
+        action = self.create_action()
+        other = WatchedObject(is_enabled=False)
+
+        action.object = other
+
+        self.assertFalse(action.enabled)
+        self.object.is_enabled = False
+        self.assertEqual(self.pending, [])
+
+        other.is_enabled = True
+        self.run_pending()
+
+        self.assertTrue(action.enabled)
+
+    def test_enabled_name_change(self):
+        action = self.create_action()
+
+        action.enabled_name = "is_visible"
+        self.object.is_enabled = False
+        self.assertEqual(self.pending, [])
+
+        self.object.is_visible = False
+        self.run_pending()
+
+        self.assertFalse(action.enabled)
+        self.assertFalse(action.visible)
+
+    def test_scheduler_set_after_object(self):
+        action = ListeningAction(
+            object=self.object, enabled_name="is_enabled"
+        )
+        action.scheduler = self.scheduler
+
+        self.object.is_enabled = False
+        self.assertTrue(action.enabled)
+        self.run_pending()
+        self.assertFalse(action.enabled)
+
+        action.scheduler = None
+
+        # observing directly again
+        self.object.is_enabled = True
+        self.assertTrue(action.enabled)
+        self.assertEqual(self.scheduler.statistics()["observers"], 0)
+
+    def test_reset_statistics(self):
+        self.create_action()
+        self.object.is_enabled = False
+        self.run_pending()
+
+        self.scheduler.reset_statistics()
+
+        statistics = self.scheduler.statistics()
+        self.assertEqual(statistics["notifications"], 0)
+        self.assertEqual(statistics["evaluations"], 0)
+        self.assertEqual(statistics["observers"], 2)
@@ -15,6 +15,7 @@ from traits.testing.api import UnittestTools
 
 from ..action import Action
 from ..action_item import ActionItem
+from ..action_manager_item import ActionManagerItem
 from ..group import Group
 
 
@@ -171,6 +172,64 @@ class TestActionItem(unittest.TestCase, UnittestTools):
         item = group.find("Not here")
         self.assertIsNone(item)
 
+    def test_find_after_insert_and_remove(self):
+        action_item2 = ActionItem(action=Action(name="Other"))
+        group = Group(self.action_item)
+        group.insert(0, action_item2)
+        self.assertIs(group.find("Other"), action_item2)
+
+        group.remove(action_item2)
+        self.assertIsNone(group.find("Other"))
+        self.assertIs(group.find("Test"), self.action_item)
+
+    def test_find_duplicate_ids(self):
+        action_item2 = ActionItem(action=Action(name="Test"))
+        group = Group(self.action_item)
+
+        # The first item with the id is found, wherever it is inserted.
+        group.insert(0, action_item2)
+        self.assertIs(group.find("Test"), action_item2)
+
+        group.remove(action_item2)
+        self.assertIs(group.find("Test"), self.action_item)
+
+    def test_find_after_id_changed(self):
+        group = Group(self.action_item)
+        self.action.id = "renamed"
+
+        self.assertIs(group.find("renamed"), self.action_item)
+        self.assertIsNone(group.find("Test"))
+
+    def test_find_after_item_renamed(self):
+        item_a = ActionManagerItem(id="a")
+        item_c = ActionManagerItem(id="c")
+        group = Group(item_a, item_c)
+
+        item_a.id = "b"
+        self.assertIs(group.find("b"), item_a)
+        self.assertIsNone(group.find("a"))
+
+        # the first item with the id is found after a rename
+        item_c.id = "b"
+        self.assertIs(group.find("b"), item_a)
+        item_a.id = "a"
+        self.assertIs(group.find("b"), item_c)
+
+    def test_find_after_items_mutated(self):
+        action_item2 = ActionItem(action=Action(name="Other"))
+        group = Group(self.action_item)
+
+        group._items.append(action_item2)
+        self.assertIs(group.find("Other"), action_item2)
+
+        del group._items[0]
+        self.assertIsNone(group.find("Test"))
+
+    def test_find_after_clear(self):
+        group = Group(self.action_item)
+        group.clear()
+        self.assertIsNone(group.find("Test"))
+
     def test_enabled_changed(self):
         group = Group(self.action_item)
         group.enabled = False
@@ -106,10 +106,13 @@ Miscellaneous
 - :class:`~.beep`
 - :class:`~.FileDropHandler`
 - :class:`~.Filter`
+- :class:`~.GUIEventLoop`
+- :class:`~.GUIEventLoopPolicy`
 - :class:`~.HeadingText`
 - :class:`~.ImageCache`
 - :class:`~.LayeredPanel`
 - :class:`~.Margin`
+- :class:`~.ProgressRunner`
 - :class:`~.PILImage`
 - :class:`~.PythonEditor`
 - :class:`~.PythonShell`
@@ -223,7 +226,10 @@ _relative_imports = {
     'clipboard': "clipboard",
     'confirm': "confirmation_dialog",
     'error': "message_dialog",
+    'GUIEventLoop': "asyncio_event_loop",
+    'GUIEventLoopPolicy': "asyncio_event_loop",
     'information': "message_dialog",
+    'ProgressRunner': "progress_runner",
     'SplitApplicationWindow': "split_application_window",
     'SplitDialog': "split_dialog",
     'SplitPanel': "split_panel",
@@ -45,6 +45,8 @@ from traits.api import (
     VetoableEvent,
 )
 
+from pyface.util.startup_profiler import profile_phase, startup_profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -164,7 +166,8 @@ class Application(HasStrictTraits):
         # Start up the application.
         logger.info("---- Application starting ----")
         self._fire_application_event("starting")
-        started = self.start()
+        with profile_phase("start", "application", {"name": self.name}):
+            started = self.start()
         if started:
 
             logger.info("---- Application started ----")
@@ -257,8 +260,11 @@ class Application(HasStrictTraits):
     # Utilities ---------------------------------------------------------------
 
     def _fire_application_event(self, event_type):
+        startup_profiler.mark(event_type, "application")
         event = ApplicationEvent(application=self, event_type=event_type)
         setattr(self, event_type, event)
+        if event_type == "application_initialized":
+            startup_profiler.finish()
 
     # Destruction methods -----------------------------------------------------
 
@@ -0,0 +1,298 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Run an asyncio event loop on top of the Pyface GUI event loop.
+
+The :class:`GUIEventLoop` is an asyncio event loop which never blocks:
+instead of waiting in its selector, it processes whatever is ready and then
+asks the toolkit to call it back, either immediately if more callbacks are
+ready, when the next asyncio timer is due, or after a short poll interval if
+it is waiting for I/O.  Coroutines therefore run in the GUI thread and can
+update widgets directly, without a second thread.
+
+The loop can either be run in the usual asyncio way (``run_forever``,
+``run_until_complete`` or :func:`asyncio.run` with a
+:class:`GUIEventLoopPolicy`), in which case it starts the GUI event loop, or
+attached to a GUI event loop which the application starts itself.
+"""
+
+import asyncio
+import selectors
+import threading
+
+
+class _NonBlockingSelector(selectors.DefaultSelector):
+    """ A selector which polls rather than waits.
+
+    The GUI event loop is responsible for the waiting, so blocking here would
+    freeze the user interface.
+    """
+
+    def select(self, timeout=None):
+        return super().select(0)
+
+
+class GUIEventLoop(asyncio.SelectorEventLoop):
+    """ An asyncio event loop driven by the Pyface GUI event loop.
+
+    Parameters
+    ----------
+    gui : IGUI or None
+        The GUI whose event loop drives this loop.  If None, a new
+        :class:`~pyface.gui.GUI` is created when first needed.
+    poll_interval : float
+        The interval in seconds at which to poll for I/O while file
+        descriptors are registered with the loop.
+    """
+
+    def __init__(self, gui=None, poll_interval=0.01):
+        super().__init__(_NonBlockingSelector())
+        self.poll_interval = poll_interval
+        self._gui = gui
+
+        # Whether the loop is currently driven by the GUI event loop.
+        self._attached = False
+
+        # Whether run_forever started the GUI event loop.
+        self._owns_gui_loop = False
+
+        # Whether a step is currently executing.
+        self._stepping = False
+
+        # Token identifying the most recently requested step, and the loop
+        # time at which it is due.  Superseded steps do nothing.
+        self._step_token = 0
+        self._step_due = None
+
+    @property
+    def gui(self):
+        """ The GUI whose event loop drives this loop. """
+        if self._gui is None:
+            from pyface.gui import GUI
+
+            self._gui = GUI()
+        return self._gui
+
+    def attach(self):
+        """ Start running asyncio callbacks from the GUI event loop.
+
+        The loop is considered to be running from this point until
+        :meth:`detach` or ``stop`` is called, but only executes while the GUI
+        event loop is running.
+        """
+        self._check_closed()
+        if self._attached:
+            return
+        if self.is_running():
+            raise RuntimeError("This event loop is already running")
+        self._thread_id = threading.get_ident()
+        self._attached = True
+        self._request_step(0.0)
+
+    def detach(self):
+        """ Stop running asyncio callbacks from the GUI event loop.
+
+        Pending callbacks are kept, and run when the loop is next attached.
+        """
+        self._attached = False
+        self._thread_id = None
+        self._step_token += 1
+        self._step_due = None
+
+    # ------------------------------------------------------------------------
+    # 'asyncio.AbstractEventLoop' interface.
+    # ------------------------------------------------------------------------
+
+    def run_forever(self):
+        """ Run the GUI event loop until ``stop`` is called. """
+        self.attach()
+        self._owns_gui_loop = True
+        try:
+            self.gui.start_event_loop()
+        finally:
+            self._owns_gui_loop = False
+            self._stopping = False
+            self.detach()
+
+    def close(self):
+        if self._attached and not self._owns_gui_loop:
+            self.detach()
+        super().close()
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self._request_step(0.0)
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self._request_step(max(0.0, when - self.time()))
+        return handle
+
+    def call_soon_threadsafe(self, callback, *args, context=None):
+        handle = super().call_soon_threadsafe(
+            callback, *args, context=context
+        )
+        if self._attached:
+            self.gui.invoke_later(self._request_step, 0.0)
+        return handle
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _request_step(self, delay):
+        """ Make sure a step will happen within ``delay`` seconds. """
+        if not self._attached or self._stepping:
+            # a step in progress reschedules itself when it finishes
+            return
+        due = self.time() + delay
+        if self._step_due is not None and self._step_due <= due:
+            return
+        self._step_due = due
+        self._step_token += 1
+        token = self._step_token
+        if delay <= 0:
+            self.gui.invoke_later(self._step, token)
+        else:
+            # round up so that the asyncio timer is due when we wake
+            self.gui.invoke_after(int(delay * 1000) + 1, self._step, token)
+
+    def _step(self, token):
+        """ Run one iteration of the asyncio loop and schedule the next. """
+        if token != self._step_token or not self._attached:
+            return
+        if self._stepping:
+            # a callback is running a nested GUI event loop; the outer step
+            # reschedules itself when it finishes
+            return
+        self._step_due = None
+        previous_loop = asyncio._get_running_loop()
+        asyncio._set_running_loop(self)
+        self._stepping = True
+        try:
+            self._run_once()
+        finally:
+            self._stepping = False
+            asyncio._set_running_loop(previous_loop)
+
+        if self._stopping:
+            self._stopping = False
+            if self._owns_gui_loop:
+                self.gui.stop_event_loop()
+            else:
+                self.detach()
+            return
+
+        if self._ready:
+            self._request_step(0.0)
+        elif self._scheduled:
+            delay = max(0.0, self._scheduled[0].when() - self.time())
+            if len(self._selector.get_map()) > 1:
+                delay = min(delay, self.poll_interval)
+            self._request_step(delay)
+        elif len(self._selector.get_map()) > 1:
+            # something other than the self-pipe is waiting for I/O
+            self._request_step(self.poll_interval)
+
+
+class GUIEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """ An event loop policy which creates :class:`GUIEventLoop` instances.
+
+    This allows :func:`asyncio.run` to drive a coroutine from the GUI event
+    loop::
+
+        asyncio.set_event_loop_policy(GUIEventLoopPolicy())
+        asyncio.run(main())
+    """
+
+    def new_event_loop(self):
+        return GUIEventLoop()
+
+
+async def open_dialog(dialog):
+    """ Open a dialog and wait for it to be closed.
+
+    The dialog is opened from the GUI event loop rather than from the calling
+    coroutine, so other coroutines keep running while a modal dialog is open.
+
+    Parameters
+    ----------
+    dialog : IDialog
+        The dialog to open.
+
+    Returns
+    -------
+    return_code : int
+        The return code of the dialog, eg. ``OK`` or ``CANCEL``.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def open():
+        try:
+            result = dialog.open()
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if dialog.style == "nonmodal":
+                # wait for the user to close the dialog
+                dialog.observe(closed, "closed")
+            elif not future.done():
+                future.set_result(result)
+
+    def closed(event):
+        dialog.observe(closed, "closed", remove=True)
+        if not future.done():
+            future.set_result(dialog.return_code)
+
+    if isinstance(loop, GUIEventLoop):
+        loop.gui.invoke_later(open)
+    else:
+        loop.call_soon(open)
+    return await future
+
+
+async def wait_for_event(obj, name):
+    """ Wait for a trait on an object to change or an event to fire.
+
+    This can be used to wait on timers, for example::
+
+        timer = EventTimer(interval=0.5)
+        timer.start()
+        while True:
+            await wait_for_event(timer, "timeout")
+            refresh()
+
+    Parameters
+    ----------
+    obj : HasTraits
+        The object to observe.
+    name : str
+        The name of the trait or event to wait for.
+
+    Returns
+    -------
+    new : Any
+        The new value of the trait.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def handler(event):
+        if not future.done():
+            future.set_result(event.new)
+
+    obj.observe(handler, name)
+    try:
+        return await future
+    finally:
+        obj.observe(handler, name, remove=True)
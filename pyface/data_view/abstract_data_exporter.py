@@ -87,5 +87,47 @@ class AbstractDataExporter(ABCHasStrictTraits):
             value = model.get_value(row, column)
         return value
 
+    def get_values(self, model, rows, column):
+        """ Utility method to extract the values of several rows of a column.
+
+        This returns the same values as calling ``get_value`` for each row,
+        but if ``is_text`` is True the text of rows sharing a value type is
+        fetched with a single call to the value type's ``get_texts()``
+        method.
+
+        Parameters
+        ----------
+        model : AbstractDataModel
+            The data model holding the data.
+        rows : list of row indices
+            The rows to extract values from.
+        column : sequence of int
+            The column to extract values from.
+
+        Returns
+        -------
+        values : list
+            The values, in the same order as the rows.
+        """
+        if not self.is_text:
+            return [self.get_value(model, row, column) for row in rows]
+
+        # group the rows by value type, keeping their positions
+        groups = {}
+        for position, row in enumerate(rows):
+            value_type = model.get_value_type(row, column)
+            group = groups.get(id(value_type))
+            if group is None:
+                groups[id(value_type)] = group = (value_type, [], [])
+            group[1].append(position)
+            group[2].append(row)
+
+        values = [""] * len(rows)
+        for value_type, positions, group_rows in groups.values():
+            texts = value_type.get_texts(model, group_rows, column)
+            for position, text in zip(positions, texts):
+                values[position] = text
+        return values
+
     def _is_text_default(self):
         return self.format.mimetype.startswith('text/')
@@ -17,11 +17,20 @@ to be toolkit-independent, and be able to adapt any approximately tabular or
 nested data structure to what the data view system expects.
 """
 from abc import abstractmethod
+from collections import deque
+from contextlib import contextmanager
+import time
 
-from traits.api import ABCHasStrictTraits, Event, Instance
+from traits.api import (
+    ABCHasStrictTraits, Bool, Event, Float, Instance, observe
+)
 
 from .data_view_errors import DataViewSetError
 from .index_manager import AbstractIndexManager
+from .values_changed_accumulator import ValuesChangedAccumulator
+
+#: The minimum time in seconds between throttled values_changed events.
+FRAME_INTERVAL = 1.0 / 60
 
 
 class AbstractDataModel(ABCHasStrictTraits):
@@ -83,6 +92,25 @@ class AbstractDataModel(ABCHasStrictTraits):
     #: slicing notation.
     values_changed = Event()
 
+    #: Whether the changes reported with ``report_values_changed`` are
+    #: merged and fired from the GUI thread at most once per frame, rather
+    #: than immediately.  This is useful when the data is updated at a high
+    #: rate, possibly from background threads.
+    throttle_values_changed = Bool()
+
+    # Private traits --------------------------------------------------------
+
+    #: The changes which have been reported but not yet fired.
+    _values_changed_accumulator = Instance(ValuesChangedAccumulator, ())
+
+    #: The time of the last throttled values_changed flush.
+    _values_changed_flush_time = Float()
+
+    def traits_init(self):
+        # create the accumulator now, as changes may later be reported from
+        # several threads at once
+        self._values_changed_accumulator
+
     # Data structure methods
 
     @abstractmethod
@@ -162,6 +190,34 @@ class AbstractDataModel(ABCHasStrictTraits):
         """
         raise NotImplementedError()
 
+    def get_values(self, rows, column):
+        """ Return the Python values for several rows of a column.
+
+        This allows value types and exporters to fetch the values of many
+        cells at once.  The default implementation calls ``get_value`` for
+        each row, but models which hold their data in arrays can return an
+        array of the values.
+
+        Parameters
+        ----------
+        rows : sequence of sequence of int
+            The indices of the rows, each a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        values : sequence
+            The values represented by the given rows and column, in the same
+            order as the rows.
+
+        Raises
+        -------
+        DataViewGetError
+            If a value cannot be accessed in an expected way.
+        """
+        return [self.get_value(row, column) for row in rows]
+
     def can_set_value(self, row, column):
         """ Whether the value in the indicated row and column can be set.
 
@@ -235,6 +291,86 @@ class AbstractDataModel(ABCHasStrictTraits):
         """
         raise NotImplementedError()
 
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column, if any.
+
+        Models whose value types depend only on the column can return the
+        value type here, which allows views to look it up once per column
+        rather than calling ``get_value_type`` for every cell.  A model
+        which returns a value type for a column promises that
+        ``get_value_type(row, column)`` returns the same value type for
+        every row other than the header row ``()``, until the model fires
+        ``structure_changed`` or a ``values_changed`` event covering the
+        column.
+
+        The default implementation returns None, so views call
+        ``get_value_type`` for every cell.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The value type of every non-header row of the column, or None if
+            the value type may differ between rows.
+        """
+        return None
+
+    # Change notification methods
+
+    def report_values_changed(self, top, left, bottom, right):
+        """ Report that the values in a range of rows and columns changed.
+
+        Subclasses should call this, rather than firing ``values_changed``
+        directly, when the values of individual cells are changed, so that
+        many changes can be merged.  If ``throttle_values_changed`` is True
+        or a ``batch_values_changed`` block is open then the change is
+        merged with other pending changes, otherwise ``values_changed`` is
+        fired immediately.
+
+        This may be called from any thread.
+
+        Parameters
+        ----------
+        top : sequence of int
+            The first row that changed.
+        left : sequence of int
+            The first column that changed.
+        bottom : sequence of int
+            The last row that changed.
+        right : sequence of int
+            The last column that changed.
+        """
+        values_changed = (top, left, bottom, right)
+        accumulator = self._values_changed_accumulator
+        if self.throttle_values_changed:
+            if accumulator.add(values_changed):
+                self._schedule_values_changed_flush()
+        elif not accumulator.add_if_batching(values_changed):
+            self.values_changed = values_changed
+
+    @contextmanager
+    def batch_values_changed(self):
+        """ Context manager that merges the changes reported within it.
+
+        Changes reported with ``report_values_changed`` while any batch is
+        open are merged into one bounding rectangle per parent row, and
+        ``values_changed`` is fired for each rectangle when the outermost
+        batch closes, from the thread which closes it.  If
+        ``throttle_values_changed`` is True, the changes are instead fired
+        from the GUI thread with the other throttled changes.
+        """
+        accumulator = self._values_changed_accumulator
+        accumulator.begin_batch()
+        try:
+            yield
+        finally:
+            if accumulator.end_batch() and not self.throttle_values_changed:
+                self._flush_values_changed()
+
     # Convenience methods
 
     def is_row_valid(self, row):
@@ -282,14 +418,29 @@ class AbstractDataModel(ABCHasStrictTraits):
 
         return len(column) == 0
 
-    def iter_rows(self, start_row=()):
+    def iter_rows(self, start_row=(), prune=None, max_depth=None,
+                  breadth_first=False):
         """ Iterator that yields rows in preorder.
 
+        The rows are visited using an explicit stack, so arbitrarily deep
+        hierarchies can be traversed without reaching the recursion limit.
+
         Parameters
         ----------
         start_row : sequence of int
             The row to start at.  The iterator will yeild the row and all
             descendant rows.
+        prune : callable or None
+            A function which is called with each row that can have children
+            and returns True if the descendants of the row should be
+            skipped.  The row itself is still yielded.
+        max_depth : int or None
+            The maximum depth of the rows yielded, relative to the start
+            row, or None for no limit.  A depth of 0 yields only the start
+            row.
+        breadth_first : bool
+            Whether to yield the rows in breadth-first order rather than in
+            preorder.
 
         Yields
         ------
@@ -298,11 +449,91 @@ class AbstractDataModel(ABCHasStrictTraits):
         """
         start_row = tuple(start_row)
         yield start_row
-        if self.can_have_children(start_row):
-            for row in range(self.get_row_count(start_row)):
-                yield from self.iter_rows(start_row + (row,))
+        for parent, children in self.iter_row_batches(
+            start_row, prune, max_depth, breadth_first
+        ):
+            for child in children:
+                yield parent + (child,)
+
+    def iter_row_batches(self, start_row=(), prune=None, max_depth=None,
+                         breadth_first=False, batch_size=None):
+        """ Iterator that yields runs of sibling rows.
+
+        This visits the descendants of the start row in the same order as
+        ``iter_rows``, but yields them as pairs of a parent row and a range
+        of consecutive child indices of that parent, so that code which
+        processes many rows, such as exporters and searches, can work on
+        whole runs of siblings at once, for example with ``get_values``.
+        The start row itself is not yielded.
 
-    def iter_items(self, start_row=()):
+        Parameters
+        ----------
+        start_row : sequence of int
+            The row whose descendants are yielded.
+        prune : callable or None
+            A function which is called with each row that can have children
+            and returns True if the descendants of the row should be
+            skipped.
+        max_depth : int or None
+            The maximum depth of the rows yielded, relative to the start
+            row, or None for no limit.
+        breadth_first : bool
+            Whether to yield the rows in breadth-first order rather than in
+            preorder.
+        batch_size : int or None
+            The maximum number of rows in each batch, or None for no limit.
+
+        Yields
+        ------
+        parent, children : sequence of int, range
+            The parent row and the indices of a run of its children.
+        """
+        start_row = tuple(start_row)
+        if not self._can_expand(start_row, 0, prune, max_depth):
+            return
+
+        if breadth_first:
+            queue = deque([(start_row, 1)])
+            while queue:
+                parent, depth = queue.popleft()
+                count = self.get_row_count(parent)
+                step = count if batch_size is None else batch_size
+                for first in range(0, count, max(step, 1)):
+                    children = range(first, min(first + step, count))
+                    yield parent, children
+                    for child in children:
+                        row = parent + (child,)
+                        if self._can_expand(row, depth, prune, max_depth):
+                            queue.append((row, depth + 1))
+            return
+
+        # each entry is a parent, the next child to visit, the number of
+        # children and the depth of the children
+        stack = [(start_row, 0, self.get_row_count(start_row), 1)]
+        while stack:
+            parent, first, count, depth = stack.pop()
+            child = first
+            while child < count:
+                row = parent + (child,)
+                child += 1
+                if self._can_expand(row, depth, prune, max_depth):
+                    # finish this run, then visit the row's descendants
+                    # before its remaining siblings
+                    yield parent, range(first, child)
+                    stack.append((parent, child, count, depth))
+                    stack.append(
+                        (row, 0, self.get_row_count(row), depth + 1)
+                    )
+                    break
+                if batch_size is not None and child - first >= batch_size:
+                    yield parent, range(first, child)
+                    first = child
+            else:
+                if first < count:
+                    yield parent, range(first, count)
+
+    def iter_items(self, start_row=(), prune=None, max_depth=None,
+                   breadth_first=False):
         """ Iterator that yields rows and columns in preorder.
 
         This yields pairs of row, column for all rows in preorder
@@ -313,13 +544,150 @@ class AbstractDataModel(ABCHasStrictTraits):
         ----------
         start_row : sequence of int
             The row to start iteration from.
+        prune : callable or None
+            A function which is called with each row that can have children
+            and returns True if the descendants of the row should be
+            skipped.
+        max_depth : int or None
+            The maximum depth of the rows, relative to the start row, or
+            None for no limit.
+        breadth_first : bool
+            Whether to visit the rows in breadth-first order rather than in
+            preorder.
 
         Yields
         ------
         row_index, column_index
             The current row and column indices.
         """
-        for row in self.iter_rows(start_row):
-            yield row, ()
-            for column in range(self.get_column_count()):
-                yield row, (column,)
+        columns = [()]
+        columns.extend((column,) for column in range(self.get_column_count()))
+        for row in self.iter_rows(start_row, prune, max_depth, breadth_first):
+            for column in columns:
+                yield row, column
+
+    def iter_matches(self, text, start_row=(), match_case=False,
+                     chunk_size=1000):
+        """ Iterator that yields the items whose text contains some text.
+
+        Items are scanned in the order of ``iter_items``, excluding the
+        column headers, in chunks of sibling rows from ``iter_row_batches``
+        holding at most about ``chunk_size`` items.  The text of the
+        items of a chunk is fetched with one ``get_texts`` call per column
+        and value type.  A list of the matching items is yielded for every
+        chunk, even if it is empty, so that callers can stop a long search
+        between chunks.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        start_row : sequence of int
+            The row to start searching from.  The row and all its
+            descendant rows are searched.
+        match_case : bool
+            Whether the case of the text must match.
+        chunk_size : int
+            The approximate number of items scanned for each list yielded.
+
+        Yields
+        ------
+        matches : list of (row_index, column_index) pairs
+            The items of the chunk whose text contains the text.
+        """
+        if not match_case:
+            text = text.lower()
+        start_row = tuple(start_row)
+        columns = [()]
+        columns.extend((column,) for column in range(self.get_column_count()))
+        if len(start_row) != 0:
+            items = [(start_row, column) for column in columns]
+            yield self._match_items(items, text, match_case)
+        batch_size = max(1, chunk_size // len(columns))
+        for parent, children in self.iter_row_batches(
+            start_row, batch_size=batch_size
+        ):
+            items = [
+                (parent + (child,), column)
+                for child in children
+                for column in columns
+            ]
+            yield self._match_items(items, text, match_case)
+
+    # Private methods
+
+    def _schedule_values_changed_flush(self):
+        """ Flush the pending changes from the GUI thread, after a frame. """
+        # import here to avoid toolkit selection on import
+        from pyface.gui import GUI
+
+        delay = (
+            self._values_changed_flush_time + FRAME_INTERVAL
+            - time.monotonic()
+        )
+        GUI.invoke_after(
+            max(0, int(delay * 1000)), self._flush_values_changed
+        )
+
+    def _flush_values_changed(self):
+        """ Fire values_changed for each of the pending changes. """
+        self._values_changed_flush_time = time.monotonic()
+        for values_changed in self._values_changed_accumulator.take():
+            self.values_changed = values_changed
+
+    @observe('structure_changed')
+    def _discard_pending_values_changed(self, event):
+        """ Forget pending changes, as views reset on structure changes. """
+        self._values_changed_accumulator.take()
+
+    @observe('throttle_values_changed')
+    def _flush_throttled_values_changed(self, event):
+        """ Fire any pending changes when throttling is turned off. """
+        if not event.new:
+            self._flush_values_changed()
+
+    def _can_expand(self, row, depth, prune, max_depth):
+        """ Whether a traversal should visit the children of a row. """
+        if max_depth is not None and depth >= max_depth:
+            return False
+        if not self.can_have_children(row):
+            return False
+        return prune is None or not prune(row)
+
+    def _match_items(self, items, text, match_case):
+        """ Return the items whose text contains the text, in order. """
+        column_value_types = {}
+        groups = {}
+        for position, (row, column) in enumerate(items):
+            if column not in column_value_types:
+                column_value_types[column] = self.get_column_value_type(
+                    column
+                )
+            value_type = column_value_types[column]
+            if value_type is None:
+                value_type = self.get_value_type(row, column)
+                if value_type is None:
+                    continue
+            key = (id(value_type), column)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = group = (value_type, column, [], [])
+            group[2].append(position)
+            group[3].append(row)
+
+        positions = []
+        for value_type, column, group_positions, rows in groups.values():
+            texts = value_type.get_texts(self, rows, column)
+            for index in self._match_texts(texts, text, match_case):
+                positions.append(group_positions[index])
+        positions.sort()
+        return [items[position] for position in positions]
+
+    def _match_texts(self, texts, text, match_case):
+        """ Return the indices of the texts which contain the text.
+
+        If ``match_case`` is False then ``text`` is already lower case.
+        """
+        if match_case:
+            return [i for i, item in enumerate(texts) if text in item]
+        return [i for i, item in enumerate(texts) if text in item.lower()]
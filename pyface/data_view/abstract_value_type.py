@@ -166,6 +166,35 @@ class AbstractValueType(ABCHasStrictTraits):
         """
         return str(model.get_value(row, column))
 
+    def get_texts(self, model, rows, column):
+        """ The textual representations of several rows of a column.
+
+        This is used when text is needed for many cells at once, such as
+        when exporting data.  The default implementation calls ``get_text``
+        for each row which has text, but subclasses may format the values
+        of all the rows at once.
+
+        Parameters
+        ----------
+        model : AbstractDataModel
+            The data model holding the data.
+        rows : sequence of sequence of int
+            The rows in the data model being queried.
+        column : sequence of int
+            The column in the data model being queried.
+
+        Returns
+        -------
+        texts : list of str
+            The textual representation of each row's value, or the empty
+            string for rows without text.
+        """
+        return [
+            self.get_text(model, row, column)
+            if self.has_text(model, row, column) else ""
+            for row in rows
+        ]
+
     def set_text(self, model, row, column, text):
         """ Set the text of the underlying value.
 
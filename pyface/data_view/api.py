@@ -17,6 +17,7 @@ minor releases until Pyface 8.
 - :class:`~.AbstractDataExporter`
 - :class:`~.AbstractDataModel`
 - :class:`~.AbstractValueType`
+- :class:`~.DataViewSearch`
 - :class:`~.DataViewWidget`
 - :class:`~.DataWrapper`
 
@@ -77,6 +78,7 @@ from pyface.data_view.data_formats import (
 from pyface.data_view.data_view_errors import (
     DataViewError, DataViewGetError, DataViewSetError
 )
+from pyface.data_view.data_view_search import DataViewSearch
 from pyface.data_view.i_data_view_widget import IDataViewWidget
 from pyface.data_view.i_data_wrapper import (
     DataFormat, IDataWrapper, text_format
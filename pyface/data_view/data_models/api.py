@@ -27,6 +27,12 @@ Data Models
 - :class:`~.RowTableDataModel`
 - :class:`~.ArrayDataModel`. Note that this data model is only available if
   ``numpy`` is available in the environment.
+- :class:`~.ChunkedArrayDataModel`. Note that this data model is only
+  available if ``numpy`` is available in the environment.
+- :class:`~.ColumnTableDataModel`. Note that this data model is only
+  available if ``numpy`` is available in the environment.
+- :class:`~.SortFilterDataModel`. Note that this data model is only available
+  if ``numpy`` is available in the environment.
 
 """
 try:
@@ -36,6 +42,9 @@ except ImportError:
 else:
     del numpy
     from .array_data_model import ArrayDataModel  # noqa: F401
+    from .chunked_array_data_model import ChunkedArrayDataModel  # noqa: F401
+    from .column_table_data_model import ColumnTableDataModel  # noqa: F401
+    from .sort_filter_data_model import SortFilterDataModel  # noqa: F401
 
 from .data_accessors import (  # noqa: F401
     AbstractDataAccessor, AttributeDataAccessor, ConstantDataAccessor,
@@ -171,6 +171,36 @@ class ArrayDataModel(AbstractDataModel, HasRequiredTraits):
                 return None
             return self.data[index]
 
+    def get_values(self, rows, column):
+        """ Return the Python values for several rows of a column.
+
+        Values of array cells are returned as an array, taken from the data
+        in a single indexing operation.
+
+        Parameters
+        ----------
+        rows : sequence of sequence of int
+            The indices of the rows, each a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        values : sequence
+            The values represented by the given rows and column, in the same
+            order as the rows.
+        """
+        depth = self.data.ndim - 1
+        if (
+            len(column) == 0
+            or len(rows) == 0
+            or any(len(row) != depth for row in rows)
+        ):
+            return super().get_values(rows, column)
+        from numpy import array
+        index = tuple(array(rows, dtype=int).T) + (column[0],)
+        return self.data[index]
+
     def can_set_value(self, row, column):
         """ Whether the value in the indicated row and column can be set.
 
@@ -211,7 +241,7 @@ class ArrayDataModel(AbstractDataModel, HasRequiredTraits):
         if self.can_set_value(row, column):
             index = tuple(row + column)
             self.data[index] = value
-            self.values_changed = (row, column, row, column)
+            self.report_values_changed(row, column, row, column)
         else:
             raise DataViewSetError()
 
@@ -247,6 +277,79 @@ class ArrayDataModel(AbstractDataModel, HasRequiredTraits):
         else:
             return self.value_type
 
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column, if any.
+
+        For 2-dimensional arrays every row of a column has the same value
+        type.  Higher dimensional arrays have non-leaf rows without values,
+        so None is returned.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The value type of every non-header row of the column, or None.
+        """
+        if self.data.ndim != 2:
+            return None
+        if len(column) == 0:
+            return self.row_header_type
+        return self.value_type
+
+    def iter_matches(self, text, start_row=(), match_case=False,
+                     chunk_size=1000):
+        """ Iterator that yields the items whose text contains some text.
+
+        For 2-dimensional arrays the data is scanned in blocks of whole
+        rows, each column of a block is formatted with a single call to
+        ``get_texts``, and the texts are matched using numpy string
+        operations.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        start_row : sequence of int
+            The row to start searching from.  The row and all its
+            descendant rows are searched.
+        match_case : bool
+            Whether the case of the text must match.
+        chunk_size : int
+            The approximate number of items scanned for each list yielded.
+
+        Yields
+        ------
+        matches : list of (row_index, column_index) pairs
+            The items of the chunk whose text contains the text.
+        """
+        if self.data.ndim != 2 or len(start_row) != 0:
+            yield from super().iter_matches(
+                text, start_row, match_case, chunk_size
+            )
+            return
+
+        if not match_case:
+            text = text.lower()
+        n_rows, n_columns = self.data.shape
+        columns = [()] + [(column,) for column in range(n_columns)]
+        block_size = max(1, chunk_size // len(columns))
+        for start in range(0, n_rows, block_size):
+            rows = [
+                (row,) for row in range(start, min(start + block_size, n_rows))
+            ]
+            hits = []
+            for position, column in enumerate(columns):
+                value_type = self.get_column_value_type(column)
+                texts = value_type.get_texts(self, rows, column)
+                for index in self._match_texts(texts, text, match_case):
+                    hits.append((index, position))
+            hits.sort()
+            yield [(rows[index], columns[position]) for index, position in hits]
+
     # data update methods
 
     @observe('data')
@@ -291,3 +394,13 @@ class ArrayDataModel(AbstractDataModel, HasRequiredTraits):
     def _data_default(self):
         from numpy import zeros
         return zeros(shape=(0, 0))
+
+    # private methods
+
+    def _match_texts(self, texts, text, match_case):
+        """ Return the indices of the texts which contain the text. """
+        from numpy import asarray, char, flatnonzero
+        texts = asarray(texts, dtype=str)
+        if not match_case:
+            texts = char.lower(texts)
+        return flatnonzero(char.find(texts, text) >= 0)
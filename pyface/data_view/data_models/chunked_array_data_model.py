@@ -0,0 +1,683 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+""" Provides a data model for large, lazily loaded array-like objects.
+
+This module provides a concrete implementation of a data model for array-like
+objects, such as ``numpy.memmap`` arrays or HDF5 datasets, which are too
+large to hold in memory.  The array is read a chunk at a time into a cache
+bounded by size, and the chunks around those being viewed are read ahead of
+time in a background thread.
+"""
+from collections import OrderedDict
+import queue
+import threading
+import weakref
+
+import numpy as np
+
+from traits.api import (
+    Any, Bool, HasRequiredTraits, Instance, Int, Property, Tuple,
+    cached_property, observe
+)
+
+from pyface.data_view.abstract_data_model import AbstractDataModel
+from pyface.data_view.data_view_errors import DataViewSetError
+from pyface.data_view.abstract_value_type import AbstractValueType
+from pyface.data_view.value_types.api import (
+    ConstantValue, IntValue, no_value
+)
+from pyface.data_view.index_manager import TupleIndexManager
+
+
+class ChunkCache:
+    """ A thread-safe least-recently-used cache of arrays, bounded by size.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The largest total size of the cached arrays, in bytes.  The most
+        recently used array is always kept, even if it is larger than this.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._chunks = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.reset_statistics()
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __contains__(self, key):
+        return key in self._chunks
+
+    def get(self, key):
+        """ Return a cached array and mark it as recently used.
+
+        Returns
+        -------
+        chunk : array or None
+            The cached array, or None if it isn't cached.
+        """
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._chunks.move_to_end(key)
+            return chunk
+
+    def put(self, key, chunk):
+        """ Cache an array, discarding the least recently used as needed. """
+        with self._lock:
+            old = self._chunks.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._chunks[key] = chunk
+            self.nbytes += chunk.nbytes
+            while self.nbytes > self.max_bytes and len(self._chunks) > 1:
+                _, discarded = self._chunks.popitem(last=False)
+                self.nbytes -= discarded.nbytes
+
+    def clear(self):
+        """ Discard all the cached arrays. """
+        with self._lock:
+            self._chunks.clear()
+            self.nbytes = 0
+
+    def reset_statistics(self):
+        """ Reset the counts of hits and misses. """
+        self.hits = 0
+        self.misses = 0
+
+
+class ChunkedArrayDataModel(AbstractDataModel, HasRequiredTraits):
+    """ A data model for a large array-like object read in chunks.
+
+    The array-like object only needs ``shape`` and ``dtype`` attributes and
+    to support ``__getitem__`` with slices, so ``numpy.memmap`` arrays, HDF5
+    datasets and Zarr arrays can all be viewed without being loaded into
+    memory.  Like the ``ArrayDataModel``, arrays with more than 2 dimensions
+    are presented hierarchically by dimension, and 1-dimensional arrays are
+    presented as a single column.
+
+    Values are read in chunks of rows and columns which are kept in a cache
+    of at most ``cache_bytes`` bytes.  If the array-like object has a
+    ``chunks`` attribute, as HDF5 datasets do, chunks are aligned with its
+    chunks.  Whenever a new chunk is read, its neighbours are read in a
+    background thread so that they are ready as the view scrolls.
+    """
+
+    #: The array-like object being displayed.
+    data = Any()
+
+    #: The largest total size of the cached chunks, in bytes.
+    cache_bytes = Int(64 * 2**20)
+
+    #: The approximate size of a chunk, in bytes, if the data has no
+    #: chunking of its own.
+    chunk_bytes = Int(2**20)
+
+    #: The number of rows and columns in a chunk.  By default this is
+    #: computed from the data's own chunks or from ``chunk_bytes``.
+    chunk_shape = Tuple(Int, Int)
+
+    #: The number of neighbouring chunks in each direction to read in the
+    #: background.  If zero, chunks are only read when they are needed.
+    prefetch_chunks = Int(1)
+
+    #: Whether values can't be set.  By default this is True unless the data
+    #: is a writeable numpy array.
+    read_only = Bool()
+
+    #: The chunk cache.
+    cache = Instance(ChunkCache)
+
+    #: The index manager that helps convert toolkit indices to data view
+    #: indices.
+    index_manager = Instance(TupleIndexManager, args=())
+
+    #: The value type of the row index column header.
+    label_header_type = Instance(
+        AbstractValueType,
+        factory=ConstantValue,
+        kw={'text': "Index"},
+        allow_none=False,
+    )
+
+    #: The value type of the column titles.
+    column_header_type = Instance(
+        AbstractValueType,
+        factory=IntValue,
+        kw={'is_editable': False},
+        allow_none=False,
+    )
+
+    #: The value type of the row titles.
+    row_header_type = Instance(
+        AbstractValueType,
+        factory=IntValue,
+        kw={'is_editable': False},
+        allow_none=False,
+    )
+
+    #: The type of value being displayed in the data model.
+    value_type = Instance(AbstractValueType, allow_none=False, required=True)
+
+    # Private traits ---------------------------------------------------------
+
+    #: The shape of the data, with at least 2 dimensions.
+    _shape = Property(Tuple, observe='data')
+
+    #: The most recently read chunk.
+    _last_chunk = Any()
+
+    #: The background prefetching thread.
+    _prefetcher = Any()
+
+    #: A lock serializing reads from the data.
+    _read_lock = Any(factory=threading.Lock)
+
+    # ------------------------------------------------------------------------
+    # 'ChunkedArrayDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    def prefetch(self, rows, columns=None):
+        """ Read the chunks for some rows and columns in the background.
+
+        Parameters
+        ----------
+        rows : range
+            The top-level rows to read.
+        columns : range or None
+            The columns to read, or None for all columns.
+        """
+        row_chunk, column_chunk = self.chunk_shape
+        shape = self._shape
+        if columns is None:
+            columns = range(shape[-1])
+        keys = [
+            (i, j)
+            for i in _chunk_range(rows, row_chunk, shape[0])
+            for j in _chunk_range(columns, column_chunk, shape[-1])
+        ]
+        self._request_prefetch(keys)
+
+    def wait_for_prefetch(self, timeout=None):
+        """ Wait for the background thread to read the requested chunks.
+
+        Parameters
+        ----------
+        timeout : float or None
+            The longest time to wait, in seconds.
+
+        Returns
+        -------
+        done : bool
+            Whether all requested chunks have been read.
+        """
+        if self._prefetcher is None:
+            return True
+        return self._prefetcher.wait(timeout)
+
+    def close(self):
+        """ Stop the background thread and discard the cached chunks. """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+        self.cache.clear()
+
+    # ------------------------------------------------------------------------
+    # 'AbstractDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    # Data structure methods
+
+    def get_column_count(self):
+        """ How many columns in the data view model.
+
+        Returns
+        -------
+        column_count : non-negative int
+            The number of columns in the data view model, which is the size of
+            the last dimension of the array.
+        """
+        return self._shape[-1]
+
+    def can_have_children(self, row):
+        """ Whether or not a row can have child rows.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        can_have_children : bool
+            Whether or not the row can ever have child rows.
+        """
+        return len(row) < len(self._shape) - 1
+
+    def get_row_count(self, row):
+        """ How many child rows the row currently has.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        row_count : non-negative int
+            The number of child rows that the row has.
+        """
+        shape = self._shape
+        if len(row) < len(shape) - 1:
+            return shape[len(row)]
+        return 0
+
+    # Data value methods
+
+    def get_value(self, row, column):
+        """ Return the Python value for the row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value : Any
+            The value represented by the given row and column.
+        """
+        if len(row) == 0:
+            if len(column) == 0:
+                return None
+            return column[0]
+        elif len(column) == 0:
+            return row[-1]
+        else:
+            index = tuple(row) + tuple(column)
+            if len(index) != len(self._shape):
+                return None
+            key, offset = self._locate(index)
+            return self._get_chunk(key)[offset]
+
+    def can_set_value(self, row, column):
+        """ Whether the value in the indicated row and column can be set.
+
+        This returns False for row and column headers and for read-only
+        data, but True for all other array values.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        can_set_value : bool
+            Whether or not the value can be set.
+        """
+        index = tuple(row) + tuple(column)
+        return not self.read_only and len(index) == len(self._shape)
+
+    def set_value(self, row, column, value):
+        """ Set the Python value for the row and column.
+
+        The value is written to the data and to any cached chunk holding it.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 1.
+        value : Any
+            The new value for the given row and column.
+
+        Raises
+        -------
+        DataViewSetError
+            If the value cannot be set.
+        """
+        if not self.can_set_value(row, column):
+            raise DataViewSetError()
+        index = tuple(row) + tuple(column)
+        with self._read_lock:
+            if len(self.data.shape) == 1:
+                self.data[index[0]] = value
+            else:
+                self.data[index] = value
+            key, offset = self._locate(index)
+            chunk = self.cache.get(key)
+            if chunk is not None:
+                chunk[offset] = value
+        self.report_values_changed(row, column, row, column)
+
+    def get_value_type(self, row, column):
+        """ Return the value type of the given row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType
+            The value type of the given row and column.
+        """
+        if len(row) == 0:
+            if len(column) == 0:
+                return self.label_header_type
+            return self.column_header_type
+        elif len(column) == 0:
+            return self.row_header_type
+        elif len(row) < len(self._shape) - 1:
+            return no_value
+        else:
+            return self.value_type
+
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column, if any.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The value type of every non-header row of the column, or None for
+            data of more than 2 dimensions.
+        """
+        if len(self._shape) != 2:
+            return None
+        if len(column) == 0:
+            return self.row_header_type
+        return self.value_type
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _locate(self, index):
+        """ The key of the chunk holding a value and the value's offset. """
+        row_chunk, column_chunk = self.chunk_shape
+        i, row_offset = divmod(index[0], row_chunk)
+        j, column_offset = divmod(index[-1], column_chunk)
+        return (i, j), (row_offset,) + index[1:-1] + (column_offset,)
+
+    def _get_chunk(self, key):
+        """ Return a chunk, reading it if needed. """
+        chunk = self.cache.get(key)
+        if chunk is None:
+            chunk = self._read_chunk(key)
+        if key != self._last_chunk:
+            self._prefetch_neighbours(key)
+            self._last_chunk = key
+        return chunk
+
+    def _read_chunk(self, key):
+        """ Read a chunk from the data into the cache. """
+        with self._read_lock:
+            # another thread may have read the chunk while we waited
+            chunk = self.cache.get(key)
+            if chunk is not None:
+                return chunk
+            i, j = key
+            row_chunk, column_chunk = self.chunk_shape
+            rows = slice(i * row_chunk, (i + 1) * row_chunk)
+            columns = slice(j * column_chunk, (j + 1) * column_chunk)
+            if len(self.data.shape) == 1:
+                chunk = np.array(self.data[rows]).reshape((-1, 1))
+            else:
+                chunk = np.array(self.data[rows, ..., columns])
+            self.cache.put(key, chunk)
+        return chunk
+
+    def _prefetch_neighbours(self, key):
+        """ Read the chunks around a chunk in the background. """
+        distance = self.prefetch_chunks
+        if distance <= 0:
+            return
+        i, j = key
+        row_chunk, column_chunk = self.chunk_shape
+        shape = self._shape
+        last_i = (shape[0] - 1) // row_chunk
+        last_j = (shape[-1] - 1) // column_chunk
+        # read ahead in the direction of travel first
+        if self._last_chunk is not None and self._last_chunk[0] > i:
+            steps = [-1, 1]
+        else:
+            steps = [1, -1]
+        keys = []
+        for n in range(1, distance + 1):
+            for step in steps:
+                if 0 <= i + step * n <= last_i:
+                    keys.append((i + step * n, j))
+            for step in steps:
+                if 0 <= j + step * n <= last_j:
+                    keys.append((i, j + step * n))
+        self._request_prefetch(keys)
+
+    def _request_prefetch(self, keys):
+        keys = [key for key in keys if key not in self.cache]
+        if not keys:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = _Prefetcher(self._read_chunk)
+        self._prefetcher.request(keys)
+
+    def _reset(self):
+        """ Discard cached and pending chunks after the data changes. """
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher.wait()
+        self.cache.clear()
+        self._last_chunk = None
+
+    # Trait observers --------------------------------------------------------
+
+    @observe('data', post_init=True)
+    def data_updated(self, event):
+        """ Handle the array being replaced with a new array. """
+        self._reset()
+        self.reset_traits(['chunk_shape', 'read_only'])
+        self.structure_changed = True
+
+    @observe('chunk_shape', post_init=True)
+    def _chunk_shape_updated(self, event):
+        self._reset()
+
+    @observe('cache_bytes', post_init=True)
+    def _cache_bytes_updated(self, event):
+        self.cache.max_bytes = event.new
+
+    @observe('value_type.updated')
+    def value_type_updated(self, event):
+        """ Handle the value type being updated. """
+        shape = self._shape
+        if shape[0] > 0 and shape[-1] > 0:
+            self.values_changed = (
+                (0,), (0,), (shape[0] - 1,), (shape[-1] - 1,)
+            )
+
+    @observe('column_header_type.updated')
+    def column_header_type_updated(self, event):
+        """ Handle the column header type being updated. """
+        if self._shape[-1] > 0:
+            self.values_changed = ((), (0,), (), (self._shape[-1] - 1,))
+
+    @observe('row_header_type.updated')
+    def value_header_type_updated(self, event):
+        """ Handle the value header type being updated. """
+        if self._shape[0] > 0:
+            self.values_changed = ((0,), (), (self._shape[0] - 1,), ())
+
+    @observe('label_header_type.updated')
+    def label_header_type_updated(self, event):
+        """ Handle the label header type being updated. """
+        self.values_changed = ((), (), (), ())
+
+    # Trait property getters -------------------------------------------------
+
+    @cached_property
+    def _get__shape(self):
+        if self.data is None:
+            return (0, 0)
+        shape = tuple(self.data.shape)
+        if len(shape) == 0:
+            return (0, 0)
+        elif len(shape) == 1:
+            return shape + (1,)
+        return shape
+
+    # Trait defaults ---------------------------------------------------------
+
+    def _cache_default(self):
+        return ChunkCache(self.cache_bytes)
+
+    def _chunk_shape_default(self):
+        if self.data is None:
+            return (1, 1)
+        shape = self._shape
+        chunks = getattr(self.data, "chunks", None)
+        if isinstance(chunks, tuple) and len(chunks) == len(shape):
+            return (max(chunks[0], 1), max(chunks[-1], 1))
+
+        itemsize = np.dtype(self.data.dtype).itemsize
+        inner = int(np.prod(shape[1:-1], dtype=np.int64)) * itemsize
+        columns = max(1, min(shape[-1], self.chunk_bytes // max(inner, 1)))
+        rows = max(1, self.chunk_bytes // max(inner * columns, 1))
+        return (min(rows, max(shape[0], 1)), columns)
+
+    def _read_only_default(self):
+        flags = getattr(self.data, "flags", None)
+        return flags is None or not flags.writeable
+
+
+class _Prefetcher:
+    """ A background thread which reads chunks into the cache.
+
+    Requests are served most recent first, since those are nearest to where
+    the view is now.  The thread exits when it has been idle for a while, and
+    only holds a weak reference to the reading method, so that it doesn't
+    keep the model alive.
+
+    Parameters
+    ----------
+    read : callable
+        A method taking a chunk key which reads it into the cache.
+    idle_timeout : float
+        How long the thread waits for new requests before exiting.
+    """
+
+    def __init__(self, read, idle_timeout=1.0):
+        self._read = weakref.WeakMethod(read)
+        self._idle_timeout = idle_timeout
+        self._queue = queue.LifoQueue()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._generation = 0
+        self._thread = None
+
+    def request(self, keys):
+        """ Queue chunks to be read, the first keys being read first. """
+        with self._condition:
+            self._pending += len(keys)
+            for key in reversed(keys):
+                self._queue.put((self._generation, key))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pyface-chunk-prefetch",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def cancel(self):
+        """ Drop the queued requests. """
+        with self._condition:
+            self._generation += 1
+
+    def wait(self, timeout=None):
+        """ Wait for the queued requests to be served. """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending == 0, timeout
+            )
+
+    def stop(self):
+        """ Drop the queued requests and wait for the thread to exit. """
+        with self._condition:
+            self._generation += 1
+            thread = self._thread
+            if thread is not None:
+                self._pending += 1
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._condition:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            read = self._read()
+            try:
+                if item is None or read is None:
+                    with self._condition:
+                        self._thread = None
+                        # drop anything still queued
+                        while not self._queue.empty():
+                            self._queue.get()
+                        self._pending = 0
+                        self._condition.notify_all()
+                    return
+                generation, key = item
+                if generation == self._generation:
+                    read(key)
+            except Exception:
+                # a failed read is retried, and reported, when the chunk is
+                # needed
+                pass
+            finally:
+                del read
+                with self._condition:
+                    if self._pending > 0:
+                        self._pending -= 1
+                    self._condition.notify_all()
+
+
+def _chunk_range(indices, chunk_size, size):
+    """ The chunk indices covering a range of indices. """
+    start = max(indices.start, 0)
+    stop = min(indices.stop, size)
+    if stop <= start:
+        return range(0)
+    return range(start // chunk_size, (stop - 1) // chunk_size + 1)
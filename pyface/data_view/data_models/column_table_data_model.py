@@ -0,0 +1,438 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+""" Provides a table data model for column-oriented data.
+
+This module provides a concrete implementation of a data model for data held
+as a collection of equal-length 1-dimensional arrays, one per column, such as
+a dictionary of NumPy arrays or a Pandas ``DataFrame``.  Values are read
+directly from the column arrays, so no per-row objects are created.
+"""
+import numpy as np
+
+from traits.api import (
+    Any, Dict, Instance, List, Property, cached_property, observe
+)
+
+from pyface.data_view.abstract_data_model import AbstractDataModel
+from pyface.data_view.data_view_errors import DataViewSetError
+from pyface.data_view.abstract_value_type import AbstractValueType
+from pyface.data_view.value_types.api import (
+    BoolValue, ConstantValue, FloatValue, IntValue, TextValue, no_value
+)
+from pyface.data_view.index_manager import IntIndexManager
+
+
+class ColumnTableDataModel(AbstractDataModel):
+    """ A data model for a table of column arrays.
+
+    The data is either a mapping of column names to 1-dimensional arrays of
+    equal length, or a Pandas ``DataFrame``.  Pandas is not required unless
+    a ``DataFrame`` is used.  The columns displayed, and their order, are
+    given by ``column_names``, which defaults to all the columns of the
+    data.
+
+    Each column has a value type which is, by default, chosen from the dtype
+    of the column, but which can be overridden per column with the
+    ``value_types`` mapping.  The row headers show the row number, or the
+    index of a ``DataFrame``.
+
+    Whole columns can be fetched as arrays with :meth:`get_column_array`,
+    and the values of many rows of a column with :meth:`get_values`, which
+    is what sorting, filtering, searching and exporting code should use
+    rather than calling :meth:`get_value` per cell.
+    """
+
+    #: A mapping of column names to 1-dimensional arrays, or a DataFrame.
+    data = Any(factory=dict)
+
+    #: The names of the columns to display, in order.  By default this is
+    #: all the columns of the data.
+    column_names = List()
+
+    #: Value types for particular columns, by column name.  Columns not in
+    #: this mapping use a value type chosen from their dtype.
+    value_types = Dict(Any, Instance(AbstractValueType))
+
+    #: The index manager that helps convert toolkit indices to data view
+    #: indices.
+    index_manager = Instance(IntIndexManager, args=())
+
+    #: The value type of the row index column header.
+    label_header_type = Instance(
+        AbstractValueType,
+        factory=ConstantValue,
+        kw={'text': "Index"},
+        allow_none=False,
+    )
+
+    #: The value type of the column titles.
+    column_header_type = Instance(
+        AbstractValueType,
+        factory=TextValue,
+        kw={'is_editable': False},
+        allow_none=False,
+    )
+
+    #: The value type of the row titles.
+    row_header_type = Instance(AbstractValueType, allow_none=False)
+
+    # Private traits ---------------------------------------------------------
+
+    #: The column arrays, by column name, created as they are needed.
+    _arrays = Dict()
+
+    #: The default value types, by column name, created as they are needed.
+    _default_value_types = Dict()
+
+    #: The number of rows in the table.
+    _row_count = Property(observe='data')
+
+    #: The row index of a DataFrame, or None.
+    _index = Property(observe='data')
+
+    # ------------------------------------------------------------------------
+    # 'ColumnTableDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    def get_column_array(self, column):
+        """ Return all the values of a column as an array.
+
+        Parameters
+        ----------
+        column : int
+            The index of the column.
+
+        Returns
+        -------
+        values : array
+            A 1-dimensional array of the values in the column.  This may be a
+            view of the data, and should not be modified.
+        """
+        name = self.column_names[column]
+        array = self._arrays.get(name)
+        if array is None:
+            column_data = self.data[name]
+            if _is_pandas(column_data):
+                array = column_data.to_numpy()
+            else:
+                array = np.asarray(column_data)
+            self._arrays[name] = array
+        return array
+
+    # ------------------------------------------------------------------------
+    # 'AbstractDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    # Data structure methods
+
+    def get_column_count(self):
+        """ How many columns in the data view model.
+
+        Returns
+        -------
+        column_count : non-negative int
+            The number of columns in ``column_names``.
+        """
+        return len(self.column_names)
+
+    def can_have_children(self, row):
+        """ Whether or not a row can have child rows.
+
+        Only the root has child rows.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        can_have_children : bool
+            Whether or not the row can ever have child rows.
+        """
+        return len(row) == 0
+
+    def get_row_count(self, row):
+        """ How many child rows the row currently has.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        row_count : non-negative int
+            The number of child rows that the row has.
+        """
+        if len(row) == 0:
+            return self._row_count
+        return 0
+
+    # Data value methods
+
+    def get_value(self, row, column):
+        """ Return the Python value for the row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value : Any
+            The value represented by the given row and column.
+        """
+        if len(row) == 0:
+            if len(column) == 0:
+                return None
+            return str(self.column_names[column[0]])
+        elif len(column) == 0:
+            if self._index is None:
+                return row[0]
+            return self._index[row[0]]
+        return self.get_column_array(column[0])[row[0]]
+
+    def get_values(self, rows, column):
+        """ Return the Python values for several rows of a column.
+
+        Values of data columns are returned as an array, taken from the
+        column array in a single indexing operation.
+
+        Parameters
+        ----------
+        rows : sequence of sequence of int
+            The indices of the rows, each a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        values : sequence
+            The values represented by the given rows and column, in the same
+            order as the rows.
+        """
+        if len(column) == 0 or any(len(row) != 1 for row in rows):
+            return super().get_values(rows, column)
+        indices = np.fromiter(
+            (row[0] for row in rows), dtype=np.intp, count=len(rows)
+        )
+        return self.get_column_array(column[0])[indices]
+
+    def can_set_value(self, row, column):
+        """ Whether the value in the indicated row and column can be set.
+
+        This returns False for row and column headers and for columns whose
+        arrays are not writeable, and True otherwise.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        can_set_value : bool
+            Whether or not the value can be set.
+        """
+        if len(row) == 0 or len(column) == 0:
+            return False
+        if _is_pandas(self.data):
+            return True
+        array = self.get_column_array(column[0])
+        return array.flags.writeable
+
+    def set_value(self, row, column, value):
+        """ Set the Python value for the row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 1.
+        value : Any
+            The new value for the given row and column.
+
+        Raises
+        -------
+        DataViewSetError
+            If the value cannot be set.
+        """
+        if not self.can_set_value(row, column):
+            raise DataViewSetError()
+        if _is_pandas(self.data):
+            position = self.data.columns.get_loc(self.column_names[column[0]])
+            self.data.iloc[row[0], position] = value
+            # the column may have been copied or changed dtype
+            self._arrays.pop(self.column_names[column[0]], None)
+        else:
+            self.get_column_array(column[0])[row[0]] = value
+        self.report_values_changed(row, column, row, column)
+
+    def get_value_type(self, row, column):
+        """ Return the value type of the given row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType
+            The value type of the given row and column.
+        """
+        if len(row) == 0:
+            if len(column) == 0:
+                return self.label_header_type
+            return self.column_header_type
+        elif len(column) == 0:
+            return self.row_header_type
+        elif len(row) == 1:
+            return self._column_value_type(column[0])
+        return no_value
+
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType
+            The value type of every non-header row of the column.
+        """
+        if len(column) == 0:
+            return self.row_header_type
+        return self._column_value_type(column[0])
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _column_value_type(self, column):
+        name = self.column_names[column]
+        value_type = self.value_types.get(name)
+        if value_type is None:
+            value_type = self._default_value_types.get(name)
+            if value_type is None:
+                dtype = self.get_column_array(column).dtype
+                value_type = _value_type_for_dtype(dtype)
+                self._default_value_types[name] = value_type
+        return value_type
+
+    def _all_values_changed(self):
+        row_count = self._row_count
+        column_count = self.get_column_count()
+        if row_count > 0 and column_count > 0:
+            self.values_changed = (
+                (0,), (0,), (row_count - 1,), (column_count - 1,)
+            )
+
+    # Trait observers --------------------------------------------------------
+
+    @observe('data', post_init=True)
+    def _data_updated(self, event):
+        """ Handle the data being replaced. """
+        self._arrays = {}
+        self._default_value_types = {}
+        self.reset_traits(['column_names', 'row_header_type'])
+        self.structure_changed = True
+
+    @observe('column_names.items')
+    def _column_names_updated(self, event):
+        """ Handle the displayed columns changing. """
+        self.structure_changed = True
+
+    @observe('value_types.items')
+    def _value_types_updated(self, event):
+        """ Handle value types being added or removed. """
+        self._all_values_changed()
+
+    @observe('value_types:items:updated')
+    def _value_type_updated(self, event):
+        """ Handle a column value type being updated. """
+        self._all_values_changed()
+
+    @observe('column_header_type.updated')
+    def _column_header_type_updated(self, event):
+        """ Handle the column header type being updated. """
+        if self.get_column_count() > 0:
+            self.values_changed = (
+                (), (0,), (), (self.get_column_count() - 1,)
+            )
+
+    @observe('row_header_type.updated')
+    def _row_header_type_updated(self, event):
+        """ Handle the row header type being updated. """
+        if self._row_count > 0:
+            self.values_changed = ((0,), (), (self._row_count - 1,), ())
+
+    @observe('label_header_type.updated')
+    def _label_header_type_updated(self, event):
+        """ Handle the label header type being updated. """
+        self.values_changed = ((), (), (), ())
+
+    # Trait property getters -------------------------------------------------
+
+    @cached_property
+    def _get__row_count(self):
+        if _is_pandas(self.data):
+            return len(self.data)
+        for column_data in self.data.values():
+            return len(column_data)
+        return 0
+
+    @cached_property
+    def _get__index(self):
+        if _is_pandas(self.data):
+            return self.data.index.to_numpy()
+        return None
+
+    # Trait defaults ---------------------------------------------------------
+
+    def _column_names_default(self):
+        if _is_pandas(self.data):
+            return list(self.data.columns)
+        return list(self.data)
+
+    def _row_header_type_default(self):
+        if self._index is None:
+            return IntValue(is_editable=False)
+        value_type = _value_type_for_dtype(self._index.dtype)
+        value_type.is_editable = False
+        return value_type
+
+
+def _is_pandas(data):
+    """ Whether an object is a Pandas object, without importing Pandas. """
+    return type(data).__module__.split(".", 1)[0] == "pandas"
+
+
+def _value_type_for_dtype(dtype):
+    """ A value type suitable for the values of an array with a dtype. """
+    if dtype.kind == 'b':
+        return BoolValue()
+    elif dtype.kind in 'iu':
+        return IntValue()
+    elif dtype.kind == 'f':
+        return FloatValue()
+    return TextValue()
@@ -178,7 +178,7 @@ class RowTableDataModel(AbstractDataModel):
             column_data = self.column_data[column[0]]
         obj = self.data[row[0]]
         column_data.set_value(obj, value)
-        self.values_changed = (row, column, row, column)
+        self.report_values_changed(row, column, row, column)
 
     def get_value_type(self, row, column):
         """ Return the value type of the given row and column.
@@ -207,6 +207,25 @@ class RowTableDataModel(AbstractDataModel):
             return column_data.title_type
         return column_data.value_type
 
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column.
+
+        Every row of a column has the value type of the column's accessor.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType
+            The value type of every non-header row of the column.
+        """
+        if len(column) == 0:
+            return self.row_header_data.value_type
+        return self.column_data[column[0]].value_type
+
     # data update methods
 
     @observe("data")
@@ -0,0 +1,505 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+""" Provides a data model that sorts and filters the rows of another model.
+
+This module provides a concrete implementation of a data model which wraps
+another data model, presenting its top-level rows in sorted order and
+hiding rows which do not pass a set of filters.  The mapping between the
+rows of the view and the rows of the source is held in numpy arrays, so
+sorting and filtering are vectorized over whole columns.
+"""
+import numpy as np
+
+from traits.api import (
+    Any, Bool, Callable, Dict, HasRequiredTraits, Instance, Int, observe
+)
+
+from pyface.data_view.abstract_data_model import AbstractDataModel
+from pyface.data_view.data_view_errors import DataViewSetError
+from pyface.data_view.index_manager import AbstractIndexManager
+from pyface.data_view.data_models.array_data_model import ArrayDataModel
+
+
+class SortFilterDataModel(AbstractDataModel, HasRequiredTraits):
+    """ A data model that sorts and filters the rows of another data model.
+
+    The top-level rows of the ``source`` model are shown in the order given
+    by the values in the ``sort_column``, and only rows whose values pass
+    every one of the ``filters`` are shown.  Child rows of hierarchical
+    models move with their top-level row, but are not themselves sorted or
+    filtered.
+
+    The values of a column are fetched as a single array: the source model
+    may provide a ``get_column_array(column)`` method returning a 1-D array
+    of the values of a column; two-dimensional ``ArrayDataModel`` columns
+    are sliced directly; and otherwise the values are collected with
+    ``get_value``.
+
+    Changes to the values of a few rows of the sort or filter columns
+    update the row order incrementally rather than sorting all the rows
+    again.  Changes to values which do not move rows are passed on as
+    ``values_changed`` events in the view's row order.
+    """
+
+    #: The data model whose rows are sorted and filtered.
+    source = Instance(AbstractDataModel, allow_none=False, required=True)
+
+    #: The column to sort by, or None to keep the rows in source order.
+    sort_column = Any(None)
+
+    #: Whether rows are sorted in ascending order.
+    sort_ascending = Bool(True)
+
+    #: An optional callable which maps an array of column values to an array
+    #: of sort keys, eg. ``numpy.char.lower`` for case-insensitive sorting.
+    sort_key = Callable(allow_none=True)
+
+    #: Callables which map an array of column values to a boolean array of
+    #: which rows to show, by column index.  A row is shown if it passes all
+    #: of the filters.
+    filters = Dict(Int, Callable)
+
+    #: The largest number of changed rows which are moved incrementally
+    #: rather than by sorting all the rows again.
+    incremental_limit = Int(64)
+
+    #: The index manager that helps convert toolkit indices to data view
+    #: indices.  This is a new index manager of the same type as the
+    #: source's.
+    index_manager = Instance(AbstractIndexManager)
+
+    # Private traits ---------------------------------------------------------
+
+    #: The source row of each visible row, in view order.
+    _permutation = Any()
+
+    #: The view row of each source row, or -1 for rows which are hidden.
+    _inverse = Any()
+
+    #: Whether each source row passes the filters.
+    _mask = Any()
+
+    #: The sort key of each source row, or None if unsorted.
+    _keys = Any()
+
+    def __init__(self, **traits):
+        super().__init__(**traits)
+        self._rebuild()
+
+    # ------------------------------------------------------------------------
+    # 'SortFilterDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    def map_to_source(self, row):
+        """ Return the source row index of a row of this model.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        source_row : tuple of int
+            The indices of the corresponding row of the source.
+        """
+        row = tuple(row)
+        if len(row) == 0:
+            return row
+        return (int(self._permutation[row[0]]),) + row[1:]
+
+    def map_from_source(self, source_row):
+        """ Return the row index of this model for a source row.
+
+        Parameters
+        ----------
+        source_row : sequence of int
+            The indices of the source row as a sequence from root to leaf.
+
+        Returns
+        -------
+        row : tuple of int or None
+            The indices of the corresponding row of this model, or None if
+            the row is filtered out.
+        """
+        source_row = tuple(source_row)
+        if len(source_row) == 0:
+            return source_row
+        index = int(self._inverse[source_row[0]])
+        if index < 0:
+            return None
+        return (index,) + source_row[1:]
+
+    def invalidate(self):
+        """ Sort and filter all the rows again.
+
+        This should be called if the source data changes in a way which the
+        source model does not report.
+        """
+        self._rebuild()
+        self.structure_changed = True
+
+    # ------------------------------------------------------------------------
+    # 'AbstractDataModel' interface.
+    # ------------------------------------------------------------------------
+
+    # Data structure methods
+
+    def get_column_count(self):
+        """ How many columns in the data view model.
+
+        Returns
+        -------
+        column_count : non-negative int
+            The number of columns of the source.
+        """
+        return self.source.get_column_count()
+
+    def can_have_children(self, row):
+        """ Whether or not a row can have child rows.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        can_have_children : bool
+            Whether or not the row can ever have child rows.
+        """
+        return self.source.can_have_children(self.map_to_source(row))
+
+    def get_row_count(self, row):
+        """ How many child rows the row currently has.
+
+        The root has one child row for each source row passing the filters.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+
+        Returns
+        -------
+        row_count : non-negative int
+            The number of child rows that the row has.
+        """
+        if len(row) == 0:
+            return len(self._permutation)
+        return self.source.get_row_count(self.map_to_source(row))
+
+    # Data value methods
+
+    def get_value(self, row, column):
+        """ Return the Python value for the row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value : Any
+            The value of the corresponding source row and column.
+        """
+        return self.source.get_value(self.map_to_source(row), column)
+
+    def can_set_value(self, row, column):
+        """ Whether the value in the indicated row and column can be set.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        can_set_value : bool
+            Whether or not the value of the source can be set.
+        """
+        return self.source.can_set_value(self.map_to_source(row), column)
+
+    def set_value(self, row, column, value):
+        """ Set the Python value for the row and column.
+
+        The value is set on the source, and any change in the order of the
+        rows follows from the source's ``values_changed`` event.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+        value : Any
+            The new value for the given row and column.
+
+        Raises
+        -------
+        DataViewSetError
+            If the value cannot be set.
+        """
+        if not self.is_row_valid(row):
+            raise DataViewSetError("Invalid row {!r}".format(row))
+        self.source.set_value(self.map_to_source(row), column, value)
+
+    def get_value_type(self, row, column):
+        """ Return the value type of the given row and column.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The value type of the corresponding source row and column.
+        """
+        return self.source.get_value_type(self.map_to_source(row), column)
+
+    def get_column_value_type(self, column):
+        """ Return the value type shared by every row of a column, if any.
+
+        Parameters
+        ----------
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The source's value type for every non-header row of the column.
+        """
+        return self.source.get_column_value_type(column)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _source_row_count(self):
+        return self.source.get_row_count(())
+
+    def _column_array(self, column):
+        """ The values of all the top-level rows of a source column. """
+        source = self.source
+        get_column_array = getattr(source, "get_column_array", None)
+        if get_column_array is not None:
+            return np.asarray(get_column_array(column))
+        if isinstance(source, ArrayDataModel) and source.data.ndim == 2:
+            return source.data[:, column]
+        return self._row_array(column, range(self._source_row_count()))
+
+    def _row_array(self, column, rows):
+        """ The values of some top-level rows of a source column. """
+        return _as_array([
+            self.source.get_value((int(row),), (column,)) for row in rows
+        ])
+
+    def _sort_keys(self, values):
+        if self.sort_key is not None:
+            return np.asarray(self.sort_key(values))
+        return values
+
+    def _filter_mask(self, values_for_column, count):
+        """ Apply the filters to the values given by a callable. """
+        mask = np.ones(count, dtype=bool)
+        for column, predicate in self.filters.items():
+            mask &= np.asarray(predicate(values_for_column(column)), bool)
+        return mask
+
+    def _rebuild(self):
+        """ Sort and filter all the source rows. """
+        count = self._source_row_count()
+        self._mask = self._filter_mask(self._column_array, count)
+        rows = np.flatnonzero(self._mask)
+        if self.sort_column is None:
+            self._keys = None
+        else:
+            self._keys = self._sort_keys(self._column_array(self.sort_column))
+            rows = self._sorted(rows)
+        self._set_permutation(rows, count)
+
+    def _sorted(self, rows):
+        """ Stably sort source rows by key, keeping ties in source order. """
+        keys = self._keys
+        if self.sort_ascending:
+            return rows[_argsort(keys[rows])]
+        # sort the reversed rows and reverse the result, so that ties stay in
+        # source order
+        reversed_rows = rows[::-1]
+        return reversed_rows[_argsort(keys[reversed_rows])][::-1]
+
+    def _set_permutation(self, permutation, count):
+        self._permutation = np.asarray(permutation, dtype=np.intp)
+        inverse = np.full(count, -1, dtype=np.intp)
+        inverse[self._permutation] = np.arange(len(self._permutation))
+        self._inverse = inverse
+
+    def _update_rows(self, rows):
+        """ Re-filter and re-sort some source rows whose values changed.
+
+        Returns
+        -------
+        moved : bool
+            Whether any visible row has been added, removed or moved.
+        """
+        count = self._source_row_count()
+        old_permutation = self._permutation
+        old_positions = self._inverse[rows]
+
+        self._mask[rows] = self._filter_mask(
+            lambda column: self._row_array(column, rows), len(rows)
+        )
+        if self._keys is None:
+            permutation = np.flatnonzero(self._mask)
+        else:
+            keys = np.asarray(
+                self._sort_keys(self._row_array(self.sort_column, rows))
+            )
+            if not np.can_cast(keys.dtype, self._keys.dtype):
+                # widen the keys, eg. for longer strings, rather than
+                # truncating the new values
+                try:
+                    dtype = np.result_type(self._keys, keys)
+                except TypeError:
+                    dtype = object
+                self._keys = self._keys.astype(dtype)
+            self._keys[rows] = keys
+            permutation = old_permutation[~np.isin(old_permutation, rows)]
+            for row in rows[self._mask[rows]]:
+                permutation = np.insert(
+                    permutation, self._insertion_point(permutation, row), row
+                )
+        self._set_permutation(permutation, count)
+
+        return len(permutation) != len(old_permutation) or np.any(
+            self._inverse[rows] != old_positions
+        )
+
+    def _insertion_point(self, permutation, row):
+        """ The position at which a row goes in a sorted permutation. """
+        keys = self._keys
+        key = keys[row]
+        if self.sort_ascending:
+            sorted_keys = keys[permutation]
+            low = np.searchsorted(sorted_keys, key, "left")
+            high = np.searchsorted(sorted_keys, key, "right")
+            return low + int(np.sum(permutation[low:high] < row))
+        reversed_permutation = permutation[::-1]
+        sorted_keys = keys[reversed_permutation]
+        low = np.searchsorted(sorted_keys, key, "left")
+        high = np.searchsorted(sorted_keys, key, "right")
+        position = low + int(np.sum(reversed_permutation[low:high] > row))
+        return len(permutation) - position
+
+    # Trait observers --------------------------------------------------------
+
+    @observe("source", post_init=True)
+    def _source_updated(self, event):
+        self.invalidate()
+
+    @observe(
+        "sort_column, sort_ascending, sort_key, filters.items", post_init=True
+    )
+    def _sorting_updated(self, event):
+        self.invalidate()
+
+    @observe("source:structure_changed")
+    def _source_structure_changed(self, event):
+        self.invalidate()
+
+    @observe("source:values_changed")
+    def _source_values_changed(self, event):
+        top, left, bottom, right = event.new
+        if len(top) == 0 or len(bottom) == 0:
+            # header values don't depend on the order of the rows
+            if len(top) == 0 and len(bottom) == 0:
+                self.values_changed = event.new
+                return
+            if len(bottom) == 0:
+                bottom = (self._source_row_count() - 1,)
+            else:
+                top = (0,)
+
+        if len(left) == 0 and len(right) == 0:
+            # row-only changes, such as replacing a row object, may change
+            # every column
+            first, last = 0, self.get_column_count() - 1
+        else:
+            first = left[0] if left else -1
+            last = right[0] if right else -1
+        columns = set(self.filters)
+        if self.sort_column is not None:
+            columns.add(self.sort_column)
+        affected = len(top) == 1 and any(
+            first <= column <= last for column in columns
+        )
+
+        if affected:
+            rows = np.arange(top[0], bottom[0] + 1)
+            if len(rows) > self.incremental_limit:
+                self.invalidate()
+                return
+            if self._update_rows(rows):
+                self.structure_changed = True
+                return
+
+        positions = self._inverse[top[0]:bottom[0] + 1]
+        positions = positions[positions >= 0]
+        if len(positions) == 0:
+            return
+        if len(top) == 1:
+            self.values_changed = (
+                (int(positions.min()),), left, (int(positions.max()),), right
+            )
+        else:
+            # a change below the top level of a single row
+            self.values_changed = (
+                (int(positions[0]),) + top[1:],
+                left,
+                (int(positions[0]),) + bottom[1:],
+                right,
+            )
+
+    # Trait defaults ---------------------------------------------------------
+
+    def _index_manager_default(self):
+        return type(self.source.index_manager)()
+
+
+def _as_array(values):
+    """ Convert a list of values to a 1-D array, of objects if need be. """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None
+    if array is None or array.ndim != 1:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+    return array
+
+
+def _argsort(keys):
+    """ A stable argsort, falling back to Python for unorderable arrays. """
+    try:
+        return np.argsort(keys, kind="stable")
+    except TypeError:
+        return np.array(
+            sorted(range(len(keys)), key=lambda i: keys[i]), dtype=np.intp
+        )
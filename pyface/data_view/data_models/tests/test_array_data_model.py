@@ -13,10 +13,11 @@ from unittest import TestCase
 from traits.testing.api import UnittestTools
 from traits.testing.optional_dependencies import numpy as np, requires_numpy
 
+from pyface.data_view.abstract_data_model import AbstractDataModel
 from pyface.data_view.data_view_errors import DataViewSetError
 from pyface.data_view.abstract_value_type import AbstractValueType
 from pyface.data_view.value_types.api import (
-    FloatValue, IntValue, no_value
+    FloatValue, IntValue, TextValue, no_value
 )
 # This import results in an error without numpy installed
 # see enthought/pyface#742
@@ -72,6 +73,20 @@ class TestArrayDataModel(UnittestTools, TestCase):
         self.assertEqual(model.data.ndim, 2)
         self.assertEqual(model.data.shape, (30, 1))
 
+    def test_get_values(self):
+        rows = [(4, 1), (0, 0), (2, 1)]
+        values = self.model.get_values(rows, (2,))
+        self.assertEqual(
+            values.tolist(),
+            [self.model.get_value(row, (2,)) for row in rows],
+        )
+
+    def test_get_values_headers(self):
+        self.assertEqual(self.model.get_values([(4,), (1,)], ()), [4, 1])
+        self.assertEqual(
+            self.model.get_values([(4,), (1,)], (0,)), [None, None]
+        )
+
     def test_set_data_1d(self):
         with self.assertTraitChanges(self.model, 'structure_changed'):
             self.model.data = np.arange(30.0)
@@ -157,6 +172,20 @@ class TestArrayDataModel(UnittestTools, TestCase):
                         (row, column, row, column)
                     )
 
+    def test_set_value_batched(self):
+        with self.assertTraitChanges(
+                self.model, "values_changed", count=2) as result:
+            with self.model.batch_values_changed():
+                self.model.set_value((1, 1), (2,), -1.0)
+                self.model.set_value((1, 0), (0,), -2.0)
+                self.model.set_value((3, 0), (1,), -3.0)
+
+        self.assertEqual(
+            [event[3] for event in result.events],
+            [((1, 0), (0,), (1, 1), (2,)), ((3, 0), (1,), (3, 0), (1,))],
+        )
+        self.assertEqual(self.array[1, 0, 0], -2.0)
+
     def test_get_value_type(self):
         for row, column in self.model.iter_items():
             with self.subTest(row=row, column=column):
@@ -176,6 +205,64 @@ class TestArrayDataModel(UnittestTools, TestCase):
                     self.assertIsInstance(result, AbstractValueType)
                     self.assertIs(result, self.model.value_type)
 
+    def test_get_column_value_type(self):
+        # non-leaf rows have no values, so the value type varies by row
+        self.assertIsNone(self.model.get_column_value_type((0,)))
+
+        self.model.data = self.array[0]
+        self.assertIs(
+            self.model.get_column_value_type(()), self.model.row_header_type
+        )
+        self.assertIs(
+            self.model.get_column_value_type((0,)), self.model.value_type
+        )
+
+    def test_iter_matches(self):
+        model = ArrayDataModel(
+            data=np.arange(12.0).reshape(4, 3), value_type=FloatValue()
+        )
+
+        matches = [
+            item for chunk in model.iter_matches("1", chunk_size=4)
+            for item in chunk
+        ]
+
+        self.assertEqual(
+            matches,
+            [((0,), (1,)), ((1,), ()), ((3,), (1,)), ((3,), (2,))],
+        )
+        self.assertEqual(
+            matches,
+            [
+                item for chunk in AbstractDataModel.iter_matches(model, "1")
+                for item in chunk
+            ],
+        )
+
+    def test_iter_matches_nested(self):
+        matches = [
+            item for chunk in self.model.iter_matches("29") for item in chunk
+        ]
+
+        self.assertEqual(matches, [((4, 1), (2,))])
+
+    def test_iter_matches_case(self):
+        model = ArrayDataModel(
+            data=np.array([["Ab", "ab"], ["AB", "c"]]), value_type=TextValue()
+        )
+
+        self.assertEqual(
+            [item for chunk in model.iter_matches("ab") for item in chunk],
+            [((0,), (0,)), ((0,), (1,)), ((1,), (0,))],
+        )
+        self.assertEqual(
+            [
+                item for chunk in model.iter_matches("ab", match_case=True)
+                for item in chunk
+            ],
+            [((0,), (1,))],
+        )
+
     def test_data_updated(self):
         with self.assertTraitChanges(self.model, "values_changed"):
             self.model.data = 2 * self.array
@@ -349,6 +436,91 @@ class TestArrayDataModel(UnittestTools, TestCase):
         result = list(self.model.iter_rows([2, 0]))
         self.assertEqual(result, [(2, 0)])
 
+    def test_iter_rows_prune(self):
+        result = list(self.model.iter_rows(prune=lambda row: row == (1,)))
+        self.assertEqual(
+            result,
+            [
+                (),
+                (0,), (0, 0), (0, 1),
+                (1,),
+                (2,), (2, 0), (2, 1),
+                (3,), (3, 0), (3, 1),
+                (4,), (4, 0), (4, 1),
+            ]
+        )
+
+    def test_iter_rows_max_depth(self):
+        result = list(self.model.iter_rows(max_depth=1))
+        self.assertEqual(result, [(), (0,), (1,), (2,), (3,), (4,)])
+
+    def test_iter_rows_breadth_first(self):
+        result = list(self.model.iter_rows((1,), breadth_first=True))
+        self.assertEqual(result, [(1,), (1, 0), (1, 1)])
+
+        result = list(self.model.iter_rows(breadth_first=True))
+        self.assertEqual(
+            result,
+            [
+                (),
+                (0,), (1,), (2,), (3,), (4,),
+                (0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1),
+                (3, 0), (3, 1), (4, 0), (4, 1),
+            ]
+        )
+
+    def test_iter_row_batches(self):
+        result = list(self.model.iter_row_batches(max_depth=1))
+        self.assertEqual(result, [((), range(5))])
+
+        result = list(self.model.iter_row_batches((3,)))
+        self.assertEqual(result, [((3,), range(2))])
+
+        result = list(self.model.iter_row_batches())
+        self.assertEqual(
+            result,
+            [
+                ((), range(0, 1)),
+                ((0,), range(2)),
+                ((), range(1, 2)),
+                ((1,), range(2)),
+                ((), range(2, 3)),
+                ((2,), range(2)),
+                ((), range(3, 4)),
+                ((3,), range(2)),
+                ((), range(4, 5)),
+                ((4,), range(2)),
+            ]
+        )
+
+    def test_iter_row_batches_batch_size(self):
+        result = list(
+            self.model.iter_row_batches(max_depth=1, batch_size=2)
+        )
+        self.assertEqual(
+            result, [((), range(0, 2)), ((), range(2, 4)), ((), range(4, 5))]
+        )
+
+        result = list(
+            self.model.iter_row_batches(
+                max_depth=1, batch_size=2, breadth_first=True,
+            )
+        )
+        self.assertEqual(
+            result, [((), range(0, 2)), ((), range(2, 4)), ((), range(4, 5))]
+        )
+
+    def test_iter_row_batches_leaf(self):
+        result = list(self.model.iter_row_batches((2, 0)))
+        self.assertEqual(result, [])
+
+    def test_iter_items_max_depth(self):
+        result = list(self.model.iter_items((2,), max_depth=0))
+        self.assertEqual(
+            result,
+            [((2,), ()), ((2,), (0,)), ((2,), (1,)), ((2,), (2,))]
+        )
+
     def test_iter_items(self):
         result = list(self.model.iter_items())
         self.assertEqual(
@@ -0,0 +1,212 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from traits.api import Undefined
+from traits.testing.api import UnittestTools
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
+from pyface.data_view.data_view_errors import DataViewSetError
+from pyface.data_view.value_types.api import FloatValue, no_value
+# This import results in an error without numpy installed
+# see enthought/pyface#742
+if np is not None:
+    from pyface.data_view.data_models.api import ChunkedArrayDataModel
+    from pyface.data_view.data_models.chunked_array_data_model import (
+        ChunkCache
+    )
+
+
+class LazyArray:
+    """ A minimal chunked array-like object which counts its reads. """
+
+    def __init__(self, array, chunks=None):
+        self.array = array
+        self.shape = array.shape
+        self.dtype = array.dtype
+        self.chunks = chunks
+        self.reads = []
+
+    def __getitem__(self, index):
+        self.reads.append(index)
+        return self.array[index]
+
+
+@requires_numpy
+class TestChunkCache(TestCase):
+
+    def test_lru_by_bytes(self):
+        cache = ChunkCache(max_bytes=3 * 80)
+        for key in range(3):
+            cache.put(key, np.zeros(10))
+        cache.get(0)
+        cache.put(3, np.zeros(10))
+
+        self.assertEqual(cache.nbytes, 240)
+        self.assertIn(0, cache)
+        self.assertNotIn(1, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_keeps_oversized_chunk(self):
+        cache = ChunkCache(max_bytes=8)
+        cache.put(0, np.zeros(10))
+        cache.put(1, np.zeros(10))
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn(1, cache)
+
+
+@requires_numpy
+class TestChunkedArrayDataModel(UnittestTools, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.array = np.arange(1000.0).reshape(100, 10)
+        self.data = LazyArray(self.array, chunks=(16, 5))
+        self.model = ChunkedArrayDataModel(
+            data=self.data, value_type=FloatValue(), prefetch_chunks=0,
+        )
+
+    def tearDown(self):
+        self.model.close()
+        super().tearDown()
+
+    def test_structure(self):
+        self.assertEqual(self.model.get_column_count(), 10)
+        self.assertEqual(self.model.get_row_count(()), 100)
+        self.assertTrue(self.model.can_have_children(()))
+        self.assertFalse(self.model.can_have_children((0,)))
+        self.assertEqual(self.model.get_row_count((0,)), 0)
+        self.assertEqual(self.model.chunk_shape, (16, 5))
+
+    def test_get_value(self):
+        for row in (0, 17, 99):
+            for column in (0, 6, 9):
+                self.assertEqual(
+                    self.model.get_value((row,), (column,)),
+                    self.array[row, column],
+                )
+        self.assertEqual(self.model.get_value((), (3,)), 3)
+        self.assertEqual(self.model.get_value((4,), ()), 4)
+        self.assertIsNone(self.model.get_value((), ()))
+
+    def test_get_column_value_type(self):
+        self.assertIs(
+            self.model.get_column_value_type((3,)), self.model.value_type
+        )
+        self.assertIs(
+            self.model.get_column_value_type(()), self.model.row_header_type
+        )
+
+    def test_reads_whole_chunks_once(self):
+        for row in range(16):
+            for column in range(5):
+                self.model.get_value((row,), (column,))
+
+        self.assertEqual(self.data.reads, [(slice(0, 16), Ellipsis,
+                                            slice(0, 5))])
+
+    def test_cache_bound(self):
+        self.model.cache_bytes = 2 * 16 * 5 * 8
+        for row in range(0, 100, 16):
+            self.model.get_value((row,), (0,))
+
+        self.assertEqual(len(self.model.cache), 2)
+        self.assertLessEqual(self.model.cache.nbytes, 2 * 16 * 5 * 8)
+
+    def test_default_chunk_shape(self):
+        model = ChunkedArrayDataModel(
+            data=self.array, value_type=FloatValue(), chunk_bytes=800,
+        )
+        self.assertEqual(model.chunk_shape, (10, 10))
+
+    def test_prefetch_neighbours(self):
+        self.model.prefetch_chunks = 1
+        self.model.get_value((20,), (0,))
+        self.assertTrue(self.model.wait_for_prefetch(timeout=5.0))
+
+        self.assertIn((0, 0), self.model.cache)
+        self.assertIn((2, 0), self.model.cache)
+        self.assertIn((1, 1), self.model.cache)
+
+    def test_prefetch_rows(self):
+        self.model.prefetch(range(40, 60))
+        self.assertTrue(self.model.wait_for_prefetch(timeout=5.0))
+
+        self.assertEqual(
+            set(self.model.cache._chunks),
+            {(2, 0), (2, 1), (3, 0), (3, 1)},
+        )
+
+    def test_read_only(self):
+        self.assertTrue(self.model.read_only)
+        self.assertFalse(self.model.can_set_value((0,), (0,)))
+        with self.assertRaises(DataViewSetError):
+            self.model.set_value((0,), (0,), 1.0)
+
+    def test_set_value(self):
+        model = ChunkedArrayDataModel(
+            data=self.array, value_type=FloatValue(), prefetch_chunks=0,
+        )
+        self.assertFalse(model.read_only)
+        model.get_value((5,), (5,))
+        with self.assertTraitChanges(model, "values_changed") as result:
+            model.set_value((5,), (5,), -1.0)
+
+        self.assertEqual(result.events, [
+            (model, "values_changed", Undefined, ((5,), (5,), (5,), (5,)))
+        ])
+        self.assertEqual(self.array[5, 5], -1.0)
+        self.assertEqual(model.get_value((5,), (5,)), -1.0)
+
+    def test_data_updated(self):
+        self.model.get_value((0,), (0,))
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.data = np.ones((3, 4))
+
+        self.assertEqual(len(self.model.cache), 0)
+        self.assertEqual(self.model.get_column_count(), 4)
+        self.assertEqual(self.model.get_value((2,), (3,)), 1.0)
+
+    def test_data_1d(self):
+        model = ChunkedArrayDataModel(
+            data=np.arange(10.0), value_type=FloatValue(),
+        )
+        self.assertEqual(model.get_column_count(), 1)
+        self.assertEqual(model.get_row_count(()), 10)
+        self.assertEqual(model.get_value((7,), (0,)), 7.0)
+
+    def test_data_3d(self):
+        array = np.arange(60.0).reshape(3, 4, 5)
+        model = ChunkedArrayDataModel(data=array, value_type=FloatValue())
+
+        self.assertEqual(model.get_row_count(()), 3)
+        self.assertEqual(model.get_row_count((1,)), 4)
+        self.assertEqual(model.get_value((1, 2), (3,)), array[1, 2, 3])
+        self.assertIs(model.get_value_type((1,), (3,)), no_value)
+
+    def test_memmap(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "data.npy")
+        np.save(path, self.array)
+        array = np.load(path, mmap_mode="r")
+
+        model = ChunkedArrayDataModel(data=array, value_type=FloatValue())
+
+        self.assertTrue(model.read_only)
+        self.assertEqual(model.get_value((57,), (3,)), 573.0)
+        self.assertTrue(model.wait_for_prefetch(timeout=5.0))
+        model.close()
+        del array
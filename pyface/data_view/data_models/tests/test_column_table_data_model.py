@@ -0,0 +1,165 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from unittest import TestCase, skipIf
+
+from traits.testing.api import UnittestTools
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
+from pyface.data_view.data_view_errors import DataViewSetError
+from pyface.data_view.value_types.api import (
+    BoolValue, ConstantValue, FloatValue, IntValue, TextValue, no_value
+)
+# This import results in an error without numpy installed
+# see enthought/pyface#742
+if np is not None:
+    from pyface.data_view.data_models.api import (
+        ColumnTableDataModel, SortFilterDataModel
+    )
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+@requires_numpy
+class TestColumnTableDataModel(UnittestTools, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = {
+            "id": np.arange(5),
+            "value": np.linspace(0.0, 1.0, 5),
+            "flag": np.array([True, False, True, False, True]),
+            "name": np.array(["a", "b", "c", "d", "e"]),
+        }
+        self.model = ColumnTableDataModel(data=self.data)
+
+    def test_structure(self):
+        self.assertEqual(self.model.get_column_count(), 4)
+        self.assertEqual(self.model.get_row_count(()), 5)
+        self.assertTrue(self.model.can_have_children(()))
+        self.assertFalse(self.model.can_have_children((0,)))
+        self.assertEqual(self.model.get_row_count((0,)), 0)
+
+    def test_empty(self):
+        model = ColumnTableDataModel()
+        self.assertEqual(model.get_column_count(), 0)
+        self.assertEqual(model.get_row_count(()), 0)
+
+    def test_get_value(self):
+        self.assertEqual(self.model.get_value((2,), (0,)), 2)
+        self.assertEqual(self.model.get_value((4,), (1,)), 1.0)
+        self.assertEqual(self.model.get_value((1,), (3,)), "b")
+        self.assertEqual(self.model.get_value((), (1,)), "value")
+        self.assertEqual(self.model.get_value((3,), ()), 3)
+        self.assertIsNone(self.model.get_value((), ()))
+
+    def test_get_value_type(self):
+        model = self.model
+        self.assertIsInstance(model.get_value_type((), ()), ConstantValue)
+        self.assertIsInstance(model.get_value_type((), (0,)), TextValue)
+        self.assertIsInstance(model.get_value_type((0,), ()), IntValue)
+        self.assertIsInstance(model.get_value_type((0,), (0,)), IntValue)
+        self.assertIsInstance(model.get_value_type((0,), (1,)), FloatValue)
+        self.assertIsInstance(model.get_value_type((0,), (2,)), BoolValue)
+        self.assertIsInstance(model.get_value_type((0,), (3,)), TextValue)
+        self.assertIs(model.get_value_type((0, 1), (0,)), no_value)
+
+    def test_get_column_value_type(self):
+        model = self.model
+        self.assertIsInstance(model.get_column_value_type(()), IntValue)
+        for column in range(model.get_column_count()):
+            with self.subTest(column=column):
+                self.assertIs(
+                    model.get_column_value_type((column,)),
+                    model.get_value_type((0,), (column,)),
+                )
+
+    def test_value_types_override(self):
+        value_type = FloatValue()
+        with self.assertTraitChanges(self.model, "values_changed"):
+            self.model.value_types["id"] = value_type
+        self.assertIs(self.model.get_value_type((0,), (0,)), value_type)
+
+    def test_column_names(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.column_names = ["name", "id"]
+        self.assertEqual(self.model.get_column_count(), 2)
+        self.assertEqual(self.model.get_value((1,), (0,)), "b")
+        self.assertEqual(self.model.get_value((), (1,)), "id")
+
+    def test_get_values(self):
+        np.testing.assert_array_equal(
+            self.model.get_values([(3,), (1,)], (0,)), [3, 1]
+        )
+        self.assertEqual(
+            self.model.get_values([(3,), (1,)], ()), [3, 1]
+        )
+        self.assertIs(self.model.get_column_array(0), self.data["id"])
+
+    def test_set_value(self):
+        with self.assertTraitChanges(self.model, "values_changed") as result:
+            self.model.set_value((1,), (0,), 10)
+        self.assertEqual(result.events[0][3], ((1,), (0,), (1,), (0,)))
+        self.assertEqual(self.data["id"][1], 10)
+
+    def test_set_value_read_only(self):
+        self.data["id"].flags.writeable = False
+        self.assertFalse(self.model.can_set_value((1,), (0,)))
+        self.assertFalse(self.model.can_set_value((), (0,)))
+        with self.assertRaises(DataViewSetError):
+            self.model.set_value((1,), (0,), 10)
+
+    def test_data_updated(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.data = {"x": [1.5, 2.5]}
+        self.assertEqual(self.model.column_names, ["x"])
+        self.assertEqual(self.model.get_row_count(()), 2)
+        self.assertIsInstance(
+            self.model.get_value_type((0,), (0,)), FloatValue
+        )
+
+    def test_large_table_is_lazy(self):
+        data = {
+            "c{}".format(i): np.zeros(10**6, dtype=float) for i in range(20)
+        }
+        model = ColumnTableDataModel(data=data)
+        self.assertEqual(model.get_row_count(()), 10**6)
+        self.assertEqual(model.get_value((999999,), (19,)), 0.0)
+        self.assertEqual(len(model._arrays), 1)
+
+    def test_sort_filter_source(self):
+        model = SortFilterDataModel(
+            source=self.model, sort_column=1, sort_ascending=False
+        )
+        self.assertEqual(
+            [model.get_value((row,), (3,)) for row in range(5)],
+            ["e", "d", "c", "b", "a"],
+        )
+
+    @skipIf(pd is None, "Pandas is not available")
+    def test_data_frame(self):
+        frame = pd.DataFrame(
+            {"x": [1, 2, 3], "y": ["a", "b", "c"]},
+            index=["r0", "r1", "r2"],
+        )
+        model = ColumnTableDataModel(data=frame)
+
+        self.assertEqual(model.column_names, ["x", "y"])
+        self.assertEqual(model.get_row_count(()), 3)
+        self.assertEqual(model.get_value((1,), (0,)), 2)
+        self.assertEqual(model.get_value((1,), ()), "r1")
+        self.assertIsInstance(model.get_value_type((0,), ()), TextValue)
+
+        model.set_value((2,), (0,), 30)
+        self.assertEqual(frame["x"].iloc[2], 30)
+        self.assertEqual(model.get_value((2,), (0,)), 30)
@@ -152,6 +152,18 @@ class TestRowTableDataModel(UnittestTools, unittest.TestCase):
                         (row, column, row, column)
                     )
 
+    def test_set_value_batched(self):
+        with self.assertTraitChanges(
+                self.model, "values_changed", count=1) as result:
+            with self.model.batch_values_changed():
+                for row in [2, 7, 4]:
+                    self.model.set_value((row,), (0,), -row)
+                self.model.set_value((5,), (), 50)
+
+        self.assertEqual(result.events[0][3], ((2,), (), (7,), (0,)))
+        self.assertEqual(self.data[7].b, -7)
+        self.assertEqual(self.data[5].a, 50)
+
     def test_get_value_type(self):
         for row, column in self.model.iter_items():
             with self.subTest(row=row, column=column):
@@ -181,6 +193,27 @@ class TestRowTableDataModel(UnittestTools, unittest.TestCase):
                         self.model.column_data[column[0]].value_type,
                     )
 
+    def test_get_column_value_type(self):
+        self.assertIs(
+            self.model.get_column_value_type(()),
+            self.model.row_header_data.value_type,
+        )
+        for column in range(self.model.get_column_count()):
+            with self.subTest(column=column):
+                self.assertIs(
+                    self.model.get_column_value_type((column,)),
+                    self.model.get_value_type((0,), (column,)),
+                )
+
+    def test_iter_matches(self):
+        matches = [
+            item
+            for chunk in self.model.iter_matches("1", chunk_size=7)
+            for item in chunk
+        ]
+
+        self.assertEqual(matches, [((1,), ()), ((1,), (0,)), ((1,), (1,))])
+
     def test_data_updated(self):
         with self.assertTraitChanges(self.model, "structure_changed"):
             self.model.data = [
@@ -0,0 +1,193 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from unittest import TestCase
+
+from traits.api import HasTraits, Int, Str
+from traits.trait_list_object import TraitList
+from traits.testing.api import UnittestTools
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
+from pyface.data_view.data_models.api import (
+    AttributeDataAccessor, RowTableDataModel
+)
+from pyface.data_view.value_types.api import FloatValue
+# This import results in an error without numpy installed
+# see enthought/pyface#742
+if np is not None:
+    from pyface.data_view.data_models.api import (
+        ArrayDataModel, SortFilterDataModel
+    )
+
+
+class Person(HasTraits):
+
+    name = Str()
+
+    age = Int()
+
+
+@requires_numpy
+class TestSortFilterDataModel(UnittestTools, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.array = np.array([
+            [3.0, 30.0],
+            [1.0, 10.0],
+            [2.0, 20.0],
+            [1.0, 40.0],
+            [5.0, 50.0],
+        ])
+        self.source = ArrayDataModel(data=self.array, value_type=FloatValue())
+        self.model = SortFilterDataModel(source=self.source, sort_column=0)
+
+    def column(self, column):
+        return [
+            self.model.get_value((row,), (column,))
+            for row in range(self.model.get_row_count(()))
+        ]
+
+    def test_unsorted(self):
+        model = SortFilterDataModel(source=self.source)
+        self.assertEqual(model.get_row_count(()), 5)
+        self.assertEqual(model.get_column_count(), 2)
+        self.assertEqual(model.map_to_source((3,)), (3,))
+
+    def test_sorted_ascending(self):
+        self.assertEqual(self.column(1), [10.0, 40.0, 20.0, 30.0, 50.0])
+        self.assertEqual(self.model.map_to_source((1,)), (3,))
+        self.assertEqual(self.model.map_from_source((0,)), (3,))
+
+    def test_sorted_descending_keeps_ties_stable(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.sort_ascending = False
+        self.assertEqual(self.column(1), [50.0, 30.0, 20.0, 10.0, 40.0])
+
+    def test_sort_key(self):
+        self.model.sort_key = np.negative
+        self.assertEqual(self.column(1), [50.0, 30.0, 20.0, 10.0, 40.0])
+
+    def test_get_column_value_type(self):
+        self.assertIs(
+            self.model.get_column_value_type((1,)), self.source.value_type
+        )
+
+    def test_filter(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.filters[1] = lambda values: values >= 20.0
+        self.assertEqual(self.model.get_row_count(()), 4)
+        self.assertEqual(self.column(1), [40.0, 20.0, 30.0, 50.0])
+        self.assertIsNone(self.model.map_from_source((1,)))
+
+    def test_filters_before_source(self):
+        model = SortFilterDataModel(
+            filters={0: lambda values: values > 1.0}, source=self.source
+        )
+        self.assertEqual(model.get_row_count(()), 3)
+
+    def test_set_value_moves_row(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.set_value((0,), (0,), 4.0)
+        self.assertEqual(self.column(1), [40.0, 20.0, 30.0, 10.0, 50.0])
+        self.assertEqual(self.model.map_to_source((3,)), (1,))
+
+    def test_set_value_keeps_position(self):
+        with self.assertTraitChanges(self.model, "values_changed") as result:
+            with self.assertTraitDoesNotChange(
+                self.model, "structure_changed"
+            ):
+                self.model.set_value((2,), (1,), 25.0)
+        self.assertEqual(result.events[0][3], ((2,), (1,), (2,), (1,)))
+
+    def test_set_sort_value_keeps_position(self):
+        with self.assertTraitChanges(self.model, "values_changed") as result:
+            self.model.set_value((2,), (0,), 2.5)
+        self.assertEqual(result.events[0][3], ((2,), (0,), (2,), (0,)))
+
+    def test_set_value_filters_row_out(self):
+        self.model.filters[1] = lambda values: values >= 20.0
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.model.set_value((0,), (1,), 5.0)
+        self.assertEqual(self.column(1), [20.0, 30.0, 50.0])
+
+    def test_incremental_matches_full_sort(self):
+        rng = np.random.default_rng(0)
+        source = ArrayDataModel(
+            data=rng.integers(0, 10, (200, 2)).astype(float),
+            value_type=FloatValue(),
+        )
+        model = SortFilterDataModel(
+            source=source,
+            sort_column=0,
+            sort_ascending=False,
+            filters={1: lambda values: values > 2},
+        )
+        for _ in range(50):
+            row = int(rng.integers(0, 200))
+            column = int(rng.integers(0, 2))
+            source.set_value((row,), (column,), float(rng.integers(0, 10)))
+        incremental = model._permutation.copy()
+        model.invalidate()
+        np.testing.assert_array_equal(incremental, model._permutation)
+
+    def test_incremental_longer_keys(self):
+        people = TraitList([
+            Person(name="a", age=1),
+            Person(name="b", age=2),
+        ])
+        source = RowTableDataModel(
+            data=people,
+            row_header_data=AttributeDataAccessor(attr="age"),
+            column_data=[AttributeDataAccessor(attr="name")],
+        )
+        model = SortFilterDataModel(source=source, sort_column=0)
+
+        source.set_value((0,), (0,), "bz")
+
+        incremental = model._permutation.copy()
+        self.assertEqual(
+            [model.get_value((row,), (0,)) for row in range(2)], ["b", "bz"]
+        )
+        model.invalidate()
+        np.testing.assert_array_equal(incremental, model._permutation)
+
+    def test_source_structure_changed(self):
+        with self.assertTraitChanges(self.model, "structure_changed"):
+            self.source.data = np.array([[2.0, 1.0], [1.0, 2.0]])
+        self.assertEqual(self.column(1), [2.0, 1.0])
+
+    def test_row_table_source(self):
+        people = TraitList([
+            Person(name="Carol", age=30),
+            Person(name="alice", age=40),
+            Person(name="Bob", age=20),
+        ])
+        source = RowTableDataModel(
+            data=people,
+            row_header_data=AttributeDataAccessor(attr="name"),
+            column_data=[
+                AttributeDataAccessor(attr="name"),
+                AttributeDataAccessor(attr="age"),
+            ],
+        )
+        model = SortFilterDataModel(
+            source=source, sort_column=0, sort_key=np.char.lower,
+        )
+        self.assertEqual(
+            [model.get_value((row,), ()) for row in range(3)],
+            ["alice", "Bob", "Carol"],
+        )
+        model.sort_key = None
+        model.sort_column = 1
+        self.assertEqual(model.get_value((0,), ()), "Bob")
+        with self.assertTraitChanges(model, "structure_changed"):
+            people[1] = Person(name="alice", age=10)
+        self.assertEqual(model.get_value((0,), ()), "alice")
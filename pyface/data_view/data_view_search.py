@@ -0,0 +1,310 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Background text search of data models.
+
+This module provides the :class:`DataViewSearch` class, which scans the text
+of a data model in a worker thread using the model's ``iter_matches`` method,
+and delivers the matches to the GUI thread as they are found.
+"""
+
+import bisect
+import logging
+import math
+import threading
+
+from traits.api import (
+    Any, Bool, HasStrictTraits, Instance, Int, List, Str, Tuple, observe
+)
+
+from pyface.data_view.abstract_data_model import AbstractDataModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class DataViewSearch(HasStrictTraits):
+    """ Search the text of a data model in a background thread.
+
+    Calling :meth:`search` cancels any search in progress and starts a new
+    one.  Matches are appended to the ``matches`` list from the GUI thread
+    as they are found, at most once per iteration of the event loop.
+
+    Changes to the data model are handled in the GUI thread.  When values
+    change in a block of sibling rows without children, only the changed
+    items are searched again; if a search is in progress this is done once
+    it finishes.  Other changes to the values, and changes to the structure
+    of the model, clear the matches and run the search again.  The data
+    model is read from the worker thread, so the search may see some
+    changes before they are reported.
+    """
+
+    #: The data model to search.
+    data_model = Instance(AbstractDataModel)
+
+    #: The approximate number of items scanned between deliveries of
+    #: matches and checks for cancellation.
+    chunk_size = Int(1000)
+
+    #: The largest number of changed items which are searched again, rather
+    #: than running the whole search again.
+    rescan_limit = Int(10000)
+
+    #: The text of the current or most recent search.
+    text = Str()
+
+    #: Whether the current or most recent search matches case.
+    match_case = Bool()
+
+    #: The items found so far as (row, column) pairs, in the order of the
+    #: data model's ``iter_items``.
+    matches = List(Tuple)
+
+    #: Whether a search is in progress.
+    searching = Bool()
+
+    # Private traits --------------------------------------------------------
+
+    #: Counter identifying the current search; deliveries from other
+    #: searches are discarded.
+    _generation = Int()
+
+    #: Set to stop the current search's worker thread.
+    _cancelled = Instance(threading.Event)
+
+    #: The worker thread of the current search.
+    _thread = Instance(threading.Thread)
+
+    #: Matches found by the worker which have not been delivered.
+    _pending = Any(factory=list)
+
+    #: Lock protecting the pending matches and the generation.
+    _lock = Any(factory=threading.Lock)
+
+    #: The items whose values changed during the current search, to be
+    #: searched again when it finishes.
+    _changed = Any(factory=set)
+
+    # ------------------------------------------------------------------------
+    # DataViewSearch interface
+    # ------------------------------------------------------------------------
+
+    def search(self, text, match_case=False):
+        """ Start searching for items whose text contains some text.
+
+        Any search in progress is cancelled and the matches are cleared.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.  Nothing is matched by the empty string.
+        match_case : bool
+            Whether the case of the text must match.
+        """
+        # import here to avoid toolkit selection on import
+        from pyface.gui import GUI
+
+        self.cancel()
+        self.text = text
+        self.match_case = match_case
+        self.matches = []
+        if not text or self.data_model is None:
+            return
+
+        cancelled = threading.Event()
+        self._cancelled = cancelled
+        self.searching = True
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(
+                GUI, self.data_model, self._generation, cancelled, text,
+                match_case,
+            ),
+            name="DataViewSearch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def cancel(self):
+        """ Stop the search in progress, keeping the matches found so far.
+        """
+        if self._cancelled is not None:
+            self._cancelled.set()
+            self._cancelled = None
+        with self._lock:
+            self._generation += 1
+            self._pending = []
+        self._changed = set()
+        self.searching = False
+
+    def wait(self, timeout=None):
+        """ Wait for the worker thread of the current search to finish.
+
+        The matches are only delivered once the GUI event loop runs.
+
+        Parameters
+        ----------
+        timeout : float or None
+            The maximum time to wait in seconds, or None to wait until the
+            worker thread finishes.
+
+        Returns
+        -------
+        finished : bool
+            Whether the worker thread has finished.
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    # ------------------------------------------------------------------------
+    # Private interface
+    # ------------------------------------------------------------------------
+
+    def _run(self, gui, data_model, generation, cancelled, text,
+             match_case):
+        """ Scan the data model for matches in the worker thread. """
+        try:
+            for matches in data_model.iter_matches(
+                text, match_case=match_case, chunk_size=self.chunk_size
+            ):
+                if cancelled.is_set():
+                    return
+                if matches:
+                    with self._lock:
+                        if generation != self._generation:
+                            return
+                        self._pending.extend(matches)
+                    gui.invoke_later_coalesced(
+                        (self, "deliver"), self._deliver, generation
+                    )
+        except Exception:
+            logger.exception("Search for %r failed", text)
+        finally:
+            if not cancelled.is_set():
+                gui.invoke_later(self._finish, generation)
+
+    def _deliver(self, generation):
+        """ Append the pending matches in the GUI thread. """
+        with self._lock:
+            if generation != self._generation:
+                return
+            pending, self._pending = self._pending, []
+        if pending:
+            self.matches.extend(pending)
+
+    def _finish(self, generation):
+        """ Mark the search as finished in the GUI thread. """
+        self._deliver(generation)
+        if generation == self._generation:
+            self._cancelled = None
+            changed, self._changed = self._changed, set()
+            if changed:
+                self._rescan(changed)
+            self.searching = False
+
+    def _rescan(self, items, low=0, high=None):
+        """ Search some items again and update the matches in place.
+
+        Only the matches from ``low`` up to ``high`` are updated, so they
+        must include any matches of the items.
+        """
+        text = self.text if self.match_case else self.text.lower()
+        found = self.data_model._match_items(
+            sorted(items), text, self.match_case
+        )
+        matches = self.matches
+        if high is None:
+            high = len(matches)
+        kept = [match for match in matches[low:high] if match not in items]
+        # the matches are in preorder, which is the order of the tuples
+        updated = sorted(kept + found)
+        if updated != matches[low:high]:
+            matches[low:high] = updated
+
+    def _restart(self, generation):
+        """ Run the most recent search again in the GUI thread. """
+        if generation == self._generation and self.text:
+            self.search(self.text, self.match_case)
+
+    @observe('data_model')
+    def _data_model_updated(self, event):
+        """ Stop searching and clear matches when the model is replaced. """
+        self.cancel()
+        self.matches = []
+
+    @observe('data_model:structure_changed', dispatch='ui')
+    def _data_model_structure_updated(self, event):
+        """ Clear matches and search again when the structure changes. """
+        self._restart_later()
+
+    @observe('data_model:values_changed', dispatch='ui')
+    def _data_model_values_updated(self, event):
+        """ Search the changed items again when values change. """
+        if not self.text:
+            return
+        top, left, bottom, right = event.new
+        if len(top) == 0 and len(bottom) == 0:
+            # column headers are not searched
+            return
+        if (
+            len(top) == 0
+            or len(top) != len(bottom)
+            or top[:-1] != bottom[:-1]
+        ):
+            self._restart_later()
+            return
+
+        parent = tuple(top[:-1])
+        rows = [parent + (row,) for row in range(top[-1], bottom[-1] + 1)]
+        if len(left) == 0 and len(right) == 0:
+            # a change to whole rows may change every column
+            first, last = -1, self.data_model.get_column_count() - 1
+        else:
+            first = left[0] if left else -1
+            last = right[0] if right else -1
+        columns = [
+            (column,) if column >= 0 else ()
+            for column in range(first, last + 1)
+        ]
+        if len(rows) * len(columns) > self.rescan_limit or any(
+            self.data_model.can_have_children(row) for row in rows
+        ):
+            # changes to rows with children may also change the children,
+            # eg. when an array data model's array is replaced
+            self._restart_later()
+            return
+        items = {(row, column) for row in rows for column in columns}
+        if self.searching:
+            self._changed.update(items)
+        else:
+            # the matches of the items lie between those of the first row's
+            # items and those of the last row's items
+            matches = self.matches
+            low = bisect.bisect_left(matches, (rows[0], ()))
+            high = bisect.bisect_right(matches, (rows[-1], (math.inf,)))
+            self._rescan(items, low, high)
+
+    def _restart_later(self):
+        """ Clear the matches and run the search again from the GUI thread.
+
+        Restarts requested before the search runs again are merged.
+        """
+        # import here to avoid toolkit selection on import
+        from pyface.gui import GUI
+
+        self.cancel()
+        self.matches = []
+        if self.text:
+            GUI.invoke_later_coalesced(
+                (self, "restart"), self._restart, self._generation
+            )
@@ -63,6 +63,13 @@ class RowExporter(AbstractDataExporter):
         if self.row_headers:
             columns = [()] + columns
 
+        if self.is_text and columns:
+            # format text a column at a time
+            values = [
+                self.get_values(model, rows, column) for column in columns
+            ]
+            return [list(row_values) for row_values in zip(*values)]
+
         return [
             [self.get_value(model, row, column,) for column in columns]
             for row in rows
@@ -12,12 +12,13 @@ from contextlib import contextmanager
 import logging
 
 from traits.api import (
-    Bool, Enum, HasTraits, Instance, List, Property,
-    TraitError, Tuple, cached_property,
+    Bool, ComparisonMode, Enum, Event, HasTraits, Instance, Int, List,
+    Property, TraitError, Tuple, cached_property, observe,
 )
 
 from pyface.data_view.abstract_data_model import AbstractDataModel
 from pyface.data_view.abstract_data_exporter import AbstractDataExporter
+from pyface.data_view.data_view_search import DataViewSearch
 from pyface.i_drop_handler import IDropHandler
 from pyface.i_layout_widget import ILayoutWidget
 
@@ -52,9 +53,68 @@ class IDataViewWidget(ILayoutWidget):
     #: The selected indices in the view.
     selection = List(Tuple)
 
+    #: Event fired when the user changes the selection in the view.  The
+    #: value is a pair of lists ``(added, removed)`` of selection ranges.
+    #: Each range is a ``(top, left, bottom, right)`` tuple of inclusive
+    #: bounds on the row and column indices of the selected elements, as for
+    #: ``AbstractDataModel.values_changed``.  Rows in a range share a parent.
+    selection_changed = Event()
+
     #: Exporters available for the DataViewWidget.
     exporters = List(Instance(AbstractDataExporter))
 
+    #: The items whose text matches the most recent search, in order.
+    search_matches = List(Tuple)
+
+    #: Whether a search is in progress.
+    searching = Bool()
+
+    #: The index in ``search_matches`` of the current match, or -1.
+    current_match = Int(-1)
+
+    def search(self, text, match_case=False):
+        """ Start searching the text of the data model in the background.
+
+        Matches are added to ``search_matches`` and highlighted in the view
+        as they are found.  Any search in progress is cancelled.  When values
+        of the data model change the changed items are searched again, and
+        when its structure changes the search is run again.
+
+        The wx backend does not highlight matches, but ``next_match`` and
+        ``previous_match`` still scroll to them.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        match_case : bool
+            Whether the case of the text must match.
+        """
+
+    def cancel_search(self):
+        """ Stop the search in progress, keeping the matches found so far.
+        """
+
+    def next_match(self):
+        """ Make the next match current and scroll it into view.
+
+        Returns
+        -------
+        match : tuple or None
+            The (row, column) pair of the match, or None if there are no
+            matches.
+        """
+
+    def previous_match(self):
+        """ Make the previous match current and scroll it into view.
+
+        Returns
+        -------
+        match : tuple or None
+            The (row, column) pair of the match, or None if there are no
+            matches.
+        """
+
 
 class MDataViewWidget(HasTraits):
     """ Mixin class for data view widgets. """
@@ -74,20 +134,51 @@ class MDataViewWidget(HasTraits):
     drop_handlers = List(Instance(IDropHandler, allow_none=False))
 
     #: The selected indices in the view.  This should never be mutated, any
-    #: changes should be by replacement of the entire list.
-    selection = Property(observe='_selection.items')
+    #: changes should be by replacement of the entire list.  When the user
+    #: changes the selection, the list is only built when it is requested.
+    selection = Property(
+        observe='_selection.items,_control_selection_updated'
+    )
+
+    #: Event fired when the user changes the selection in the view.  The
+    #: value is a pair of lists ``(added, removed)`` of selection ranges.
+    #: Each range is a ``(top, left, bottom, right)`` tuple of inclusive
+    #: bounds on the row and column indices of the selected elements, as for
+    #: ``AbstractDataModel.values_changed``.  Rows in a range share a parent.
+    selection_changed = Event()
 
     #: Exporters available for the DataViewWidget.
     exporters = List(Instance(AbstractDataExporter))
 
+    #: The items whose text matches the most recent search, in order.
+    search_matches = Property(List(Tuple), observe='_search.matches.items')
+
+    #: Whether a search is in progress.
+    searching = Property(Bool(), observe='_search.searching')
+
+    #: The index in ``search_matches`` of the current match, or -1.
+    current_match = Int(-1)
+
     # Private traits --------------------------------------------------------
 
+    #: The background search of the data model.
+    _search = Instance(DataViewSearch, ())
+
     #: Whether the selection is currently being updated.
     _selection_updating_flag = Bool()
 
     #: The selected indices in the view.  This should never be mutated, any
-    #: changes should be by replacement of the entire list.
-    _selection = List(Tuple)
+    #: changes should be by replacement of the entire list.  Setting a list
+    #: equal to the current one still updates the control, since the control
+    #: may have changed since this was set.
+    _selection = List(Tuple, comparison_mode=ComparisonMode.identity)
+
+    #: Whether the control's selection has changed since ``_selection`` was
+    #: set, so that the selection should be read from the control.
+    _selection_from_control = Bool()
+
+    #: Event fired when the control's selection changes.
+    _control_selection_updated = Event()
 
     # ------------------------------------------------------------------------
     # MDataViewWidget Interface
@@ -212,11 +303,160 @@ class MDataViewWidget(HasTraits):
         """ Handle a toolkit even that  changes the selection.
 
         This is designed to be usable as a callback for a toolkit event
-        or signal handler, so it accepts any arguments.
+        or signal handler, so it accepts any arguments.  It reads the whole
+        selection from the control; toolkits which report the ranges that
+        changed should call ``_report_selection_changed`` instead.
         """
         if not self._selection_updating_flag:
             with self._selection_updating():
-                self._selection = self._get_control_selection()
+                old_selection = self.selection
+                selection = self._get_control_selection()
+                self._selection_from_control = False
+                self._selection = selection
+            old_items = set(old_selection)
+            new_items = set(selection)
+            added = [
+                (row, column, row, column)
+                for row, column in selection
+                if (row, column) not in old_items
+            ]
+            removed = [
+                (row, column, row, column)
+                for row, column in old_selection
+                if (row, column) not in new_items
+            ]
+            if added or removed:
+                self.selection_changed = (added, removed)
+
+    def _report_selection_changed(self, added, removed):
+        """ Record that the user has changed the control's selection.
+
+        The selection is not read from the control until it is requested.
+
+        Parameters
+        ----------
+        added : list of tuple
+            The selection ranges which were added to the selection.
+        removed : list of tuple
+            The selection ranges which were removed from the selection.
+        """
+        self._selection_from_control = True
+        self._control_selection_updated = True
+        self.selection_changed = (added, removed)
+
+    def _store_control_selection(self):
+        """ Copy a selection that is held by the control to ``_selection``.
+
+        This should be called before the control is destroyed or loses its
+        selection.
+        """
+        if self._selection_from_control and self.control is not None:
+            with self._selection_updating():
+                selection = self._get_control_selection()
+                self._selection_from_control = False
+                self._selection = selection
+
+    def search(self, text, match_case=False):
+        """ Start searching the text of the data model in the background.
+
+        Matches are added to ``search_matches`` and highlighted in the view
+        as they are found.  Any search in progress is cancelled.  When values
+        of the data model change the changed items are searched again, and
+        when its structure changes the search is run again.
+
+        The wx backend does not highlight matches, but ``next_match`` and
+        ``previous_match`` still scroll to them.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for.
+        match_case : bool
+            Whether the case of the text must match.
+        """
+        self._search.search(text, match_case)
+
+    def cancel_search(self):
+        """ Stop the search in progress, keeping the matches found so far.
+        """
+        self._search.cancel()
+
+    def next_match(self):
+        """ Make the next match current and scroll it into view.
+
+        Returns
+        -------
+        match : tuple or None
+            The (row, column) pair of the match, or None if there are no
+            matches.
+        """
+        return self._go_to_match(1)
+
+    def previous_match(self):
+        """ Make the previous match current and scroll it into view.
+
+        Returns
+        -------
+        match : tuple or None
+            The (row, column) pair of the match, or None if there are no
+            matches.
+        """
+        return self._go_to_match(-1)
+
+    def _search_matches_updated(self, event):
+        """ Observer for the search matches being replaced. """
+        if self.control is not None:
+            self._set_control_search_matches(event.new)
+
+    def _search_matches_items_updated(self, event):
+        """ Observer for search matches being found or updated. """
+        if self.control is not None:
+            if event.removed:
+                self._remove_control_search_matches(event.removed)
+            if event.added:
+                self._add_control_search_matches(event.added)
+
+    def _set_control_search_matches(self, matches):
+        """ Toolkit specific method to set the highlighted search matches.
+
+        Parameters
+        ----------
+        matches : list of pairs of row and column indices
+            The items matching the search.
+        """
+        raise NotImplementedError()
+
+    def _add_control_search_matches(self, matches):
+        """ Toolkit specific method to highlight more search matches.
+
+        Parameters
+        ----------
+        matches : list of pairs of row and column indices
+            The newly found items matching the search.
+        """
+        raise NotImplementedError()
+
+    def _remove_control_search_matches(self, matches):
+        """ Toolkit specific method to stop highlighting search matches.
+
+        Parameters
+        ----------
+        matches : list of pairs of row and column indices
+            The items which no longer match the search.
+        """
+        raise NotImplementedError()
+
+    def _scroll_control_to(self, row, column):
+        """ Toolkit specific method to make an item current and visible.
+
+        Parameters
+        ----------
+        row : sequence of int
+            The index of the row of the item.
+        column : sequence of int
+            The index of the column of the item.
+        """
+        raise NotImplementedError()
 
     # ------------------------------------------------------------------------
     # Widget Interface
@@ -242,6 +482,7 @@ class MDataViewWidget(HasTraits):
         self._set_control_selection_mode(self.selection_mode)
         self._set_control_selection_type(self.selection_type)
         self._set_control_selection(self.selection)
+        self._set_control_search_matches(self.search_matches)
 
     def _add_event_listeners(self):
         logger.debug('Adding DataViewWidget listeners')
@@ -266,12 +507,23 @@ class MDataViewWidget(HasTraits):
             '_selection.items',
             dispatch='ui',
         )
+        self.observe(
+            self._search_matches_updated,
+            '_search:matches',
+            dispatch='ui',
+        )
+        self.observe(
+            self._search_matches_items_updated,
+            '_search:matches:items',
+            dispatch='ui',
+        )
         if self.control is not None:
             self._observe_control_selection()
 
     def _remove_event_listeners(self):
         logger.debug('Removing DataViewWidget listeners')
         if self.control is not None:
+            self._store_control_selection()
             self._observe_control_selection(remove=True)
         self.observe(
             self._header_visible_updated,
@@ -297,6 +549,18 @@ class MDataViewWidget(HasTraits):
             dispatch='ui',
             remove=True,
         )
+        self.observe(
+            self._search_matches_updated,
+            '_search:matches',
+            dispatch='ui',
+            remove=True,
+        )
+        self.observe(
+            self._search_matches_items_updated,
+            '_search:matches:items',
+            dispatch='ui',
+            remove=True,
+        )
         super()._remove_event_listeners()
 
     # ------------------------------------------------------------------------
@@ -315,10 +579,60 @@ class MDataViewWidget(HasTraits):
             finally:
                 self._selection_updating_flag = False
 
+    def _go_to_match(self, step):
+        """ Move the current match by a step, wrapping around. """
+        matches = self.search_matches
+        if len(matches) == 0:
+            return None
+        if self.current_match < 0 and step < 0:
+            self.current_match = len(matches) - 1
+        else:
+            self.current_match = (self.current_match + step) % len(matches)
+        row, column = matches[self.current_match]
+        if self.control is not None:
+            self._scroll_control_to(row, column)
+        return row, column
+
+    # Trait observers
+
+    @observe('data_model')
+    def _update_search_data_model(self, event):
+        self._search.data_model = event.new
+
+    @observe('_search:matches')
+    def _reset_current_match(self, event):
+        self.current_match = -1
+
+    @observe('_search:matches:items')
+    def _update_current_match(self, event):
+        current = self.current_match
+        index = event.index
+        if current < index:
+            return
+        if current >= index + len(event.removed):
+            self.current_match = current + len(event.added) - len(
+                event.removed
+            )
+        else:
+            # the current match was updated; follow it if it still matches
+            match = event.removed[current - index]
+            if match in event.added:
+                self.current_match = index + event.added.index(match)
+            else:
+                self.current_match = -1
+
     # Trait property handlers
 
+    def _get_search_matches(self):
+        return self._search.matches
+
+    def _get_searching(self):
+        return self._search.searching
+
     @cached_property
     def _get_selection(self):
+        if self._selection_from_control and self.control is not None:
+            return self._get_control_selection()
         return self._selection
 
     def _set_selection(self, selection):
@@ -368,4 +682,5 @@ class MDataViewWidget(HasTraits):
                         "Invalid column index {!r}".format(column)
                     )
 
+        self._selection_from_control = False
         self._selection = selection
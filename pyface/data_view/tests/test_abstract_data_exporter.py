@@ -44,6 +44,9 @@ class TestAbstractDataExporter(TestCase):
         self.value_type = Mock()
         self.value_type.has_text = Mock(return_value=True)
         self.value_type.get_text = Mock(return_value='text')
+        self.value_type.get_texts = Mock(
+            side_effect=lambda model, rows, column: ['text'] * len(rows)
+        )
         self.value_type.has_editor_value = Mock(return_value=True)
         self.value_type.get_editor_value = Mock(return_value=1)
 
@@ -117,3 +120,33 @@ class TestAbstractDataExporter(TestCase):
         value = exporter.get_value(self.model, (0,), (0,))
 
         self.assertEqual(value, 0.0)
+
+    def test_get_values_is_text(self):
+        other_value_type = Mock()
+        other_value_type.get_texts = Mock(return_value=['other'])
+        self.model.get_value_type = Mock(
+            side_effect=lambda row, column: (
+                other_value_type if row == (1,) else self.value_type
+            )
+        )
+        exporter = TrivialExporter(
+            format=trivial_format,
+            is_text=True,
+        )
+
+        values = exporter.get_values(self.model, [(0,), (1,), (2,)], (0,))
+
+        self.assertEqual(values, ['text', 'other', 'text'])
+        self.value_type.get_texts.assert_called_once_with(
+            self.model, [(0,), (2,)], (0,)
+        )
+
+    def test_get_values_is_not_text(self):
+        exporter = TrivialExporter(
+            format=trivial_format,
+            is_text=False,
+        )
+
+        values = exporter.get_values(self.model, [(0,), (1,)], (0,))
+
+        self.assertEqual(values, [1, 1])
@@ -0,0 +1,200 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import sys
+import threading
+import time
+from unittest import TestCase
+
+from traits.api import Int
+from traits.testing.api import UnittestTools
+
+from pyface.gui import GUI
+
+from pyface.data_view.abstract_data_model import AbstractDataModel
+from pyface.data_view.index_manager import TupleIndexManager
+from pyface.data_view.value_types.api import IntValue
+
+
+class ChainDataModel(AbstractDataModel):
+    """ A data model where every row has two children, up to some depth.
+
+    The first child of each row has children, the second child is a leaf.
+    """
+
+    #: The depth of the deepest rows.
+    depth = Int(10)
+
+    def get_column_count(self):
+        return 1
+
+    def can_have_children(self, row):
+        return len(row) < self.depth and (len(row) == 0 or row[-1] == 0)
+
+    def get_row_count(self, row):
+        return 2 if self.can_have_children(row) else 0
+
+    def get_value(self, row, column):
+        return len(row)
+
+    def get_value_type(self, row, column):
+        return IntValue()
+
+    def _index_manager_default(self):
+        return TupleIndexManager()
+
+
+class TestAbstractDataModelTraversal(TestCase):
+
+    def test_iter_rows_deep(self):
+        depth = sys.getrecursionlimit() * 2
+        model = ChainDataModel(depth=depth)
+
+        rows = list(model.iter_rows())
+
+        self.assertEqual(len(rows), 2 * depth + 1)
+        self.assertEqual(rows[:4], [(), (0,), (0, 0), (0, 0, 0)])
+        self.assertEqual(rows[-2:], [(0, 1), (1,)])
+
+    def test_iter_rows_breadth_first_deep(self):
+        depth = sys.getrecursionlimit() * 2
+        model = ChainDataModel(depth=depth)
+
+        rows = list(model.iter_rows(breadth_first=True))
+
+        self.assertEqual(len(rows), 2 * depth + 1)
+        self.assertEqual([len(row) for row in rows[:5]], [0, 1, 1, 2, 2])
+
+    def test_iter_row_batches_matches_iter_rows(self):
+        model = ChainDataModel(depth=5)
+
+        for breadth_first in [False, True]:
+            for batch_size in [None, 1]:
+                with self.subTest(
+                    breadth_first=breadth_first, batch_size=batch_size
+                ):
+                    rows = [
+                        parent + (child,)
+                        for parent, children in model.iter_row_batches(
+                            breadth_first=breadth_first,
+                            batch_size=batch_size,
+                        )
+                        for child in children
+                    ]
+                    self.assertEqual(
+                        rows,
+                        list(model.iter_rows(breadth_first=breadth_first))[1:]
+                    )
+
+    def test_iter_rows_prune_and_max_depth(self):
+        model = ChainDataModel(depth=5)
+
+        rows = list(model.iter_rows(prune=lambda row: len(row) == 2))
+        self.assertEqual(
+            rows, [(), (0,), (0, 0), (0, 1), (1,)]
+        )
+
+        rows = list(model.iter_rows(max_depth=2))
+        self.assertEqual(rows, [(), (0,), (0, 0), (0, 1), (1,)])
+
+    def test_iter_matches_deep(self):
+        depth = sys.getrecursionlimit() * 2
+        model = ChainDataModel(depth=depth)
+
+        matches = [
+            item
+            for chunk in model.iter_matches(str(depth))
+            for item in chunk
+        ]
+
+        # only the two deepest rows have the depth as their value
+        deepest = (0,) * (depth - 1)
+        self.assertEqual(
+            matches,
+            [
+                (deepest + (0,), ()),
+                (deepest + (0,), (0,)),
+                (deepest + (1,), ()),
+                (deepest + (1,), (0,)),
+            ]
+        )
+
+
+class TestAbstractDataModelValuesChanged(UnittestTools, TestCase):
+
+    def setUp(self):
+        self.gui = GUI()
+        self.model = ChainDataModel(depth=5)
+
+    def test_report_values_changed(self):
+        with self.assertTraitChanges(
+                self.model, "values_changed", count=1) as result:
+            self.model.report_values_changed((1,), (0,), (1,), (0,))
+
+        self.assertEqual(result.events[0][3], ((1,), (0,), (1,), (0,)))
+
+    def test_batch_values_changed_nested(self):
+        with self.assertTraitChanges(
+                self.model, "values_changed", count=1) as result:
+            with self.model.batch_values_changed():
+                self.model.report_values_changed((0, 1), (), (0, 1), ())
+                with self.model.batch_values_changed():
+                    self.model.report_values_changed(
+                        (0, 0), (0,), (0, 0), (0,)
+                    )
+                self.assertEqual(result.events, [])
+
+        self.assertEqual(result.events[0][3], ((0, 0), (), (0, 1), (0,)))
+
+    def test_batch_values_changed_structure_changed(self):
+        with self.assertTraitDoesNotChange(self.model, "values_changed"):
+            with self.model.batch_values_changed():
+                self.model.report_values_changed((1,), (0,), (1,), (0,))
+                self.model.structure_changed = True
+
+    def test_throttle_values_changed(self):
+        self.model.throttle_values_changed = True
+        events = []
+        self.model.observe(
+            lambda event: events.append(event.new), "values_changed"
+        )
+
+        def report(row):
+            for i in range(1000):
+                self.model.report_values_changed(
+                    (0, row), (0,), (0, row), (0,)
+                )
+
+        threads = [
+            threading.Thread(target=report, args=(row,)) for row in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(events, [])
+
+        deadline = time.monotonic() + 5.0
+        while not events and time.monotonic() < deadline:
+            self.gui.process_events()
+
+        self.assertEqual(events, [((0, 0), (0,), (0, 1), (0,))])
+
+    def test_throttle_values_changed_turned_off(self):
+        self.model.throttle_values_changed = True
+        self.model.report_values_changed((1,), (0,), (1,), (0,))
+
+        with self.assertTraitChanges(
+                self.model, "values_changed", count=1) as result:
+            self.model.throttle_values_changed = False
+
+        self.assertEqual(result.events[0][3], ((1,), (0,), (1,), (0,)))
+        # the scheduled flush has nothing left to do
+        self.gui.process_events()
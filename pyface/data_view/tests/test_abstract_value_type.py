@@ -71,6 +71,11 @@ class TestAbstractValueType(UnittestTools, TestCase):
         result = value_type.get_text(self.model, [0], [0])
         self.assertEqual(result, "1.0")
 
+    def test_get_texts(self):
+        value_type = ValueType()
+        result = value_type.get_texts(self.model, [[0], [1]], [0])
+        self.assertEqual(result, ["1.0", "1.0"])
+
     def test_set_text(self):
         value_type = ValueType()
         with self.assertRaises(DataViewSetError):
@@ -41,6 +41,7 @@ class TestApi(unittest.TestCase):
             text_row_format,
             DataViewError,
             DataViewGetError,
+            DataViewSearch,
             DataViewSetError,
             DataViewWidget,
             DataWrapper,
@@ -61,4 +62,4 @@ class TestApi(unittest.TestCase):
             for name in dir(api)
             if not name.startswith("_")
         }
-        self.assertEqual(len(items_in_api), 34)
+        self.assertEqual(len(items_in_api), 35)
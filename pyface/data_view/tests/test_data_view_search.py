@@ -0,0 +1,197 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import threading
+import unittest
+
+from traits.api import Instance
+from traits.trait_list_object import TraitList
+from traits.testing.api import UnittestTools
+
+from pyface.gui import GUI
+from pyface.data_view.data_models.data_accessors import AttributeDataAccessor
+from pyface.data_view.data_models.row_table_data_model import (
+    RowTableDataModel
+)
+from pyface.data_view.data_view_search import DataViewSearch
+from pyface.data_view.value_types.api import TextValue
+
+
+class DataItem:
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+class BlockingModel(RowTableDataModel):
+    """ A model whose search blocks after the first chunk. """
+
+    release = Instance(threading.Event, ())
+
+    def iter_matches(self, *args, **kwargs):
+        for i, matches in enumerate(super().iter_matches(*args, **kwargs)):
+            if i == 1:
+                self.release.wait(5.0)
+            yield matches
+
+
+class TestDataViewSearch(UnittestTools, unittest.TestCase):
+
+    def setUp(self):
+        self.gui = GUI()
+        self.data = TraitList([
+            DataItem("apple", "pear"),
+            DataItem("plum", "Apple pie"),
+            DataItem("fig", "date"),
+        ])
+        self.model = RowTableDataModel(
+            data=self.data,
+            row_header_data=AttributeDataAccessor(attr="a", value_type=TextValue()),
+            column_data=[
+                AttributeDataAccessor(attr="b", value_type=TextValue())
+            ],
+        )
+        self.search = DataViewSearch(data_model=self.model, chunk_size=2)
+
+    def tearDown(self):
+        self.search.cancel()
+        self.search.wait(5.0)
+        self.gui.process_events()
+
+    def wait_for_search(self):
+        self.assertTrue(self.search.wait(5.0))
+        for _ in range(10):
+            if not self.search.searching:
+                break
+            self.gui.process_events()
+
+    def test_search(self):
+        self.search.search("apple")
+        self.assertTrue(self.search.searching)
+        self.wait_for_search()
+
+        self.assertFalse(self.search.searching)
+        self.assertEqual(
+            self.search.matches, [((0,), ()), ((1,), (0,))]
+        )
+
+    def test_search_match_case(self):
+        self.search.search("apple", match_case=True)
+        self.wait_for_search()
+
+        self.assertEqual(self.search.matches, [((0,), ())])
+
+    def test_search_empty_text(self):
+        self.search.search("")
+
+        self.assertFalse(self.search.searching)
+        self.assertEqual(self.search.matches, [])
+
+    def test_new_search_cancels(self):
+        self.model = BlockingModel(
+            data=self.data,
+            row_header_data=AttributeDataAccessor(attr="a", value_type=TextValue()),
+            column_data=[
+                AttributeDataAccessor(attr="b", value_type=TextValue())
+            ],
+        )
+        release = self.model.release
+        self.search.data_model = self.model
+
+        self.search.search("p")
+        old_thread = self.search._thread
+        self.search.search("date")
+        release.set()
+        old_thread.join(5.0)
+        self.wait_for_search()
+
+        self.assertEqual(self.search.matches, [((2,), (0,))])
+
+    def test_model_changed(self):
+        self.search.search("apple")
+        self.wait_for_search()
+
+        self.data.append(DataItem("crab apple", "quince"))
+
+        # the matches are cleared, and the search is run again later
+        self.assertEqual(self.search.matches, [])
+        self.assertFalse(self.search.searching)
+        self.gui.process_events()
+        self.assertTrue(self.search.searching)
+        self.wait_for_search()
+        self.assertEqual(
+            self.search.matches, [((0,), ()), ((1,), (0,)), ((3,), ())]
+        )
+
+    def test_model_changed_after_cancel(self):
+        self.search.search("apple")
+        self.wait_for_search()
+
+        self.data.append(DataItem("crab apple", "quince"))
+        self.search.cancel()
+        self.gui.process_events()
+
+        self.assertFalse(self.search.searching)
+        self.assertEqual(self.search.matches, [])
+
+    def test_values_changed(self):
+        self.search.search("apple")
+        self.wait_for_search()
+
+        with self.assertTraitDoesNotChange(self.search, "searching"):
+            self.model.set_value((2,), (0,), "apple tart")
+            self.model.set_value((1,), (0,), "pie")
+
+        self.assertEqual(
+            self.search.matches, [((0,), ()), ((2,), (0,))]
+        )
+
+    def test_column_header_changed(self):
+        self.search.search("apple")
+        self.wait_for_search()
+
+        self.model.values_changed = ((), (0,), (), (0,))
+
+        self.assertFalse(self.search.searching)
+        self.assertEqual(
+            self.search.matches, [((0,), ()), ((1,), (0,))]
+        )
+
+    def test_values_changed_while_searching(self):
+        self.model = BlockingModel(
+            data=self.data,
+            row_header_data=AttributeDataAccessor(attr="a", value_type=TextValue()),
+            column_data=[
+                AttributeDataAccessor(attr="b", value_type=TextValue())
+            ],
+        )
+        release = self.model.release
+        self.search.data_model = self.model
+
+        self.search.search("date")
+        thread = self.search._thread
+        # the first row has been searched, but the search is not finished
+        self.model.set_value((0,), (0,), "dated")
+        self.model.set_value((2,), (0,), "fig roll")
+        release.set()
+        self.wait_for_search()
+
+        # the search ran to the end, and the changed items were searched
+        self.assertIs(self.search._thread, thread)
+        self.assertEqual(self.search.matches, [((0,), (0,))])
+
+    def test_replace_data_model(self):
+        self.search.search("apple")
+        self.wait_for_search()
+
+        self.search.data_model = RowTableDataModel()
+
+        self.assertEqual(self.search.matches, [])
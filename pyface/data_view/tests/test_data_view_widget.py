@@ -334,6 +334,105 @@ class TestWidget(LayoutWidgetMixin, unittest.TestCase):
             [((1, 4), ())],
         )
 
+    def test_selection_changed(self):
+        self._create_widget_control()
+        self.widget.selection = [((1, 4), ())]
+        self.gui.process_events()
+
+        with self.assertTraitChanges(
+                self.widget, 'selection_changed', count=1) as result:
+            self.widget._set_control_selection([((1, 2), ()), ((1, 3), ())])
+            self.gui.process_events()
+
+        added, removed = result.events[0][3]
+        added_rows = [
+            top[:-1] + (row,)
+            for top, _, bottom, _ in added
+            for row in range(top[-1], bottom[-1] + 1)
+        ]
+        self.assertEqual(sorted(added_rows), [(1, 2), (1, 3)])
+        self.assertEqual(removed, [((1, 4), (), (1, 4), ())])
+        self.assertEqual(self.widget.selection, [((1, 2), ()), ((1, 3), ())])
+
+        # the control's selection is kept when the control is destroyed
+        self.widget.destroy()
+        self.assertEqual(self.widget.selection, [((1, 2), ()), ((1, 3), ())])
+
+    def test_search(self):
+        self._create_widget_control()
+
+        self.widget.search("17")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+
+        # matches 17 and 117
+        self.assertEqual(
+            self.widget.search_matches, [((0, 2), (5,)), ((3, 4), (3,))]
+        )
+        self.assertEqual(self.widget.next_match(), ((0, 2), (5,)))
+        self.assertEqual(self.widget.next_match(), ((3, 4), (3,)))
+        self.assertEqual(self.widget.next_match(), ((0, 2), (5,)))
+        self.assertEqual(self.widget.previous_match(), ((3, 4), (3,)))
+        self.assertEqual(self.widget.current_match, 1)
+
+    def test_search_model_changed(self):
+        self._create_widget_control()
+        self.widget.search("17")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+        self.widget.next_match()
+
+        self.model.data = np.arange(1.0, 121.0).reshape(4, 5, 6)
+
+        # the old matches are cleared at once
+        self.assertEqual(self.widget.search_matches, [])
+        self.assertEqual(self.widget.current_match, -1)
+
+        # and the search is run again on the new values
+        for _ in range(10):
+            self.gui.process_events()
+            if self.widget.searching:
+                break
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+        self.assertEqual(
+            self.widget.search_matches, [((0, 2), (4,)), ((3, 4), (2,))]
+        )
+
+    def test_search_value_changed(self):
+        self._create_widget_control()
+        self.widget.search("17")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+        self.widget.next_match()
+        self.widget.next_match()
+
+        self.model.set_value((0, 2), (5,), 0.0)
+
+        # the current match follows its item
+        self.assertEqual(self.widget.search_matches, [((3, 4), (3,))])
+        self.assertEqual(self.widget.current_match, 0)
+
+    def test_search_no_matches(self):
+        self.widget.search("no match")
+        self.assertTrue(self.widget._search.wait(5.0))
+        self.gui.process_events()
+
+        self.assertEqual(self.widget.search_matches, [])
+        self.assertIsNone(self.widget.next_match())
+
     def test_selection_updating_context_manager(self):
         self.assertFalse(self.widget._selection_updating_flag)
 
@@ -0,0 +1,97 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pyface.data_view.value_type_cache import ColumnValueTypeCache
+
+
+def create_model(column_value_type):
+    model = Mock()
+    model.get_value_type.return_value = "cell"
+    model.get_column_value_type.return_value = column_value_type
+    return model
+
+
+class TestColumnValueTypeCache(TestCase):
+
+    def setUp(self):
+        self.cache = ColumnValueTypeCache()
+
+    def test_uniform_column_looked_up_once(self):
+        model = create_model("column")
+
+        for row in range(10):
+            result = self.cache.get_value_type(model, (row,), (0,))
+            self.assertEqual(result, "column")
+
+        model.get_column_value_type.assert_called_once_with((0,))
+        model.get_value_type.assert_not_called()
+
+    def test_varying_column(self):
+        model = create_model(None)
+
+        for row in range(3):
+            result = self.cache.get_value_type(model, (row,), (1,))
+            self.assertEqual(result, "cell")
+
+        model.get_column_value_type.assert_called_once_with((1,))
+        self.assertEqual(model.get_value_type.call_count, 3)
+
+    def test_header_row_not_cached(self):
+        model = create_model("column")
+
+        result = self.cache.get_value_type(model, (), (0,))
+
+        self.assertEqual(result, "cell")
+        model.get_column_value_type.assert_not_called()
+
+    def test_clear(self):
+        model = create_model("column")
+        self.cache.get_value_type(model, (0,), (0,))
+
+        self.cache.clear()
+        self.cache.get_value_type(model, (0,), (0,))
+
+        self.assertEqual(model.get_column_value_type.call_count, 2)
+
+    def test_values_changed_columns(self):
+        model = create_model("column")
+        for column in [(), (0,), (1,), (2,), (3,)]:
+            self.cache.get_value_type(model, (0,), column)
+        model.get_column_value_type.reset_mock()
+
+        self.cache.values_changed(((0,), (1,), (4,), (2,)))
+        for column in [(), (0,), (1,), (2,), (3,)]:
+            self.cache.get_value_type(model, (0,), column)
+
+        self.assertEqual(
+            [call.args[0] for call in model.get_column_value_type.mock_calls],
+            [(1,), (2,)],
+        )
+
+    def test_values_changed_header(self):
+        model = create_model("column")
+        for column in [(), (0,), (1,)]:
+            self.cache.get_value_type(model, (0,), column)
+        model.get_column_value_type.reset_mock()
+
+        # a column header change, as when an accessor's value type changes
+        self.cache.values_changed(((), (1,), (), (1,)))
+        # a row header change
+        self.cache.values_changed(((0,), (), (4,), ()))
+        for column in [(), (0,), (1,)]:
+            self.cache.get_value_type(model, (0,), column)
+
+        self.assertEqual(
+            [call.args[0] for call in model.get_column_value_type.mock_calls],
+            [(), (1,)],
+        )
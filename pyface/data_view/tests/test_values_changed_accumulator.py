@@ -0,0 +1,97 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import threading
+from unittest import TestCase
+
+from pyface.data_view.values_changed_accumulator import (
+    ValuesChangedAccumulator
+)
+
+
+class TestValuesChangedAccumulator(TestCase):
+
+    def setUp(self):
+        self.accumulator = ValuesChangedAccumulator()
+
+    def test_add_merges_cells(self):
+        self.assertTrue(self.accumulator.add(((2,), (1,), (2,), (1,))))
+        self.assertFalse(self.accumulator.add(((5,), (3,), (5,), (3,))))
+        self.accumulator.add(((4,), (0,), (4,), (0,)))
+
+        self.assertEqual(
+            self.accumulator.take(), [((2,), (0,), (5,), (3,))]
+        )
+        self.assertEqual(self.accumulator.take(), [])
+
+    def test_add_merges_per_parent(self):
+        self.accumulator.add(((0, 1), (0,), (0, 1), (0,)))
+        self.accumulator.add(((1, 3), (2,), (1, 3), (2,)))
+        self.accumulator.add(((0, 4), (1,), (0, 4), (1,)))
+
+        self.assertEqual(
+            self.accumulator.take(),
+            [((0, 1), (0,), (0, 4), (1,)), ((1, 3), (2,), (1, 3), (2,))],
+        )
+
+    def test_add_row_headers(self):
+        self.accumulator.add(((3,), (), (3,), ()))
+        self.accumulator.add(((1,), (2,), (1,), (2,)))
+
+        self.assertEqual(self.accumulator.take(), [((1,), (), (3,), (2,))])
+
+    def test_add_column_headers(self):
+        self.accumulator.add(((), (1,), (), (1,)))
+        self.accumulator.add(((), (4,), (), (4,)))
+        self.accumulator.add(((0,), (0,), (0,), (0,)))
+
+        self.assertEqual(
+            self.accumulator.take(),
+            [((), (1,), (), (4,)), ((0,), (0,), (0,), (0,))],
+        )
+
+    def test_add_unmerged(self):
+        self.accumulator.add(((), (), (), ()))
+        self.accumulator.add(((0,), (), (2, 1), (3,)))
+
+        self.assertEqual(
+            self.accumulator.take(),
+            [((), (), (), ()), ((0,), (), (2, 1), (3,))],
+        )
+
+    def test_batch(self):
+        self.assertFalse(
+            self.accumulator.add_if_batching(((0,), (0,), (0,), (0,)))
+        )
+
+        self.accumulator.begin_batch()
+        self.accumulator.begin_batch()
+        self.assertTrue(
+            self.accumulator.add_if_batching(((1,), (0,), (1,), (0,)))
+        )
+        self.assertFalse(self.accumulator.end_batch())
+        self.assertTrue(self.accumulator.end_batch())
+
+        self.assertEqual(self.accumulator.take(), [((1,), (0,), (1,), (0,))])
+
+    def test_add_threads(self):
+        def add(row):
+            for column in range(100):
+                self.accumulator.add(((row,), (column,), (row,), (column,)))
+
+        threads = [
+            threading.Thread(target=add, args=(row,)) for row in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.accumulator.take(), [((0,), (0,), (3,), (99,))])
@@ -0,0 +1,85 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A per-column cache of value types for toolkit item models.
+
+Toolkit item models look up the value type of a cell for every cell and
+every role they are asked about.  For data models whose value types depend
+only on the column (see ``AbstractDataModel.get_column_value_type``), the
+:class:`ColumnValueTypeCache` looks the value type up once per column and
+forgets it when the data model reports that the column has changed.
+"""
+
+# Marker for columns whose value types vary between rows.
+_VARIES = object()
+
+
+class ColumnValueTypeCache:
+    """ Cache the value types of columns with uniform value types. """
+
+    def __init__(self):
+        self._value_types = {}
+
+    def get_value_type(self, model, row, column):
+        """ Return the value type of a cell, from the cache if possible.
+
+        Parameters
+        ----------
+        model : AbstractDataModel
+            The data model holding the data.
+        row : sequence of int
+            The indices of the row as a sequence from root to leaf.
+        column : sequence of int
+            The indices of the column as a sequence of length 0 or 1.
+
+        Returns
+        -------
+        value_type : AbstractValueType or None
+            The value type of the given row and column.
+        """
+        if len(row) == 0:
+            return model.get_value_type(row, column)
+        key = tuple(column)
+        value_type = self._value_types.get(key)
+        if value_type is None:
+            value_type = model.get_column_value_type(key)
+            if value_type is None:
+                value_type = _VARIES
+            self._value_types[key] = value_type
+        if value_type is _VARIES:
+            return model.get_value_type(row, column)
+        return value_type
+
+    def clear(self):
+        """ Forget all cached value types. """
+        self._value_types.clear()
+
+    def values_changed(self, values_changed):
+        """ Forget the value types of columns which have changed.
+
+        Parameters
+        ----------
+        values_changed : tuple
+            The value of a data model's ``values_changed`` event.
+        """
+        if not self._value_types:
+            return
+        top, left, bottom, right = values_changed
+        if len(left) == 0:
+            self._value_types.pop((), None)
+            first = 0
+        else:
+            first = left[0]
+        if len(right) == 0:
+            return
+        last = right[0]
+        for key in list(self._value_types):
+            if key and first <= key[0] <= last:
+                del self._value_types[key]
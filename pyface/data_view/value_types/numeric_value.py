@@ -11,16 +11,134 @@
 import locale
 from math import inf
 
-from traits.api import Callable, Float
+from traits.api import Any, Callable, Float, observe
 
 from pyface.data_view.data_view_errors import DataViewSetError
 from .editable_value import EditableValue
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#: The largest number of formatted values cached by a value type.
+TEXT_CACHE_SIZE = 4096
+
+# The largest number of distinct values, as a fraction of the number of
+# values, for which values are formatted once per distinct value.
+_UNIQUE_FRACTION = 0.25
+
+# The value of a grouping entry which stops further grouping.
+_CHAR_MAX = 127
+
 
 def format_locale(value):
     return "{:n}".format(value)
 
 
+def format_locale_array(values):
+    """ Format an array of numbers as ``format_locale`` does, in bulk.
+
+    Integer arrays are converted to digit strings by NumPy and grouped
+    using the current locale's separators, one string length at a time.
+    Float arrays are formatted once per distinct value if there are few
+    distinct values, and the result is adjusted for the current locale.
+
+    Parameters
+    ----------
+    values : array-like
+        A 1-dimensional array of integers or floats.
+
+    Returns
+    -------
+    texts : list of str
+        The formatted values.
+
+    Raises
+    ------
+    TypeError
+        If NumPy is not available or the values are not integers or floats.
+    """
+    if np is None:
+        raise TypeError("NumPy is required to format arrays")
+    values = np.asarray(values)
+    table = _locale_table()
+    if values.dtype.kind in "iu":
+        texts = values.astype(str)
+        if not table.grouping:
+            return texts.tolist()
+        negative = values < 0
+        digits = np.char.lstrip(texts, "-")
+        grouped = table.group_array(digits)
+        if negative.any():
+            grouped[negative] = np.char.add("-", grouped[negative])
+        return grouped.tolist()
+    elif values.dtype.kind == "f":
+        texts = _format_distinct(values, "{:g}".format)
+        if table.is_default:
+            return texts
+        return [table.localize_float(text) for text in texts]
+    raise TypeError(
+        "Can't format array of dtype {!r}".format(values.dtype)
+    )
+
+
+class ArrayFormat:
+    """ A printf-style number format which can format arrays in bulk.
+
+    Unlike ``format_locale``, these formats do not depend on the locale.
+
+    Parameters
+    ----------
+    template : str
+        A printf-style format for a single number, eg. ``"%.3f"``.
+    """
+
+    def __init__(self, template):
+        self.template = template
+
+    def __call__(self, value):
+        return self.template % value
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ArrayFormat) and self.template == other.template
+        )
+
+    def __hash__(self):
+        return hash(self.template)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.template)
+
+    def format_array(self, values):
+        """ Format an array of numbers.
+
+        Parameters
+        ----------
+        values : array-like
+            A 1-dimensional array of numbers.
+
+        Returns
+        -------
+        texts : list of str
+            The formatted values.
+        """
+        if np is None:
+            return [self(value) for value in values]
+        return np.char.mod(self.template, np.asarray(values)).tolist()
+
+
+def fixed_format(precision=6):
+    """ A fixed-point format with a number of decimal places. """
+    return ArrayFormat("%.{}f".format(precision))
+
+
+def scientific_format(precision=6):
+    """ A scientific format with a number of decimal places. """
+    return ArrayFormat("%.{}e".format(precision))
+
+
 class NumericValue(EditableValue):
     """ Data channels for a numeric value.
     """
@@ -40,6 +158,12 @@ class NumericValue(EditableValue):
     #: A function that converts the required type from a display string.
     unformat = Callable(locale.delocalize)
 
+    #: Formatted values by value, for the current format and locale.
+    _text_cache = Any(factory=dict)
+
+    #: The numeric locale the cached values were formatted with.
+    _text_cache_locale = Any()
+
     def is_valid(self, model, row, column, value):
         """ Whether or not the value within the specified range.
 
@@ -107,6 +231,41 @@ class NumericValue(EditableValue):
         """
         return self.format(model.get_value(row, column))
 
+    def get_texts(self, model, rows, column):
+        """ Get the display text of several rows of a column.
+
+        The values are fetched together with the model's ``get_values``.
+        If the format is ``format_locale`` or has a ``format_array`` method,
+        such as the formats returned by ``fixed_format`` and
+        ``scientific_format``, the values are formatted together.  Otherwise
+        each distinct value is formatted once and cached.
+
+        Parameters
+        ----------
+        model : AbstractDataModel
+            The data model holding the data.
+        rows : sequence of sequence of int
+            The rows in the data model being queried.
+        column : sequence of int
+            The column in the data model being queried.
+
+        Returns
+        -------
+        texts : list of str
+            The text to display for each row.
+        """
+        values = model.get_values(rows, column)
+        if self.format is format_locale:
+            format_array = format_locale_array
+        else:
+            format_array = getattr(self.format, "format_array", None)
+        if format_array is not None:
+            try:
+                return format_array(values)
+            except (TypeError, ValueError):
+                pass
+        return self._format_cached(values)
+
     def set_text(self, model, row, column, text):
         """ Set the text of the underlying value.
 
@@ -134,6 +293,32 @@ class NumericValue(EditableValue):
             )
         self.set_editor_value(model, row, column, value)
 
+    def _format_cached(self, values):
+        """ Format values, formatting each distinct value once. """
+        numeric_locale = locale.setlocale(locale.LC_NUMERIC)
+        if numeric_locale != self._text_cache_locale:
+            self._text_cache = {}
+            self._text_cache_locale = numeric_locale
+        cache = self._text_cache
+        format = self.format
+        texts = []
+        for value in values:
+            try:
+                text = cache[value]
+            except KeyError:
+                text = format(value)
+                if len(cache) < TEXT_CACHE_SIZE:
+                    cache[value] = text
+            except TypeError:
+                # unhashable value
+                text = format(value)
+            texts.append(text)
+        return texts
+
+    @observe('format')
+    def _clear_text_cache(self, event):
+        self._text_cache = {}
+
 
 class IntValue(NumericValue):
     """ Data channels for an integer value.
@@ -147,3 +332,122 @@ class FloatValue(NumericValue):
     """
 
     evaluate = Callable(float)
+
+
+class _LocaleTable:
+    """ The number formatting conventions of a locale, precompiled.
+
+    Parameters
+    ----------
+    conventions : dict
+        The conventions, as returned by ``locale.localeconv``.
+    """
+
+    def __init__(self, conventions):
+        self.decimal_point = conventions["decimal_point"]
+        self.thousands_sep = conventions["thousands_sep"]
+        if self.thousands_sep:
+            self.grouping = list(conventions["grouping"])
+        else:
+            self.grouping = []
+        self.is_default = self.decimal_point == "." and not self.grouping
+        self._positions = {}
+
+    def separator_positions(self, length):
+        """ The positions in a string of digits before which separators go.
+        """
+        positions = self._positions.get(length)
+        if positions is None:
+            positions = []
+            end = length
+            size = None
+            sizes = iter(self.grouping)
+            while True:
+                group = next(sizes, 0)
+                if group == 0:
+                    # repeat the last group size
+                    if size is None:
+                        break
+                    group = size
+                elif group >= _CHAR_MAX:
+                    break
+                size = group
+                end -= size
+                if end <= 0:
+                    break
+                positions.append(end)
+            positions.reverse()
+            self._positions[length] = positions
+        return positions
+
+    def group(self, digits):
+        """ Insert separators into a string of digits. """
+        positions = self.separator_positions(len(digits))
+        if not positions:
+            return digits
+        starts = [0] + positions
+        ends = positions + [len(digits)]
+        return self.thousands_sep.join(
+            digits[start:end] for start, end in zip(starts, ends)
+        )
+
+    def group_array(self, digits):
+        """ Insert separators into an array of strings of digits. """
+        grouped = digits.astype(object)
+        lengths = np.char.str_len(digits)
+        for length in np.unique(lengths).tolist():
+            positions = self.separator_positions(length)
+            if not positions:
+                continue
+            mask = lengths == length
+            if len(self.thousands_sep) == 1:
+                chars = digits[mask].astype("U{}".format(length))
+                chars = chars.view("U1").reshape(-1, length)
+                chars = np.insert(chars, positions, self.thousands_sep, axis=1)
+                grouped[mask] = np.ascontiguousarray(chars).view(
+                    "U{}".format(chars.shape[1])
+                ).ravel()
+            else:
+                grouped[mask] = [
+                    self.group(text) for text in digits[mask].tolist()
+                ]
+        return grouped
+
+    def localize_float(self, text):
+        """ Localize a number formatted with the "g" format. """
+        sign = ""
+        if text[:1] == "-":
+            sign, text = "-", text[1:]
+        mantissa, e, exponent = text.partition("e")
+        integer, point, fraction = mantissa.partition(".")
+        if integer.isdigit():
+            integer = self.group(integer)
+        if point:
+            point = self.decimal_point
+        return sign + integer + point + fraction + e + exponent
+
+
+# Locale tables, by the name of the numeric locale.
+_locale_tables = {}
+
+
+def _locale_table():
+    """ The precompiled conventions of the current numeric locale. """
+    name = locale.setlocale(locale.LC_NUMERIC)
+    table = _locale_tables.get(name)
+    if table is None:
+        table = _LocaleTable(locale.localeconv())
+        _locale_tables[name] = table
+    return table
+
+
+def _format_distinct(values, format):
+    """ Format an array of values, once per value if few are distinct. """
+    if values.size >= 64:
+        distinct, inverse = np.unique(values, return_inverse=True)
+        if len(distinct) <= _UNIQUE_FRACTION * values.size:
+            texts = np.array(
+                [format(value) for value in distinct.tolist()], dtype=object
+            )
+            return texts[inverse.ravel()].tolist()
+    return [format(value) for value in values.tolist()]
@@ -11,9 +11,12 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
 from pyface.data_view.data_view_errors import DataViewSetError
 from pyface.data_view.value_types.numeric_value import (
-    FloatValue, IntValue, NumericValue, format_locale
+    FloatValue, IntValue, NumericValue, _LocaleTable, fixed_format,
+    format_locale, format_locale_array, scientific_format
 )
 
 
@@ -69,6 +72,41 @@ class TestNumericValue(TestCase):
         text = value.get_text(self.model, [0], [0])
         self.assertEqual(text, format_locale(1.0))
 
+    def test_get_texts(self):
+        self.model.get_values = Mock(return_value=[1.0, 2.5, 1.0])
+        value = NumericValue(format="{:.2f}".format)
+        texts = value.get_texts(self.model, [[0], [1], [2]], [0])
+        self.assertEqual(texts, ["1.00", "2.50", "1.00"])
+        self.assertEqual(len(value._text_cache), 2)
+
+    def test_get_texts_format_changed(self):
+        self.model.get_values = Mock(return_value=[1.0])
+        value = NumericValue(format="{:.2f}".format)
+        value.get_texts(self.model, [[0]], [0])
+        value.format = "{:.1f}".format
+        texts = value.get_texts(self.model, [[0]], [0])
+        self.assertEqual(texts, ["1.0"])
+
+    def test_get_texts_unhashable(self):
+        self.model.get_values = Mock(return_value=[[1.0]])
+        value = NumericValue(format=str)
+        texts = value.get_texts(self.model, [[0]], [0])
+        self.assertEqual(texts, ["[1.0]"])
+
+    @requires_numpy
+    def test_get_texts_array(self):
+        self.model.get_values = Mock(return_value=np.array([1, -2000, 30]))
+        value = IntValue()
+        texts = value.get_texts(self.model, [[0], [1], [2]], [0])
+        self.assertEqual(texts, [format_locale(x) for x in (1, -2000, 30)])
+
+    @requires_numpy
+    def test_get_texts_array_format(self):
+        self.model.get_values = Mock(return_value=np.array([1.0, 0.25]))
+        value = FloatValue(format=fixed_format(3))
+        texts = value.get_texts(self.model, [[0], [1]], [0])
+        self.assertEqual(texts, ["1.000", "0.250"])
+
     def test_set_text(self):
         value = NumericValue(evaluate=float)
         value.set_text(self.model, [0], [0], format_locale(1.1))
@@ -99,3 +137,92 @@ class TestFloatValue(TestCase):
     def test_defaults(self):
         value = FloatValue()
         self.assertIs(value.evaluate, float)
+
+
+class TestArrayFormats(TestCase):
+
+    def test_fixed_format(self):
+        format = fixed_format(2)
+        self.assertEqual(format(1.234), "1.23")
+        self.assertEqual(format, fixed_format(2))
+
+    def test_scientific_format(self):
+        format = scientific_format(1)
+        self.assertEqual(format(1234.0), "1.2e+03")
+
+    @requires_numpy
+    def test_format_array(self):
+        format = scientific_format(2)
+        values = np.array([1.0, 12345.0])
+        self.assertEqual(
+            format.format_array(values), [format(x) for x in values]
+        )
+
+
+@requires_numpy
+class TestFormatLocaleArray(TestCase):
+
+    def test_integers(self):
+        values = np.array([0, 7, -12, 1234, -123456789, 2**62])
+        self.assertEqual(
+            format_locale_array(values), [format_locale(x) for x in values]
+        )
+
+    def test_floats(self):
+        values = np.array([0.0, -1.5, 1234.5678, 1e-7, 1e20, np.nan, np.inf])
+        self.assertEqual(
+            format_locale_array(values), [format_locale(x) for x in values]
+        )
+
+    def test_few_distinct_floats(self):
+        values = np.tile(np.array([0.5, 1.25, -3.0]), 100)
+        self.assertEqual(
+            format_locale_array(values), [format_locale(x) for x in values]
+        )
+
+    def test_objects(self):
+        with self.assertRaises(TypeError):
+            format_locale_array(np.array(["a"], dtype=object))
+
+
+class TestLocaleTable(TestCase):
+
+    def setUp(self):
+        self.table = _LocaleTable({
+            "decimal_point": ",",
+            "thousands_sep": ".",
+            "grouping": [3, 3, 0],
+        })
+
+    def test_group(self):
+        self.assertEqual(self.table.group("12"), "12")
+        self.assertEqual(self.table.group("1234567"), "1.234.567")
+
+    def test_group_no_repeat(self):
+        table = _LocaleTable({
+            "decimal_point": ".",
+            "thousands_sep": ",",
+            "grouping": [3, 2, 127],
+        })
+        self.assertEqual(table.group("123456789"), "1234,56,789")
+
+    def test_group_repeat_last(self):
+        table = _LocaleTable({
+            "decimal_point": ".",
+            "thousands_sep": ",",
+            "grouping": [3, 2, 0],
+        })
+        self.assertEqual(table.group("12345678"), "1,23,45,678")
+
+    @requires_numpy
+    def test_group_array(self):
+        digits = np.array(["1", "1234", "9876543"])
+        self.assertEqual(
+            self.table.group_array(digits).tolist(),
+            ["1", "1.234", "9.876.543"],
+        )
+
+    def test_localize_float(self):
+        self.assertEqual(self.table.localize_float("-1234.5"), "-1.234,5")
+        self.assertEqual(self.table.localize_float("1.5e+20"), "1,5e+20")
+        self.assertEqual(self.table.localize_float("nan"), "nan")
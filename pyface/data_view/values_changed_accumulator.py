@@ -0,0 +1,162 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Accumulation of data model value changes.
+
+Data models fire a ``values_changed`` event for every change, and toolkit
+item models turn every event into a repaint request, dispatched to the GUI
+thread.  When many cells are changed in quick succession, the
+:class:`ValuesChangedAccumulator` merges the changes into one bounding
+rectangle per parent row, so that they can be reported with a few events.
+"""
+
+import threading
+
+
+class ValuesChangedAccumulator:
+    """ Merge ``values_changed`` events into bounding rectangles.
+
+    Changes within the children of a single parent row, or within the column
+    headers, are merged into a single rectangle; other changes are kept as
+    they are.  The row header column ``()`` is treated as the column before
+    the first column.
+
+    All methods may be called from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # rectangles as [top, left, bottom, right] ints, keyed by the parent
+        # row, or by None for the column headers
+        self._rectangles = {}
+        # changes which can't be merged
+        self._unmerged = []
+        self._batch_depth = 0
+
+    def add(self, values_changed):
+        """ Add a change.
+
+        Parameters
+        ----------
+        values_changed : tuple
+            The value of a ``values_changed`` event.
+
+        Returns
+        -------
+        first : bool
+            Whether there were no changes pending before this one.
+        """
+        with self._lock:
+            first = not (self._rectangles or self._unmerged)
+            self._add(values_changed)
+        return first
+
+    def add_if_batching(self, values_changed):
+        """ Add a change if a batch is open.
+
+        Parameters
+        ----------
+        values_changed : tuple
+            The value of a ``values_changed`` event.
+
+        Returns
+        -------
+        added : bool
+            Whether a batch is open and the change was added.
+        """
+        with self._lock:
+            if self._batch_depth == 0:
+                return False
+            self._add(values_changed)
+        return True
+
+    def begin_batch(self):
+        """ Open a batch.  Batches may be nested. """
+        with self._lock:
+            self._batch_depth += 1
+
+    def end_batch(self):
+        """ Close a batch.
+
+        Returns
+        -------
+        outermost : bool
+            Whether no batches remain open.
+        """
+        with self._lock:
+            self._batch_depth -= 1
+            return self._batch_depth == 0
+
+    def take(self):
+        """ Remove and return the pending changes.
+
+        Returns
+        -------
+        changes : list of tuple
+            The merged changes, as values for ``values_changed`` events.
+        """
+        with self._lock:
+            rectangles, self._rectangles = self._rectangles, {}
+            unmerged, self._unmerged = self._unmerged, []
+
+        changes = []
+        for parent, (top, left, bottom, right) in rectangles.items():
+            if parent is None:
+                changes.append(
+                    ((), _to_column(left), (), _to_column(right))
+                )
+            else:
+                changes.append((
+                    parent + (top,),
+                    _to_column(left),
+                    parent + (bottom,),
+                    _to_column(right),
+                ))
+        changes.extend(unmerged)
+        return changes
+
+    def _add(self, values_changed):
+        """ Merge a change into the pending changes, holding the lock. """
+        top, left, bottom, right = values_changed
+        if len(left) > 1 or len(right) > 1:
+            self._unmerged.append(values_changed)
+            return
+        if len(top) == 0 and len(bottom) == 0:
+            parent = None
+            first_row = last_row = 0
+        elif (
+            len(top) != 0
+            and len(top) == len(bottom)
+            and top[:-1] == bottom[:-1]
+        ):
+            parent = tuple(top[:-1])
+            first_row = top[-1]
+            last_row = bottom[-1]
+        else:
+            self._unmerged.append(values_changed)
+            return
+
+        first_column = left[0] if left else -1
+        last_column = right[0] if right else -1
+        rectangle = self._rectangles.get(parent)
+        if rectangle is None:
+            self._rectangles[parent] = [
+                first_row, first_column, last_row, last_column
+            ]
+        else:
+            rectangle[0] = min(rectangle[0], first_row)
+            rectangle[1] = min(rectangle[1], first_column)
+            rectangle[2] = max(rectangle[2], last_row)
+            rectangle[3] = max(rectangle[3], last_column)
+
+
+def _to_column(column):
+    """ Convert a merged column number back to a column index. """
+    return () if column < 0 else (column,)
@@ -39,6 +39,7 @@ from .i_dialog import IDialog
 from .i_splash_screen import ISplashScreen
 from .i_window import IWindow
 from .ui_traits import Image
+from .util.startup_profiler import profile_phase
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +120,8 @@ class GUIApplication(Application):
         window : IWindow  or None
             The new IWindow instance.
         """
-        window = self.window_factory(application=self, **kwargs)
+        with profile_phase("create_window", "window"):
+            window = self.window_factory(application=self, **kwargs)
 
         if window.size == (-1, -1):
             window.size = self.window_size
@@ -138,7 +140,8 @@ class GUIApplication(Application):
         self.windows.append(window)
 
         # Something might try to veto the opening of the window.
-        opened = window.open()
+        with profile_phase("open_window", "window", {"title": window.title}):
+            opened = window.open()
         if opened:
             window.activate()
 
@@ -166,10 +169,12 @@ class GUIApplication(Application):
         if ok:
             # create the GUI so that the splash screen comes up first thing
             if self.gui is Undefined:
-                self.gui = GUI(splash_screen=self.splash_screen)
+                with profile_phase("create_gui", "application"):
+                    self.gui = GUI(splash_screen=self.splash_screen)
 
             # create the initial windows to show
-            self._create_windows()
+            with profile_phase("create_windows", "application"):
+                self._create_windows()
 
         return ok
 
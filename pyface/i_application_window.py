@@ -11,13 +11,14 @@
 """ The interface of a top-level application window. """
 
 
-from traits.api import HasTraits, Instance, List
+from traits.api import Bool, HasTraits, Instance, List
 
 from pyface.action.i_menu_bar_manager import IMenuBarManager
 from pyface.action.i_status_bar_manager import IStatusBarManager
 from pyface.action.i_tool_bar_manager import IToolBarManager
 from pyface.i_window import IWindow
 from pyface.ui_traits import Image
+from pyface.util.startup_profiler import profile_phase
 
 
 class IApplicationWindow(IWindow):
@@ -47,6 +48,11 @@ class IApplicationWindow(IWindow):
     #: The collection of tool bar managers for the window.
     tool_bar_managers = List(Instance(IToolBarManager))
 
+    #: Whether an action placed in several menus and tool bars of the window
+    #: is represented by a single toolkit action.  Toolkits which do not
+    #: support this ignore it.
+    share_actions = Bool(False)
+
     # ------------------------------------------------------------------------
     # Protected 'IApplicationWindow' interface.
     # ------------------------------------------------------------------------
@@ -125,6 +131,11 @@ class MApplicationWindow(HasTraits):
     #: The collection of tool bar managers for the window.
     tool_bar_managers = List(Instance(IToolBarManager))
 
+    #: Whether an action placed in several menus and tool bars of the window
+    #: is represented by a single toolkit action.  Toolkits which do not
+    #: support this ignore it.
+    share_actions = Bool(False)
+
     # ------------------------------------------------------------------------
     # 'IWidget' interface.
     # ------------------------------------------------------------------------
@@ -158,6 +169,9 @@ class MApplicationWindow(HasTraits):
 
         # All of these are optional.
         self._set_window_icon()
-        self._create_menu_bar(parent)
-        self._create_tool_bar(parent)
-        self._create_status_bar(parent)
+        with profile_phase("create_menu_bar", "action"):
+            self._create_menu_bar(parent)
+        with profile_phase("create_tool_bars", "action"):
+            self._create_tool_bar(parent)
+        with profile_phase("create_status_bar", "action"):
+            self._create_status_bar(parent)
@@ -96,6 +96,26 @@ class IGUI(Interface):
             Arguments and keyword arguments to be used when calling.
         """
 
+    @classmethod
+    def invoke_later_coalesced(cls, key, callable, *args, **kw):
+        """ Call a callable in the main GUI thread, merging pending calls.
+
+        If a call with the same key is still waiting to be dispatched then
+        it is replaced by this one, so only the most recent callable and
+        arguments are used.  This is intended for high-frequency updates
+        from worker threads, such as progress reports, where only the latest
+        value matters.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying calls which can be merged.
+        callable : Callable
+            Callable to be called.
+        args, kwargs :
+            Arguments and keyword arguments to be used when calling.
+        """
+
     @classmethod
     def set_trait_after(cls, millisecs, obj, trait_name, new):
         """ Sets a trait after a specific delay in the main GUI thread.
@@ -126,6 +146,36 @@ class IGUI(Interface):
             The value to set.
         """
 
+    @classmethod
+    def set_trait_later_coalesced(cls, obj, trait_name, new):
+        """ Sets a trait in the main GUI thread, merging pending sets.
+
+        If a set of the same trait on the same object is still waiting to be
+        dispatched then only the most recent value is set.
+
+        Parameters
+        ----------
+        obj : traits.has_traits.HasTraits
+            Object on which the trait is to be set
+        trait_name : str
+            The name of the trait to set
+        new : Any
+            The value to set.
+        """
+
+    @staticmethod
+    def dispatch_statistics():
+        """ Statistics about calls queued by the ``*_later`` methods.
+
+        Returns
+        -------
+        statistics : dict
+            A dictionary with the current ``queue_depth``, the
+            ``max_queue_depth``, the number of calls ``dispatched`` and
+            ``coalesced``, the number of ``batches`` and the ``mean_latency``
+            and ``max_latency`` (in seconds) between queueing and dispatch.
+        """
+
     @staticmethod
     def process_events(allow_user_events=True):
         """ Process any pending GUI events.
@@ -15,6 +15,7 @@ from traits.api import HasTraits, List, Str
 
 from pyface.i_image import IImage
 from pyface.resource.resource_path import resource_module, resource_path
+from pyface.util.startup_profiler import profile_phase
 
 
 class IImageResource(IImage):
@@ -100,12 +101,13 @@ class MImageResource(HasTraits):
             The toolkit image corresponding to the resource and the specified
             size.
         """
-        ref = self._get_ref(size)
-        if ref is not None:
-            image = ref.load()
+        with profile_phase("load_image", "image", {"name": self.name}):
+            ref = self._get_ref(size)
+            if ref is not None:
+                image = ref.load()
 
-        else:
-            image = self._get_image_not_found_image()
+            else:
+                image = self._get_image_not_found_image()
 
         return image
 
@@ -0,0 +1,287 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Run work in the background while a progress dialog shows its progress.
+
+Calling :meth:`IProgressDialog.update` from a tight loop on the GUI thread
+spends most of its time processing events.  A :class:`ProgressRunner` instead
+runs the work in an executor and the worker reports progress through a
+:class:`ProgressChannel`, which only keeps the most recent report.  The GUI
+thread samples the channel at most ``max_update_rate`` times per second and
+updates the dialog, and cancelling or closing the dialog requests
+cancellation of the work.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import inspect
+import threading
+import types
+
+from traits.api import Any, Event, HasStrictTraits, Instance, Range
+
+from pyface.i_progress_dialog import IProgressDialog
+
+
+class ProgressCancelled(Exception):
+    """ Raised in a worker when the user has cancelled the work. """
+
+
+class ProgressChannel:
+    """ A thread-safe channel for reporting progress from a worker.
+
+    Only the most recent report is kept, so reporting is cheap no matter
+    how often it is done.
+
+    Parameters
+    ----------
+    state : namespace
+        An object on which the latest report is stored as the ``report``
+        attribute.  A :class:`multiprocessing.managers.Namespace` proxy is
+        used for process pools.
+    cancel_event : threading.Event-like
+        An event which is set when cancellation is requested.
+    """
+
+    def __init__(self, state=None, cancel_event=None):
+        if state is None:
+            state = types.SimpleNamespace()
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        state.report = None
+        self._state = state
+        self._cancel_event = cancel_event
+
+    @property
+    def cancelled(self):
+        """ Whether cancellation has been requested. """
+        return self._cancel_event.is_set()
+
+    def report(self, value, message=None):
+        """ Report progress.
+
+        Parameters
+        ----------
+        value : int
+            The progress value, between the dialog's ``min`` and ``max``.
+        message : str or None
+            An optional new message for the dialog.
+        """
+        self._state.report = (value, message)
+
+    def check_cancelled(self):
+        """ Raise ProgressCancelled if cancellation has been requested. """
+        if self._cancel_event.is_set():
+            raise ProgressCancelled()
+
+    def cancel(self):
+        """ Request cancellation of the work. """
+        self._cancel_event.set()
+
+    def latest(self):
+        """ The most recent ``(value, message)`` report, or None. """
+        return self._state.report
+
+
+def _execute(function, channel, args, kwargs):
+    """ Run a callable or generator function in a worker.
+
+    Generator functions report each value they yield, which may either be a
+    progress value or a ``(value, message)`` tuple, and are cancelled between
+    yields.  Other callables are passed the channel as the ``progress``
+    keyword argument and are responsible for reporting and checking for
+    cancellation themselves.
+    """
+    if not inspect.isgeneratorfunction(function):
+        return function(*args, progress=channel, **kwargs)
+
+    generator = function(*args, **kwargs)
+    try:
+        while True:
+            channel.check_cancelled()
+            try:
+                report = next(generator)
+            except StopIteration as stop:
+                return stop.value
+            if isinstance(report, tuple):
+                channel.report(*report)
+            else:
+                channel.report(report)
+    finally:
+        generator.close()
+
+
+class ProgressRunner(HasStrictTraits):
+    """ Run work in an executor, showing its progress in a dialog.
+
+    Example::
+
+        def load(paths):
+            for i, path in enumerate(paths):
+                read(path)
+                yield i + 1, f"Loaded {path}"
+
+        dialog = ProgressDialog(max=len(paths), can_cancel=True)
+        runner = ProgressRunner(dialog=dialog)
+        future = runner.run(load, paths)
+    """
+
+    #: The dialog showing progress.  It is opened by :meth:`run` if it is
+    #: not already open, and closed when the work finishes.
+    dialog = Instance(IProgressDialog)
+
+    #: The executor that runs the work.  By default a single-worker thread
+    #: pool is created.  Work submitted to a process pool must be picklable.
+    executor = Any()
+
+    #: The maximum number of dialog updates per second.  This must be
+    #: positive.
+    max_update_rate = Range(low=0.0, value=10.0, exclude_low=True)
+
+    #: The future of the work currently running, if any.
+    future = Any()
+
+    #: Fired on the GUI thread with the future when the work finishes.
+    finished = Event()
+
+    # Private interface ------------------------------------------------------
+
+    #: The channel for the work currently running.
+    _channel = Instance(ProgressChannel)
+
+    #: The most recent report shown in the dialog.
+    _shown = Any()
+
+    #: The timer sampling the progress channel.
+    _timer = Any()
+
+    #: The multiprocessing manager used for process pools.
+    _manager = Any()
+
+    # ------------------------------------------------------------------------
+    # 'ProgressRunner' interface.
+    # ------------------------------------------------------------------------
+
+    def run(self, function, *args, **kwargs):
+        """ Start running work in the executor.
+
+        Parameters
+        ----------
+        function : callable
+            Either a generator function, whose yielded values are reported
+            as progress, or a callable which accepts a ``progress`` keyword
+            argument holding the :class:`ProgressChannel` to report to.
+        *args, **kwargs
+            Additional arguments to pass to the function.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            The future for the result of the work.
+        """
+        from pyface.timer.timer import CallbackTimer
+
+        if self.future is not None and not self.future.done():
+            raise RuntimeError("ProgressRunner is already running work")
+
+        self._channel = self._create_channel()
+        self._shown = None
+        if self.dialog is not None:
+            if self.dialog.control is None:
+                self.dialog.open()
+            self.dialog.observe(self._dialog_closed, "closed")
+
+        self._timer = CallbackTimer(
+            interval=1.0 / self.max_update_rate, callback=self._sample
+        )
+        self._timer.start()
+
+        future = self.executor.submit(
+            _execute, function, self._channel, args, kwargs
+        )
+        self.future = future
+        future.add_done_callback(self._work_done)
+        return future
+
+    def cancel(self):
+        """ Request cancellation of the work currently running. """
+        if self._channel is not None:
+            self._channel.cancel()
+
+    def shutdown(self):
+        """ Shut down the executor and any multiprocessing manager. """
+        self.executor.shutdown()
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _create_channel(self):
+        """ Create a channel suitable for the executor. """
+        if isinstance(self.executor, ProcessPoolExecutor):
+            if self._manager is None:
+                from multiprocessing import Manager
+
+                self._manager = Manager()
+            return ProgressChannel(
+                self._manager.Namespace(), self._manager.Event()
+            )
+        return ProgressChannel()
+
+    def _sample(self):
+        """ Show the latest report in the dialog. """
+        if self._channel is None:
+            return
+        report = self._channel.latest()
+        if report is None or report == self._shown:
+            return
+        self._shown = report
+        if self.dialog is None or self.dialog.control is None:
+            return
+        value, message = report
+        if message is not None:
+            self.dialog.change_message(message)
+        if value < self.dialog.max:
+            cont, _ = self.dialog.update(value)
+            if cont is False:
+                self.cancel()
+
+    def _work_done(self, future):
+        """ Finish up on the GUI thread once the work is done. """
+        from pyface.gui import GUI
+
+        GUI.invoke_later(self._finish, future)
+
+    def _finish(self, future):
+        if future is not self.future:
+            return
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self._sample()
+        self._channel = None
+        if self.dialog is not None:
+            self.dialog.observe(
+                self._dialog_closed, "closed", remove=True
+            )
+            if self.dialog.control is not None:
+                self.dialog.close()
+        self.finished = future
+
+    def _dialog_closed(self, event):
+        """ Closing the dialog before the work is done cancels it. """
+        self.cancel()
+
+    # Trait default methods --------------------------------------------------
+
+    def _executor_default(self):
+        return ThreadPoolExecutor(max_workers=1)
@@ -55,6 +55,11 @@ class ITaskWindowBackend(Interface):
             specified TaskState.
         """
 
+    def add_dock_pane(self, state, dock_pane):
+        """ Assuming the specified TaskState is active, add the control of a
+            dock pane which was created after the task was shown.
+        """
+
     # Methods for saving and restoring the layout -------------------------#
 
     def get_layout(self):
@@ -93,6 +98,9 @@ class MTaskWindowBackend(HasTraits):
     def show_task(self, state):
         raise NotImplementedError()
 
+    def add_dock_pane(self, state, dock_pane):
+        raise NotImplementedError()
+
     def get_layout(self):
         raise NotImplementedError()
 
@@ -9,11 +9,14 @@
 # Thanks for using Enthought open source!
 
 import logging
+import time
 
 
 from traits.api import (
     Bool,
     Callable,
+    Dict,
+    Float,
     HasStrictTraits,
     Instance,
     List,
@@ -36,6 +39,7 @@ from pyface.tasks.i_task_pane import ITaskPane
 from pyface.tasks.i_task_window_backend import ITaskWindowBackend
 from pyface.tasks.task import Task, TaskLayout
 from pyface.tasks.task_window_layout import TaskWindowLayout
+from pyface.util.startup_profiler import profile_phase
 
 # Logging.
 logger = logging.getLogger(__name__)
@@ -78,6 +82,15 @@ class TaskWindow(ApplicationWindow):
     #: the translation process, although this is not usually necessary.
     action_manager_builder_factory = Callable(TaskActionManagerBuilder)
 
+    #: Whether the panes, menu bar and tool bars of a task are created when it
+    #: is first activated rather than when it is added to the window. Dock
+    #: panes which are neither part of the task's layout nor visible are then
+    #: only created when they are first made visible.  This can speed up
+    #: windows with many tasks, but code which inspects the panes or action
+    #: managers of an inactive task must first call ``get_dock_panes`` or
+    #: activate the task.
+    defer_pane_creation = Bool(False)
+
     # Protected traits -----------------------------------------------------
 
     _active_state = Instance("pyface.tasks.task_window.TaskState")
@@ -151,13 +164,18 @@ class TaskWindow(ApplicationWindow):
             if self._active_state is not None:
                 self._window_backend.hide_task(self._active_state)
 
-            # Initialize the new task, if necessary.
-            if not state.initialized:
-                task.initialized()
-                state.initialized = True
+            with profile_phase("activate_task", "task", {"id": task.id}):
+                # Create the task's panes and action managers, if necessary.
+                self._create_state(state)
+                self._create_dock_pane_controls(state, state.layout)
+
+                # Initialize the new task, if necessary.
+                if not state.initialized:
+                    task.initialized()
+                    state.initialized = True
 
-            # Display the panes of the new task.
-            self._window_backend.show_task(state)
+                # Display the panes of the new task.
+                self._window_backend.show_task(state)
 
             # Activate the new task. The menus, toolbars, and status bar will be
             # replaced at this time.
@@ -171,6 +189,9 @@ class TaskWindow(ApplicationWindow):
 
     def add_task(self, task):
         """ Adds a task to the window. The task is not activated.
+
+        If ``defer_pane_creation`` is True, the task's panes, menu bar and
+        tool bars are only created when the task is first activated.
         """
         if task.window is not None:
             logger.error(
@@ -188,24 +209,9 @@ class TaskWindow(ApplicationWindow):
         if self.control is None:
             self.create()
 
-        # Create the central pane.
-        state.central_pane = task.create_central_pane()
-        state.central_pane.task = task
-        state.central_pane.create(self.control)
-
-        # Create the dock panes.
-        state.dock_panes = task.create_dock_panes()
-        for dock_pane_factory in task.extra_dock_pane_factories:
-            state.dock_panes.append(dock_pane_factory(task=task))
-        for dock_pane in state.dock_panes:
-            dock_pane.task = task
-            dock_pane.create(self.control)
-
-        # Build the menu and tool bars.
-        builder = self.action_manager_builder_factory(task=task)
-        state.menu_bar_manager = builder.create_menu_bar_manager()
-        state.status_bar_manager = task.status_bar
-        state.tool_bar_managers = builder.create_tool_bar_managers()
+        if not self.defer_pane_creation:
+            self._create_state(state)
+            self._create_dock_pane_controls(state)
 
     def remove_task(self, task):
         """ Removes a task that has already been added to the window. All the
@@ -253,7 +259,10 @@ class TaskWindow(ApplicationWindow):
         """ Returns the central pane for the specified task.
         """
         state = self._get_state(task)
-        return state.central_pane if state else None
+        if state is None:
+            return None
+        self._create_panes(state)
+        return state.central_pane
 
     def get_dock_pane(self, id, task=None):
         """ Returns the dock pane in the task with the specified ID, or
@@ -264,13 +273,31 @@ class TaskWindow(ApplicationWindow):
             state = self._active_state
         else:
             state = self._get_state(task)
-        return state.get_dock_pane(id) if state else None
+        if state is None:
+            return None
+        self._create_panes(state)
+        return state.get_dock_pane(id)
 
     def get_dock_panes(self, task):
         """ Returns the dock panes for the specified task.
         """
         state = self._get_state(task)
-        return state.dock_panes[:] if state else []
+        if state is None:
+            return []
+        self._create_panes(state)
+        return state.dock_panes[:]
+
+    def get_pane_timings(self, task=None):
+        """ Returns a dictionary mapping pane IDs to the time in seconds taken
+            to create the controls of the panes of the specified task which
+            have been created so far. If a task is not specified, the active
+            task is used.
+        """
+        if task is None:
+            state = self._active_state
+        else:
+            state = self._get_state(task)
+        return dict(state.pane_timings) if state else {}
 
     def get_task(self, id):
         """ Returns the task with the specified ID, or None if no such task
@@ -294,6 +321,7 @@ class TaskWindow(ApplicationWindow):
             to the window.
         """
         if self._active_state:
+            self._create_dock_pane_controls(self._active_state, layout)
             self._window_backend.set_layout(layout)
 
     def reset_layout(self):
@@ -333,6 +361,8 @@ class TaskWindow(ApplicationWindow):
             state = self._get_state(layout.id)
             if state:
                 state.layout = layout
+                if state == self._active_state:
+                    self._create_dock_pane_controls(state, layout)
             else:
                 logger.warning(
                     "Cannot apply layout for task %r: task does not "
@@ -353,6 +383,83 @@ class TaskWindow(ApplicationWindow):
     # Protected 'TaskWindow' interface.
     # ------------------------------------------------------------------------
 
+    def _create_state(self, state):
+        """ Create the panes, the central pane control and the action managers
+            of a Task state, if they have not been created yet.
+        """
+        self._create_panes(state)
+        if state.central_pane.control is None:
+            self._create_pane_control(state, state.central_pane)
+
+        if not state.action_managers_created:
+            with profile_phase(
+                "build_action_managers", "action", {"task": state.task.id}
+            ):
+                builder = self.action_manager_builder_factory(task=state.task)
+                state.menu_bar_manager = builder.create_menu_bar_manager()
+                state.status_bar_manager = state.task.status_bar
+                state.tool_bar_managers = builder.create_tool_bar_managers()
+            state.action_managers_created = True
+
+    def _create_panes(self, state):
+        """ Create the pane objects of a Task state, without their controls,
+            if they have not been created yet.
+        """
+        if state.central_pane is not None:
+            return
+
+        task = state.task
+        central_pane = task.create_central_pane()
+        central_pane.task = task
+
+        dock_panes = task.create_dock_panes()
+        for dock_pane_factory in task.extra_dock_pane_factories:
+            dock_panes.append(dock_pane_factory(task=task))
+        for dock_pane in dock_panes:
+            dock_pane.task = task
+
+        state.central_pane = central_pane
+        state.dock_panes = dock_panes
+
+    def _create_dock_pane_controls(self, state, layout=None):
+        """ Create the missing dock pane controls of a Task state that are
+            needed to show it with a TaskLayout: those of the panes in the
+            layout and of the visible panes. If no layout is given, the
+            controls of all the dock panes are created.
+        """
+        self._create_panes(state)
+        if layout is None:
+            ids = None
+        else:
+            ids = {
+                item.id
+                for area in ("left", "right", "top", "bottom")
+                if getattr(layout, area) is not None
+                for item in getattr(layout, area).iterleaves()
+            }
+        for dock_pane in state.dock_panes:
+            if dock_pane.control is None and (
+                ids is None or dock_pane.visible or dock_pane.id in ids
+            ):
+                self._create_pane_control(state, dock_pane)
+
+    def _create_pane_control(self, state, pane):
+        """ Create the control of a pane, recording how long it took.
+        """
+        start = time.perf_counter()
+        with profile_phase(
+            "create_pane", "pane", {"id": pane.id, "task": state.task.id}
+        ):
+            pane.create(self.control)
+        elapsed = time.perf_counter() - start
+        state.pane_timings[pane.id] = elapsed
+        logger.debug(
+            "Created pane %r of task %r in %.3f s",
+            pane.id,
+            state.task.id,
+            elapsed,
+        )
+
     def _destroy_state(self, state):
         """ Destroy all controls associated with a Task state.
         """
@@ -370,7 +477,8 @@ class TaskWindow(ApplicationWindow):
         # Destroy all controls associated with the task.
         for dock_pane in state.dock_panes:
             dock_pane.destroy()
-        state.central_pane.destroy()
+        if state.central_pane is not None:
+            state.central_pane.destroy()
         state.task.window = None
 
     def _get_pane_ring(self):
@@ -441,6 +549,13 @@ class TaskWindow(ApplicationWindow):
         if event.new:
             self.active_pane = event.object
 
+    @observe("dock_panes:items:visible")
+    def _create_dock_pane_when_visible(self, event):
+        dock_pane = event.object
+        if event.new and dock_pane.control is None and self._active_state:
+            self._create_pane_control(self._active_state, dock_pane)
+            self._window_backend.add_dock_pane(self._active_state, dock_pane)
+
     @observe("_states.items")
     def _states_updated(self, event):
         self.tasks = [state.task for state in self._states]
@@ -460,6 +575,14 @@ class TaskState(HasStrictTraits):
     #: Whether the task state has been initialized.
     initialized = Bool(False)
 
+    #: Whether the menu bar, status bar and tool bar managers have been
+    #: created.
+    action_managers_created = Bool(False)
+
+    #: The time in seconds taken to create the control of each pane, by pane
+    #: ID.
+    pane_timings = Dict(Str, Float)
+
     #: The central pane of the TaskWindow
     central_pane = Instance(ITaskPane)
 
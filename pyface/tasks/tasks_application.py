@@ -15,6 +15,7 @@ the creation of tasks and corresponding windows.
 import logging
 
 from traits.api import (
+    Any,
     Callable,
     HasStrictTraits,
     List,
@@ -27,6 +28,7 @@ from traits.api import (
 from traits.observation.api import trait
 
 from pyface.gui_application import GUIApplication
+from pyface.util.startup_profiler import profile_phase
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,11 @@ class TasksApplication(GUIApplication):
         Instance("pyface.tasks.task_window_layout.TaskWindowLayout")
     )
 
+    #: The file in which the layouts of the windows are saved when the
+    #: application exits, and from which they are restored when it starts.
+    #: If empty, the default layout is always used.
+    layout_file = Str()
+
     #: Hook to add global schema additions to tasks/windows
     extra_actions = List(
         Instance("pyface.action.schema.schema_addition.SchemaAddition")
@@ -92,6 +99,11 @@ class TasksApplication(GUIApplication):
     #: Hook to add global dock pane additions to tasks/windows
     extra_dock_pane_factories = List(Callable)
 
+    # Private interface ------------------------------------------------------
+
+    #: The store for the layout file.
+    _layout_store = Any()
+
     # Window lifecycle methods -----------------------------------------------
 
     def create_task(self, id):
@@ -111,7 +123,8 @@ class TasksApplication(GUIApplication):
             logger.warning("Could not find task factory {}".format(id))
             return None
 
-        task = factory.create(id=factory.id)
+        with profile_phase("create_task", "task", {"id": id}):
+            task = factory.create(id=factory.id)
         task.extra_actions.extend(self.extra_actions)
         task.extra_dock_pane_factories.extend(self.extra_dock_pane_factories)
         return task
@@ -152,10 +165,61 @@ class TasksApplication(GUIApplication):
 
         return window
 
+    # Layout persistence ------------------------------------------------------
+
+    def load_window_layouts(self):
+        """ Load the window layouts saved in the layout file.
+
+        Returns
+        -------
+        layouts : list of TaskWindowLayout
+            The saved layouts, or an empty list if there is no layout file or
+            it can't be read.
+        """
+        from pyface.util.layout_format import LayoutFormatError
+
+        store = self._get_layout_store()
+        if store is None:
+            return []
+        try:
+            layouts = store.load()
+        except (LayoutFormatError, OSError):
+            logger.exception("Could not load layouts from %s", store.path)
+            return []
+        return [layouts[key] for key in sorted(layouts)]
+
+    def save_window_layouts(self):
+        """ Save the layouts of the open windows to the layout file.
+
+        Only the layouts of windows which have changed since the layouts were
+        last loaded or saved are written.
+
+        Returns
+        -------
+        count : int
+            The number of layouts written.
+        """
+        store = self._get_layout_store()
+        if store is None:
+            return 0
+        layouts = [
+            window.get_window_layout()
+            for window in self.windows
+            if hasattr(window, "get_window_layout")
+        ]
+        return store.save(
+            {
+                "window{:04d}".format(index): layout
+                for index, layout in enumerate(layouts)
+            }
+        )
+
     def _create_windows(self):
-        """ Create the initial windows to display from the default layout.
+        """ Create the initial windows to display from the saved layouts, or
+        the default layout if there are none.
         """
-        for layout in self.default_layout:
+        layouts = self.load_window_layouts() or self.default_layout
+        for layout in layouts:
             window = self.create_window(layout)
             self.add_window(window)
             self.active_window = window
@@ -164,6 +228,29 @@ class TasksApplication(GUIApplication):
         # Private interface
         # -------------------------------------------------------------------------
 
+    def _prepare_exit(self):
+        """ Save the window layouts and close each window. """
+        if self.layout_file:
+            try:
+                self.save_window_layouts()
+            except Exception:
+                logger.exception(
+                    "Could not save layouts to %s", self.layout_file
+                )
+        super()._prepare_exit()
+
+    def _get_layout_store(self):
+        """ The store for the layout file, or None if there is none. """
+        from pyface.util.layout_format import LayoutStore
+
+        if not self.layout_file:
+            return None
+        if self._layout_store is None or (
+            self._layout_store.path != self.layout_file
+        ):
+            self._layout_store = LayoutStore(self.layout_file)
+        return self._layout_store
+
     def _get_task_factory(self, id):
         """ Returns the TaskFactory with the specified ID, or None.
         """
@@ -9,11 +9,55 @@
 # Thanks for using Enthought open source!
 import unittest
 
+from traits.api import Int
+from traits.etsconfig.api import ETSConfig
 from traits.testing.api import UnittestTools
-from pyface.tasks.api import Task
+from pyface.gui import GUI
+from pyface.tasks.api import (
+    DockPane,
+    PaneItem,
+    Task,
+    TaskLayout,
+    TaskPane,
+)
 from ..task_window import TaskWindow
 
 
+USING_WX = ETSConfig.toolkit not in {"", "qt", "qt4"}
+
+
+class CountingDockPane(DockPane):
+
+    #: The number of times the pane's control has been created.
+    create_count = Int()
+
+    def create(self, parent):
+        self.create_count += 1
+        super().create(parent)
+
+
+class LazyTask(Task):
+
+    #: The number of times the task's panes have been created.
+    pane_creation_count = Int()
+
+    def _default_layout_default(self):
+        return TaskLayout(left=PaneItem("tests.lazy_task.layout_pane"))
+
+    def create_central_pane(self):
+        return TaskPane(id="tests.lazy_task.central_pane")
+
+    def create_dock_panes(self):
+        self.pane_creation_count += 1
+        return [
+            CountingDockPane(id="tests.lazy_task.layout_pane"),
+            CountingDockPane(id="tests.lazy_task.hidden_pane"),
+            CountingDockPane(
+                id="tests.lazy_task.visible_pane", visible=True
+            ),
+        ]
+
+
 def _task_window_with_named_tasks(*names, **kwargs):
     tasks = [Task(name=name) for name in names]
 
@@ -165,3 +209,126 @@ class TestTaskWindow(unittest.TestCase, UnittestTools):
         with self.assertTraitChanges(task_window, "title", count=1):
             task_window.title = ""
         self.assertEqual(task_window.title, "")
+
+
+@unittest.skipIf(USING_WX, "TaskWindowBackend is not implemented in WX")
+class TestTaskWindowDeferredPanes(unittest.TestCase):
+    def setUp(self):
+        self.gui = GUI()
+        self.window = TaskWindow(defer_pane_creation=True)
+        self.task_1 = LazyTask(id="tests.lazy_task_1")
+        self.task_2 = LazyTask(id="tests.lazy_task_2")
+        self.window.add_task(self.task_1)
+        self.window.add_task(self.task_2)
+
+    def tearDown(self):
+        if self.window.control is not None:
+            self.window.destroy()
+            self.gui.process_events()
+        del self.window
+        del self.gui
+
+    def test_add_task_creates_nothing(self):
+        state = self.window._get_state(self.task_1)
+        self.assertEqual(self.task_1.pane_creation_count, 0)
+        self.assertIsNone(state.central_pane)
+        self.assertFalse(state.action_managers_created)
+        self.assertEqual(self.window.get_pane_timings(self.task_1), {})
+
+    def test_activate_task_creates_needed_controls(self):
+        self.window.activate_task(self.task_1)
+
+        panes = {
+            pane.id: pane for pane in self.window.get_dock_panes(self.task_1)
+        }
+        self.assertIsNotNone(self.window.central_pane.control)
+        self.assertEqual(
+            panes["tests.lazy_task.layout_pane"].create_count, 1
+        )
+        self.assertEqual(
+            panes["tests.lazy_task.visible_pane"].create_count, 1
+        )
+        self.assertIsNone(panes["tests.lazy_task.hidden_pane"].control)
+        state = self.window._get_state(self.task_1)
+        self.assertTrue(state.action_managers_created)
+        self.assertEqual(
+            set(self.window.get_pane_timings()),
+            {
+                "tests.lazy_task.central_pane",
+                "tests.lazy_task.layout_pane",
+                "tests.lazy_task.visible_pane",
+            },
+        )
+
+        # The inactive task is untouched.
+        self.assertEqual(self.task_2.pane_creation_count, 0)
+
+    def test_hidden_pane_created_when_visible(self):
+        self.window.activate_task(self.task_1)
+        pane = self.window.get_dock_pane("tests.lazy_task.hidden_pane")
+
+        pane.visible = True
+
+        self.assertEqual(pane.create_count, 1)
+        self.assertIsNotNone(pane.control)
+        self.assertIn(
+            "tests.lazy_task.hidden_pane", self.window.get_pane_timings()
+        )
+
+    def test_get_dock_panes_does_not_create_controls(self):
+        panes = self.window.get_dock_panes(self.task_2)
+
+        self.assertEqual(len(panes), 3)
+        self.assertTrue(all(pane.control is None for pane in panes))
+        self.assertIs(
+            self.window.get_dock_pane(
+                "tests.lazy_task.hidden_pane", self.task_2
+            ),
+            panes[1],
+        )
+
+        # Activating reuses the panes which have already been created.
+        self.window.activate_task(self.task_2)
+        self.assertEqual(self.task_2.pane_creation_count, 1)
+
+    def test_switching_tasks_creates_controls_once(self):
+        self.window.activate_task(self.task_1)
+        self.window.activate_task(self.task_2)
+        self.window.activate_task(self.task_1)
+
+        pane = self.window.get_dock_pane("tests.lazy_task.layout_pane")
+        self.assertEqual(pane.create_count, 1)
+
+    def test_set_layout_creates_controls(self):
+        self.window.activate_task(self.task_1)
+        pane = self.window.get_dock_pane("tests.lazy_task.hidden_pane")
+
+        self.window.set_layout(
+            TaskLayout(right=PaneItem("tests.lazy_task.hidden_pane"))
+        )
+
+        self.assertEqual(pane.create_count, 1)
+
+    def test_remove_never_activated_task(self):
+        self.window.remove_task(self.task_2)
+
+        self.assertIsNone(self.task_2.window)
+        self.assertEqual(self.task_2.pane_creation_count, 0)
+
+    def test_eager_pane_creation(self):
+        window = TaskWindow(defer_pane_creation=False)
+        task = LazyTask()
+        try:
+            window.add_task(task)
+
+            self.assertTrue(
+                all(
+                    pane.control is not None
+                    for pane in window.get_dock_panes(task)
+                )
+            )
+            self.assertIsNotNone(window.get_central_pane(task).control)
+            self.assertEqual(len(window.get_pane_timings(task)), 4)
+        finally:
+            window.destroy()
+            self.gui.process_events()
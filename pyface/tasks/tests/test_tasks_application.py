@@ -9,6 +9,9 @@
 # Thanks for using Enthought open source!
 
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from traits.api import Bool, observe
@@ -16,7 +19,10 @@ from traits.api import Bool, observe
 from pyface.application_window import ApplicationWindow
 from pyface.toolkit import toolkit_object
 
-from ..tasks_application import TasksApplication
+from ..task import Task
+from ..task_pane import TaskPane
+from ..task_window_layout import TaskWindowLayout
+from ..tasks_application import TaskFactory, TasksApplication
 
 GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
 no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
@@ -30,6 +36,11 @@ EVENTS = [
 ]
 
 
+class PaneTask(Task):
+    def create_central_pane(self):
+        return TaskPane()
+
+
 class TestingApp(TasksApplication):
 
     #: Whether the app should start cleanly.
@@ -129,6 +140,24 @@ class TestApplication(unittest.TestCase, GuiTestAssistant):
         self.assertEqual(app.user_data, ETSConfig.user_data)
         self.assertEqual(app.company, ETSConfig.company)
 
+    def test_layout_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "layouts")
+        factory = TaskFactory(id="test_task", factory=PaneTask)
+
+        app = TasksApplication(task_factories=[factory], layout_file=path)
+        self.assertEqual(app.load_window_layouts(), [])
+        self.gui.invoke_after(1000, app.exit)
+        app.run()
+
+        self.assertTrue(os.path.exists(path))
+        app = TasksApplication(task_factories=[factory], layout_file=path)
+        layouts = app.load_window_layouts()
+        self.assertEqual(len(layouts), 1)
+        self.assertIsInstance(layouts[0], TaskWindowLayout)
+        self.assertEqual(layouts[0].get_tasks(), ["test_task"])
+
     def test_lifecycle(self):
 
         app = TasksApplication()
@@ -0,0 +1,157 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import asyncio
+import threading
+import unittest
+
+from traits.api import Event, HasTraits
+
+from ..asyncio_event_loop import (
+    GUIEventLoop, GUIEventLoopPolicy, open_dialog, wait_for_event
+)
+from ..constant import CANCEL, OK
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+class Source(HasTraits):
+    fired = Event()
+
+
+class FakeDialog(HasTraits):
+    """ A dialog stand-in which reports how it was opened. """
+
+    style = "modal"
+
+    def __init__(self, loop, result):
+        super().__init__()
+        self.loop = loop
+        self.result = result
+        self.opened_in_step = None
+
+    def open(self):
+        self.opened_in_step = self.loop._stepping
+        return self.result
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestGUIEventLoop(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.loop = GUIEventLoop(gui=self.gui)
+
+    def tearDown(self):
+        self.loop.close()
+        GuiTestAssistant.tearDown(self)
+
+    def test_run_until_complete(self):
+        async def gather():
+            results = await asyncio.gather(
+                *(asyncio.sleep(0.01 * (i % 5), result=i) for i in range(50))
+            )
+            return sum(results)
+
+        result = self.loop.run_until_complete(gather())
+
+        self.assertEqual(result, sum(range(50)))
+        self.assertFalse(self.loop.is_running())
+
+    def test_running_loop_in_coroutine(self):
+        async def get_loop():
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+        result = self.loop.run_until_complete(get_loop())
+
+        self.assertIs(result, self.loop)
+
+    def test_attach_runs_with_gui_event_loop(self):
+        results = []
+
+        async def record():
+            await asyncio.sleep(0.01)
+            results.append(threading.current_thread())
+
+        self.loop.attach()
+        self.assertTrue(self.loop.is_running())
+        task = self.loop.create_task(record())
+
+        self.event_loop_helper.event_loop_until_condition(task.done)
+
+        self.assertEqual(results, [threading.main_thread()])
+        self.loop.detach()
+        self.assertFalse(self.loop.is_running())
+
+    def test_stop_detaches(self):
+        self.loop.attach()
+        self.loop.call_soon(self.loop.stop)
+
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not self.loop.is_running()
+        )
+
+    def test_call_soon_threadsafe(self):
+        results = []
+        self.loop.attach()
+
+        thread = threading.Thread(
+            target=self.loop.call_soon_threadsafe,
+            args=(results.append, "called"),
+        )
+        thread.start()
+        thread.join()
+
+        self.event_loop_helper.event_loop_until_condition(lambda: results)
+        self.loop.detach()
+
+    def test_wait_for_event(self):
+        source = Source()
+
+        async def wait():
+            return await wait_for_event(source, "fired")
+
+        self.loop.attach()
+        task = self.loop.create_task(wait())
+        self.event_loop_helper.event_loop()
+        self.assertFalse(task.done())
+
+        source.fired = "value"
+        self.event_loop_helper.event_loop_until_condition(task.done)
+
+        self.assertEqual(task.result(), "value")
+        self.loop.detach()
+
+    def test_open_dialog_outside_step(self):
+        dialog = FakeDialog(self.loop, CANCEL)
+
+        result = self.loop.run_until_complete(open_dialog(dialog))
+
+        self.assertEqual(result, CANCEL)
+        self.assertFalse(dialog.opened_in_step)
+
+    def test_policy(self):
+        policy = GUIEventLoopPolicy()
+
+        loop = policy.new_event_loop()
+        try:
+            self.assertIsInstance(loop, GUIEventLoop)
+        finally:
+            loop.close()
+
+    def test_open_dialog_ok(self):
+        dialog = FakeDialog(self.loop, OK)
+
+        result = self.loop.run_until_complete(open_dialog(dialog))
+
+        self.assertEqual(result, OK)
@@ -176,6 +176,35 @@ class TestGUIApplication(unittest.TestCase, GuiTestAssistant):
         self.assertEqual(event_order, EVENTS)
         self.assertEqual(app.windows, [])
 
+    def test_startup_profile(self):
+        from pyface.util.startup_profiler import startup_profiler
+
+        app = GUIApplication()
+        window = ApplicationWindow()
+        app.observe(lambda _: app.add_window(window), "started")
+
+        startup_profiler.reset()
+        startup_profiler.enabled = True
+        self.addCleanup(setattr, startup_profiler, "enabled", False)
+        self.gui.invoke_after(1000, app.exit)
+        result = app.run()
+
+        self.assertTrue(result)
+        # recording stops once the application is initialized
+        self.assertFalse(startup_profiler.enabled)
+        names = [event[0] for event in startup_profiler.events]
+        for name in [
+            "starting",
+            "create_windows",
+            "start",
+            "started",
+            "create_menu_bar",
+            "open_window",
+            "application_initialized",
+        ]:
+            self.assertIn(name, names)
+        self.assertNotIn("stopping", names)
+
     def test_exit_prepare_error(self):
         app = TestingApp(exit_prepared_error=True)
         self.connect_listeners(app)
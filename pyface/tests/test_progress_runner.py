@@ -0,0 +1,197 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from concurrent.futures import ProcessPoolExecutor
+import threading
+import unittest
+from unittest import mock
+
+from traits.api import TraitError
+
+from ..progress_dialog import ProgressDialog
+from ..progress_runner import (
+    ProgressCancelled, ProgressChannel, ProgressRunner, _execute
+)
+from ..toolkit import toolkit_object
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+def count_to(n):
+    for i in range(n):
+        yield i + 1, "Step {}".format(i + 1)
+    return "done"
+
+
+def report_many(n, progress):
+    for i in range(n):
+        progress.report(i)
+    return n
+
+
+class TestProgressChannel(unittest.TestCase):
+
+    def test_report_keeps_latest(self):
+        channel = ProgressChannel()
+        self.assertIsNone(channel.latest())
+
+        channel.report(1)
+        channel.report(2, "two")
+
+        self.assertEqual(channel.latest(), (2, "two"))
+
+    def test_cancel(self):
+        channel = ProgressChannel()
+        channel.check_cancelled()
+        self.assertFalse(channel.cancelled)
+
+        channel.cancel()
+
+        self.assertTrue(channel.cancelled)
+        with self.assertRaises(ProgressCancelled):
+            channel.check_cancelled()
+
+    def test_execute_generator(self):
+        channel = ProgressChannel()
+
+        result = _execute(count_to, channel, (3,), {})
+
+        self.assertEqual(result, "done")
+        self.assertEqual(channel.latest(), (3, "Step 3"))
+
+    def test_execute_generator_cancelled(self):
+        channel = ProgressChannel()
+        seen = []
+
+        def work():
+            for i in range(10):
+                seen.append(i)
+                if i == 2:
+                    channel.cancel()
+                yield i
+
+        with self.assertRaises(ProgressCancelled):
+            _execute(work, channel, (), {})
+        self.assertEqual(seen, [0, 1, 2])
+
+    def test_execute_callable(self):
+        channel = ProgressChannel()
+
+        result = _execute(report_many, channel, (5,), {})
+
+        self.assertEqual(result, 5)
+        self.assertEqual(channel.latest(), (4, None))
+
+
+class TestProgressRunnerTraits(unittest.TestCase):
+
+    def test_max_update_rate_must_be_positive(self):
+        runner = ProgressRunner(max_update_rate=0.5)
+
+        with self.assertRaises(TraitError):
+            runner.max_update_rate = 0
+        with self.assertRaises(TraitError):
+            runner.max_update_rate = -1.0
+        self.assertEqual(runner.max_update_rate, 0.5)
+
+
+@unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestProgressRunner(unittest.TestCase, GuiTestAssistant):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.dialog = ProgressDialog(min=0, max=100000, can_cancel=True)
+        self.runner = ProgressRunner(dialog=self.dialog, max_update_rate=20)
+
+    def tearDown(self):
+        self.runner.shutdown()
+        if self.dialog.control is not None:
+            with self.delete_widget(self.dialog.control):
+                self.dialog.destroy()
+        GuiTestAssistant.tearDown(self)
+
+    def test_run_rate_limited(self):
+        with mock.patch.object(
+            self.dialog, "update", wraps=self.dialog.update
+        ) as update:
+            with self.assertTraitChanges(self.runner, "finished"):
+                future = self.runner.run(report_many, 100000)
+                self.event_loop_helper.event_loop_until_condition(
+                    lambda: self.dialog.control is None
+                )
+
+        self.assertEqual(future.result(), 100000)
+        self.assertLess(update.call_count, 1000)
+        self.assertIsNone(self.dialog.control)
+
+    def test_run_generator(self):
+        self.dialog.max = 50
+
+        future = self.runner.run(count_to, 50)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.dialog.control is None
+        )
+
+        self.assertEqual(future.result(), "done")
+        self.assertEqual(self.dialog.message, "Step 50")
+
+    def test_closing_dialog_cancels(self):
+        started = threading.Event()
+
+        def work(progress):
+            started.set()
+            while not progress.cancelled:
+                progress.report(1)
+            progress.check_cancelled()
+
+        future = self.runner.run(work)
+        started.wait()
+        with self.event_loop():
+            self.dialog.close()
+        self.event_loop_helper.event_loop_until_condition(future.done)
+
+        self.assertIsInstance(future.exception(), ProgressCancelled)
+
+    def test_cancel(self):
+        def work(progress):
+            while True:
+                progress.check_cancelled()
+
+        future = self.runner.run(work)
+        self.runner.cancel()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.dialog.control is None
+        )
+
+        self.assertIsInstance(future.exception(), ProgressCancelled)
+
+    def test_run_while_running(self):
+        event = threading.Event()
+        self.runner.run(lambda progress: event.wait())
+        try:
+            with self.assertRaises(RuntimeError):
+                self.runner.run(lambda progress: None)
+        finally:
+            event.set()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.dialog.control is None
+        )
+
+    def test_process_pool(self):
+        self.runner.executor = ProcessPoolExecutor(max_workers=1)
+        self.dialog.max = 5
+
+        future = self.runner.run(count_to, 5)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.dialog.control is None, timeout=30.0
+        )
+
+        self.assertEqual(future.result(), "done")
@@ -18,6 +18,9 @@ API for the ``pyface.timer`` subpackage.
 - :class:`~.CallbackTimer`
 - :class:`~.EventTimer`
 - :class:`~.Timer`
+- :class:`~.TimerWheel`
+- :class:`~.WheelCallbackTimer`
+- :class:`~.WheelEventTimer`
 
 Interfaces
 ----------
@@ -28,6 +31,7 @@ Interfaces
 """
 
 from .i_timer import ICallbackTimer, IEventTimer, ITimer
+from .timer_wheel import TimerWheel, WheelCallbackTimer, WheelEventTimer
 
 
 # ----------------------------------------------------------------------------
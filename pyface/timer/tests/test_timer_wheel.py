@@ -0,0 +1,262 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+from unittest import TestCase, mock, skipIf
+
+from pyface.toolkit import toolkit_object
+from ..timer_wheel import TimerWheel, WheelCallbackTimer, WheelEventTimer
+
+GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
+no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
+
+
+class FakeDriver(object):
+    """ A stand-in for the toolkit timer driving a wheel. """
+
+    def __init__(self, wheel):
+        self.wheel = wheel
+        self.active = False
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestTimerWheel(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch(
+            "pyface.timer.i_timer.perf_counter", self.clock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.wheel = TimerWheel(
+            resolution=0.01, slot_bits=2, levels=3, driver_factory=FakeDriver
+        )
+
+    def test_call_later(self):
+        calls = []
+
+        self.wheel.call_later(0.05, calls.append, "a")
+
+        self.assertTrue(self.wheel._driver.active)
+        self.wheel.advance(4)
+        self.assertEqual(calls, [])
+        self.wheel.advance(5)
+        self.assertEqual(calls, ["a"])
+        self.assertFalse(self.wheel._driver.active)
+        self.assertEqual(self.wheel.count, 0)
+
+    def test_deadlines_across_levels(self):
+        # 4 slots per level, 3 levels: covers 64 ticks, so these exercise
+        # every level, cascading and parking beyond the span of the wheel
+        calls = []
+        delays = [1, 3, 4, 5, 15, 16, 17, 40, 63, 64, 100, 150]
+        for delay in reversed(delays):
+            self.wheel.call_later(
+                delay * 0.01, lambda d=delay: calls.append((d, self.tick))
+            )
+
+        for self.tick in range(1, 200):
+            self.wheel.advance(self.tick)
+
+        self.assertEqual(calls, [(delay, delay) for delay in delays])
+        self.assertGreater(self.wheel.statistics()["cascaded"], 0)
+
+    def test_late_driver_fires_all_expired(self):
+        calls = []
+        for delay in [0.01, 0.02, 0.03]:
+            self.wheel.call_later(delay, calls.append, delay)
+
+        self.wheel.advance(10)
+
+        self.assertEqual(calls, [0.01, 0.02, 0.03])
+        self.assertEqual(self.wheel.statistics()["max_lateness"], 9)
+
+    def test_cancel(self):
+        calls = []
+        entry = self.wheel.call_later(0.02, calls.append, "a")
+        self.wheel.call_later(0.02, calls.append, "b")
+
+        self.wheel.cancel(entry)
+        self.wheel.cancel(entry)
+        self.wheel.advance(2)
+
+        self.assertEqual(calls, ["b"])
+        stats = self.wheel.statistics()
+        self.assertEqual(stats["cancelled"], 1)
+        self.assertEqual(stats["fired"], 1)
+
+    def test_cancel_last_stops_driver(self):
+        entry = self.wheel.call_later(0.02, print)
+
+        self.wheel.cancel(entry)
+
+        self.assertFalse(self.wheel._driver.active)
+        self.assertEqual(self.wheel.count, 0)
+
+    def test_slack_coalesces_deadlines(self):
+        calls = []
+        self.clock.time = 0.013
+        for delay in [0.01, 0.02, 0.03, 0.04]:
+            deadline = self.wheel.deadline(delay, slack=0.08)
+            self.wheel.schedule(deadline, calls.append, (delay,))
+
+        self.wheel.advance(7)
+        self.assertEqual(calls, [])
+        self.wheel.advance(8)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(self.wheel.statistics()["coalesced"], 3)
+
+    def test_idle_wheel_follows_clock(self):
+        calls = []
+        self.clock.time = 10.0
+
+        self.wheel.call_later(0.01, calls.append, "a")
+        self.wheel.advance(1000)
+        self.assertEqual(calls, [])
+        self.wheel.advance(1001)
+
+        self.assertEqual(calls, ["a"])
+
+    def test_callback_exception(self):
+        def fail():
+            raise ZeroDivisionError()
+
+        self.wheel.call_later(0.01, fail)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.wheel.advance(1)
+
+        self.assertEqual(self.wheel.count, 0)
+        self.assertFalse(self.wheel._driver.active)
+
+    def test_callback_exception_calls_rest_of_tick(self):
+        calls = []
+
+        def fail(name):
+            calls.append(name)
+            raise ZeroDivisionError()
+
+        self.wheel.call_later(0.01, fail, "a")
+        self.wheel.call_later(0.01, calls.append, "b")
+        self.wheel.call_later(0.01, fail, "c")
+        self.wheel.call_later(0.05, calls.append, "d")
+
+        with self.assertLogs("pyface.timer.timer_wheel", "ERROR"):
+            with self.assertRaises(ZeroDivisionError):
+                self.wheel.advance(1)
+
+        self.assertEqual(calls, ["a", "b", "c"])
+        self.assertEqual(self.wheel.count, 1)
+        self.assertTrue(self.wheel._driver.active)
+
+        self.wheel.advance(5)
+
+        self.assertEqual(calls, ["a", "b", "c", "d"])
+        self.assertEqual(self.wheel.count, 0)
+        self.assertFalse(self.wheel._driver.active)
+
+    def test_wheel_timer(self):
+        calls = []
+        timer = WheelCallbackTimer(
+            wheel=self.wheel, interval=0.03, repeat=3, callback=calls.append,
+            args=("a",),
+        )
+
+        timer.start()
+        for tick in range(1, 20):
+            self.wheel.advance(tick)
+
+        self.assertEqual(calls, ["a", "a", "a"])
+        self.assertFalse(timer.active)
+        self.assertEqual(self.wheel.count, 0)
+
+    def test_wheel_timer_stop(self):
+        timer = WheelEventTimer(wheel=self.wheel, interval=0.03)
+        events = []
+        timer.observe(events.append, "timeout")
+
+        timer.start()
+        self.wheel.advance(3)
+        timer.stop()
+        self.wheel.advance(10)
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(self.wheel.count, 0)
+
+    def test_wheel_timer_coalesce(self):
+        timers = []
+        self.clock.time = 0.011
+        for i in range(3):
+            timer = WheelEventTimer(
+                wheel=self.wheel, interval=0.05, coalesce=True
+            )
+            timer.start()
+            timers.append(timer)
+            self.clock.time += 0.01
+
+        entries = {timer._entry.deadline for timer in timers}
+        for timer in timers:
+            timer.stop()
+
+        self.assertEqual(entries, {10})
+
+
+@skipIf(no_gui_test_assistant, "No GuiTestAssistant")
+class TestWheelTimerEventLoop(TestCase, GuiTestAssistant):
+    """ Test wheel timers driven by a toolkit timer. """
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+
+    def tearDown(self):
+        GuiTestAssistant.tearDown(self)
+
+    def test_many_timers(self):
+        wheel = TimerWheel()
+        calls = []
+        for i in range(1000):
+            wheel.call_later(0.001 * (i % 100), calls.append, i)
+
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: len(calls) == 1000
+        )
+
+        self.assertEqual(sorted(calls), list(range(1000)))
+        self.assertEqual(wheel.count, 0)
+
+    def test_callback_timer_repeat(self):
+        calls = []
+        timer = WheelCallbackTimer(
+            wheel=TimerWheel(), interval=0.02, repeat=4,
+            callback=lambda: calls.append(1),
+        )
+        timer.start()
+        try:
+            self.event_loop_helper.event_loop_until_condition(
+                lambda: not timer.active
+            )
+        finally:
+            timer.stop()
+
+        self.assertEqual(len(calls), 4)
@@ -0,0 +1,458 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+"""
+A hierarchical timer wheel driven by a single toolkit timer.
+
+Each :class:`~pyface.timer.timer.PyfaceTimer` owns a toolkit timer, which is
+fine for a handful of timers but has a noticeable cost when an application
+has thousands of them.  The :class:`TimerWheel` multiplexes any number of
+timers onto one toolkit timer which ticks at a fixed resolution while there
+are timers scheduled.  Scheduling and cancelling are O(1), and each tick only
+looks at the timers which expire in it.
+
+:class:`WheelEventTimer` and :class:`WheelCallbackTimer` provide the usual
+:class:`~pyface.timer.i_timer.ITimer` API on top of a wheel, and
+:meth:`TimerWheel.call_later` is a lightweight alternative to
+:func:`~pyface.timer.do_later.do_after` which does not create a
+:class:`~traits.has_traits.HasTraits` object per call.
+"""
+
+import logging
+import math
+
+from traits.api import Bool, Instance, Range
+
+from pyface.timer.i_timer import BaseTimer, MCallbackTimer, MEventTimer
+from pyface.timer import i_timer
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+class WheelEntry:
+    """ A handle for a callback scheduled on a :class:`TimerWheel`.
+
+    Parameters
+    ----------
+    deadline : int
+        The tick at which the callback is due.
+    callback : callable
+        The callable to call when the entry expires.
+    args, kwargs : tuple, dict
+        The arguments to pass to the callback.
+    """
+
+    __slots__ = ("deadline", "callback", "args", "kwargs", "cancelled")
+
+    def __init__(self, deadline, callback, args=(), kwargs=None):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.cancelled = False
+
+
+class TimerWheel:
+    """ A hierarchical timer wheel.
+
+    Time is divided into ticks of ``resolution`` seconds.  The wheel has
+    ``levels`` levels of ``2 ** slot_bits`` slots each: the first level holds
+    entries due within one revolution, and each further level covers
+    ``2 ** slot_bits`` times the span of the one below.  Entries on higher
+    levels are cascaded down as their slot comes round.
+
+    Parameters
+    ----------
+    resolution : float
+        The length of a tick, in seconds.
+    slot_bits : int
+        The base-2 logarithm of the number of slots per level.
+    levels : int
+        The number of levels.
+    driver_factory : callable or None
+        A callable which takes the wheel and returns an ITimer that calls
+        :meth:`advance` every tick.  If None then a toolkit
+        :class:`~pyface.timer.timer.CallbackTimer` is used.
+    """
+
+    def __init__(
+        self, resolution=0.01, slot_bits=6, levels=4, driver_factory=None
+    ):
+        self.resolution = resolution
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._span = 1 << (slot_bits * levels)
+        self._wheel = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._driver_factory = driver_factory
+        self._driver = None
+        self._origin = i_timer.perf_counter()
+        self._current = 0
+        self._count = 0
+        # the clock tick being advanced to, while callbacks are running
+        self._advancing = None
+        self.reset_statistics()
+
+    @property
+    def count(self):
+        """ The number of entries currently scheduled. """
+        return self._count
+
+    def now(self):
+        """ The current tick, according to the clock. """
+        return int((i_timer.perf_counter() - self._origin) / self.resolution)
+
+    def call_later(self, delay, callback, *args, **kwargs):
+        """ Call a callback once after a delay.
+
+        Parameters
+        ----------
+        delay : float
+            The delay in seconds.
+        callback : callable
+            The callable to call.
+        *args, **kwargs
+            The arguments to pass to the callback.
+
+        Returns
+        -------
+        entry : WheelEntry
+            A handle which can be passed to :meth:`cancel`.
+        """
+        return self.schedule(self.deadline(delay), callback, args, kwargs)
+
+    def deadline(self, delay, slack=0.0, align=1):
+        """ Compute the deadline tick for a delay.
+
+        Parameters
+        ----------
+        delay : float
+            The delay in seconds.
+        slack : float
+            The amount of time, in seconds, by which the deadline may be
+            postponed so that it coincides with other deadlines.  The
+            deadline is rounded up to a multiple of the slack.
+        align : int
+            If greater than one, the deadline is rounded up to a multiple of
+            this many ticks, so that timers with the same interval expire in
+            the same tick.
+
+        Returns
+        -------
+        deadline : int
+            The tick at which the delay expires.  This is always at least
+            one tick after the current tick.
+        """
+        ticks = max(1, math.ceil(delay / self.resolution))
+        deadline = self._start_tick() + ticks
+        granule = max(align, int(slack / self.resolution))
+        if granule > 1:
+            deadline = -(-deadline // granule) * granule
+        return deadline
+
+    def schedule(self, deadline, callback, args=(), kwargs=None):
+        """ Schedule a callback for a given deadline tick.
+
+        Parameters
+        ----------
+        deadline : int
+            The tick at which to call the callback, as returned by
+            :meth:`deadline`.
+        callback : callable
+            The callable to call.
+        args, kwargs : tuple, dict
+            The arguments to pass to the callback.
+
+        Returns
+        -------
+        entry : WheelEntry
+            A handle which can be passed to :meth:`cancel`.
+        """
+        if self._count == 0:
+            self._start_tick()
+        entry = WheelEntry(
+            max(deadline, self._current + 1), callback, args, kwargs
+        )
+        self._place(entry)
+        self._count += 1
+        self._scheduled += 1
+        if self._count == 1:
+            self._start_driver()
+        return entry
+
+    def cancel(self, entry):
+        """ Cancel a scheduled entry.
+
+        Cancelling an entry which has already expired or been cancelled does
+        nothing.
+
+        Parameters
+        ----------
+        entry : WheelEntry
+            The entry to cancel.
+        """
+        if entry.cancelled:
+            return
+        entry.cancelled = True
+        self._count -= 1
+        self._cancelled += 1
+        if self._count == 0:
+            self._stop_driver()
+
+    def advance(self, tick=None):
+        """ Advance the wheel, calling the callbacks of expired entries.
+
+        This is usually called by the driving timer.
+
+        Parameters
+        ----------
+        tick : int or None
+            The tick to advance to.  If None, the current tick according to
+            the clock is used.
+        """
+        if tick is None:
+            tick = self.now()
+        self._driver_ticks += 1
+        self._advancing = tick
+        try:
+            self._advance(tick)
+        finally:
+            self._advancing = None
+
+    def statistics(self):
+        """ Return a dictionary of wheel statistics.
+
+        Returns
+        -------
+        statistics : dict
+            The number of entries currently ``active``, and the number of
+            entries ``scheduled``, ``fired`` and ``cancelled``, the number
+            of entries which fired in the same tick as another
+            (``coalesced``), the number of entries ``cascaded`` between
+            levels, the number of ``ticks`` processed and ``driver_ticks``
+            received, and the ``max_lateness`` in ticks of any entry.
+        """
+        return {
+            "active": self._count,
+            "scheduled": self._scheduled,
+            "fired": self._fired,
+            "cancelled": self._cancelled,
+            "coalesced": self._coalesced,
+            "cascaded": self._cascaded,
+            "ticks": self._ticks,
+            "driver_ticks": self._driver_ticks,
+            "max_lateness": self._max_lateness,
+        }
+
+    def reset_statistics(self):
+        """ Reset the accumulated statistics. """
+        self._scheduled = 0
+        self._fired = 0
+        self._cancelled = 0
+        self._coalesced = 0
+        self._cascaded = 0
+        self._ticks = 0
+        self._driver_ticks = 0
+        self._max_lateness = 0
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _advance(self, tick):
+        """ Process the ticks up to ``tick``. """
+        while self._current < tick and self._count > 0:
+            expired = self._tick()
+            live = [entry for entry in expired if not entry.cancelled]
+            if len(live) > 1:
+                self._coalesced += len(live) - 1
+            # the entries have left the wheel, so all of them are called
+            # even if one raises; the first exception is raised afterwards
+            error = None
+            for entry in live:
+                # an earlier callback in this tick may cancel a later one
+                if entry.cancelled:
+                    continue
+                entry.cancelled = True
+                self._count -= 1
+                self._fired += 1
+                self._max_lateness = max(
+                    self._max_lateness, tick - entry.deadline
+                )
+                try:
+                    entry.callback(*entry.args, **entry.kwargs)
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+                    else:
+                        logger.exception("Error in timer wheel callback")
+            if error is not None:
+                if self._count == 0:
+                    self._stop_driver()
+                raise error
+        if self._count == 0:
+            self._stop_driver()
+
+    def _start_tick(self):
+        """ The tick from which new deadlines are measured.
+
+        This is the clock's current tick, even if the driving timer is
+        running late.  When the wheel is idle it is fast-forwarded to the
+        clock, which is safe because all its slots are empty.
+        """
+        if self._advancing is not None:
+            now = max(self._current, self._advancing)
+        else:
+            now = max(self._current, self.now())
+        if self._count == 0:
+            self._current = now
+        return now
+
+    def _place(self, entry):
+        """ Put an entry in the slot for its deadline. """
+        delta = min(entry.deadline - self._current, self._span - 1)
+        # entries beyond the span of the wheel are parked in the top level
+        # and re-placed when they are cascaded
+        target = self._current + delta
+        bits = self._bits
+        level = 0
+        while delta >> (bits * (level + 1)):
+            level += 1
+        index = (target >> (bits * level)) & self._mask
+        self._wheel[level][index].append(entry)
+
+    def _tick(self):
+        """ Move on one tick and return the entries in the new slot. """
+        self._current += 1
+        self._ticks += 1
+        current = self._current
+        bits = self._bits
+        mask = self._mask
+
+        # find the highest level whose slot boundary we have crossed and
+        # cascade downwards from there
+        level = 0
+        while (
+            level + 1 < len(self._wheel)
+            and not current & ((1 << (bits * (level + 1))) - 1)
+        ):
+            level += 1
+        for cascade_level in range(level, 0, -1):
+            index = (current >> (bits * cascade_level)) & mask
+            entries = self._wheel[cascade_level][index]
+            self._wheel[cascade_level][index] = []
+            for entry in entries:
+                if not entry.cancelled:
+                    self._cascaded += 1
+                    self._place(entry)
+
+        index = current & mask
+        expired = self._wheel[0][index]
+        self._wheel[0][index] = []
+        return expired
+
+    def _start_driver(self):
+        if self._driver is None:
+            if self._driver_factory is not None:
+                self._driver = self._driver_factory(self)
+            else:
+                from pyface.timer.timer import CallbackTimer
+
+                self._driver = CallbackTimer(
+                    interval=self.resolution, callback=self.advance
+                )
+        self._driver.start()
+
+    def _stop_driver(self):
+        if self._driver is not None:
+            self._driver.stop()
+        # discard any cancelled entries still sitting in the slots
+        for level in self._wheel:
+            for slot in level:
+                slot.clear()
+
+
+#: The wheel used by wheel timers which do not specify one.
+_default_wheel = None
+
+
+def get_default_wheel():
+    """ Get the timer wheel shared by default by all wheel timers. """
+    global _default_wheel
+    if _default_wheel is None:
+        _default_wheel = TimerWheel()
+    return _default_wheel
+
+
+class WheelTimer(BaseTimer):
+    """ Base class for timers scheduled on a :class:`TimerWheel`.
+
+    Unlike toolkit timers, wheel timers are accurate only to the resolution
+    of their wheel.
+    """
+
+    #: The wheel the timer is scheduled on.
+    wheel = Instance(TimerWheel, factory=get_default_wheel)
+
+    #: The amount of time, in seconds, by which each expiry may be postponed
+    #: so that it coincides with other timers.
+    slack = Range(low=0.0)
+
+    #: Whether to align expiries to a multiple of the interval so that all
+    #: timers with the same interval fire in the same tick.
+    coalesce = Bool(False)
+
+    # Private interface ------------------------------------------------------
+
+    #: The currently scheduled wheel entry.
+    _entry = Instance(WheelEntry)
+
+    # -------------------------------------------------------------------------
+    # BaseTimer Protected methods
+    # -------------------------------------------------------------------------
+
+    def _start(self):
+        self._schedule()
+
+    def _stop(self):
+        if self._entry is not None:
+            self.wheel.cancel(self._entry)
+            self._entry = None
+
+    # -------------------------------------------------------------------------
+    # Private interface
+    # -------------------------------------------------------------------------
+
+    def _schedule(self):
+        """ Schedule the next expiry on the wheel. """
+        wheel = self.wheel
+        align = 1
+        if self.coalesce:
+            align = max(1, round(self.interval / wheel.resolution))
+        deadline = wheel.deadline(self.interval, self.slack, align)
+        self._entry = wheel.schedule(deadline, self._expire)
+
+    def _expire(self):
+        """ Perform the timer action and reschedule if still active. """
+        self._entry = None
+        self.perform()
+        if self._active and self._entry is None:
+            self._schedule()
+
+
+class WheelEventTimer(MEventTimer, WheelTimer):
+    """ A wheel timer which fires the ``timeout`` event. """
+    pass
+
+
+class WheelCallbackTimer(MCallbackTimer, WheelTimer):
+    """ A wheel timer which calls a callback. """
+    pass
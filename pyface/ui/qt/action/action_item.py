@@ -22,6 +22,7 @@ from traits.api import Any, Bool, HasTraits
 
 
 from pyface.action.action_event import ActionEvent
+from pyface.ui.qt.action.shared_action import shared_action_registry
 
 
 class PyfaceWidgetAction(QtGui.QWidgetAction):
@@ -62,6 +63,10 @@ class _MenuItem(HasTraits):
     # The toolkit control id.
     control_id = None
 
+    # The QAction shared with other placements of the action in the window,
+    # if any.
+    _shared = Any()
+
     # ------------------------------------------------------------------------
     # 'object' interface.
     # ------------------------------------------------------------------------
@@ -75,6 +80,52 @@ class _MenuItem(HasTraits):
         # FIXME v3: This is a wx'ism and should be hidden in the toolkit code.
         self.control_id = None
 
+        registry = shared_action_registry(parent)
+        if registry is not None:
+            self._shared = registry.acquire(action, controller, menu)
+
+        if self._shared is not None:
+            # The QAction and its observers are shared with the other
+            # placements of the action in the window.
+            self.control = self._shared.control
+            menu.addAction(self.control)
+            menu.menu_items.append(self)
+        else:
+            self._qt4_create_control(parent, menu, item)
+
+        # Detect if the control is destroyed.
+        self.control.destroyed.connect(self._qt4_on_destroyed)
+
+        if controller is not None:
+            self.controller = controller
+            controller.add_to_menu(self)
+
+    def dispose(self):
+        if self._shared is not None:
+            shared, self._shared = self._shared, None
+            shared.registry.release(shared)
+            return
+
+        action = self.item.action
+        action.observe(self._on_action_enabled_changed, "enabled", remove=True)
+        action.observe(self._on_action_visible_changed, "visible", remove=True)
+        action.observe(self._on_action_checked_changed, "checked", remove=True)
+        action.observe(self._on_action_name_changed, "name", remove=True)
+        action.observe(
+            self._on_action_accelerator_changed, "accelerator", remove=True
+        )
+        action.observe(self._on_action_image_changed, "image", remove=True)
+        action.observe(self._on_action_tooltip_changed, "tooltip", remove=True)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _qt4_create_control(self, parent, menu, item):
+        """ Create a QAction for the item and observe the action. """
+
+        action = item.action
+
         if action.style == "widget":
             self.control = PyfaceWidgetAction(parent, action)
             menu.addAction(self.control)
@@ -127,29 +178,6 @@ class _MenuItem(HasTraits):
         action.observe(self._on_action_image_changed, "image")
         action.observe(self._on_action_tooltip_changed, "tooltip")
 
-        # Detect if the control is destroyed.
-        self.control.destroyed.connect(self._qt4_on_destroyed)
-
-        if controller is not None:
-            self.controller = controller
-            controller.add_to_menu(self)
-
-    def dispose(self):
-        action = self.item.action
-        action.observe(self._on_action_enabled_changed, "enabled", remove=True)
-        action.observe(self._on_action_visible_changed, "visible", remove=True)
-        action.observe(self._on_action_checked_changed, "checked", remove=True)
-        action.observe(self._on_action_name_changed, "name", remove=True)
-        action.observe(
-            self._on_action_accelerator_changed, "accelerator", remove=True
-        )
-        action.observe(self._on_action_image_changed, "image", remove=True)
-        action.observe(self._on_action_tooltip_changed, "tooltip", remove=True)
-
-    # ------------------------------------------------------------------------
-    # Private interface.
-    # ------------------------------------------------------------------------
-
     def _qt4_on_destroyed(self, control=None):
         """ Delete the reference to the control to avoid attempting to talk to
         it again.
@@ -286,6 +314,10 @@ class _Tool(HasTraits):
     # The toolkit control id.
     control_id = None
 
+    # The QAction shared with other placements of the action in the window,
+    # if any.
+    _shared = Any()
+
     # ------------------------------------------------------------------------
     # 'object' interface.
     # ------------------------------------------------------------------------
@@ -299,6 +331,52 @@ class _Tool(HasTraits):
         self.tool_bar = tool_bar
         action = item.action
 
+        registry = shared_action_registry(parent)
+        if registry is not None:
+            self._shared = registry.acquire(action, controller, tool_bar)
+
+        if self._shared is not None:
+            # The QAction and its observers are shared with the other
+            # placements of the action in the window.
+            self.control = self._shared.control
+            tool_bar.addAction(self.control)
+            tool_bar.tools.append(self)
+        else:
+            self._qt4_create_control(parent, tool_bar, item)
+
+        # Detect if the control is destroyed.
+        self.control.destroyed.connect(self._qt4_on_destroyed)
+
+        if controller is not None:
+            self.controller = controller
+            controller.add_to_toolbar(self)
+
+    def dispose(self):
+        if self._shared is not None:
+            shared, self._shared = self._shared, None
+            shared.registry.release(shared)
+            return
+
+        action = self.item.action
+        action.observe(self._on_action_enabled_changed, "enabled", remove=True)
+        action.observe(self._on_action_visible_changed, "visible", remove=True)
+        action.observe(self._on_action_checked_changed, "checked", remove=True)
+        action.observe(self._on_action_name_changed, "name", remove=True)
+        action.observe(
+            self._on_action_accelerator_changed, "accelerator", remove=True
+        )
+        action.observe(self._on_action_image_changed, "image", remove=True)
+        action.observe(self._on_action_tooltip_changed, "tooltip", remove=True)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _qt4_create_control(self, parent, tool_bar, item):
+        """ Create a QAction for the item and observe the action. """
+
+        action = item.action
+
         if action.style == "widget":
             widget = action.create_control(tool_bar)
             self.control = tool_bar.addWidget(widget)
@@ -347,29 +425,6 @@ class _Tool(HasTraits):
         action.observe(self._on_action_image_changed, "image")
         action.observe(self._on_action_tooltip_changed, "tooltip")
 
-        # Detect if the control is destroyed.
-        self.control.destroyed.connect(self._qt4_on_destroyed)
-
-        if controller is not None:
-            self.controller = controller
-            controller.add_to_toolbar(self)
-
-    def dispose(self):
-        action = self.item.action
-        action.observe(self._on_action_enabled_changed, "enabled", remove=True)
-        action.observe(self._on_action_visible_changed, "visible", remove=True)
-        action.observe(self._on_action_checked_changed, "checked", remove=True)
-        action.observe(self._on_action_name_changed, "name", remove=True)
-        action.observe(
-            self._on_action_accelerator_changed, "accelerator", remove=True
-        )
-        action.observe(self._on_action_image_changed, "image", remove=True)
-        action.observe(self._on_action_tooltip_changed, "tooltip", remove=True)
-
-    # ------------------------------------------------------------------------
-    # Private interface.
-    # ------------------------------------------------------------------------
-
     def _qt4_on_destroyed(self, control=None):
         """ Delete the reference to the control to avoid attempting to talk to
         it again.
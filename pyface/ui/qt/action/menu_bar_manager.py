@@ -22,6 +22,7 @@ from traits.api import provides
 from pyface.qt import QtGui
 from pyface.action.action_manager import ActionManager
 from pyface.action.i_menu_bar_manager import IMenuBarManager
+from .menu_manager import MenuManager
 
 
 @provides(IMenuBarManager)
@@ -50,10 +51,14 @@ class MenuBarManager(ActionManager):
         else:
             menu_bar = QtGui.QMenuBar(parent)
 
-        # Every item in every group must be a menu manager.
+        # Every item in every group must be a menu manager.  Their menus are
+        # populated when first shown, if possible.
         for group in self.groups:
             for item in group.items:
-                menu = item.create_menu(parent, controller)
+                if isinstance(item, MenuManager):
+                    menu = item._create_menu(parent, controller, lazy=True)
+                else:
+                    menu = item.create_menu(parent, controller)
                 menu.menuAction().setText(item.name)
                 menu_bar.addMenu(menu)
 
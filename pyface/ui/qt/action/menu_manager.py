@@ -18,7 +18,7 @@
 from pyface.qt import QtCore, QtGui
 
 
-from traits.api import Instance, List, Str, provides
+from traits.api import Bool, Instance, List, Str, provides
 
 
 from pyface.action.action_manager import ActionManager
@@ -44,6 +44,12 @@ class MenuManager(ActionManager, ActionManagerItem):
     # The default action for tool button when shown in a toolbar (Qt only)
     action = Instance(Action)
 
+    #: Whether the manager's menu is only populated when it is first shown,
+    #: if it is a sub-menu or a menu in a menu bar.  Menus that contain
+    #: actions with accelerators or menu roles are always populated straight
+    #: away, since the toolkit only knows about those once they are created.
+    populate_on_show = Bool(True)
+
     # Private interface ---------------------------------------------------#
 
     #: Keep track of all created menus in order to properly dispose of them
@@ -63,10 +69,7 @@ class MenuManager(ActionManager, ActionManagerItem):
         if controller is None:
             controller = self.controller
 
-        menu = _Menu(self, parent, controller)
-        self._menus.append(menu)
-
-        return menu
+        return self._create_menu(parent, controller)
 
     # ------------------------------------------------------------------------
     # 'ActionManager' interface.
@@ -86,7 +89,7 @@ class MenuManager(ActionManager, ActionManagerItem):
     def add_to_menu(self, parent, menu, controller):
         """ Adds the item to a menu. """
 
-        submenu = self.create_menu(parent, controller)
+        submenu = self._create_menu(parent, controller, lazy=True)
         submenu.menuAction().setText(self.name)
         menu.addMenu(submenu)
 
@@ -112,6 +115,68 @@ class MenuManager(ActionManager, ActionManagerItem):
             else tool_button.InstantPopup
         )
 
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _create_menu(self, parent, controller, lazy=False):
+        """ Creates a menu, which is populated when first shown if lazy. """
+
+        if controller is None:
+            controller = self.controller
+
+        menu = _Menu(
+            self, parent, controller, lazy=lazy and self.populate_on_show
+        )
+        self._menus.append(menu)
+
+        return menu
+
+
+def _needs_eager_population(manager):
+    """ Does a manager contain actions that must exist before it is shown?
+
+    Accelerators only work, and menu roles are only applied, once the
+    QAction has been added to a menu.
+    """
+    for group in manager.groups:
+        if _group_needs_eager_population(group):
+            return True
+    return False
+
+
+def _group_needs_eager_population(group):
+    for item in group.items:
+        if isinstance(item, Group):
+            if _group_needs_eager_population(item):
+                return True
+        elif isinstance(item, ActionManager):
+            if _needs_eager_population(item):
+                return True
+        else:
+            action = getattr(item, "action", None)
+            if action is not None and (
+                action.accelerator or getattr(action, "menu_role", False)
+            ):
+                return True
+    return False
+
+
+class _MenuEntry(object):
+    """ The controls added to a menu for one item or separator. """
+
+    __slots__ = ("key", "actions", "wrappers")
+
+    def __init__(self, key, actions, wrappers):
+        # The item, or a tuple identifying the separator.
+        self.key = key
+
+        # The QActions in the menu for the entry.
+        self.actions = actions
+
+        # The menu item wrappers created for the entry.
+        self.wrappers = wrappers
+
 
 class _Menu(QtGui.QMenu):
     """ The toolkit-specific menu control. """
@@ -120,7 +185,7 @@ class _Menu(QtGui.QMenu):
     # 'object' interface.
     # ------------------------------------------------------------------------
 
-    def __init__(self, manager, parent, controller):
+    def __init__(self, manager, parent, controller, lazy=False):
         """ Creates a new tree. """
 
         # Base class constructor.
@@ -138,6 +203,16 @@ class _Menu(QtGui.QMenu):
         # List of menu items
         self.menu_items = []
 
+        # The entries for the items and separators currently in the menu, in
+        # order.
+        self._entries = []
+
+        # Whether the menu has been populated.  A lazy menu is populated when
+        # it is about to be shown for the first time.
+        self._populated = False
+        self._lazy = lazy
+        self.aboutToShow.connect(self._on_about_to_show)
+
         # Create the menu structure.
         self.refresh()
 
@@ -158,6 +233,7 @@ class _Menu(QtGui.QMenu):
         self._manager.observe(self._on_visible_changed, "visible", remove=True)
         self._manager.observe(self._on_name_changed, "name", remove=True)
         self._manager.observe(self._on_image_changed, "action:image", remove=True)
+        self.aboutToShow.disconnect(self._on_about_to_show)
         # Removes event listeners from downstream menu items
         self.clear()
 
@@ -172,29 +248,54 @@ class _Menu(QtGui.QMenu):
             item.dispose()
 
         self.menu_items = []
+        self._entries = []
 
         super().clear()
 
     def is_empty(self):
         """ Is the menu empty? """
 
+        if not self._populated:
+            self._populate()
+
         return self.isEmpty()
 
     def refresh(self, event=None):
-        """ Ensures that the menu reflects the state of the manager. """
-
-        self.clear()
-
-        manager = self._manager
-        parent = self._parent
-
-        previous_non_empty_group = None
-        for group in manager.groups:
-            previous_non_empty_group = self._add_group(
-                parent, group, previous_non_empty_group
-            )
+        """ Ensures that the menu reflects the state of the manager.
+
+        Only the items and separators which have been added, removed or moved
+        since the last refresh are updated.  A lazy menu which has not been
+        shown yet is left empty.
+        """
+
+        if not self._populated:
+            if self._lazy and not _needs_eager_population(self._manager):
+                return
+            self._populate()
+            return
+
+        keys = self._get_keys()
+        if len(set(keys)) != len(keys):
+            # The same item appears twice, so entries can't be matched up.
+            self.clear()
+            self._add_entries(keys)
+            return
+
+        old_entries = {entry.key: entry for entry in self._entries}
+        entries = []
+        for key in keys:
+            entry = old_entries.pop(key, None)
+            if entry is None:
+                entry = self._create_entry(key)
+            entries.append(entry)
+
+        for entry in old_entries.values():
+            self._remove_entry(entry)
+
+        self._entries = entries
+        self._reorder_actions()
 
-        self.setEnabled(manager.enabled)
+        self.setEnabled(self._manager.enabled)
 
     def show(self, x=None, y=None):
         """ Show the menu at the specified location. """
@@ -229,32 +330,115 @@ class _Menu(QtGui.QMenu):
 
         self.menuAction().setIcon(event.new.create_icon())
 
-    def _add_group(self, parent, group, previous_non_empty_group=None):
-        """ Adds a group to a menu. """
+    def _on_about_to_show(self):
+        """ Populate a lazy menu when it is first shown. """
+
+        if not self._populated:
+            self._populate()
+
+    def _populate(self):
+        """ Create the controls for all the items in the menu. """
+
+        self._populated = True
+        self.clear()
+        self._add_entries(self._get_keys())
+        self.setEnabled(self._manager.enabled)
+
+    def _add_entries(self, keys):
+        """ Append the entries for the given keys to the menu. """
+
+        self._entries = [self._create_entry(key) for key in keys]
+
+    def _create_entry(self, key):
+        """ Append the controls for an item or separator to the menu. """
+
+        if isinstance(key, tuple):
+            return _MenuEntry(key, [self.addSeparator()], [])
+
+        action_count = len(self.actions())
+        wrapper_count = len(self.menu_items)
+        key.add_to_menu(self._parent, self, self._controller)
+
+        return _MenuEntry(
+            key,
+            self.actions()[action_count:],
+            self.menu_items[wrapper_count:],
+        )
+
+    def _remove_entry(self, entry):
+        """ Remove the controls for an item or separator from the menu. """
+
+        for wrapper in entry.wrappers:
+            wrapper.dispose()
+            self.menu_items.remove(wrapper)
+
+        for action in entry.actions:
+            self.removeAction(action)
+            submenu = action.menu()
+            if isinstance(submenu, _Menu):
+                submenu._manager._menus.remove(submenu)
+                submenu.dispose()
+                submenu.deleteLater()
+            elif action.parent() is self:
+                action.deleteLater()
+
+    def _reorder_actions(self):
+        """ Move the actions in the menu into the order of the entries. """
+
+        actions = self.actions()
+        index = 0
+        for entry in self._entries:
+            for action in entry.actions:
+                if actions[index] is not action:
+                    # Move the action in front of the one in its place.
+                    self.insertAction(actions[index], action)
+                    actions.remove(action)
+                    actions.insert(index, action)
+                index += 1
+
+    def _get_keys(self):
+        """ Return the keys of the items and separators for the menu.
+
+        Items are their own keys, while separators are identified by a tuple
+        of the group they belong to and whether they come before or after it.
+        """
+
+        keys = []
+        previous_non_empty_group = None
+        for group in self._manager.groups:
+            previous_non_empty_group = self._add_group_keys(
+                keys, group, previous_non_empty_group
+            )
+
+        return keys
+
+    def _add_group_keys(self, keys, group, previous_non_empty_group=None):
+        """ Add the keys for a group to a list of keys. """
 
         if len(group.items) > 0:
             # Is a separator required?
             if previous_non_empty_group is not None and group.separator:
-                self.addSeparator()
+                keys.append(("before", group))
 
-            # Create actions and sub-menus for each contribution item in
-            # the group.
+            # Add keys for each contribution item in the group.
             for item in group.items:
                 if isinstance(item, Group):
                     if len(item.items) > 0:
-                        self._add_group(parent, item, previous_non_empty_group)
+                        self._add_group_keys(
+                            keys, item, previous_non_empty_group
+                        )
 
                         if (
                             previous_non_empty_group is not None
                             and previous_non_empty_group.separator
                             and item.separator
                         ):
-                            self.addSeparator()
+                            keys.append(("after", item))
 
                         previous_non_empty_group = item
 
                 else:
-                    item.add_to_menu(parent, self, self._controller)
+                    keys.append(item)
 
             previous_non_empty_group = group
 
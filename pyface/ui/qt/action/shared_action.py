@@ -0,0 +1,298 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Sharing of QActions between the menus and tool bars of a window.
+
+By default every menu item and tool bar tool creates its own QAction, and
+each QAction observes the traits of its Pyface action.  When shared actions
+are enabled for a window, each Pyface action (and controller) has a single
+QAction per window which is added to every menu, tool bar and context menu
+in which the action appears, so a change to the action updates one QAction
+through one set of observers.  The QAction is reference counted by its
+placements and torn down when the last of them is disposed.
+"""
+
+from inspect import getfullargspec
+
+from pyface.qt import QtGui
+
+from pyface.action.action_event import ActionEvent
+
+#: The action styles which can be represented by a shared QAction.  Radio
+#: actions belong to a per-group QActionGroup and widget actions create a
+#: widget per placement, so they are never shared.
+SHARED_STYLES = {"push", "toggle"}
+
+
+def enable_shared_actions(window):
+    """ Share QActions between the menus and tool bars of a window.
+
+    Parameters
+    ----------
+    window : QWidget
+        The top-level widget of the window.
+
+    Returns
+    -------
+    registry : SharedActionRegistry
+        The registry of the window's shared actions.
+    """
+    registry = getattr(window, "_pyface_shared_actions", None)
+    if registry is None:
+        registry = SharedActionRegistry(window)
+        window._pyface_shared_actions = registry
+    return registry
+
+
+def shared_action_registry(parent):
+    """ The shared action registry of the window containing a control.
+
+    Parameters
+    ----------
+    parent : QWidget or None
+        A control in the window.
+
+    Returns
+    -------
+    registry : SharedActionRegistry or None
+        The registry, or None if shared actions are not enabled for the
+        window.
+    """
+    if not isinstance(parent, QtGui.QWidget):
+        return None
+    return getattr(parent.window(), "_pyface_shared_actions", None)
+
+
+class SharedActionRegistry(object):
+    """ The shared QActions of a window, keyed by action and controller.
+
+    Parameters
+    ----------
+    window : QWidget
+        The top-level widget of the window, which owns the QActions.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._shared = {}
+        self.reset_statistics()
+
+    def __len__(self):
+        return len(self._shared)
+
+    def acquire(self, action, controller, container):
+        """ Get a shared QAction for a placement of an action.
+
+        Parameters
+        ----------
+        action : Action
+            The Pyface action.
+        controller : ActionController or None
+            The controller used to perform the action.
+        container : QWidget
+            The menu or tool bar the QAction will be added to.
+
+        Returns
+        -------
+        shared : _SharedAction or None
+            The shared action, with its reference count incremented, or None
+            if the action can't be shared in this placement.
+        """
+        if action.style not in SHARED_STYLES:
+            return None
+        key = (action, controller)
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = _SharedAction(self, key, action, controller)
+            self._shared[key] = shared
+            self._created += 1
+        elif container in _associated_widgets(shared.control):
+            # a QAction appears at most once in a widget
+            return None
+        else:
+            self._reused += 1
+        shared.ref_count += 1
+        return shared
+
+    def release(self, shared):
+        """ Release a placement of a shared action.
+
+        The QAction is destroyed once it has no placements left.
+        """
+        shared.ref_count -= 1
+        if shared.ref_count <= 0:
+            self._remove(shared)
+            shared.dispose()
+
+    def statistics(self):
+        """ Return a dictionary of sharing statistics.
+
+        Returns
+        -------
+        statistics : dict
+            The number of shared QActions ``created`` and the number of
+            placements which ``reused`` an existing one, and the number of
+            ``live`` shared QActions.
+        """
+        return {
+            "created": self._created,
+            "reused": self._reused,
+            "live": len(self._shared),
+        }
+
+    def reset_statistics(self):
+        """ Reset the accumulated sharing statistics. """
+        self._created = 0
+        self._reused = 0
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _remove(self, shared):
+        if self._shared.get(shared.key) is shared:
+            del self._shared[shared.key]
+
+
+class _SharedAction(object):
+    """ A QAction shared by all placements of an action in a window. """
+
+    def __init__(self, registry, key, action, controller):
+        self.registry = registry
+        self.key = key
+        self.action = action
+        self.controller = controller
+        self.ref_count = 0
+
+        if action.image is None:
+            control = QtGui.QAction(action.name, registry.window)
+        else:
+            control = QtGui.QAction(
+                action.image.create_icon(), action.name, registry.window
+            )
+        if action.accelerator:
+            control.setShortcut(action.accelerator)
+        control.setToolTip(action.tooltip)
+        control.setWhatsThis(action.description)
+        control.setEnabled(action.enabled)
+        control.setVisible(action.visible)
+
+        if getattr(action, "menu_role", False):
+            if action.menu_role == "About":
+                control.setMenuRole(QtGui.QAction.MenuRole.AboutRole)
+            elif action.menu_role == "Preferences":
+                control.setMenuRole(QtGui.QAction.MenuRole.PreferencesRole)
+
+        if action.style == "toggle":
+            control.setCheckable(True)
+            control.setChecked(action.checked)
+
+        control.triggered.connect(self._on_triggered)
+        control.destroyed.connect(self._on_destroyed)
+        self.control = control
+
+        action.observe(self._on_enabled_changed, "enabled")
+        action.observe(self._on_visible_changed, "visible")
+        action.observe(self._on_checked_changed, "checked")
+        action.observe(self._on_name_changed, "name")
+        action.observe(self._on_accelerator_changed, "accelerator")
+        action.observe(self._on_image_changed, "image")
+        action.observe(self._on_tooltip_changed, "tooltip")
+
+    def dispose(self):
+        """ Remove the observers and destroy the QAction. """
+        if self.action is None:
+            return
+        action = self.action
+        action.observe(self._on_enabled_changed, "enabled", remove=True)
+        action.observe(self._on_visible_changed, "visible", remove=True)
+        action.observe(self._on_checked_changed, "checked", remove=True)
+        action.observe(self._on_name_changed, "name", remove=True)
+        action.observe(
+            self._on_accelerator_changed, "accelerator", remove=True
+        )
+        action.observe(self._on_image_changed, "image", remove=True)
+        action.observe(self._on_tooltip_changed, "tooltip", remove=True)
+        self.action = None
+
+        if self.control is not None:
+            control = self.control
+            self.control = None
+            control.destroyed.disconnect(self._on_destroyed)
+            control.deleteLater()
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _on_destroyed(self, control=None):
+        """ The window has gone, so stop observing the action. """
+        self.control = None
+        self.registry._remove(self)
+        self.dispose()
+
+    def _on_triggered(self):
+        action = self.action
+        if action is None:
+            return
+        action_event = ActionEvent()
+
+        if action.style == "toggle":
+            action.checked = self.control.isChecked()
+
+        # Most of the time, actions do not care about the event, so we only
+        # pass it if the perform method requires it.
+        if self.controller is not None:
+            argspec = getfullargspec(self.controller.perform)
+            if len(argspec.args) == 2:
+                self.controller.perform(action)
+            else:
+                self.controller.perform(action, action_event)
+        else:
+            argspec = getfullargspec(action.perform)
+            if len(argspec.args) == 1:
+                action.perform()
+            else:
+                action.perform(action_event)
+
+    def _on_enabled_changed(self, event):
+        if self.control is not None:
+            self.control.setEnabled(event.new)
+
+    def _on_visible_changed(self, event):
+        if self.control is not None:
+            self.control.setVisible(event.new)
+
+    def _on_checked_changed(self, event):
+        if self.control is not None:
+            self.control.setChecked(event.new)
+
+    def _on_name_changed(self, event):
+        if self.control is not None:
+            self.control.setText(event.new)
+
+    def _on_accelerator_changed(self, event):
+        if self.control is not None:
+            self.control.setShortcut(event.new)
+
+    def _on_image_changed(self, event):
+        if self.control is not None and event.new is not None:
+            self.control.setIcon(event.new.create_icon())
+
+    def _on_tooltip_changed(self, event):
+        if self.control is not None:
+            self.control.setToolTip(event.new)
+
+
+def _associated_widgets(control):
+    """ The widgets a QAction has been added to. """
+    if hasattr(control, "associatedObjects"):
+        return control.associatedObjects()
+    return control.associatedWidgets()
@@ -0,0 +1,165 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from pyface.action.api import Action, Group, MenuManager
+from pyface.qt import QtGui
+from pyface.ui.qt.util.gui_test_assistant import GuiTestAssistant
+
+
+class TestMenu(GuiTestAssistant, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.widget = QtGui.QWidget()
+        self.actions = [Action(name="Action %d" % i) for i in range(4)]
+        self.manager = MenuManager(*self.actions, name="Test")
+
+    def tearDown(self):
+        self.manager.destroy()
+        self.widget.deleteLater()
+        del self.widget
+        super().tearDown()
+
+    def texts(self, menu):
+        return [
+            "-" if action.isSeparator() else action.text()
+            for action in menu.actions()
+        ]
+
+    def test_refresh_reuses_actions(self):
+        menu = self.manager.create_menu(self.widget)
+        controls = menu.actions()
+
+        self.manager.changed = True
+
+        self.assertEqual(menu.actions(), controls)
+
+    def test_refresh_item_inserted(self):
+        menu = self.manager.create_menu(self.widget)
+        controls = menu.actions()
+        group = self.manager.find_group("additions")
+
+        group.insert(1, Action(name="New"))
+        self.manager.changed = True
+
+        self.assertEqual(
+            self.texts(menu),
+            ["Action 0", "New", "Action 1", "Action 2", "Action 3"],
+        )
+        actions = menu.actions()
+        self.assertEqual(actions[:1] + actions[2:], controls)
+        self.assertEqual(len(menu.menu_items), 5)
+
+    def test_refresh_item_removed(self):
+        menu = self.manager.create_menu(self.widget)
+        group = self.manager.find_group("additions")
+        item = group.items[2]
+        wrapper = menu.menu_items[2]
+
+        group.remove(item)
+        self.manager.changed = True
+
+        self.assertEqual(
+            self.texts(menu), ["Action 0", "Action 1", "Action 3"]
+        )
+        self.assertNotIn(wrapper, menu.menu_items)
+
+        # The wrapper no longer follows the action.
+        self.actions[2].name = "Changed"
+        self.assertEqual(
+            self.texts(menu), ["Action 0", "Action 1", "Action 3"]
+        )
+
+    def test_refresh_item_moved(self):
+        menu = self.manager.create_menu(self.widget)
+        controls = menu.actions()
+        group = self.manager.find_group("additions")
+        item = group.items[3]
+
+        group.remove(item)
+        group.insert(0, item)
+        self.manager.changed = True
+
+        self.assertEqual(
+            self.texts(menu),
+            ["Action 3", "Action 0", "Action 1", "Action 2"],
+        )
+        self.assertEqual(menu.actions(), controls[3:] + controls[:3])
+
+    def test_refresh_group_added(self):
+        menu = self.manager.create_menu(self.widget)
+
+        self.manager.insert(0, Group(Action(name="First"), id="first"))
+        self.manager.changed = True
+
+        self.assertEqual(
+            self.texts(menu),
+            ["First", "-", "Action 0", "Action 1", "Action 2", "Action 3"],
+        )
+
+        self.manager.find_group("first").clear()
+        self.manager.changed = True
+
+        self.assertEqual(
+            self.texts(menu),
+            ["Action 0", "Action 1", "Action 2", "Action 3"],
+        )
+
+    def test_submenu_populated_on_show(self):
+        submenu_manager = MenuManager(Action(name="Sub"), name="Submenu")
+        self.manager.append(submenu_manager)
+        menu = self.manager.create_menu(self.widget)
+
+        submenu = menu.actions()[-1].menu()
+        self.assertTrue(submenu.isEmpty())
+
+        # Changes before the submenu is shown don't create anything.
+        submenu_manager.append(Action(name="Sub 2"))
+        submenu_manager.changed = True
+        self.assertTrue(submenu.isEmpty())
+
+        submenu.aboutToShow.emit()
+
+        self.assertEqual(self.texts(submenu), ["Sub", "Sub 2"])
+
+    def test_submenu_with_accelerator_populated_eagerly(self):
+        submenu_manager = MenuManager(
+            Action(name="Sub", accelerator="Ctrl+K"), name="Submenu"
+        )
+        self.manager.append(submenu_manager)
+        menu = self.manager.create_menu(self.widget)
+
+        submenu = menu.actions()[-1].menu()
+
+        self.assertEqual(self.texts(submenu), ["Sub"])
+
+    def test_submenu_populate_on_show_disabled(self):
+        submenu_manager = MenuManager(
+            Action(name="Sub"), name="Submenu", populate_on_show=False
+        )
+        self.manager.append(submenu_manager)
+        menu = self.manager.create_menu(self.widget)
+
+        submenu = menu.actions()[-1].menu()
+
+        self.assertEqual(self.texts(submenu), ["Sub"])
+
+    def test_remove_submenu(self):
+        submenu_manager = MenuManager(Action(name="Sub"), name="Submenu")
+        self.manager.append(submenu_manager)
+        menu = self.manager.create_menu(self.widget)
+        self.assertEqual(len(submenu_manager._menus), 1)
+
+        self.manager.find_group("additions").remove(submenu_manager)
+        self.manager.changed = True
+
+        self.assertEqual(len(submenu_manager._menus), 0)
+        self.assertEqual(len(menu.actions()), 4)
@@ -0,0 +1,155 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from pyface.action.api import Action, MenuManager, ToolBarManager
+from pyface.qt import QtGui
+from pyface.ui.qt.action.shared_action import (
+    enable_shared_actions,
+    shared_action_registry,
+)
+from pyface.ui.qt.util.gui_test_assistant import GuiTestAssistant
+
+
+class TestSharedActions(GuiTestAssistant, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.window = QtGui.QMainWindow()
+        self.registry = enable_shared_actions(self.window)
+        self.performed = []
+        self.action = Action(
+            name="Shared", on_perform=lambda: self.performed.append(True)
+        )
+        self.menu_manager = MenuManager(self.action, name="Menu")
+        self.tool_bar_manager = ToolBarManager(self.action)
+
+    def tearDown(self):
+        self.menu_manager.destroy()
+        self.tool_bar_manager.destroy()
+        with self.delete_widget(self.window):
+            self.window.deleteLater()
+        del self.window
+        super().tearDown()
+
+    def test_registry_lookup(self):
+        widget = QtGui.QWidget(self.window)
+
+        self.assertIs(enable_shared_actions(self.window), self.registry)
+        self.assertIs(shared_action_registry(widget), self.registry)
+        self.assertIsNone(shared_action_registry(QtGui.QWidget()))
+        self.assertIsNone(shared_action_registry(None))
+
+    def test_menu_and_tool_bar_share_action(self):
+        menu = self.menu_manager.create_menu(self.window)
+        tool_bar = self.tool_bar_manager.create_tool_bar(self.window)
+        context_menu = self.menu_manager.create_menu(QtGui.QWidget(self.window))
+
+        control = menu.actions()[0]
+        self.assertIs(tool_bar.actions()[0], control)
+        self.assertIs(context_menu.actions()[0], control)
+        self.assertIs(control.parent(), self.window)
+        self.assertEqual(
+            self.registry.statistics(),
+            {"created": 1, "reused": 2, "live": 1},
+        )
+
+    def test_action_changes_update_shared_action(self):
+        menu = self.menu_manager.create_menu(self.window)
+        self.tool_bar_manager.create_tool_bar(self.window)
+        control = menu.actions()[0]
+
+        self.action.name = "Renamed"
+        self.action.enabled = False
+        self.action.tooltip = "Tip"
+
+        self.assertEqual(control.text(), "Renamed")
+        self.assertFalse(control.isEnabled())
+        self.assertEqual(control.toolTip(), "Tip")
+
+    def test_trigger_performs_once(self):
+        menu = self.menu_manager.create_menu(self.window)
+        self.tool_bar_manager.create_tool_bar(self.window)
+
+        menu.actions()[0].trigger()
+
+        self.assertEqual(self.performed, [True])
+
+    def test_toggle_action(self):
+        action = Action(name="Toggle", style="toggle")
+        manager = MenuManager(action, name="Menu")
+        menu = manager.create_menu(self.window)
+        control = menu.actions()[0]
+
+        self.assertTrue(control.isCheckable())
+        control.trigger()
+        self.assertTrue(action.checked)
+
+        action.checked = False
+        self.assertFalse(control.isChecked())
+        manager.destroy()
+
+    def test_radio_actions_not_shared(self):
+        action = Action(name="Radio", style="radio")
+        manager = MenuManager(action, name="Menu")
+        manager.create_menu(self.window)
+
+        self.assertEqual(len(self.registry), 0)
+        manager.destroy()
+
+    def test_reference_counted_teardown(self):
+        menu = self.menu_manager.create_menu(self.window)
+        self.tool_bar_manager.create_tool_bar(self.window)
+        control = menu.actions()[0]
+
+        self.menu_manager.destroy()
+        self.assertEqual(len(self.registry), 1)
+        self.action.name = "Still"
+        self.assertEqual(control.text(), "Still")
+
+        self.tool_bar_manager.destroy()
+        self.assertEqual(len(self.registry), 0)
+
+        # the action is no longer observed
+        self.action.name = "Gone"
+        self.assertEqual(control.text(), "Still")
+
+    def test_same_action_twice_in_menu(self):
+        manager = MenuManager(self.action, self.action, name="Menu")
+        menu = manager.create_menu(self.window)
+
+        self.assertEqual(len(menu.actions()), 2)
+        self.assertIsNot(menu.actions()[0], menu.actions()[1])
+        manager.destroy()
+
+    def test_application_window_share_actions(self):
+        from pyface.api import ApplicationWindow
+        from pyface.action.api import MenuBarManager
+
+        window = ApplicationWindow(
+            share_actions=True,
+            menu_bar_manager=MenuBarManager(
+                MenuManager(self.action, name="File")
+            ),
+            tool_bar_managers=[ToolBarManager(self.action)],
+        )
+        window.create()
+        try:
+            registry = shared_action_registry(window.control)
+            self.assertIsNotNone(registry)
+
+            # populate the lazily created menu
+            menu = window.control.menuBar().actions()[0].menu()
+            self.assertFalse(menu.is_empty())
+
+            self.assertEqual(len(registry), 1)
+            self.assertEqual(registry.statistics()["reused"], 1)
+        finally:
+            window.destroy()
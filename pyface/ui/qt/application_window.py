@@ -22,6 +22,7 @@ from traits.api import observe, provides, Str
 
 from pyface.qt import QtGui
 from pyface.i_application_window import IApplicationWindow, MApplicationWindow
+from .action.shared_action import enable_shared_actions
 from .image_resource import ImageResource
 from .window import Window
 
@@ -120,6 +121,9 @@ class ApplicationWindow(MApplicationWindow, Window):
         control.setAnimated(False)
         control.setDockNestingEnabled(True)
 
+        if self.share_actions:
+            enable_shared_actions(control)
+
         return control
 
     # ------------------------------------------------------------------------
@@ -19,6 +19,7 @@ from pyface.data_view.data_view_errors import (
     DataViewGetError, DataViewSetError
 )
 from pyface.data_view.index_manager import Root
+from pyface.data_view.value_type_cache import ColumnValueTypeCache
 from .data_wrapper import DataWrapper
 
 
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 WHITE = QColor(255, 255, 255)
 BLACK = QColor(0, 0, 0)
+HIGHLIGHT = QColor(255, 230, 120)
 
 set_check_state_map = {
     Qt.CheckState.Checked: CheckState.CHECKED,
@@ -44,6 +46,9 @@ class DataViewItemModel(QAbstractItemModel):
 
     def __init__(self, model, selection_type, exporters, parent=None):
         super().__init__(parent)
+        self._value_types = ColumnValueTypeCache()
+        #: The (row, column) pairs highlighted as search matches.
+        self.search_matches = set()
         self.model = model
         self.selectionType = selection_type
         self.exporters = exporters
@@ -56,6 +61,7 @@ class DataViewItemModel(QAbstractItemModel):
     @model.setter
     def model(self, model: AbstractDataModel):
         self._disconnect_model_observers()
+        self._value_types.clear()
         if hasattr(self, '_model'):
             self.beginResetModel()
             self._model = model
@@ -68,10 +74,12 @@ class DataViewItemModel(QAbstractItemModel):
     # model event listeners
 
     def on_structure_changed(self, event):
+        self._value_types.clear()
         self.beginResetModel()
         self.endResetModel()
 
     def on_values_changed(self, event):
+        self._value_types.values_changed(event.new)
         top, left, bottom, right = event.new
         if top == () and bottom == ():
             # this is a column header change
@@ -140,7 +148,9 @@ class DataViewItemModel(QAbstractItemModel):
     def flags(self, index):
         row = self._to_row_index(index)
         column = self._to_column_index(index)
-        value_type = self.model.get_value_type(row, column)
+        value_type = self._value_types.get_value_type(
+            self.model, row, column
+        )
         if row == () and column == ():
             return Qt.ItemFlag.ItemIsEnabled
 
@@ -174,7 +184,15 @@ class DataViewItemModel(QAbstractItemModel):
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         row = self._to_row_index(index)
         column = self._to_column_index(index)
-        value_type = self.model.get_value_type(row, column)
+        value_type = self._value_types.get_value_type(
+            self.model, row, column
+        )
+        if self.search_matches and (row, column) in self.search_matches:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return HIGHLIGHT
+            elif role == Qt.ItemDataRole.ForegroundRole:
+                return BLACK
+
         try:
             if not value_type:
                 return None
@@ -226,7 +244,9 @@ class DataViewItemModel(QAbstractItemModel):
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
         row = self._to_row_index(index)
         column = self._to_column_index(index)
-        value_type = self.model.get_value_type(row, column)
+        value_type = self._value_types.get_value_type(
+            self.model, row, column
+        )
         if not value_type:
             return False
 
@@ -10,10 +10,10 @@
 
 import logging
 
-from traits.api import Callable, Enum, Instance, observe, provides
+from traits.api import Bool, Callable, Enum, Instance, observe, provides
 
 from pyface.qt.QtCore import (
-    QAbstractItemModel, QItemSelection, QItemSelectionModel
+    QAbstractItemModel, QItemSelection, QItemSelectionModel, QTimer
 )
 from pyface.qt.QtGui import QAbstractItemView, QTreeView
 from pyface.data_view.i_data_view_widget import (
@@ -44,6 +44,57 @@ pyface_selection_modes = {
 }
 
 
+def _to_column_index(column):
+    """ Convert a Qt column number to a data view column index. """
+    return () if column == 0 else (column - 1,)
+
+
+def _to_qt_column(column):
+    """ Convert a data view column index to a Qt column number. """
+    return 0 if len(column) == 0 else column[0] + 1
+
+
+def _runs(items):
+    """ Group (key, int) pairs into runs of consecutive ints for each key.
+
+    Yields
+    ------
+    key, start, stop
+        The key and the inclusive bounds of each run.
+    """
+    groups = {}
+    for key, value in items:
+        groups.setdefault(key, set()).add(value)
+    for key, values in groups.items():
+        values = sorted(values)
+        start = previous = values[0]
+        for value in values[1:]:
+            if value != previous + 1:
+                yield key, start, previous
+                start = value
+            previous = value
+        yield key, start, previous
+
+
+def _merge_spans(spans):
+    """ Merge overlapping or adjacent inclusive (start, stop) spans. """
+    merged = []
+    for start, stop in sorted(spans):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return merged
+
+
+def _difference(selection, other):
+    """ Return the parts of a QItemSelection which are not in another. """
+    result = QItemSelection()
+    result.merge(selection, QItemSelectionModel.SelectionFlag.Select)
+    result.merge(other, QItemSelectionModel.SelectionFlag.Deselect)
+    return result
+
+
 class DataViewTreeView(QTreeView):
     """ QTreeView subclass that handles drag and drop via DropHandlers. """
 
@@ -112,6 +163,15 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
     #: usually be a DataViewItemModel subclass.
     _item_model = Instance(QAbstractItemModel)
 
+    #: Ranges the user has selected which have not been reported yet.
+    _selection_added = Instance(QItemSelection, ())
+
+    #: Ranges the user has deselected which have not been reported yet.
+    _selection_removed = Instance(QItemSelection, ())
+
+    #: Whether reporting the selection changes has been scheduled.
+    _selection_report_pending = Bool()
+
     # ------------------------------------------------------------------------
     # IDataViewWidget Interface
     # ------------------------------------------------------------------------
@@ -155,50 +215,109 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
 
     def _get_control_selection(self):
         """ Toolkit specific method to get the selection. """
-        indices = self.control.selectedIndexes()
-        if self.selection_type == 'row':
-            return self._item_model._extract_rows(indices)
-        elif self.selection_type == 'column':
-            return self._item_model._extract_columns(indices)
-        else:
-            return self._item_model._extract_indices(indices)
+        # work from the selected ranges rather than from every selected cell
+        selection = {}
+        for qt_range in self.control.selectionModel().selection():
+            parent = self._item_model._to_row_index(qt_range.parent())
+            rows = range(qt_range.top(), qt_range.bottom() + 1)
+            columns = range(qt_range.left(), qt_range.right() + 1)
+            if self.selection_type == 'row':
+                for row in rows:
+                    selection[(parent + (row,), ())] = None
+            elif self.selection_type == 'column':
+                for column in columns:
+                    selection[(parent, _to_column_index(column))] = None
+            else:
+                for row in rows:
+                    for column in columns:
+                        selection[
+                            (parent + (row,), _to_column_index(column))
+                        ] = None
+        return list(selection)
 
     def _set_control_selection(self, selection):
         """ Toolkit specific method to change the selection. """
         selection_model = self.control.selectionModel()
         select_flags = QItemSelectionModel.SelectionFlag.Select
         qt_selection = QItemSelection()
+        to_model_index = self._item_model._to_model_index
 
+        # select runs of adjacent rows or columns as single ranges
         if self.selection_type == 'row':
             select_flags |= QItemSelectionModel.SelectionFlag.Rows
-            for row, column in selection:
-                index = self._item_model._to_model_index(row, (0,))
-                qt_selection.select(index, index)
+            runs = _runs(
+                (tuple(row[:-1]), row[-1]) for row, _ in selection if row
+            )
+            for parent, top, bottom in runs:
+                qt_selection.select(
+                    to_model_index(parent + (top,), (0,)),
+                    to_model_index(parent + (bottom,), (0,)),
+                )
         elif self.selection_type == 'column':
             select_flags |= QItemSelectionModel.SelectionFlag.Columns
-            for row, column in selection:
-                index = self._item_model._to_model_index(
-                    row + (0,), column)
-                qt_selection.select(index, index)
+            runs = _runs(
+                (tuple(row), _to_qt_column(column))
+                for row, column in selection
+            )
+            for row, left, right in runs:
+                qt_selection.select(
+                    to_model_index(row + (0,), _to_column_index(left)),
+                    to_model_index(row + (0,), _to_column_index(right)),
+                )
         else:
-            for row, column in selection:
-                index = self._item_model._to_model_index(row, column)
-                qt_selection.select(index, index)
+            runs = _runs(
+                ((tuple(row[:-1]), tuple(column)), row[-1])
+                for row, column in selection
+                if row
+            )
+            for (parent, column), top, bottom in runs:
+                qt_selection.select(
+                    to_model_index(parent + (top,), column),
+                    to_model_index(parent + (bottom,), column),
+                )
         selection_model.clearSelection()
         selection_model.select(qt_selection, select_flags)
 
+    def _set_control_search_matches(self, matches):
+        """ Toolkit specific method to set the highlighted search matches. """
+        self._item_model.search_matches = set(matches)
+        self.control.viewport().update()
+
+    def _add_control_search_matches(self, matches):
+        """ Toolkit specific method to highlight more search matches. """
+        self._item_model.search_matches.update(matches)
+        self.control.viewport().update()
+
+    def _remove_control_search_matches(self, matches):
+        """ Toolkit specific method to stop highlighting search matches. """
+        self._item_model.search_matches.difference_update(matches)
+        self.control.viewport().update()
+
+    def _scroll_control_to(self, row, column):
+        """ Toolkit specific method to make an item current and visible. """
+        to_model_index = self._item_model._to_model_index
+        for depth in range(1, len(row)):
+            self.control.expand(to_model_index(row[:depth], ()))
+        index = to_model_index(row, column)
+        self.control.selectionModel().setCurrentIndex(
+            index, QItemSelectionModel.SelectionFlag.NoUpdate
+        )
+        self.control.scrollTo(index)
+
     def _observe_control_selection(self, remove=False):
         selection_model = self.control.selectionModel()
         if remove:
             try:
                 selection_model.selectionChanged.disconnect(
-                    self._update_selection
+                    self._on_selection_changed
                 )
             except (TypeError, RuntimeError):
                 # has already been disconnected
                 logger.info("selectionChanged already disconnected")
         else:
-            selection_model.selectionChanged.connect(self._update_selection)
+            selection_model.selectionChanged.connect(
+                self._on_selection_changed
+            )
 
     # ------------------------------------------------------------------------
     # IWidget Interface
@@ -222,6 +341,7 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
         """ Perform any actions required to destroy the control.
         """
         if self.control is not None:
+            self._store_control_selection()
             self.control.setModel(None)
 
             # ensure that we release references
@@ -234,6 +354,85 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
     # Private methods
     # ------------------------------------------------------------------------
 
+    # Control selection handlers
+
+    def _on_selection_changed(self, selected, deselected):
+        """ Accumulate changes to the selection until the next event loop
+        iteration, so that the changes are reported once. """
+        if self._selection_updating_flag:
+            return
+
+        select = QItemSelectionModel.SelectionFlag.Select
+        deselect = QItemSelectionModel.SelectionFlag.Deselect
+
+        # a range only counts as added or removed if it was not in the
+        # selection when the changes were last reported
+        added = _difference(selected, self._selection_removed)
+        removed = _difference(deselected, self._selection_added)
+        self._selection_added.merge(deselected, deselect)
+        self._selection_added.merge(added, select)
+        self._selection_removed.merge(selected, deselect)
+        self._selection_removed.merge(removed, select)
+
+        if not self._selection_report_pending:
+            self._selection_report_pending = True
+            QTimer.singleShot(0, self._report_pending_selection_changes)
+
+    def _report_pending_selection_changes(self):
+        """ Report the selection changes accumulated since the last report.
+        """
+        added = self._selection_added
+        removed = self._selection_removed
+        self._selection_added = QItemSelection()
+        self._selection_removed = QItemSelection()
+        self._selection_report_pending = False
+        if self.control is None or (added.isEmpty() and removed.isEmpty()):
+            return
+        self._report_selection_changed(
+            self._to_selection_ranges(added),
+            self._to_selection_ranges(removed),
+        )
+
+    def _to_selection_ranges(self, qt_selection):
+        """ Convert a QItemSelection to a list of selection ranges.
+
+        Qt splits ranges as they are merged, so adjacent ranges are joined.
+        """
+        spans = {}
+        for qt_range in qt_selection:
+            parent = self._item_model._to_row_index(qt_range.parent())
+            rows = (qt_range.top(), qt_range.bottom())
+            columns = (qt_range.left(), qt_range.right())
+            if self.selection_type == 'row':
+                spans.setdefault((parent, 0, 0), []).append(rows)
+            elif self.selection_type == 'column':
+                spans.setdefault((parent, None, None), []).append(columns)
+            else:
+                spans.setdefault((parent,) + columns, []).append(rows)
+
+        ranges = []
+        for (parent, left, right), key_spans in spans.items():
+            for start, stop in _merge_spans(key_spans):
+                if self.selection_type == 'row':
+                    ranges.append(
+                        (parent + (start,), (), parent + (stop,), ())
+                    )
+                elif self.selection_type == 'column':
+                    ranges.append((
+                        parent,
+                        _to_column_index(start),
+                        parent,
+                        _to_column_index(stop),
+                    ))
+                else:
+                    ranges.append((
+                        parent + (start,),
+                        _to_column_index(left),
+                        parent + (stop,),
+                        _to_column_index(right),
+                    ))
+        return ranges
+
     # Trait observers
 
     @observe('data_model', dispatch='ui')
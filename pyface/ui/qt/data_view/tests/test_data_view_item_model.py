@@ -12,7 +12,7 @@ from unittest import TestCase
 
 from traits.testing.optional_dependencies import numpy as np, requires_numpy
 
-from pyface.qt.QtCore import QMimeData
+from pyface.qt.QtCore import QMimeData, Qt
 # This import results in an error without numpy installed
 # see enthought/pyface#742
 if np is not None:
@@ -20,7 +20,9 @@ if np is not None:
 from pyface.data_view.exporters.row_exporter import RowExporter
 from pyface.data_view.data_formats import table_format
 from pyface.data_view.value_types.api import FloatValue
-from pyface.ui.qt.data_view.data_view_item_model import DataViewItemModel
+from pyface.ui.qt.data_view.data_view_item_model import (
+    BLACK, HIGHLIGHT, DataViewItemModel
+)
 
 
 @requires_numpy
@@ -72,3 +74,31 @@ class TestDataViewItemModel(TestCase):
 
         self.assertIsInstance(mime_data, QMimeData)
         # exact contents depend on Qt, so won't test more deeply
+
+    def test_data_value_type_updated(self):
+        self.model.data = self.data[0]
+        index = self.item_model._to_model_index((1,), (2,))
+        self.assertEqual(self.item_model.data(index), "8")
+
+        # the cached column value type is replaced when the model changes
+        self.model.value_type = FloatValue(format="{:.2f}".format)
+
+        self.assertEqual(self.item_model.data(index), "8.00")
+
+    def test_data_search_matches(self):
+        index = self.item_model._to_model_index((1, 2), (3,))
+        other_index = self.item_model._to_model_index((1, 2), (4,))
+
+        self.item_model.search_matches = {((1, 2), (3,))}
+
+        self.assertEqual(
+            self.item_model.data(index, Qt.ItemDataRole.BackgroundRole),
+            HIGHLIGHT,
+        )
+        self.assertEqual(
+            self.item_model.data(index, Qt.ItemDataRole.ForegroundRole),
+            BLACK,
+        )
+        self.assertIsNone(
+            self.item_model.data(other_index, Qt.ItemDataRole.BackgroundRole)
+        )
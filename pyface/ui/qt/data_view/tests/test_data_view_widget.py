@@ -0,0 +1,168 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest.mock import patch
+
+from traits.testing.optional_dependencies import numpy as np, requires_numpy
+
+from pyface.qt.QtCore import QItemSelection, QItemSelectionModel
+from pyface.testing.layout_widget_mixin import LayoutWidgetMixin
+
+# This import results in an error without numpy installed
+# see enthought/pyface#742
+if np is not None:
+    from pyface.data_view.data_models.api import ArrayDataModel
+from pyface.data_view.value_types.api import FloatValue
+from pyface.ui.qt.data_view.data_view_widget import DataViewWidget
+
+Select = QItemSelectionModel.SelectionFlag.Select
+Deselect = QItemSelectionModel.SelectionFlag.Deselect
+Rows = QItemSelectionModel.SelectionFlag.Rows
+
+
+@requires_numpy
+class TestDataViewWidget(LayoutWidgetMixin, unittest.TestCase):
+
+    def _create_widget_simple(self, **traits):
+        self.data = np.arange(6000.0).reshape(1000, 6)
+        self.model = ArrayDataModel(data=self.data, value_type=FloatValue())
+        traits.setdefault("data_model", self.model)
+        return DataViewWidget(**traits)
+
+    def _select_rows(self, top, bottom, command=Select):
+        item_model = self.widget._item_model
+        selection = QItemSelection(
+            item_model._to_model_index((top,), ()),
+            item_model._to_model_index((bottom,), ()),
+        )
+        self.widget.control.selectionModel().select(selection, command | Rows)
+
+    def test_selection_changes_reported_once(self):
+        self._create_widget_control()
+
+        with self.assertTraitChanges(
+                self.widget, 'selection_changed', count=1) as result:
+            for bottom in range(10, 500, 10):
+                self._select_rows(0, bottom)
+            self._select_rows(0, 99, Deselect)
+            self.gui.process_events()
+
+        added, removed = result.events[0][3]
+        self.assertEqual(added, [((100,), (), (490,), ())])
+        self.assertEqual(removed, [])
+
+    def test_selection_changes_cancel(self):
+        self._create_widget_control()
+        self.widget.selection = [((0,), ())]
+
+        with self.assertTraitDoesNotChange(self.widget, 'selection_changed'):
+            self._select_rows(5, 10)
+            self._select_rows(0, 0, Deselect)
+            self._select_rows(5, 10, Deselect)
+            self._select_rows(0, 0)
+            self.gui.process_events()
+
+        self.assertEqual(self.widget.selection, [((0,), ())])
+
+    def test_selection_read_lazily(self):
+        self._create_widget_control()
+
+        with patch.object(
+            DataViewWidget,
+            "_get_control_selection",
+            wraps=self.widget._get_control_selection,
+        ) as get_control_selection:
+            self._select_rows(0, 999)
+            self.gui.process_events()
+            get_control_selection.assert_not_called()
+
+            self.assertEqual(len(self.widget.selection), 1000)
+            self.assertEqual(len(self.widget.selection), 1000)
+            get_control_selection.assert_called_once()
+
+    def test_set_selection_as_ranges(self):
+        self._create_widget_control()
+
+        self.widget.selection = [((row,), ()) for row in range(200, 400)]
+
+        qt_selection = self.widget.control.selectionModel().selection()
+        self.assertEqual(len(qt_selection), 1)
+        self.assertEqual(
+            self.widget._get_control_selection(),
+            [((row,), ()) for row in range(200, 400)],
+        )
+
+    def test_set_selection_after_control_change(self):
+        self._create_widget_control()
+        self.widget.selection = [((1,), ())]
+        self._select_rows(5, 5)
+        self.gui.process_events()
+
+        # setting an equal list must still update the control
+        self.widget.selection = [((1,), ())]
+
+        self.assertEqual(self.widget._get_control_selection(), [((1,), ())])
+        self.assertEqual(self.widget.selection, [((1,), ())])
+
+    def test_search_go_to_match(self):
+        self._create_widget_control()
+        self.widget.search("5990")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+
+        self.assertEqual(self.widget.search_matches, [((998,), (2,))])
+        self.assertEqual(
+            self.widget._item_model.search_matches, {((998,), (2,))}
+        )
+
+        self.widget.next_match()
+
+        current = self.widget.control.currentIndex()
+        self.assertEqual((current.row(), current.column()), (998, 3))
+        self.assertEqual(self.widget.selection, [])
+
+    def test_search_highlights_updated_on_value_change(self):
+        self._create_widget_control()
+        self.widget.search("5990")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+        self.widget.next_match()
+
+        self.model.set_value((998,), (2,), 0.0)
+        self.model.set_value((3,), (1,), 5990.0)
+        self.gui.process_events()
+
+        self.assertEqual(self.widget.search_matches, [((3,), (1,))])
+        self.assertEqual(
+            self.widget._item_model.search_matches, {((3,), (1,))}
+        )
+        self.assertEqual(self.widget.current_match, -1)
+
+    def test_search_highlights_cleared_on_change(self):
+        self._create_widget_control()
+        self.widget.search("5990")
+        self.assertTrue(self.widget._search.wait(5.0))
+        for _ in range(10):
+            if not self.widget.searching:
+                break
+            self.gui.process_events()
+
+        self.model.data = np.zeros((10, 6))
+        self.gui.process_events()
+
+        self.assertEqual(self.widget.search_matches, [])
+        self.assertEqual(self.widget._item_model.search_matches, set())
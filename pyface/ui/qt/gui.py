@@ -20,6 +20,7 @@ from pyface.qt import QtCore, QtGui
 
 
 from traits.api import Bool, HasTraits, observe, provides, Str
+from pyface.util.call_dispatcher import CallDispatcher
 from pyface.util.guisupport import start_event_loop_qt4
 
 
@@ -65,7 +66,11 @@ class GUI(MGUI, HasTraits):
 
     @classmethod
     def invoke_later(cls, callable, *args, **kw):
-        _FutureCall(0, callable, *args, **kw)
+        _get_dispatcher().invoke(callable, *args, **kw)
+
+    @classmethod
+    def invoke_later_coalesced(cls, key, callable, *args, **kw):
+        _get_dispatcher().invoke_coalesced(key, callable, *args, **kw)
 
     @classmethod
     def set_trait_after(cls, millisecs, obj, trait_name, new):
@@ -73,7 +78,17 @@ class GUI(MGUI, HasTraits):
 
     @classmethod
     def set_trait_later(cls, obj, trait_name, new):
-        _FutureCall(0, setattr, obj, trait_name, new)
+        _get_dispatcher().invoke(setattr, obj, trait_name, new)
+
+    @classmethod
+    def set_trait_later_coalesced(cls, obj, trait_name, new):
+        _get_dispatcher().invoke_coalesced(
+            (id(obj), trait_name), setattr, obj, trait_name, new
+        )
+
+    @staticmethod
+    def dispatch_statistics():
+        return _get_dispatcher().statistics()
 
     @staticmethod
     def process_events(allow_user_events=True):
@@ -134,8 +149,8 @@ class GUI(MGUI, HasTraits):
 class _FutureCall(QtCore.QObject):
     """ This is a helper class that is similar to the wx FutureCall class. """
 
-    # Keep a list of references so that they don't get garbage collected.
-    _calls = []
+    # Keep references so that they don't get garbage collected.
+    _calls = set()
 
     # Manage access to the list of instances.
     _calls_mutex = QtCore.QMutex()
@@ -155,7 +170,7 @@ class _FutureCall(QtCore.QObject):
         # Save the instance.
         self._calls_mutex.lock()
         try:
-            self._calls.append(self)
+            self._calls.add(self)
         finally:
             self._calls_mutex.unlock()
 
@@ -196,6 +211,55 @@ class _FutureCall(QtCore.QObject):
         """
         self._calls_mutex.lock()
         try:
-            self._calls.remove(self)
+            self._calls.discard(self)
         finally:
             self._calls_mutex.unlock()
+
+
+class _DispatchReceiver(QtCore.QObject):
+    """ Receives the wake-up events of the shared call dispatcher. """
+
+    # A new Qt event type for dispatcher wake-ups.
+    _pyface_event = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+    def __init__(self):
+        super().__init__()
+
+        self.dispatcher = CallDispatcher(self._wake)
+
+        # Move to the main GUI thread if necessary (see _FutureCall).
+        if threading.current_thread() != threading.main_thread():
+            self.moveToThread(QtGui.QApplication.instance().thread())
+
+    def event(self, event):
+        """ QObject event handler.
+        """
+        if event.type() == self._pyface_event:
+            self.dispatcher.dispatch()
+            return True
+
+        return super().event(event)
+
+    def _wake(self):
+        """ Post an event so the queue is drained by the GUI thread. """
+        QtGui.QApplication.postEvent(
+            self, QtCore.QEvent(self._pyface_event)
+        )
+
+
+# The shared dispatch receiver, created on first use.
+_receiver = None
+
+# Guards creation of the shared dispatch receiver.
+_receiver_lock = threading.Lock()
+
+
+def _get_dispatcher():
+    """ Get the call dispatcher shared by all GUI instances. """
+    global _receiver
+
+    if _receiver is None:
+        with _receiver_lock:
+            if _receiver is None:
+                _receiver = _DispatchReceiver()
+    return _receiver.dispatcher
@@ -23,6 +23,7 @@ from traits.api import Str
 
 
 from pyface.i_image_resource import IImageResource, MImageResource
+from pyface.util.startup_profiler import profile_phase
 
 
 @provides(IImageResource)
@@ -52,12 +53,13 @@ class ImageResource(MImageResource, HasTraits):
     create_bitmap = MImageResource.create_image
 
     def create_icon(self, size=None):
-        ref = self._get_ref(size)
+        with profile_phase("load_image", "image", {"name": self.name}):
+            ref = self._get_ref(size)
 
-        if ref is not None:
-            image = ref.load()
-        else:
-            image = self._get_image_not_found_image()
+            if ref is not None:
+                image = ref.load()
+            else:
+                image = self._get_image_not_found_image()
 
         return QtGui.QIcon(image)
 
@@ -101,8 +101,9 @@ class ProgressDialog(MProgressDialog, Window):
 
     def close(self):
         """ Closes the window. """
-        self.progress_bar.destroy()
-        self.progress_bar = None
+        if self.progress_bar is not None:
+            self.progress_bar.destroy()
+            self.progress_bar = None
 
         super().close()
 
@@ -170,9 +171,10 @@ class ProgressDialog(MProgressDialog, Window):
     # Private Interface
     # -------------------------------------------------------------------------
 
-    def reject(self, event):
+    def reject(self, event=None):
         self._user_cancelled = True
-        self.close()
+        if self.control is not None:
+            self.close()
 
     def _set_time_label(self, value, control):
         hours = value / 3600
@@ -201,9 +203,9 @@ class ProgressDialog(MProgressDialog, Window):
         # TODO: hookup the buttons to our methods, this may involve subclassing from QDialog
 
         if self.can_cancel:
-            buttons.rejected.connect(dialog.reject)
+            buttons.rejected.connect(self.reject)
             self._connections_to_remove.append(
-                (buttons.rejected, dialog.reject)
+                (buttons.rejected, self.reject)
             )
         if self.can_ok:
             buttons.accepted.connect(dialog.accept)
@@ -8,7 +8,9 @@
 #
 # Thanks for using Enthought open source!
 
+from contextlib import contextmanager
 import sys
+import time
 
 
 from pyface.tasks.i_editor_area_pane import IEditorAreaPane, MEditorAreaPane
@@ -18,7 +20,9 @@ from traits.api import (
     cached_property,
     Callable,
     Dict,
+    Float,
     Instance,
+    Int,
     List,
     observe,
     Property,
@@ -69,6 +73,22 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
     # The constructor of the empty widget which comes up when one creates a split
     create_empty_widget = Callable
 
+    #: Whether editor controls are created lazily.  An editor added to the
+    #: pane is shown as a placeholder tab with the editor's label and tooltip,
+    #: and the editor's control is only created when its tab is first
+    #: activated.
+    lazy_editors = Bool(False)
+
+    #: The maximum number of lazily created editor controls to keep, or 0 for
+    #: no limit.  Once it is exceeded, the controls of the least recently
+    #: active editors which are hidden and not dirty are destroyed, and their
+    #: tabs revert to placeholders until they are activated again.
+    max_loaded_editors = Int(0)
+
+    #: The number of seconds an editor must have been inactive before its
+    #: control can be unloaded.
+    unload_delay = Float(0.0)
+
     # Private interface ---------------------------------------------------
 
     #: A list of connected Qt signals to be removed before destruction.
@@ -76,6 +96,26 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
     #: handler.
     _connections_to_remove = List(Tuple(Any, Callable))
 
+    #: The placeholder tab pages of editors whose controls are not created.
+    _placeholders = Dict()
+
+    #: The time at which each editor was last active.
+    _last_active = Dict()
+
+    #: The tab page of each editor, which is either its control or its
+    #: placeholder.
+    _editor_pages = Dict()
+
+    #: The editor of each tab page.
+    _page_editors = Dict()
+
+    #: The position of each editor in the editors list.
+    _editor_positions = Dict()
+
+    #: The tabwidgets of the editor area, or None if they must be found again
+    #: after a split or collapse.
+    _tabwidgets = Any()
+
     _private_drop_handlers = List(IDropHandler)
     _all_drop_handlers = Property(
         List(IDropHandler),
@@ -115,6 +155,7 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         # Create and configure the Editor Area Widget.
         self.control = EditorAreaWidget(self, parent)
         self.active_tabwidget = self.control.tabwidget()
+        self._tabwidgets = None
 
         # handle application level focus changes
         QtGui.QApplication.instance().focusChanged.connect(self._focus_changed)
@@ -142,6 +183,7 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
             # Remove reference to active tabwidget so that it can be deleted
             # together with the main control
             self.active_tabwidget = None
+            self._tabwidgets = None
 
         super().destroy()
 
@@ -153,7 +195,8 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         """ Activates the specified editor in the pane.
         """
         active_tabwidget = self._get_editor_tabwidget(editor)
-        active_tabwidget.setCurrentWidget(editor.control)
+        active_tabwidget.setCurrentWidget(self._get_editor_widget(editor))
+        self._load_editor(editor)
         self.active_tabwidget = active_tabwidget
         editor_widget = editor.control.parent()
         editor_widget.setVisible(True)
@@ -171,10 +214,15 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         """ Adds an editor to the active_tabwidget
         """
         editor.editor_area = self
-        editor.create(self.active_tabwidget)
-        index = self.active_tabwidget.addTab(
-            editor.control, self._get_label(editor)
-        )
+        if self.lazy_editors:
+            widget = QtGui.QWidget(self.active_tabwidget)
+            widget.setToolTip(editor.tooltip)
+            self._placeholders[editor] = widget
+        else:
+            editor.create(self.active_tabwidget)
+            widget = editor.control
+        self._set_editor_page(editor, widget)
+        index = self.active_tabwidget.addTab(widget, self._get_label(editor))
         # There seem to be a bug in pyside or qt, where the index is set to 1
         # when you create the first tab. This is a hack to fix it.
         if self.active_tabwidget.count() == 1:
@@ -182,14 +230,21 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         self.active_tabwidget.setTabToolTip(index, editor.tooltip)
         self.editors.append(editor)
 
+        # the tab may have become current when it was added
+        if self.active_tabwidget.currentWidget() is widget:
+            self._load_editor(editor)
+
     def remove_editor(self, editor):
         """ Removes an editor from the associated tabwidget
         """
         tabwidget, index = self._get_editor_tabwidget_index(editor)
         tabwidget.removeTab(index)
-        self.editors.remove(editor)
-        editor.destroy()
-        editor.editor_area = None
+        position = self._editor_positions.get(editor, -1)
+        if position >= 0 and self.editors[position] is editor:
+            del self.editors[position]
+        else:
+            self.editors.remove(editor)
+        self._discard_editor(editor)
         if not self.editors:
             self.active_editor = None
 
@@ -285,10 +340,171 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
 
         return menu
 
+    def remove_editors(self, editors):
+        """ Removes several editors, updating each tabwidget in one pass.
+
+        Parameters
+        ----------
+        editors : iterable of IEditor
+            The editors to remove.  Editors which are not in the pane are
+            ignored.
+        """
+        removed = {}
+        for editor in editors:
+            if editor in self._editor_pages:
+                removed[editor] = None
+        if not removed:
+            return
+
+        indices = {}
+        for editor in removed:
+            tabwidget, index = self._get_editor_tabwidget_index(editor)
+            indices.setdefault(tabwidget, []).append(index)
+
+        for tabwidget, tab_indices in indices.items():
+            with _batched_tab_changes(tabwidget):
+                for index in sorted(tab_indices, reverse=True):
+                    tabwidget.removeTab(index)
+
+        self.editors = [
+            editor for editor in self.editors if editor not in removed
+        ]
+        for editor in removed:
+            self._discard_editor(editor)
+
+        # current tabs have changed without notification
+        for tabwidget in indices:
+            if tabwidget.empty_widget is None:
+                self._current_tab_changed(tabwidget)
+        if not self.editors:
+            self.active_editor = None
+        elif self.active_editor in removed:
+            self._active_tabwidget_changed(self.active_tabwidget)
+
+    def reorder_editors(self, editors):
+        """ Reorders the tabs of several editors in one pass.
+
+        The tabs of the given editors which share a tabwidget are put in the
+        given order, in the positions they already occupy, and other tabs are
+        not moved.  The current tab of each tabwidget is unchanged.
+
+        Parameters
+        ----------
+        editors : sequence of IEditor
+            The editors in their new order.
+        """
+        orders = {}
+        for editor in dict.fromkeys(editors):
+            page = self._editor_pages.get(editor)
+            if page is not None:
+                tabwidget = self._get_editor_tabwidget(editor)
+                orders.setdefault(tabwidget, []).append(page)
+
+        for tabwidget, order in orders.items():
+            pages = [tabwidget.widget(i) for i in range(tabwidget.count())]
+            final = list(pages)
+            slots = sorted(tabwidget.index_of(page) for page in order)
+            for slot, page in zip(slots, order):
+                final[slot] = page
+            with _batched_tab_changes(tabwidget):
+                for slot, page in enumerate(final):
+                    index = pages.index(page, slot)
+                    if index != slot:
+                        tabwidget.tabBar().moveTab(index, slot)
+                        pages.insert(slot, pages.pop(index))
+
+    def is_editor_loaded(self, editor):
+        """ Return whether the control of an editor has been created.
+        """
+        return editor in self._editor_pages and editor not in self._placeholders
+
+    def unload_inactive_editors(self):
+        """ Destroy the controls of inactive editors beyond the budget.
+
+        Only editors which are not dirty, are not the current tab of any
+        tabwidget and were last active at least ``unload_delay`` seconds ago
+        are unloaded, least recently active first, until at most
+        ``max_loaded_editors`` controls remain.  This is done automatically
+        whenever an editor is loaded, but may also be called periodically.
+
+        Returns
+        -------
+        unloaded : list of IEditor
+            The editors whose controls were destroyed.
+        """
+        return self._unload_inactive_editors()
+
     # ------------------------------------------------------------------------
     # Protected interface.
     # ------------------------------------------------------------------------
 
+    def _set_editor_page(self, editor, page):
+        """ Record the tab page of an editor.
+        """
+        old = self._editor_pages.get(editor)
+        if old is not None:
+            del self._page_editors[old]
+        self._editor_pages[editor] = page
+        self._page_editors[page] = editor
+
+    def _discard_editor(self, editor):
+        """ Forget an editor whose tab has been removed, and destroy its
+        control or placeholder.
+        """
+        page = self._editor_pages.pop(editor)
+        del self._page_editors[page]
+        self._last_active.pop(editor, None)
+        placeholder = self._placeholders.pop(editor, None)
+        if placeholder is None:
+            editor.destroy()
+        else:
+            placeholder.deleteLater()
+        editor.editor_area = None
+
+    def _current_tab_changed(self, tabwidget):
+        """ Load the editor of a tabwidget's current tab if needed.
+        """
+        editor = self._get_editor(tabwidget.currentWidget())
+        if editor is not None and editor in self._placeholders:
+            # tabs can't be replaced while they are being inserted or moved
+            self._load_editor_later(editor)
+        return editor
+
+    def _unload_inactive_editors(self, keep=None):
+        """ Unload inactive editors beyond the budget, other than ``keep``.
+        """
+        if not self.lazy_editors or self.max_loaded_editors <= 0:
+            return []
+
+        loaded = [
+            editor for editor in self.editors
+            if editor not in self._placeholders
+        ]
+        excess = len(loaded) - self.max_loaded_editors
+        if excess <= 0:
+            return []
+
+        visible = {
+            tabwidget.currentWidget() for tabwidget in self.tabwidgets()
+        }
+        cutoff = time.monotonic() - self.unload_delay
+        candidates = sorted(
+            (
+                editor for editor in loaded
+                if editor is not self.active_editor
+                and editor is not keep
+                and editor.control not in visible
+                and not getattr(editor, "dirty", False)
+                and self._last_active.get(editor, 0.0) <= cutoff
+            ),
+            key=lambda editor: self._last_active.get(editor, 0.0),
+        )
+
+        unloaded = candidates[:excess]
+        for editor in unloaded:
+            self._unload_editor(editor)
+        return unloaded
+
     def _get_label(self, editor):
         """ Return a tab label for an editor.
         """
@@ -303,10 +519,71 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
     def _get_editor(self, editor_widget):
         """ Returns the editor corresponding to editor_widget
         """
-        for editor in self.editors:
-            if getattr(editor, "control", None) is editor_widget:
-                return editor
-        return None
+        if editor_widget is None:
+            return None
+        return self._page_editors.get(editor_widget)
+
+    def _get_editor_widget(self, editor):
+        """ Returns the tab page of an editor, which is either its control or
+        its placeholder.
+        """
+        return self._editor_pages.get(editor)
+
+    def _load_editor(self, editor):
+        """ Create the control of an editor in place of its placeholder.
+        """
+        placeholder = self._placeholders.pop(editor, None)
+        if placeholder is None:
+            return
+
+        tabwidget = placeholder.parent().parent()
+        editor.create(tabwidget)
+        self._set_editor_page(editor, editor.control)
+        self._replace_tab(tabwidget, placeholder, editor.control, editor)
+        placeholder.deleteLater()
+        self._last_active[editor] = time.monotonic()
+        self._unload_inactive_editors(keep=editor)
+
+    def _load_editor_later(self, editor):
+        """ Create the control of an editor once control returns to the event
+        loop, if its tab is still current.
+        """
+
+        def load():
+            placeholder = self._placeholders.get(editor)
+            if placeholder is None:
+                return
+            tabwidget = placeholder.parent().parent()
+            if tabwidget.currentWidget() is placeholder:
+                self._load_editor(editor)
+
+        QtCore.QTimer.singleShot(0, load)
+
+    def _unload_editor(self, editor):
+        """ Destroy the control of an editor and put a placeholder in its
+        tab.
+        """
+        tabwidget = self._get_editor_tabwidget(editor)
+        placeholder = QtGui.QWidget(tabwidget)
+        placeholder.setToolTip(editor.tooltip)
+        self._placeholders[editor] = placeholder
+        self._set_editor_page(editor, placeholder)
+        self._replace_tab(tabwidget, editor.control, placeholder, editor)
+        editor.destroy()
+
+    def _replace_tab(self, tabwidget, old, new, editor):
+        """ Replace the page of a tab without changing the current tab.
+        """
+        index = tabwidget.index_of(old)
+        current = tabwidget.currentIndex()
+        blocked = tabwidget.blockSignals(True)
+        try:
+            tabwidget.insertTab(index, new, self._get_label(editor))
+            tabwidget.setTabToolTip(index, editor.tooltip)
+            tabwidget.removeTab(index + 1)
+            tabwidget.setCurrentIndex(current)
+        finally:
+            tabwidget.blockSignals(blocked)
 
     def set_key_bindings(self):
         """ Set keyboard shortcuts for tabbed navigation
@@ -355,10 +632,9 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         """ Activates the tab with the specified index, if there is one.
         """
         self.active_tabwidget.setCurrentIndex(index)
-        current_widget = self.active_tabwidget.currentWidget()
-        for editor in self.editors:
-            if current_widget == editor.control:
-                self.activate_editor(editor)
+        editor = self._get_editor(self.active_tabwidget.currentWidget())
+        if editor is not None:
+            self.activate_editor(editor)
 
     def _next_tab(self):
         """ Activate the tab after the currently active tab.
@@ -382,20 +658,44 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         """ Returns the list of tabwidgets associated with the current editor
         area.
         """
-        return self.control.tabwidgets()
+        if self._tabwidgets is None:
+            self._tabwidgets = self.control.tabwidgets()
+        return list(self._tabwidgets)
 
     def _get_editor_tabwidget(self, editor):
         """ Given an editor, return its tabwidget. """
-        return editor.control.parent().parent()
+        return self._get_editor_widget(editor).parent().parent()
 
     def _get_editor_tabwidget_index(self, editor):
         """ Given an editor, return its tabwidget and index. """
         tabwidget = self._get_editor_tabwidget(editor)
-        index = tabwidget.indexOf(editor.control)
+        index = tabwidget.index_of(self._get_editor_widget(editor))
         return tabwidget, index
 
     # Trait change handlers ------------------------------------------------
 
+    @observe("active_editor")
+    def _record_activation(self, event):
+        if event.new is not None:
+            self._last_active[event.new] = time.monotonic()
+
+    @observe("editors.items")
+    def _update_editor_positions(self, event):
+        """ Update the positions of the editors after the changed slot.
+        """
+        positions = self._editor_positions
+        start = getattr(event, "index", None)
+        if isinstance(start, int):
+            for editor in event.removed:
+                positions.pop(editor, None)
+        else:
+            # the list was replaced, or an extended slice was changed
+            positions.clear()
+            start = 0
+        editors = self.editors
+        for position in range(start, len(editors)):
+            positions[editors[position]] = position
+
     @observe("editors:items:[dirty, name]")
     def _update_label(self, event):
         editor = event.object
@@ -461,6 +761,19 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
 # ----------------------------------------------------------------------------
 
 
+@contextmanager
+def _batched_tab_changes(tabwidget):
+    """ Change the tabs of a tabwidget without signals or repaints.
+    """
+    tabwidget.setUpdatesEnabled(False)
+    blocked = tabwidget.blockSignals(True)
+    try:
+        yield tabwidget
+    finally:
+        tabwidget.blockSignals(blocked)
+        tabwidget.setUpdatesEnabled(True)
+
+
 class EditorAreaWidget(QtGui.QSplitter):
     """ Container widget to hold a QTabWidget which are separated by other
     QTabWidgets via splitters.
@@ -569,7 +882,8 @@ class EditorAreaWidget(QtGui.QSplitter):
                 if not item.id == -1:
                     editor = self.editor_area.editors[item.id]
                     self.tabwidget().addTab(
-                        editor.control, self.editor_area._get_label(editor)
+                        self.editor_area._get_editor_widget(editor),
+                        self.editor_area._get_label(editor),
                     )
                 self.resize(item.width, item.height)
             self.tabwidget().setCurrentIndex(layout.active_tab)
@@ -677,6 +991,7 @@ class EditorAreaWidget(QtGui.QSplitter):
 
         # set equal sizes of splits
         self.setSizes([orig_size // 2, orig_size // 2])
+        self.editor_area._tabwidgets = None
 
         # make the rightchild's tabwidget active & show its empty widget
         self.editor_area.active_tabwidget = self.rightchild.tabwidget()
@@ -702,6 +1017,7 @@ class EditorAreaWidget(QtGui.QSplitter):
             parent.addWidget(sibling.rightchild)
             parent.leftchild = sibling.leftchild
             parent.rightchild = sibling.rightchild
+            self.editor_area._tabwidgets = None
             # blindly make the first tabwidget active as it is not clear which
             # tabwidget should get focus now (FIXME??)
             self.editor_area.active_tabwidget = parent.tabwidgets()[0]
@@ -740,6 +1056,7 @@ class EditorAreaWidget(QtGui.QSplitter):
 
         # add target to parent
         parent.addWidget(target)
+        self.editor_area._tabwidgets = None
 
         # make target the new active tabwidget and make the original focused
         # widget active in the target too
@@ -778,9 +1095,15 @@ class DraggableTabWidget(QtGui.QTabWidget):
         self.setAcceptDrops(True)
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.DefaultContextMenu)
 
+        # the tab pages in order, and the position of each page, kept up to
+        # date as tabs are inserted, removed and moved
+        self._pages = []
+        self._page_indices = {}
+
         # connecting signals
         self.tabCloseRequested.connect(self._close_requested)
         self.currentChanged.connect(self._current_changed)
+        self.tabBar().tabMoved.connect(self._tab_moved)
 
         # shows the custom empty widget containing buttons for relevant actions
         self.show_empty_widget()
@@ -882,6 +1205,21 @@ class DraggableTabWidget(QtGui.QTabWidget):
 
         return frame
 
+    def index_of(self, widget):
+        """ Returns the index of the tab containing a widget, or -1.
+
+        Unlike indexOf, this takes constant time: the positions of the tabs
+        are updated as tabs are inserted, removed and moved.
+        """
+        index = self._page_indices.get(widget, -1)
+        if index == -1 or self.widget(index) is not widget:
+            # the tabs were changed without notification; start again
+            self._pages = [self.widget(i) for i in range(self.count())]
+            self._page_indices = {}
+            self._update_page_indices(0)
+            index = self._page_indices.get(widget, -1)
+        return index
+
     def get_names(self):
         """ Utility function to return names of all the editors open in the
         current tabwidget.
@@ -912,14 +1250,24 @@ class DraggableTabWidget(QtGui.QTabWidget):
         """Re-implemented to update active editor
         """
         self.setCurrentIndex(index)
-        editor_widget = self.widget(index)
-        self.editor_area.active_editor = self.editor_area._get_editor(
-            editor_widget
+        self.editor_area.active_editor = self.editor_area._current_tab_changed(
+            self
+        )
+
+    def _tab_moved(self, from_index, to_index):
+        """ Update the positions of the tabs between the moved positions.
+        """
+        self._pages.insert(to_index, self._pages.pop(from_index))
+        self._update_page_indices(
+            min(from_index, to_index), max(from_index, to_index) + 1
         )
 
     def tabInserted(self, index):
         """ Re-implemented to hide empty_widget when adding a new widget
         """
+        self._pages.insert(index, self.widget(index))
+        self._update_page_indices(index)
+
         # sets tab tooltip only if a real editor was added (not an empty_widget)
         editor = self.editor_area._get_editor(self.widget(index))
         if editor:
@@ -931,9 +1279,26 @@ class DraggableTabWidget(QtGui.QTabWidget):
     def tabRemoved(self, index):
         """ Re-implemented to show empty_widget again if all tabs are removed
         """
+        if index < len(self._pages):
+            page = self._pages.pop(index)
+            if self._page_indices.get(page) == index:
+                del self._page_indices[page]
+            self._update_page_indices(index)
         if not self.count() and not self.empty_widget:
             self.show_empty_widget()
 
+    # Private methods -----------------------------------------------------
+
+    def _update_page_indices(self, start, stop=None):
+        """ Record the positions of the pages from start up to stop.
+        """
+        pages = self._pages
+        indices = self._page_indices
+        if stop is None:
+            stop = len(pages)
+        for index in range(start, stop):
+            indices[pages[index]] = index
+
     ## Event handlers -----------------------------------------------------#
 
     def contextMenuEvent(self, event):
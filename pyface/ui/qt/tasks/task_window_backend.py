@@ -67,6 +67,8 @@ class TaskWindowBackend(MTaskWindowBackend):
         # Now hide its controls.
         self.control.centralWidget().removeWidget(state.central_pane.control)
         for dock_pane in state.dock_panes:
+            if dock_pane.control is None:
+                continue
             # Warning: The layout behavior is subtly different (and wrong!) if
             # the order of these two statement is switched.
             dock_pane.control.hide()
@@ -82,6 +84,15 @@ class TaskWindowBackend(MTaskWindowBackend):
         # Show the dock panes.
         self._layout_state(state)
 
+    def add_dock_pane(self, state, dock_pane):
+        """ Assuming the specified TaskState is active, add the control of a
+            dock pane which was created after the task was shown.
+        """
+        dock_area = AREA_MAP[dock_pane.dock_area]
+        self.control.addDockWidget(dock_area, dock_pane.control)
+        if dock_pane.visible:
+            dock_pane.control.show()
+
     # Methods for saving and restoring the layout -------------------------#
 
     def get_layout(self):
@@ -119,12 +130,18 @@ class TaskWindowBackend(MTaskWindowBackend):
             area = getattr(state.layout, name + "_corner")
             self.control.setCorner(corner, AREA_MAP[area])
 
+        # Create the controls of the panes in the TaskLayout, if necessary.
+        self.window._create_dock_pane_controls(state, state.layout)
+
         # Add all panes in the TaskLayout.
         self._main_window_layout.state = state
         self._main_window_layout.set_layout(state.layout)
 
         # Add all panes not assigned an area by the TaskLayout.
         for dock_pane in state.dock_panes:
+            if dock_pane.control is None:
+                # The pane is created when it is first made visible.
+                continue
             if dock_pane.control not in self._main_window_layout.consumed:
                 dock_area = AREA_MAP[dock_pane.dock_area]
                 self.control.addDockWidget(dock_area, dock_pane.control)
@@ -144,6 +161,8 @@ class TaskWindowBackend(MTaskWindowBackend):
         if self.window.active_task:
             panes = [self.window.central_pane] + self.window.dock_panes
             for pane in panes:
+                if pane.control is None:
+                    continue
                 if new and pane.control.isAncestorOf(new):
                     pane.has_focus = True
                 elif old and pane.control.isAncestorOf(old):
@@ -13,7 +13,7 @@ import os
 import tempfile
 import unittest
 
-from traits.api import Instance
+from traits.api import Instance, Int
 
 from pyface.qt import QtGui, QtCore
 from pyface.tasks.split_editor_area_pane import (
@@ -641,3 +641,338 @@ class TestEditorAreaWidget(GuiTestAssistant, unittest.TestCase):
         finally:
             with event_loop():
                 window.destroy()
+
+
+class CountingEditor(Editor):
+    """ Test editor which counts how often its control is created. """
+
+    created = Int(0)
+
+    def create(self, parent):
+        super().create(parent)
+        self.created += 1
+
+
+class TestLazyEditors(GuiTestAssistant, unittest.TestCase):
+    """ Tests for lazily created editor controls. """
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.editor_area = SplitEditorAreaPane(lazy_editors=True)
+        self.editor_area.create(parent=None)
+
+    def tearDown(self):
+        with event_loop():
+            self.editor_area.destroy()
+        GuiTestAssistant.tearDown(self)
+
+    def add_editors(self, count):
+        editors = [
+            CountingEditor(name="editor{}".format(i), tooltip="tip{}".format(i))
+            for i in range(count)
+        ]
+        with event_loop():
+            for editor in editors:
+                self.editor_area.add_editor(editor)
+        return editors
+
+    def test_placeholders_until_activated(self):
+        editors = self.add_editors(3)
+        tabwidget = self.editor_area.active_tabwidget
+
+        # only the current tab has been loaded
+        self.assertEqual([editor.created for editor in editors], [1, 0, 0])
+        self.assertIsNone(editors[1].control)
+        self.assertFalse(self.editor_area.is_editor_loaded(editors[2]))
+
+        # placeholder tabs have the editors' labels and tooltips
+        self.assertEqual(tabwidget.tabText(1), "editor1")
+        self.assertEqual(tabwidget.tabToolTip(2), "tip2")
+        self.assertIs(
+            self.editor_area._get_editor(tabwidget.widget(2)), editors[2]
+        )
+
+        with event_loop():
+            self.editor_area.activate_editor(editors[2])
+
+        self.assertEqual(editors[2].created, 1)
+        self.assertIs(tabwidget.widget(2), editors[2].control)
+        self.assertIs(tabwidget.currentWidget(), editors[2].control)
+        self.assertEqual(tabwidget.tabText(2), "editor2")
+        self.assertEqual(tabwidget.tabToolTip(2), "tip2")
+        self.assertIs(self.editor_area.active_editor, editors[2])
+
+    def test_load_on_tab_change(self):
+        editors = self.add_editors(3)
+        tabwidget = self.editor_area.active_tabwidget
+
+        with event_loop():
+            tabwidget.setCurrentIndex(1)
+
+        self.assertEqual([editor.created for editor in editors], [1, 1, 0])
+        self.assertEqual(tabwidget.currentIndex(), 1)
+        self.assertIs(self.editor_area.active_editor, editors[1])
+
+    def test_label_change_unloaded(self):
+        editors = self.add_editors(2)
+        tabwidget = self.editor_area.active_tabwidget
+
+        editors[1].name = "renamed"
+        editors[1].tooltip = "new tip"
+
+        self.assertEqual(tabwidget.tabText(1), "renamed")
+        self.assertEqual(tabwidget.tabToolTip(1), "new tip")
+
+    def test_remove_unloaded(self):
+        editors = self.add_editors(2)
+
+        with event_loop():
+            self.editor_area.remove_editor(editors[1])
+
+        self.assertEqual(editors[1].created, 0)
+        self.assertEqual(self.editor_area.active_tabwidget.count(), 1)
+        self.assertEqual(self.editor_area.editors, [editors[0]])
+
+    def test_unload_over_budget(self):
+        self.editor_area.max_loaded_editors = 2
+        editors = self.add_editors(4)
+        tabwidget = self.editor_area.active_tabwidget
+
+        for editor in editors[1:]:
+            with event_loop():
+                self.editor_area.activate_editor(editor)
+
+        # the least recently active editors were unloaded
+        loaded = [
+            self.editor_area.is_editor_loaded(editor) for editor in editors
+        ]
+        self.assertEqual(loaded, [False, False, True, True])
+        self.assertIsNone(editors[0].control)
+        self.assertIs(tabwidget.currentWidget(), editors[3].control)
+        self.assertEqual(tabwidget.tabText(0), "editor0")
+
+        # and are loaded again when activated
+        with event_loop():
+            self.editor_area.activate_editor(editors[0])
+
+        self.assertEqual(editors[0].created, 2)
+        self.assertIs(tabwidget.currentWidget(), editors[0].control)
+        self.assertFalse(self.editor_area.is_editor_loaded(editors[2]))
+
+    def test_unload_keeps_dirty_editors(self):
+        self.editor_area.max_loaded_editors = 1
+        editors = self.add_editors(3)
+        editors[0].dirty = True
+
+        for editor in editors[1:]:
+            with event_loop():
+                self.editor_area.activate_editor(editor)
+
+        loaded = [
+            self.editor_area.is_editor_loaded(editor) for editor in editors
+        ]
+        self.assertEqual(loaded, [True, False, True])
+
+    def test_unload_delay(self):
+        self.editor_area.max_loaded_editors = 1
+        self.editor_area.unload_delay = 3600.0
+        editors = self.add_editors(2)
+
+        with event_loop():
+            self.editor_area.activate_editor(editors[1])
+
+        # recently active editors are kept over the budget
+        self.assertTrue(self.editor_area.is_editor_loaded(editors[0]))
+        self.assertEqual(self.editor_area.unload_inactive_editors(), [])
+
+        self.editor_area.unload_delay = 0.0
+        self.assertEqual(
+            self.editor_area.unload_inactive_editors(), [editors[0]]
+        )
+        self.assertIsNone(editors[0].control)
+
+    def test_persistence_with_placeholders(self):
+        editors = self.add_editors(3)
+        layout = Splitter(
+            Tabbed(PaneItem(id=2, width=600, height=600), active_tab=0),
+            Tabbed(
+                PaneItem(id=0, width=600, height=600),
+                PaneItem(id=1, width=600, height=600),
+                active_tab=0,
+            ),
+            orientation="horizontal",
+        )
+
+        with event_loop():
+            self.editor_area.set_layout(layout)
+
+        left = self.editor_area.control.leftchild.tabwidget()
+        self.assertIs(left.currentWidget(), editors[2].control)
+        self.assertEqual(editors[1].created, 0)
+
+        layout_new = self.editor_area.get_layout()
+        self.assertEqual(layout_new.items[0].items[0].id, 2)
+        self.assertEqual(
+            [item.id for item in layout_new.items[1].items], [0, 1]
+        )
+
+
+class TestEditorBookkeeping(GuiTestAssistant, unittest.TestCase):
+    """ Tests for the editor to tab index and bulk operations. """
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.editor_area = SplitEditorAreaPane()
+        self.editor_area.create(parent=None)
+
+    def tearDown(self):
+        with event_loop():
+            self.editor_area.destroy()
+        GuiTestAssistant.tearDown(self)
+
+    def add_editors(self, count, prefix="editor"):
+        editors = [
+            Editor(name="{}{}".format(prefix, i)) for i in range(count)
+        ]
+        with event_loop():
+            for editor in editors:
+                self.editor_area.add_editor(editor)
+        return editors
+
+    def assertIndexed(self):
+        """ Check the index agrees with the tabwidgets. """
+        for tabwidget in self.editor_area.tabwidgets():
+            # the positions are kept up to date without being rebuilt
+            self.assertEqual(
+                tabwidget._page_indices,
+                {tabwidget.widget(i): i for i in range(tabwidget.count())},
+            )
+            for i in range(tabwidget.count()):
+                widget = tabwidget.widget(i)
+                self.assertEqual(tabwidget.index_of(widget), i)
+                editor = self.editor_area._get_editor(widget)
+                if widget is tabwidget.empty_widget:
+                    self.assertIsNone(editor)
+                else:
+                    self.assertEqual(
+                        self.editor_area._get_editor_tabwidget_index(editor),
+                        (tabwidget, i),
+                    )
+
+    def test_index_after_split_and_drop(self):
+        left = self.add_editors(3, "left")
+        with event_loop():
+            self.editor_area.control.split()
+        right = self.add_editors(2, "right")
+        self.assertEqual(len(self.editor_area.tabwidgets()), 2)
+        self.assertIndexed()
+
+        # move a tab between tabwidgets, as a drop does
+        left_tabwidget, right_tabwidget = self.editor_area.tabwidgets()
+        with event_loop():
+            right_tabwidget.insertTab(0, left[1].control, "left1")
+        self.assertIndexed()
+        self.assertIs(
+            self.editor_area._get_editor_tabwidget(left[1]), right_tabwidget
+        )
+
+        right[0].name = "renamed"
+        tabwidget, index = self.editor_area._get_editor_tabwidget_index(
+            right[0]
+        )
+        self.assertEqual(tabwidget.tabText(index), "renamed")
+
+        with event_loop():
+            self.editor_area.control.rightchild.collapse()
+        self.assertEqual(len(self.editor_area.tabwidgets()), 1)
+        self.assertIndexed()
+
+    def test_remove_editors(self):
+        left = self.add_editors(4, "left")
+        with event_loop():
+            self.editor_area.control.split()
+        right = self.add_editors(2, "right")
+        with event_loop():
+            self.editor_area.activate_editor(right[1])
+
+        with event_loop():
+            self.editor_area.remove_editors([left[0], left[2], right[1]])
+
+        self.assertEqual(self.editor_area.editors, [left[1], left[3], right[0]])
+        left_tabwidget, right_tabwidget = self.editor_area.tabwidgets()
+        self.assertEqual(left_tabwidget.get_names(), ["left1", "left3"])
+        self.assertEqual(right_tabwidget.get_names(), ["right0"])
+        self.assertIsNone(left[0].control)
+        self.assertIsNone(left[0].editor_area)
+        self.assertIs(self.editor_area.active_editor, right[0])
+        self.assertIndexed()
+
+        # emptying a tabwidget shows its empty widget
+        with event_loop():
+            self.editor_area.remove_editors(list(self.editor_area.editors))
+        self.assertEqual(self.editor_area.editors, [])
+        self.assertIsNone(self.editor_area.active_editor)
+        self.assertIsNotNone(left_tabwidget.empty_widget)
+
+    def test_reorder_editors(self):
+        editors = self.add_editors(5)
+        tabwidget = self.editor_area.active_tabwidget
+        with event_loop():
+            self.editor_area.activate_editor(editors[1])
+
+        with event_loop():
+            self.editor_area.reorder_editors(
+                [editors[4], editors[3], editors[1]]
+            )
+
+        # the listed tabs take their own positions in the new order
+        self.assertEqual(
+            tabwidget.get_names(),
+            ["editor0", "editor4", "editor2", "editor3", "editor1"],
+        )
+        self.assertIs(tabwidget.currentWidget(), editors[1].control)
+        self.assertIs(self.editor_area.active_editor, editors[1])
+        self.assertIndexed()
+
+    def test_index_after_single_changes(self):
+        editors = self.add_editors(5)
+        tabwidget = self.editor_area.active_tabwidget
+        self.assertIndexed()
+
+        with event_loop():
+            self.editor_area.remove_editor(editors[1])
+        self.assertIndexed()
+
+        with event_loop():
+            tabwidget.insertTab(1, editors[3].control, "editor3")
+        self.assertIndexed()
+
+        with event_loop():
+            tabwidget.tabBar().moveTab(0, 3)
+        self.assertIndexed()
+
+        with event_loop():
+            tabwidget.removeTab(1)
+        self.assertIndexed()
+
+    def test_editor_positions_after_removal(self):
+        editors = self.add_editors(5)
+
+        with event_loop():
+            self.editor_area.remove_editor(editors[1])
+        with event_loop():
+            self.editor_area.remove_editor(editors[4])
+
+        expected = [editors[0], editors[2], editors[3]]
+        self.assertEqual(self.editor_area.editors, expected)
+        self.assertEqual(
+            self.editor_area._editor_positions,
+            {editor: i for i, editor in enumerate(expected)},
+        )
+
+        with event_loop():
+            self.editor_area.editors = [editors[3], editors[0]]
+        self.assertEqual(
+            self.editor_area._editor_positions,
+            {editors[3]: 0, editors[0]: 1},
+        )
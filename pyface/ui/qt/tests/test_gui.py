@@ -81,3 +81,21 @@ class TestGui(unittest.TestCase):
             qt_app.sendPostedEvents()
 
         self.assertTrue(application_running[0])
+
+    def test_set_trait_later_coalesced(self):
+        application = SimpleApplication()
+        values = []
+        application.observe(
+            lambda event: values.append(event.new), "application_running"
+        )
+
+        for value in range(100):
+            application.gui.set_trait_later_coalesced(
+                application, "application_running", value
+            )
+        self.assertEqual(values, [])
+
+        get_app_qt4().processEvents()
+
+        self.assertEqual(values, [99])
+        self.assertEqual(GUI.dispatch_statistics()["queue_depth"], 0)
@@ -126,3 +126,19 @@ class TestProgressDialog(unittest.TestCase, GuiTestAssistant):
             self.assertNotEqual(self.dialog._remaining_control.text(), "")
         self.assertIsNone(self.dialog.control)
         self.gui.process_events()
+
+    def test_cancel_button(self):
+        from pyface.qt import QtGui
+
+        self.dialog.min = 0
+        self.dialog.max = 10
+        self.dialog.can_cancel = True
+        self.dialog.open()
+        buttons = self.dialog.control.findChild(QtGui.QDialogButtonBox)
+
+        with self.assertTraitChanges(self.dialog, "closed"):
+            buttons.rejected.emit()
+            self.gui.process_events()
+
+        self.assertTrue(self.dialog._user_cancelled)
+        self.assertIsNone(self.dialog.control)
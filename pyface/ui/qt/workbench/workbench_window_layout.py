@@ -293,7 +293,7 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
         self._qt4_editor_area.restoreState(editor_layout, resolve_id)
 
     def get_toolkit_memento(self):
-        return (0, {"geometry": self.window.control.saveGeometry()})
+        return (0, {"geometry": self.window.control.saveGeometry().data()})
 
     def set_toolkit_memento(self, memento):
         if hasattr(memento, "toolkit_data"):
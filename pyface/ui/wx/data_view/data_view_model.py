@@ -14,6 +14,7 @@ from pyface.data_view.data_view_errors import (
     DataViewGetError, DataViewSetError
 )
 from pyface.data_view.index_manager import Root
+from pyface.data_view.value_type_cache import ColumnValueTypeCache
 from wx.dataview import DataViewItem, DataViewModel as wxDataViewModel
 
 
@@ -27,6 +28,7 @@ class DataViewModel(wxDataViewModel):
 
     def __init__(self, model):
         super().__init__()
+        self._value_types = ColumnValueTypeCache()
         self.model = model
 
     @property
@@ -35,6 +37,7 @@ class DataViewModel(wxDataViewModel):
 
     @model.setter
     def model(self, model):
+        self._value_types.clear()
         if hasattr(self, '_model'):
             # disconnect trait listeners
             self._model.observe(
@@ -67,9 +70,11 @@ class DataViewModel(wxDataViewModel):
         )
 
     def on_structure_changed(self, event):
+        self._value_types.clear()
         self.Cleared()
 
     def on_values_changed(self, event):
+        self._value_types.values_changed(event.new)
         top, left, bottom, right = event.new
         if top == () and bottom == ():
             # this is a column header change, reset everything
@@ -136,7 +141,9 @@ class DataViewModel(wxDataViewModel):
             column_index = ()
         else:
             column_index = (column - 1,)
-        value_type = self.model.get_value_type(row_index, column_index)
+        value_type = self._value_types.get_value_type(
+            self.model, row_index, column_index
+        )
         try:
             if value_type.has_text(self.model, row_index, column_index):
                 return value_type.get_text(self.model, row_index, column_index)
@@ -159,7 +166,9 @@ class DataViewModel(wxDataViewModel):
         else:
             column_index = (column - 1,)
         try:
-            value_type = self.model.get_value_type(row_index, column_index)
+            value_type = self._value_types.get_value_type(
+                self.model, row_index, column_index
+            )
             value_type.set_text(self.model, row_index, column_index, value)
         except DataViewSetError:
             return False
@@ -135,6 +135,27 @@ class DataViewWidget(MDataViewWidget, LayoutWidget):
             )
         wx.PostEvent(self.control, event)
 
+    def _set_control_search_matches(self, matches):
+        """ Toolkit specific method to set the highlighted search matches. """
+        # XXX highlighting of search matches is not supported in Wx
+        pass
+
+    def _add_control_search_matches(self, matches):
+        """ Toolkit specific method to highlight more search matches. """
+        # XXX highlighting of search matches is not supported in Wx
+        pass
+
+    def _remove_control_search_matches(self, matches):
+        """ Toolkit specific method to stop highlighting search matches. """
+        # XXX highlighting of search matches is not supported in Wx
+        pass
+
+    def _scroll_control_to(self, row, column):
+        """ Toolkit specific method to make an item current and visible. """
+        item = self._item_model._to_item(row)
+        self.control.SetCurrentItem(item)
+        self.control.EnsureVisible(item)
+
     def _observe_control_selection(self, remove=False):
         """ Toolkit specific method to watch for changes in the selection. """
         if remove:
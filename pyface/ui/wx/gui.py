@@ -21,6 +21,7 @@ import wx
 
 
 from traits.api import Bool, HasTraits, provides, Str
+from pyface.util.call_dispatcher import CallDispatcher
 from pyface.util.guisupport import start_event_loop_wx
 
 
@@ -31,6 +32,15 @@ from pyface.i_gui import IGUI, MGUI
 logger = logging.getLogger(__name__)
 
 
+def _wake():
+    """ Drain the shared call dispatcher from the wx event loop. """
+    wx.CallAfter(_dispatcher.dispatch)
+
+
+# The call dispatcher shared by all GUI instances.
+_dispatcher = CallDispatcher(_wake)
+
+
 @provides(IGUI)
 class GUI(MGUI, HasTraits):
 
@@ -63,7 +73,11 @@ class GUI(MGUI, HasTraits):
 
     @classmethod
     def invoke_later(cls, callable, *args, **kw):
-        wx.CallAfter(callable, *args, **kw)
+        _dispatcher.invoke(callable, *args, **kw)
+
+    @classmethod
+    def invoke_later_coalesced(cls, key, callable, *args, **kw):
+        _dispatcher.invoke_coalesced(key, callable, *args, **kw)
 
     @classmethod
     def set_trait_after(cls, millisecs, obj, trait_name, new):
@@ -71,7 +85,17 @@ class GUI(MGUI, HasTraits):
 
     @classmethod
     def set_trait_later(cls, obj, trait_name, new):
-        wx.CallAfter(setattr, obj, trait_name, new)
+        _dispatcher.invoke(setattr, obj, trait_name, new)
+
+    @classmethod
+    def set_trait_later_coalesced(cls, obj, trait_name, new):
+        _dispatcher.invoke_coalesced(
+            (id(obj), trait_name), setattr, obj, trait_name, new
+        )
+
+    @staticmethod
+    def dispatch_statistics():
+        return _dispatcher.statistics()
 
     @staticmethod
     def process_events(allow_user_events=True):
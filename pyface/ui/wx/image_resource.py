@@ -24,6 +24,7 @@ from traits.api import Str
 
 
 from pyface.i_image_resource import IImageResource, MImageResource
+from pyface.util.startup_profiler import profile_phase
 
 
 @provides(IImageResource)
@@ -53,18 +54,19 @@ class ImageResource(MImageResource, HasTraits):
         return self.create_image(size).ConvertToBitmap()
 
     def create_icon(self, size=None):
-        ref = self._get_ref(size)
-
-        if ref is not None:
-            icon = wx.Icon(self.absolute_path, wx.BITMAP_TYPE_ANY)
-        else:
-            image = self._get_image_not_found_image()
-
-            # We have to convert the image to a bitmap first and then create an
-            # icon from that.
-            bmp = image.ConvertToBitmap()
-            icon = wx.Icon()
-            icon.CopyFromBitmap(bmp)
+        with profile_phase("load_image", "image", {"name": self.name}):
+            ref = self._get_ref(size)
+
+            if ref is not None:
+                icon = wx.Icon(self.absolute_path, wx.BITMAP_TYPE_ANY)
+            else:
+                image = self._get_image_not_found_image()
+
+                # We have to convert the image to a bitmap first and then
+                # create an icon from that.
+                bmp = image.ConvertToBitmap()
+                icon = wx.Icon()
+                icon.CopyFromBitmap(bmp)
 
         return icon
 
@@ -107,6 +107,13 @@ class TaskWindowBackend(MTaskWindowBackend):
         # Show the dock panes.
         self._layout_state(state)
 
+    def add_dock_pane(self, state, dock_pane):
+        """ Assuming the specified TaskState is active, add the control of a
+            dock pane which was created after the task was shown.
+        """
+        dock_pane.add_to_manager()
+        self.window._aui_manager.Update()
+
     def get_toolbars(self, task=None):
         if task is None:
             state = self.window._active_state
@@ -156,6 +163,10 @@ class TaskWindowBackend(MTaskWindowBackend):
         #            area = getattr(state.layout, name + '_corner')
         #            self.control.setCorner(corner, AREA_MAP[area])
 
+        # AUI perspectives refer to all of the dock panes, so create any
+        # controls which have been deferred.
+        self.window._create_dock_pane_controls(state)
+
         # Add all panes in the TaskLayout.
         self._main_window_layout.state = state
         self._main_window_layout.set_layout(state.layout, self.window)
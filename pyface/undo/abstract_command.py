@@ -84,3 +84,29 @@ class AbstractCommand(HasTraits):
         """ This is called by the command stack to undo the command. """
 
         raise NotImplementedError
+
+    def size_hint(self):
+        """This is called by the command stack to estimate the number of bytes
+        of memory used by the command's saved state.  It is used to limit the
+        memory used by the stack.
+        """
+
+        # By default commands are assumed to be small.
+        return 0
+
+    def spill_payload(self):
+        """This is called by the command stack to move the command's saved
+        state out of memory.  The command should return a picklable object
+        holding the state and release its own references to it, or return
+        None if it has nothing worth spilling.
+        """
+
+        # By default there is nothing to spill.
+        return None
+
+    def restore_payload(self, payload):
+        """This is called by the command stack with the object returned by
+        'spill_payload()' before the command is next undone or redone.
+        """
+
+        raise NotImplementedError
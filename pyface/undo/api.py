@@ -26,6 +26,11 @@ Interfaces and Implementations
 - :class:`~.IUndoManager`
 - :class:`~.UndoManager`
 
+Utilities
+---------
+
+- :class:`~.PayloadStore`
+
 """
 
 from .abstract_command import AbstractCommand
@@ -33,4 +38,5 @@ from .command_stack import CommandStack
 from .i_command import ICommand
 from .i_command_stack import ICommandStack
 from .i_undo_manager import IUndoManager
+from .payload_store import PayloadStore
 from .undo_manager import UndoManager
@@ -24,6 +24,7 @@
 
 # Enthought library imports.
 from traits.api import (
+    Any,
     Bool,
     HasTraits,
     Instance,
@@ -31,6 +32,7 @@ from traits.api import (
     List,
     Property,
     Str,
+    Union,
     provides,
 )
 
@@ -39,6 +41,29 @@ from .abstract_command import AbstractCommand
 from .i_command import ICommand
 from .i_command_stack import ICommandStack
 from .i_undo_manager import IUndoManager
+from .payload_store import PayloadStore
+
+
+def _size_hint(command):
+    """ Return a command's size hint, treating commands without one as
+    small.
+    """
+
+    size_hint = getattr(command, "size_hint", None)
+    if size_hint is None:
+        return 0
+
+    return size_hint() or 0
+
+
+def _spill_payload(command):
+    """ Return a command's spilled payload, or None if it can't spill. """
+
+    spill_payload = getattr(command, "spill_payload", None)
+    if spill_payload is None:
+        return None
+
+    return spill_payload()
 
 
 class _StackEntry(HasTraits):
@@ -55,6 +80,12 @@ class _StackEntry(HasTraits):
     #: The sequence number of the entry.
     sequence_nr = Int()
 
+    #: The estimated size of the command's state while it is in memory.
+    size = Int()
+
+    #: The payload store key of the command's state if it has been spilled.
+    spilled = Any()
+
 
 class _MacroCommand(AbstractCommand):
     """ The _MacroCommand class is an internal command that handles macros. """
@@ -99,6 +130,27 @@ class _MacroCommand(AbstractCommand):
         for cmd in self.macro_commands:
             cmd.undo()
 
+    def size_hint(self):
+        """ Return the total size of the sub-commands. """
+
+        return sum(_size_hint(cmd) for cmd in self.macro_commands)
+
+    def spill_payload(self):
+        """ Spill the payloads of the sub-commands. """
+
+        payloads = [_spill_payload(cmd) for cmd in self.macro_commands]
+        if all(payload is None for payload in payloads):
+            return None
+
+        return payloads
+
+    def restore_payload(self, payload):
+        """ Restore the payloads of the sub-commands. """
+
+        for cmd, cmd_payload in zip(self.macro_commands, payload):
+            if cmd_payload is not None:
+                cmd.restore_payload(cmd_payload)
+
 
 @provides(ICommandStack)
 class CommandStack(HasTraits):
@@ -127,8 +179,35 @@ class CommandStack(HasTraits):
     #: stack.
     undo_name = Property(Str)
 
+    #### 'CommandStack' interface #############################################
+
+    #: The maximum number of entries kept on the stack, or None if there is no
+    #: limit.  The oldest entries are discarded when the limit is exceeded, so
+    #: that they can no longer be undone.
+    max_entries = Union(None, Int)
+
+    #: The maximum estimated number of bytes used by the entries kept in
+    #: memory, or None if there is no limit.  Sizes are estimated using the
+    #: commands' optional 'size_hint()' method.  When the limit is exceeded,
+    #: the payloads of the oldest entries are moved to the 'payload_store' if
+    #: there is one and the commands support it, otherwise the oldest entries
+    #: are discarded.  The most recently done command is always kept.
+    max_size = Union(None, Int)
+
+    #: An optional store that old command payloads are spilled to.
+    payload_store = Instance(PayloadStore)
+
+    #: The estimated number of bytes used by the entries kept in memory.
+    size = Property(Int, observe="_size")
+
     #### Private interface ####################################################
 
+    # Whether the state before the oldest entry on the stack is clean.
+    _base_clean = Bool(True)
+
+    # The estimated size of the entries kept in memory.
+    _size = Int()
+
     # The current index into the stack (ie. the last command that was done).
     _index = Int(-1)
 
@@ -162,8 +241,9 @@ class CommandStack(HasTraits):
         """
 
         self._index = -1
-        self._stack = []
+        self._remove_entries(0)
         self._macro_stack = []
+        self._base_clean = True
 
         self.undo_manager.stack_updated = self
 
@@ -186,6 +266,9 @@ class CommandStack(HasTraits):
         # See if the command can be merged with the previous one.
         if len(self._macro_stack) == 0:
             if self._index >= 0 and not self._stack[self._index].clean:
+                # After an undo the current entry may have been spilled, and
+                # its command must be complete before it is merged into.
+                self._restore(self._stack[self._index])
                 merged = self._stack[self._index].command.merge(command)
             else:
                 merged = False
@@ -204,7 +287,9 @@ class CommandStack(HasTraits):
             if len(self._macro_stack) == 0:
                 # If not in macro mode, remove everything after the current
                 # command from the stack.
-                del self._stack[self._index+1:]
+                self._remove_entries(self._index + 1)
+            self._update_size(self._stack[self._index])
+            self._enforce_limits()
             self.undo_manager.stack_updated = self
             return result
 
@@ -213,7 +298,7 @@ class CommandStack(HasTraits):
             # Remove everything on the stack after the last command that was
             # done.
             self._index += 1
-            del self._stack[self._index:]
+            self._remove_entries(self._index)
 
             # Create a new stack entry and add it to the stack.
             entry = _StackEntry(
@@ -221,10 +306,13 @@ class CommandStack(HasTraits):
             )
 
             self._stack.append(entry)
+            self._update_size(entry)
+            self._enforce_limits()
             self.undo_manager.stack_updated = self
         else:
             # Add the command to the parent macro command.
             self._macro_stack[-1].macro_commands.append(command)
+            self._update_size(self._stack[self._index])
 
         return result
 
@@ -283,6 +371,7 @@ class CommandStack(HasTraits):
 
         self._index += 1
         entry = self._stack[self._index]
+        self._restore(entry)
 
         return entry.command.redo()
 
@@ -290,17 +379,97 @@ class CommandStack(HasTraits):
         """ Undo the command at the current index. """
 
         entry = self._stack[self._index]
+        self._restore(entry)
         self._index -= 1
 
         entry.command.undo()
 
+    def _remove_entries(self, start):
+        """ Remove the entries from 'start' to the top of the stack. """
+
+        for entry in self._stack[start:]:
+            self._discard(entry)
+
+        del self._stack[start:]
+
+    def _discard(self, entry):
+        """ Release the memory accounting and payload of an entry. """
+
+        if entry.spilled is not None:
+            if self.payload_store is not None:
+                self.payload_store.discard(entry.spilled)
+            entry.spilled = None
+        else:
+            self._size -= entry.size
+
+    def _update_size(self, entry):
+        """ Update the size of an entry whose command may have changed. """
+
+        if entry.spilled is None:
+            size = _size_hint(entry.command)
+            self._size += size - entry.size
+            entry.size = size
+
+    def _restore(self, entry):
+        """ Reload the payload of an entry if it has been spilled. """
+
+        if entry.spilled is not None:
+            payload = self.payload_store.pop(entry.spilled)
+            entry.spilled = None
+            entry.command.restore_payload(payload)
+            self._size += entry.size
+
+    def _enforce_limits(self):
+        """ Spill or evict the oldest entries until the limits are met.
+
+        This is only done when no macro is being created, and never touches
+        the most recently done entry.
+        """
+
+        if len(self._macro_stack) > 0:
+            return
+
+        if self.max_entries is not None:
+            while len(self._stack) > max(self.max_entries, 1):
+                if self._index < 1:
+                    break
+                self._evict_oldest()
+
+        if self.max_size is None or self._size <= self.max_size:
+            return
+
+        if self.payload_store is not None:
+            for entry in self._stack[:self._index]:
+                if self._size <= self.max_size:
+                    return
+                if entry.spilled is not None or entry.size == 0:
+                    continue
+                payload = _spill_payload(entry.command)
+                if payload is not None:
+                    entry.spilled = self.payload_store.put(payload)
+                    self._size -= entry.size
+
+        while self._size > self.max_size and self._index >= 1:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        """ Discard the oldest entry on the stack. """
+
+        entry = self._stack.pop(0)
+        self._discard(entry)
+        self._index -= 1
+
+        # The state before the new oldest entry is the state after the
+        # evicted one.
+        self._base_clean = entry.clean
+
     def _get_clean(self):
         """ Get the clean state of the stack. """
 
         if self._index >= 0:
             clean = self._stack[self._index].clean
         else:
-            clean = True
+            clean = self._base_clean
 
         return clean
 
@@ -309,6 +478,13 @@ class CommandStack(HasTraits):
 
         if self._index >= 0:
             self._stack[self._index].clean = clean
+        else:
+            self._base_clean = clean
+
+    def _get_size(self):
+        """ Get the estimated size of the entries kept in memory. """
+
+        return self._size
 
     def _get_redo_name(self):
         """ Get the name of the redo command, if any. """
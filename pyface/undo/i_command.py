@@ -73,3 +73,23 @@ class ICommand(Interface):
 
     def undo(self):
         """ This is called by the command stack to undo the command. """
+
+    def size_hint(self):
+        """This is called by the command stack to estimate the number of bytes
+        of memory used by the command's saved state.  It is used to limit the
+        memory used by the stack.  It is optional, and commands that do not
+        implement it are assumed to be small.
+        """
+
+    def spill_payload(self):
+        """This is called by the command stack to move the command's saved
+        state out of memory.  The command should return a picklable object
+        holding the state and release its own references to it, or return
+        None if it has nothing worth spilling.  It is optional.
+        """
+
+    def restore_payload(self, payload):
+        """This is called by the command stack with the object returned by
+        'spill_payload()' before the command is next undone or redone.  It is
+        optional, but must be implemented if 'spill_payload()' is.
+        """
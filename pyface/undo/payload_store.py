@@ -0,0 +1,132 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import itertools
+import pickle
+import tempfile
+import zlib
+
+
+class PayloadStore(object):
+    """The PayloadStore class keeps command payloads in a compressed
+    temporary file.  A command stack uses it to move the payloads of old
+    commands out of memory, and reloads them when the commands are undone or
+    redone.
+
+    Payloads are pickled and compressed, and appended to the file.  Space
+    used by discarded payloads is reclaimed by rewriting the file once it
+    makes up more than half of it.
+    """
+
+    def __init__(self, compression_level=6, min_compact_size=1 << 20):
+        # The zlib compression level.
+        self.compression_level = compression_level
+
+        # The number of wasted bytes below which the file is never compacted.
+        self.min_compact_size = min_compact_size
+
+        self._file = tempfile.TemporaryFile()
+        self._end = 0
+        self._wasted = 0
+        self._index = {}
+        self._keys = itertools.count()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    @property
+    def file_size(self):
+        """ The number of bytes currently used by the store's file. """
+
+        return self._end
+
+    def put(self, payload):
+        """Store a payload and return a key that can be used to get it
+        back.
+        """
+
+        data = zlib.compress(
+            pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL),
+            self.compression_level,
+        )
+        key = next(self._keys)
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._index[key] = (self._end, len(data))
+        self._end += len(data)
+
+        return key
+
+    def get(self, key):
+        """ Return the payload with the given key. """
+
+        offset, length = self._index[key]
+        self._file.seek(offset)
+        data = self._file.read(length)
+
+        return pickle.loads(zlib.decompress(data))
+
+    def pop(self, key):
+        """ Return the payload with the given key and discard it. """
+
+        payload = self.get(key)
+        self.discard(key)
+
+        return payload
+
+    def discard(self, key):
+        """ Discard the payload with the given key, if there is one. """
+
+        location = self._index.pop(key, None)
+        if location is None:
+            return
+
+        self._wasted += location[1]
+        if (
+            self._wasted >= self.min_compact_size
+            and 2 * self._wasted > self._end
+        ):
+            self.compact()
+
+    def compact(self):
+        """ Rewrite the file without the space used by discarded payloads. """
+
+        new_file = tempfile.TemporaryFile()
+        end = 0
+        for key, (offset, length) in sorted(
+            self._index.items(), key=lambda item: item[1][0]
+        ):
+            self._file.seek(offset)
+            new_file.write(self._file.read(length))
+            self._index[key] = (end, length)
+            end += length
+
+        self._file.close()
+        self._file = new_file
+        self._end = end
+        self._wasted = 0
+
+    def clear(self):
+        """ Discard all payloads. """
+
+        self._index.clear()
+        self._file.seek(0)
+        self._file.truncate()
+        self._end = 0
+        self._wasted = 0
+
+    def close(self):
+        """ Close the store and delete its file. """
+
+        self._index.clear()
+        self._file.close()
@@ -11,9 +11,10 @@
 from contextlib import contextmanager
 import unittest
 
-from pyface.undo.api import CommandStack, UndoManager
+from pyface.undo.api import CommandStack, PayloadStore, UndoManager
 from pyface.undo.tests.testing_commands import (
-    MergeableCommand, SimpleCommand, UnnamedCommand,
+    MergeableCommand, MergeableSnapshotCommand, SimpleCommand,
+    SnapshotCommand, UnnamedCommand,
 )
 from traits.testing.api import UnittestTools
 
@@ -226,6 +227,158 @@ class TestCommandStack(UnittestTools, unittest.TestCase):
         self.assertEqual(self.stack._stack, [])
         self.assertTrue(self.stack.clean)
 
+    # Memory limit tests ------------------------------------------------------
+
+    def test_max_entries(self):
+        self.stack.max_entries = 3
+        for i in range(5):
+            self.stack.push(self.command)
+
+        self.assertEqual(len(self.stack._stack), 3)
+        self.assertEqual(self.stack._index, 2)
+        self.assertEqual(self.command.data, 5)
+
+        for i in range(5):
+            self.stack.undo()
+
+        self.assertEqual(self.command.data, 2)
+        self.assertEqual(self.stack.undo_name, "")
+
+    def test_evicted_clean_point(self):
+        self.stack.max_entries = 2
+        self.stack.push(self.command)
+        self.stack.clean = True
+        for i in range(3):
+            self.stack.push(self.command)
+        self.stack.undo()
+        self.stack.undo()
+
+        # the bottom of the stack is the state after the third push
+        self.assertFalse(self.stack.clean)
+
+        self.stack.clear()
+        self.assertTrue(self.stack.clean)
+
+    def test_evicted_at_clean_point(self):
+        self.stack.max_entries = 2
+        self.stack.push(self.command)
+        self.stack.push(self.command)
+        self.stack.clean = True
+        self.stack.push(self.command)
+        self.stack.push(self.command)
+        self.stack.undo()
+        self.stack.undo()
+
+        # the bottom of the stack is the saved state
+        self.assertTrue(self.stack.clean)
+
+    def test_size(self):
+        self.assertEqual(self.stack.size, 0)
+        for i in range(3):
+            self.stack.push(SnapshotCommand(snapshot_size=100))
+
+        self.assertEqual(self.stack.size, 300)
+
+        self.stack.undo()
+        self.stack.push(SnapshotCommand(snapshot_size=10))
+
+        self.assertEqual(self.stack.size, 210)
+
+        self.stack.clear()
+        self.assertEqual(self.stack.size, 0)
+
+    def test_size_macro(self):
+        self.stack.begin_macro("Snapshots")
+        try:
+            for i in range(3):
+                self.stack.push(SnapshotCommand(snapshot_size=100))
+        finally:
+            self.stack.end_macro()
+
+        self.assertEqual(self.stack.size, 300)
+
+    def test_max_size_evicts(self):
+        self.stack.max_size = 250
+        for i in range(5):
+            self.stack.push(SnapshotCommand(snapshot_size=100))
+
+        self.assertEqual(len(self.stack._stack), 2)
+        self.assertEqual(self.stack.size, 200)
+
+    def test_max_size_keeps_last_entry(self):
+        self.stack.max_size = 50
+        self.stack.push(SnapshotCommand(snapshot_size=100))
+        self.stack.push(SnapshotCommand(snapshot_size=100))
+
+        self.assertEqual(len(self.stack._stack), 1)
+        self.assertEqual(self.stack.size, 100)
+
+    def test_max_size_spills(self):
+        store = PayloadStore()
+        self.addCleanup(store.close)
+        self.stack.max_size = 250
+        self.stack.payload_store = store
+        commands = [SnapshotCommand(snapshot_size=100) for i in range(5)]
+        for command in commands:
+            self.stack.push(command)
+
+        self.assertEqual(len(self.stack._stack), 5)
+        self.assertEqual(self.stack.size, 200)
+        self.assertEqual(len(store), 3)
+        self.assertIsNone(commands[0].snapshot)
+
+        for i in range(5):
+            self.stack.undo()
+
+        self.assertEqual(commands[0].snapshot, bytes(100))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(self.stack.size, 500)
+
+        self.stack.push(SimpleCommand())
+        self.assertEqual(self.stack.size, 0)
+
+    def test_merge_into_spilled_entry(self):
+        store = PayloadStore()
+        self.addCleanup(store.close)
+        self.stack.max_size = 150
+        self.stack.payload_store = store
+        commands = [
+            SnapshotCommand(snapshot_size=100),
+            MergeableSnapshotCommand(snapshot_size=100),
+            SnapshotCommand(snapshot_size=100),
+        ]
+        for command in commands:
+            self.stack.push(command)
+        self.assertEqual(len(store), 2)
+        self.stack.undo()
+        self.assertIsNone(commands[1].snapshot)
+
+        self.stack.push(MergeableSnapshotCommand(snapshot_size=50))
+
+        self.assertEqual(len(self.stack._stack), 2)
+        self.assertEqual(commands[1].snapshot, bytes(150))
+        self.assertEqual(len(store), 1)
+        self.assertEqual(self.stack.size, 150)
+
+        self.stack.undo()
+        self.stack.redo()
+
+        self.assertEqual(commands[1].snapshot, bytes(150))
+        self.assertEqual(self.stack.size, 150)
+
+    def test_discard_spilled_entries(self):
+        store = PayloadStore()
+        self.addCleanup(store.close)
+        self.stack.max_size = 100
+        self.stack.payload_store = store
+        for i in range(3):
+            self.stack.push(SnapshotCommand(snapshot_size=100))
+        self.assertEqual(len(store), 2)
+
+        self.stack.clear()
+
+        self.assertEqual(len(store), 0)
+
     # Assertion helpers -------------------------------------------------------
 
     @contextmanager
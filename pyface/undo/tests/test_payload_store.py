@@ -0,0 +1,59 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from pyface.undo.api import PayloadStore
+
+
+class TestPayloadStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PayloadStore(min_compact_size=0)
+        self.addCleanup(self.store.close)
+
+    def test_put_get(self):
+        key_1 = self.store.put({"a": [1, 2, 3]})
+        key_2 = self.store.put(b"x" * 10000)
+
+        self.assertEqual(self.store.get(key_1), {"a": [1, 2, 3]})
+        self.assertEqual(self.store.get(key_2), b"x" * 10000)
+        self.assertEqual(len(self.store), 2)
+        # compressed
+        self.assertLess(self.store.file_size, 1000)
+
+    def test_pop(self):
+        key = self.store.put("payload")
+
+        self.assertEqual(self.store.pop(key), "payload")
+        self.assertNotIn(key, self.store)
+        with self.assertRaises(KeyError):
+            self.store.get(key)
+
+    def test_discard_missing(self):
+        self.store.discard(1234)
+
+    def test_compaction(self):
+        keys = [self.store.put(bytes(range(256)) * i) for i in range(10)]
+        size = self.store.file_size
+
+        for key in keys[:8]:
+            self.store.discard(key)
+
+        self.assertLess(self.store.file_size, size)
+        self.assertEqual(self.store.get(keys[8]), bytes(range(256)) * 8)
+        self.assertEqual(self.store.get(keys[9]), bytes(range(256)) * 9)
+
+    def test_clear(self):
+        self.store.put("payload")
+
+        self.store.clear()
+
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.file_size, 0)
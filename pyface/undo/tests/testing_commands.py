@@ -8,7 +8,7 @@
 #
 # Thanks for using Enthought open source!
 
-from traits.api import Int
+from traits.api import Any, Int
 from pyface.undo.api import AbstractCommand
 
 
@@ -54,3 +54,37 @@ class MergeableCommand(SimpleCommand):
         self.data += other.amount
         self.amount += other.amount
         return True
+
+
+class SnapshotCommand(SimpleCommand):
+    """ Command saving a snapshot of the data that can be spilled. """
+
+    name = "Snapshot"
+
+    snapshot = Any()
+
+    snapshot_size = Int(1000)
+
+    def do(self):
+        self.snapshot = bytes(self.snapshot_size)
+        self.redo()
+
+    def size_hint(self):
+        return 0 if self.snapshot is None else len(self.snapshot)
+
+    def spill_payload(self):
+        snapshot, self.snapshot = self.snapshot, None
+        return snapshot
+
+    def restore_payload(self, payload):
+        self.snapshot = payload
+
+
+class MergeableSnapshotCommand(SnapshotCommand):
+    """ Snapshot command whose snapshot grows when commands are merged. """
+
+    def merge(self, other):
+        if not isinstance(other, MergeableSnapshotCommand):
+            return False
+        self.snapshot += bytes(other.snapshot_size)
+        return True
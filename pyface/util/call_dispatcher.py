@@ -0,0 +1,177 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A toolkit-independent batching dispatcher for calls made from any thread.
+
+Toolkit GUI implementations use this to back ``invoke_later`` and
+``set_trait_later``: calls are appended to a queue and the toolkit is woken
+up at most once per batch, rather than once per call.  The queue is drained
+in a single pass from the GUI thread.
+"""
+
+from collections import deque
+import threading
+import time
+
+
+class CallDispatcher:
+    """ Batched, optionally coalescing, queue of pending calls.
+
+    Plain calls are appended to a :class:`collections.deque`, whose
+    ``append`` and ``popleft`` operations are atomic, so producers never
+    block each other or the GUI thread.  Coalesced calls additionally use a
+    short critical section to replace any pending call with the same key.
+
+    Parameters
+    ----------
+    wake : callable
+        A callable taking no arguments which arranges for :meth:`dispatch`
+        to be called from the GUI thread.  It is called at most once per
+        batch of queued calls, and may be called from any thread.
+    """
+
+    def __init__(self, wake):
+        self._wake = wake
+
+        # The queue of pending entries.  Each entry is a list of
+        # [key, enqueue time, callable, args, kwargs]; coalesced entries are
+        # updated in place while still pending.
+        self._queue = deque()
+
+        # Pending coalesced entries, by key.
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+
+        # Whether a wake-up is outstanding.
+        self._scheduled = False
+
+        self.reset_statistics()
+
+    def invoke(self, callable, *args, **kwargs):
+        """ Queue a call to be dispatched on the next batch.
+
+        Parameters
+        ----------
+        callable : callable
+            The callable to call.
+        *args, **kwargs
+            The arguments to pass to the callable.
+        """
+        self._queue.append(
+            [None, time.perf_counter(), callable, args, kwargs]
+        )
+        self._schedule()
+
+    def invoke_coalesced(self, key, callable, *args, **kwargs):
+        """ Queue a call, replacing any pending call with the same key.
+
+        The call keeps the position in the queue of the first pending call
+        with that key, but only the most recent callable and arguments are
+        used when it is dispatched.
+
+        Parameters
+        ----------
+        key : hashable
+            The key identifying calls which can be merged.
+        callable : callable
+            The callable to call.
+        *args, **kwargs
+            The arguments to pass to the callable.
+        """
+        with self._pending_lock:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[2:] = [callable, args, kwargs]
+                self._coalesced += 1
+                return
+            entry = [key, time.perf_counter(), callable, args, kwargs]
+            self._pending[key] = entry
+            self._queue.append(entry)
+        self._schedule()
+
+    def dispatch(self):
+        """ Dispatch the calls which are currently queued.
+
+        This should only be called from the GUI thread.  Calls queued while
+        dispatching are left for the next batch, so a callable that queues
+        further calls cannot starve the event loop.  If a callable raises,
+        the remaining calls are re-scheduled before the exception propagates.
+        """
+        # Clear the flag first so that anything queued from now on
+        # requests another wake-up.
+        self._scheduled = False
+        count = len(self._queue)
+        if count == 0:
+            return
+
+        self._batches += 1
+        self._max_queue_depth = max(self._max_queue_depth, count)
+        try:
+            for _ in range(count):
+                entry = self._queue.popleft()
+                key = entry[0]
+                if key is not None:
+                    with self._pending_lock:
+                        del self._pending[key]
+                latency = time.perf_counter() - entry[1]
+                self._dispatched += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+                callable, args, kwargs = entry[2:]
+                callable(*args, **kwargs)
+        finally:
+            if self._queue:
+                self._schedule()
+
+    def statistics(self):
+        """ Return a dictionary of dispatch statistics.
+
+        Returns
+        -------
+        statistics : dict
+            The current ``queue_depth``, the ``max_queue_depth`` seen at the
+            start of a batch, the number of calls ``dispatched``, the number
+            of calls ``coalesced`` into pending calls, the number of
+            ``batches`` and the ``mean_latency`` and ``max_latency`` in
+            seconds between queueing and dispatching a call.
+        """
+        dispatched = self._dispatched
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self._max_queue_depth,
+            "dispatched": dispatched,
+            "coalesced": self._coalesced,
+            "batches": self._batches,
+            "mean_latency": (
+                self._total_latency / dispatched if dispatched else 0.0
+            ),
+            "max_latency": self._max_latency,
+        }
+
+    def reset_statistics(self):
+        """ Reset the accumulated dispatch statistics. """
+        self._max_queue_depth = 0
+        self._dispatched = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _schedule(self):
+        """ Request a wake-up if one is not already outstanding. """
+        # Two threads may race here and both wake the GUI thread; this is
+        # harmless since the second dispatch finds an empty queue.
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake()
@@ -0,0 +1,800 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A compact, versioned binary format for window layouts and mementos.
+
+Layouts (:class:`~pyface.tasks.task_window_layout.TaskWindowLayout` trees)
+and workbench window mementos used to be saved with :mod:`pickle`, which is
+slow for many large layouts, can load arbitrary objects, and fails in
+unhelpful ways when the layout classes change.  This format only stores
+plain values and instances of registered layout types, and records the names
+of the fields of each type it stores, so that a field which has since been
+removed is dropped and a field which has since been added takes its default.
+
+Format (version 1)
+------------------
+
+All integers are unsigned LEB128 "varints" unless noted.  A file is::
+
+    file    := MAGIC version record*
+    record  := length body             (length of body in bytes)
+    body    := PUT key value | DELETE key
+    key     := value                   (a str)
+
+A stream of records is read in order, and the last record for a key wins,
+so a file can be updated by appending only the records which changed.  A
+value is a one byte tag followed by its data::
+
+    NONE | FALSE | TRUE
+    INT    zigzag-varint
+    FLOAT  8 byte little-endian IEEE double
+    STR    length utf-8-bytes
+    BYTES  length bytes
+    LIST   count value*
+    TUPLE  count value*
+    DICT   count (value value)*
+    OBJECT index [name count field-name*] count (field-index value)*
+
+The schema of an object (its type name and field names) is written inline
+the first time its type appears in a value, when ``index`` is the number of
+schemas seen so far in the value; later objects of the type only refer to
+the index.  Fields which have their default value are not written.
+"""
+
+from importlib import import_module
+import io
+import logging
+import os
+import struct
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+#: The bytes at the start of every layout file.
+MAGIC = b"PFLAYOUT"
+
+#: The version of the format written by this module.
+FORMAT_VERSION = 1
+
+#: The value reported by :class:`LayoutReader` for a deleted key.
+DELETED = object()
+
+# Value tags.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_BYTES = 6
+_LIST = 7
+_TUPLE = 8
+_DICT = 9
+_OBJECT = 10
+
+# Record operations.
+_PUT = 1
+_DELETE = 2
+
+_DOUBLE = struct.Struct("<d")
+
+
+class LayoutFormatError(Exception):
+    """ Raised when a layout can't be written or read. """
+
+
+# ----------------------------------------------------------------------------
+# Layout types.
+# ----------------------------------------------------------------------------
+
+#: Registered types by name.  Values are either classes or the dotted name
+#: of a class which is imported when it is first needed.
+_types = {}
+
+#: The names under which registered classes are written.
+_names = {}
+
+#: The field names of registered classes.
+_fields = {}
+
+#: The names and fields of registered classes which have not been imported,
+#: by dotted name.
+_lazy = {}
+
+
+def register_layout_type(cls, name=None, aliases=(), fields=None):
+    """ Allow instances of a HasTraits class to be stored in layouts.
+
+    Parameters
+    ----------
+    cls : type or str
+        The class, or its dotted name if it should only be imported when a
+        layout containing it is read.
+    name : str or None
+        The name under which the class is written.  By default this is the
+        dotted name of the class.
+    aliases : sequence of str
+        Other names which should be read as this class, eg. the names of the
+        class before it was moved or renamed.
+    fields : sequence of str or None
+        The names of the traits to store.  By default all traits which are
+        not events and not transient are stored.
+    """
+    dotted = cls if isinstance(cls, str) else _dotted_name(cls)
+    if name is None:
+        name = dotted
+    for type_name in (name,) + tuple(aliases):
+        _types[type_name] = cls
+    if isinstance(cls, str):
+        _lazy[dotted] = (name, fields)
+    else:
+        _names[cls] = name
+        if fields is not None:
+            _fields[cls] = tuple(fields)
+
+
+def _dotted_name(cls):
+    return "{}.{}".format(cls.__module__, cls.__qualname__)
+
+
+def _type_name(cls):
+    """ The name under which instances of a class are written. """
+    name = _names.get(cls)
+    if name is None:
+        lazy = _lazy.pop(_dotted_name(cls), None)
+        if lazy is None:
+            raise LayoutFormatError(
+                "Instances of {!r} can't be stored in a layout; "
+                "use register_layout_type() to allow it".format(cls)
+            )
+        # A lazily registered class has been imported.
+        name, fields = lazy
+        register_layout_type(cls, name, fields=fields)
+    return name
+
+
+def _type_fields(cls):
+    """ The names of the fields of a class which are stored. """
+    fields = _fields.get(cls)
+    if fields is None:
+        fields = _fields[cls] = tuple(
+            sorted(
+                cls.class_trait_names(
+                    type=lambda type: type != "event",
+                    transient=lambda transient: not transient,
+                )
+            )
+        )
+    return fields
+
+
+#: The static default values of the fields of classes, by class.
+_defaults = {}
+
+#: Marks a field whose default value is computed.
+_NO_DEFAULT = object()
+
+
+def _type_defaults(cls):
+    """ The static default value of each field of a class. """
+    defaults = _defaults.get(cls)
+    if defaults is None:
+        traits = cls.class_traits()
+        defaults = _defaults[cls] = tuple(
+            traits[field].default
+            if traits[field].default_kind in {"value", "list", "dict"}
+            else _NO_DEFAULT
+            for field in _type_fields(cls)
+        )
+    return defaults
+
+
+def _resolve_type(name):
+    """ The class registered under a name. """
+    cls = _types.get(name)
+    if cls is None:
+        raise LayoutFormatError("Unknown layout type {!r}".format(name))
+    if isinstance(cls, str):
+        module_name, _, class_name = cls.rpartition(".")
+        try:
+            cls = getattr(import_module(module_name), class_name)
+        except (ImportError, AttributeError) as exc:
+            raise LayoutFormatError(
+                "Can't import layout type {!r}".format(name)
+            ) from exc
+        _type_name(cls)
+        # Aliases of the class still refer to its dotted name.
+        for type_name, value in list(_types.items()):
+            if value == _dotted_name(cls):
+                _types[type_name] = cls
+    return cls
+
+
+for _dotted in [
+    "pyface.tasks.task_layout.PaneItem",
+    "pyface.tasks.task_layout.Tabbed",
+    "pyface.tasks.task_layout.Splitter",
+    "pyface.tasks.task_layout.HSplitter",
+    "pyface.tasks.task_layout.VSplitter",
+    "pyface.tasks.task_layout.DockLayout",
+    "pyface.tasks.task_layout.TaskLayout",
+    "pyface.tasks.task_window_layout.TaskWindowLayout",
+    "pyface.workbench.workbench_window_memento.WorkbenchWindowMemento",
+]:
+    register_layout_type(_dotted)
+del _dotted
+
+
+# ----------------------------------------------------------------------------
+# Values.
+# ----------------------------------------------------------------------------
+
+
+def _write_varint(buffer, value):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, offset):
+    result = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[offset]
+        except IndexError:
+            raise LayoutFormatError("Truncated layout data") from None
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+class _Encoder(object):
+    """ Encodes one value, keeping track of the schemas written. """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.schemas = {}
+
+    def encode(self, value):
+        buffer = self.buffer
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, int):
+            buffer.append(_INT)
+            _write_varint(
+                buffer, (value << 1) if value >= 0 else ((-value << 1) - 1)
+            )
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _DOUBLE.pack(value)
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+            buffer.append(_STR)
+            _write_varint(buffer, len(data))
+            buffer += data
+        elif isinstance(value, (bytes, bytearray)):
+            buffer.append(_BYTES)
+            _write_varint(buffer, len(value))
+            buffer += value
+        elif isinstance(value, (list, tuple)):
+            buffer.append(_TUPLE if isinstance(value, tuple) else _LIST)
+            _write_varint(buffer, len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, dict):
+            buffer.append(_DICT)
+            _write_varint(buffer, len(value))
+            for key, item in value.items():
+                self.encode(key)
+                self.encode(item)
+        else:
+            self.encode_object(value)
+
+    def encode_object(self, value):
+        cls = type(value)
+        name = _type_name(cls)
+        fields = _type_fields(cls)
+        buffer = self.buffer
+        buffer.append(_OBJECT)
+        index = self.schemas.get(cls)
+        if index is None:
+            index = self.schemas[cls] = len(self.schemas)
+            _write_varint(buffer, index)
+            self.encode_name(name)
+            _write_varint(buffer, len(fields))
+            for field in fields:
+                self.encode_name(field)
+        else:
+            _write_varint(buffer, index)
+
+        present = []
+        for i, default in enumerate(_type_defaults(cls)):
+            item = getattr(value, fields[i])
+            if type(default) is type(item) and default == item:
+                continue
+            present.append((i, item))
+        _write_varint(buffer, len(present))
+        for i, item in present:
+            _write_varint(buffer, i)
+            self.encode(item)
+
+    def encode_name(self, name):
+        data = name.encode("utf-8")
+        _write_varint(self.buffer, len(data))
+        self.buffer += data
+
+
+class _Decoder(object):
+    """ Decodes one value, keeping track of the schemas read. """
+
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.offset = offset
+        self.schemas = []
+
+    def decode(self):
+        data = self.data
+        try:
+            tag = data[self.offset]
+        except IndexError:
+            raise LayoutFormatError("Truncated layout data") from None
+        self.offset += 1
+        if tag == _NONE:
+            return None
+        elif tag == _TRUE:
+            return True
+        elif tag == _FALSE:
+            return False
+        elif tag == _INT:
+            value, self.offset = _read_varint(data, self.offset)
+            return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+        elif tag == _FLOAT:
+            end = self.offset + 8
+            if end > len(data):
+                raise LayoutFormatError("Truncated layout data")
+            (value,) = _DOUBLE.unpack_from(data, self.offset)
+            self.offset = end
+            return value
+        elif tag == _STR:
+            return self.read_bytes().decode("utf-8")
+        elif tag == _BYTES:
+            return self.read_bytes()
+        elif tag == _LIST or tag == _TUPLE:
+            count, self.offset = _read_varint(data, self.offset)
+            items = [self.decode() for _ in range(count)]
+            return tuple(items) if tag == _TUPLE else items
+        elif tag == _DICT:
+            count, self.offset = _read_varint(data, self.offset)
+            result = {}
+            for _ in range(count):
+                key = self.decode()
+                result[key] = self.decode()
+            return result
+        elif tag == _OBJECT:
+            return self.decode_object()
+        raise LayoutFormatError("Unknown value tag {}".format(tag))
+
+    def decode_object(self):
+        index, self.offset = _read_varint(self.data, self.offset)
+        if index == len(self.schemas):
+            name = self.read_bytes().decode("utf-8")
+            count, self.offset = _read_varint(self.data, self.offset)
+            fields = [
+                self.read_bytes().decode("utf-8") for _ in range(count)
+            ]
+            self.schemas.append((name, fields))
+        elif index > len(self.schemas):
+            raise LayoutFormatError("Unknown schema index {}".format(index))
+        name, fields = self.schemas[index]
+        cls = _resolve_type(name)
+
+        count, self.offset = _read_varint(self.data, self.offset)
+        traits = {}
+        for _ in range(count):
+            field_index, self.offset = _read_varint(self.data, self.offset)
+            value = self.decode()
+            try:
+                field = fields[field_index]
+            except IndexError:
+                raise LayoutFormatError(
+                    "Unknown field index {}".format(field_index)
+                ) from None
+            traits[field] = value
+
+        known = _type_fields(cls)
+        for field in list(traits):
+            if field not in known and field not in cls.__class_traits__:
+                logger.warning(
+                    "Ignoring unknown field %r of layout type %r", field, name
+                )
+                del traits[field]
+        try:
+            return cls(**traits)
+        except Exception as exc:
+            raise LayoutFormatError(
+                "Can't create {!r} from layout data".format(name)
+            ) from exc
+
+    def read_bytes(self):
+        length, offset = _read_varint(self.data, self.offset)
+        end = offset + length
+        if end > len(self.data):
+            raise LayoutFormatError("Truncated layout data")
+        self.offset = end
+        return bytes(self.data[offset:end])
+
+
+def encode_value(value):
+    """ Encode a layout value, without a header.
+
+    Parameters
+    ----------
+    value : object
+        A value made of None, bools, ints, floats, strs, bytes, lists, tuples,
+        dicts and instances of registered layout types.
+
+    Returns
+    -------
+    data : bytes
+        The encoded value.
+    """
+    encoder = _Encoder()
+    encoder.encode(value)
+    return bytes(encoder.buffer)
+
+
+def decode_value(data):
+    """ Decode a value encoded by :func:`encode_value`. """
+    decoder = _Decoder(data)
+    value = decoder.decode()
+    if decoder.offset != len(data):
+        raise LayoutFormatError("Unexpected data after layout value")
+    return value
+
+
+def _header():
+    header = bytearray(MAGIC)
+    _write_varint(header, FORMAT_VERSION)
+    return bytes(header)
+
+
+def _check_header(data):
+    """ Check the header of layout data and return the offset after it. """
+    if data[:len(MAGIC)] != MAGIC:
+        raise LayoutFormatError("Not layout data")
+    version, offset = _read_varint(data, len(MAGIC))
+    if version > FORMAT_VERSION:
+        raise LayoutFormatError(
+            "Layout format version {} is newer than the supported version {}"
+            .format(version, FORMAT_VERSION)
+        )
+    return offset
+
+
+def dumps(value):
+    """ Return a layout value encoded with a header as bytes. """
+    return _header() + encode_value(value)
+
+
+def loads(data):
+    """ Return the layout value encoded by :func:`dumps`. """
+    return decode_value(data[_check_header(data):])
+
+
+# ----------------------------------------------------------------------------
+# Streams of records.
+# ----------------------------------------------------------------------------
+
+
+def _encode_record(key, payload):
+    """ Encode a record for a key and encoded value (None to delete). """
+    encoder = _Encoder()
+    if payload is None:
+        encoder.buffer.append(_DELETE)
+        encoder.encode(key)
+    else:
+        encoder.buffer.append(_PUT)
+        encoder.encode(key)
+        encoder.buffer += payload
+    record = bytearray()
+    _write_varint(record, len(encoder.buffer))
+    record += encoder.buffer
+    return bytes(record)
+
+
+class LayoutWriter(object):
+    """ Write layout records to a binary stream.
+
+    Parameters
+    ----------
+    stream : binary file-like
+        The stream to write to.
+    header : bool
+        Whether to write the header first.  This should be False when
+        appending to an existing layout file.
+    """
+
+    def __init__(self, stream, header=True):
+        self.stream = stream
+        if header:
+            stream.write(_header())
+
+    def write(self, key, value):
+        """ Write a record setting the value for a key. """
+        self.write_encoded(key, encode_value(value))
+
+    def write_encoded(self, key, payload):
+        """ Write a record with a value already encoded by encode_value. """
+        self.stream.write(_encode_record(key, payload))
+
+    def delete(self, key):
+        """ Write a record deleting a key. """
+        self.stream.write(_encode_record(key, None))
+
+
+class LayoutReader(object):
+    """ Read layout records from a binary stream.
+
+    Iterating over the reader yields ``(key, value)`` pairs in the order
+    they were written, with :data:`DELETED` as the value of deleted keys.
+    Values are only decoded as they are reached.  A record truncated by an
+    interrupted write at the end of the stream is ignored.
+
+    Parameters
+    ----------
+    stream : binary file-like
+        The stream to read from.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        header = stream.read(len(MAGIC) + 10)
+        offset = _check_header(header)
+        # Put back anything read beyond the header.
+        self._pending = header[offset:]
+
+    def __iter__(self):
+        for key, payload in self.raw_records():
+            if payload is None:
+                yield key, DELETED
+            else:
+                yield key, decode_value(payload)
+
+    def raw_records(self):
+        """ Yield ``(key, payload)`` pairs without decoding the values.
+
+        The payload is None for deleted keys.
+        """
+        for _, key, payload in self._records():
+            yield key, payload
+
+    def read_all(self):
+        """ Return a dictionary of the final value of each key. """
+        result = {}
+        for key, value in self:
+            if value is DELETED:
+                result.pop(key, None)
+            else:
+                result[key] = value
+        return result
+
+    def _records(self):
+        """ Yield ``(size, key, payload)`` for each complete record. """
+        data = bytearray(self._pending)
+        self._pending = b""
+        offset = 0
+        eof = False
+        while True:
+            try:
+                length, start = _read_varint(data, offset)
+                complete = start + length <= len(data)
+            except LayoutFormatError:
+                complete = False
+            if not complete:
+                if eof:
+                    if offset < len(data):
+                        logger.warning("Ignoring truncated layout record")
+                    return
+                chunk = self.stream.read(1 << 16)
+                if not chunk:
+                    eof = True
+                del data[:offset]
+                data += chunk
+                offset = 0
+                continue
+
+            end = start + length
+            body = bytes(data[start:end])
+            decoder = _Decoder(body, 1)
+            key = decoder.decode()
+            if body[0] == _DELETE:
+                payload = None
+            elif body[0] == _PUT:
+                payload = body[decoder.offset:]
+            else:
+                raise LayoutFormatError(
+                    "Unknown record operation {}".format(body[0])
+                )
+            yield end - offset, key, payload
+            offset = end
+
+
+class LayoutStore(object):
+    """ A layout file which is updated by appending changed records.
+
+    Saving only appends records for the keys whose values have changed since
+    they were last loaded or saved, and for the keys which have been removed.
+    The file is rewritten without the superseded records once they make up
+    more than half of it.
+
+    Parameters
+    ----------
+    path : str
+        The path of the layout file.
+    min_compact_size : int
+        The number of superseded bytes below which the file is never
+        rewritten.
+    """
+
+    def __init__(self, path, min_compact_size=1 << 16):
+        self.path = path
+        self.min_compact_size = min_compact_size
+
+        # The encoded values in the file, by key, or None if the file has
+        # not been read yet.
+        self._payloads = None
+
+        # The number of bytes of superseded records, and of the whole file.
+        self._wasted = 0
+        self._size = 0
+
+    def load(self):
+        """ Read the layout file.
+
+        Returns
+        -------
+        layouts : dict
+            The values in the file by key.  This is empty if the file does
+            not exist.
+        """
+        self._read_index()
+        return {
+            key: decode_value(payload)
+            for key, payload in self._payloads.items()
+        }
+
+    def save(self, layouts):
+        """ Save layouts, writing only those which have changed.
+
+        Parameters
+        ----------
+        layouts : dict
+            The values to save by key.  Keys which are in the file but not in
+            ``layouts`` are deleted.
+
+        Returns
+        -------
+        count : int
+            The number of records written.
+        """
+        if self._payloads is None:
+            try:
+                self._read_index()
+            except LayoutFormatError:
+                logger.warning(
+                    "Replacing unreadable layout file %s", self.path
+                )
+                self._payloads = {}
+                self._size = 0
+        payloads = {key: encode_value(value) for key, value in layouts.items()}
+        records = [
+            _encode_record(key, payload)
+            for key, payload in payloads.items()
+            if self._payloads.get(key) != payload
+        ]
+        records.extend(
+            _encode_record(key, None)
+            for key in self._payloads
+            if key not in payloads
+        )
+        file_size = self._file_size()
+        if not records and self._size == file_size:
+            return 0
+
+        # Superseded records, and deletions, are wasted space.
+        wasted = self._wasted + sum(
+            len(_encode_record(key, payload))
+            + (0 if key in payloads else len(_encode_record(key, None)))
+            for key, payload in self._payloads.items()
+            if payload != payloads.get(key)
+        )
+        written = sum(len(record) for record in records)
+
+        # The file is also rewritten if it is missing or has a truncated or
+        # unknown tail, rather than appending to it.
+        if file_size == 0 or self._size != file_size or (
+            wasted >= self.min_compact_size
+            and 2 * wasted > self._size + written
+        ):
+            self._rewrite(payloads)
+            return len(payloads)
+
+        with open(self.path, "ab") as stream:
+            for record in records:
+                stream.write(record)
+        self._payloads = payloads
+        self._wasted = wasted
+        self._size += written
+        return len(records)
+
+    def compact(self):
+        """ Rewrite the file without superseded records. """
+        self._read_index()
+        self._rewrite(self._payloads)
+
+    # ------------------------------------------------------------------------
+    # Private interface.
+    # ------------------------------------------------------------------------
+
+    def _read_index(self):
+        """ Read the encoded values in the file without decoding them. """
+        self._payloads = {}
+        self._wasted = 0
+        self._size = 0
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as stream:
+            reader = LayoutReader(stream)
+            sizes = {}
+            size = stream.tell() - len(reader._pending)
+            for record_size, key, payload in reader._records():
+                size += record_size
+                self._wasted += sizes.pop(key, 0)
+                if payload is None:
+                    self._wasted += record_size
+                    self._payloads.pop(key, None)
+                else:
+                    sizes[key] = record_size
+                    self._payloads[key] = payload
+        self._size = size
+
+    def _file_size(self):
+        """ The size of the file on disk, or 0 if it does not exist. """
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _rewrite(self, payloads):
+        """ Atomically replace the file with one holding the payloads. """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with io.open(fd, "wb") as stream:
+                writer = LayoutWriter(stream)
+                for key, payload in payloads.items():
+                    writer.write_encoded(key, payload)
+                size = stream.tell()
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._payloads = dict(payloads)
+        self._wasted = 0
+        self._size = size
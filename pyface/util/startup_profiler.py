@@ -0,0 +1,249 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A lightweight recorder of the phases of application startup.
+
+Applications, task windows, action managers and images record the phases of
+startup (creating tasks, panes, menus and tool bars, loading images, opening
+windows, and so on) with the shared :data:`startup_profiler`.  Recording is
+off unless it is enabled, in which case each phase costs a pair of calls to
+:func:`time.perf_counter`.  Recording stops when the application has been
+initialized, at which point the timeline is reported.
+
+Setting the ``PYFACE_STARTUP_PROFILE`` environment variable enables the
+profiler when Pyface is imported.  A value of ``1`` or ``summary`` prints a
+summary table to standard error, and any other value is the path of a file
+to which a Chrome trace (viewable in ``chrome://tracing`` or Perfetto) is
+written.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+#: The environment variable which enables the startup profiler.
+PROFILE_ENV_VAR = "PYFACE_STARTUP_PROFILE"
+
+# The context returned for phases while the profiler is disabled.
+_NO_PHASE = nullcontext()
+
+
+class StartupProfiler:
+    """ Record the start time and duration of the phases of startup.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether phases are recorded.
+    output : str or None
+        What to report when recording finishes: ``"summary"`` prints a
+        summary table to standard error, a path writes a Chrome trace to that
+        file, and None reports nothing.
+    """
+
+    def __init__(self, enabled=False, output=None):
+        self.enabled = enabled
+        self.output = output
+        self.reset()
+
+    @classmethod
+    def from_environment(cls, environ=None):
+        """ Create a profiler configured by ``PYFACE_STARTUP_PROFILE``.
+
+        Parameters
+        ----------
+        environ : mapping or None
+            The environment to use, by default ``os.environ``.
+        """
+        if environ is None:
+            environ = os.environ
+        value = environ.get(PROFILE_ENV_VAR, "").strip()
+        if value.lower() in {"", "0", "false", "no", "off"}:
+            return cls()
+        if value.lower() in {"1", "true", "yes", "on", "summary"}:
+            return cls(enabled=True, output="summary")
+        return cls(enabled=True, output=value)
+
+    @property
+    def events(self):
+        """ The recorded events, in the order in which they finished.
+
+        Each event is a tuple of ``(name, category, start, duration, thread,
+        args)``, where the start is in seconds from the profiler's origin and
+        the duration is None for instantaneous marks.
+        """
+        return list(self._events)
+
+    def phase(self, name, category="startup", args=None):
+        """ A context manager which records a phase of startup.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase.  Phases with the same name are aggregated
+            in the summary, so details should be passed as ``args``.
+        category : str
+            The category of the phase, eg. "task", "pane" or "image".
+        args : dict or None
+            Details of the phase, such as the id of a task.
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name, category, args or {})
+
+    def mark(self, name, category="startup", args=None):
+        """ Record an instantaneous event, such as an application event. """
+        if self.enabled:
+            self._events.append((
+                name,
+                category,
+                time.perf_counter() - self.origin,
+                None,
+                threading.get_ident(),
+                args or {},
+            ))
+
+    def finish(self):
+        """ Stop recording and report the timeline as configured. """
+        if not self.enabled:
+            return
+        self.mark("finished")
+        self.enabled = False
+        if self.output == "summary":
+            sys.stderr.write(self.summary())
+        elif self.output:
+            self.write_chrome_trace(self.output)
+
+    def reset(self):
+        """ Discard the recorded events and restart the clock. """
+        self.origin = time.perf_counter()
+        self._events = []
+
+    # Reporting --------------------------------------------------------------
+
+    def chrome_trace(self):
+        """ Return the recorded events in the Chrome trace event format.
+
+        Returns
+        -------
+        trace : dict
+            A JSON-serializable dictionary in the "JSON Object Format" of the
+            Trace Event Format, with timestamps in microseconds.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, category, start, duration, thread, args in self._events:
+            event = {
+                "name": name,
+                "cat": category,
+                "ts": round(start * 1e6, 3),
+                "pid": pid,
+                "tid": thread,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            if duration is None:
+                event.update(ph="i", s="p")
+            else:
+                event.update(ph="X", dur=round(duration * 1e6, 3))
+            trace_events.append(event)
+        trace_events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """ Write the recorded events to a Chrome trace file. """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self):
+        """ Return a table of the recorded phases.
+
+        Phases are grouped by category and name and listed in the order in
+        which they first started, with the number of times they occurred
+        and their total and longest durations in milliseconds.
+        """
+        totals = {}
+        end = 0.0
+        for name, category, start, duration, _, _ in self._events:
+            end = max(end, start + (duration or 0.0))
+            if duration is None:
+                continue
+            key = (category, name)
+            if key in totals:
+                first, count, total, longest = totals[key]
+                totals[key] = (
+                    min(first, start),
+                    count + 1,
+                    total + duration,
+                    max(longest, duration),
+                )
+            else:
+                totals[key] = (start, 1, duration, duration)
+
+        lines = [
+            "Startup profile: {:.1f} ms".format(end * 1e3),
+            "{:>10} {:>6} {:>10} {:>10}  {}".format(
+                "start", "count", "total", "max", "phase"
+            ),
+        ]
+        for (category, name), (first, count, total, longest) in sorted(
+            totals.items(), key=lambda item: item[1][0]
+        ):
+            lines.append(
+                "{:10.1f} {:6d} {:10.1f} {:10.1f}  {}:{}".format(
+                    first * 1e3, count, total * 1e3, longest * 1e3,
+                    category, name,
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+
+class _Phase:
+    """ The context manager recording a single phase. """
+
+    __slots__ = ("profiler", "name", "category", "args", "start")
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        profiler = self.profiler
+        if profiler.enabled:
+            profiler._events.append((
+                self.name,
+                self.category,
+                self.start - profiler.origin,
+                end - self.start,
+                threading.get_ident(),
+                self.args,
+            ))
+        return False
+
+
+#: The profiler shared by Pyface's startup code.
+startup_profiler = StartupProfiler.from_environment()
+
+
+def profile_phase(name, category="startup", args=None):
+    """ Record a phase of startup with the shared profiler.
+
+    See :meth:`StartupProfiler.phase`.
+    """
+    return startup_profiler.phase(name, category, args)
@@ -0,0 +1,145 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import threading
+import unittest
+
+from pyface.util.call_dispatcher import CallDispatcher
+
+
+class TestCallDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.wakes = 0
+        self.dispatcher = CallDispatcher(self.wake)
+
+    def wake(self):
+        self.wakes += 1
+
+    def test_invoke_wakes_once_per_batch(self):
+        calls = []
+
+        for i in range(10):
+            self.dispatcher.invoke(calls.append, i)
+
+        self.assertEqual(self.wakes, 1)
+        self.assertEqual(calls, [])
+
+        self.dispatcher.dispatch()
+
+        self.assertEqual(calls, list(range(10)))
+        self.dispatcher.invoke(calls.append, 10)
+        self.assertEqual(self.wakes, 2)
+
+    def test_invoke_kwargs(self):
+        calls = []
+
+        self.dispatcher.invoke(lambda *a, **k: calls.append((a, k)), 1, b=2)
+        self.dispatcher.dispatch()
+
+        self.assertEqual(calls, [((1,), {"b": 2})])
+
+    def test_invoke_coalesced(self):
+        calls = []
+
+        self.dispatcher.invoke(calls.append, "first")
+        for i in range(5):
+            self.dispatcher.invoke_coalesced("key", calls.append, i)
+        self.dispatcher.invoke(calls.append, "last")
+        self.dispatcher.dispatch()
+
+        self.assertEqual(calls, ["first", 4, "last"])
+        stats = self.dispatcher.statistics()
+        self.assertEqual(stats["dispatched"], 3)
+        self.assertEqual(stats["coalesced"], 4)
+
+        # once dispatched, the key starts a new pending call
+        self.dispatcher.invoke_coalesced("key", calls.append, 5)
+        self.dispatcher.dispatch()
+        self.assertEqual(calls, ["first", 4, "last", 5])
+
+    def test_calls_queued_while_dispatching_wait_for_next_batch(self):
+        calls = []
+
+        def requeue():
+            calls.append("requeue")
+            self.dispatcher.invoke(calls.append, "later")
+
+        self.dispatcher.invoke(requeue)
+        self.dispatcher.dispatch()
+
+        self.assertEqual(calls, ["requeue"])
+        self.assertEqual(self.wakes, 2)
+
+        self.dispatcher.dispatch()
+
+        self.assertEqual(calls, ["requeue", "later"])
+
+    def test_exception_reschedules_remaining(self):
+        calls = []
+
+        def fail():
+            raise ZeroDivisionError()
+
+        self.dispatcher.invoke(fail)
+        self.dispatcher.invoke(calls.append, 1)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.dispatcher.dispatch()
+
+        self.assertEqual(self.wakes, 2)
+        self.dispatcher.dispatch()
+        self.assertEqual(calls, [1])
+
+    def test_statistics(self):
+        for i in range(3):
+            self.dispatcher.invoke(len, ())
+
+        stats = self.dispatcher.statistics()
+        self.assertEqual(stats["queue_depth"], 3)
+        self.assertEqual(stats["dispatched"], 0)
+        self.assertEqual(stats["mean_latency"], 0.0)
+
+        self.dispatcher.dispatch()
+
+        stats = self.dispatcher.statistics()
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["max_queue_depth"], 3)
+        self.assertEqual(stats["dispatched"], 3)
+        self.assertEqual(stats["batches"], 1)
+        self.assertGreaterEqual(stats["max_latency"], stats["mean_latency"])
+
+        self.dispatcher.reset_statistics()
+        self.assertEqual(self.dispatcher.statistics()["dispatched"], 0)
+
+    def test_invoke_from_threads(self):
+        calls = []
+
+        def worker(n):
+            for i in range(1000):
+                self.dispatcher.invoke(calls.append, (n, i))
+                self.dispatcher.invoke_coalesced(n, calls.append, None)
+
+        threads = [
+            threading.Thread(target=worker, args=(n,)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.dispatcher.dispatch()
+
+        plain = [call for call in calls if call is not None]
+        self.assertEqual(len(plain), 4000)
+        for n in range(4):
+            self.assertEqual(
+                [i for m, i in plain if m == n], list(range(1000))
+            )
+        self.assertEqual(self.dispatcher.statistics()["queue_depth"], 0)
@@ -0,0 +1,272 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from traits.api import HasTraits, Int, Str
+
+from pyface.tasks.task_layout import (
+    HSplitter, PaneItem, Tabbed, TaskLayout, VSplitter,
+)
+from pyface.tasks.task_window_layout import TaskWindowLayout
+from pyface.util.layout_format import (
+    DELETED,
+    FORMAT_VERSION,
+    LayoutFormatError,
+    LayoutReader,
+    LayoutStore,
+    LayoutWriter,
+    MAGIC,
+    dumps,
+    loads,
+    register_layout_type,
+)
+from pyface.workbench.workbench_window_memento import WorkbenchWindowMemento
+
+
+class Point(HasTraits):
+    x = Int()
+    y = Int()
+
+
+class RenamedPoint(HasTraits):
+    x = Int()
+    label = Str("default")
+
+
+class UnregisteredPoint(HasTraits):
+    x = Int()
+
+
+register_layout_type(Point, name="test.Point")
+
+
+def window_layout(index=0):
+    return TaskWindowLayout(
+        TaskLayout(
+            id="task",
+            left=Tabbed(
+                PaneItem("a", width=100), PaneItem("b"), active_tab="b"
+            ),
+            bottom=HSplitter(
+                PaneItem("c"), VSplitter(PaneItem(1), PaneItem("d"))
+            ),
+            top_left_corner="left",
+        ),
+        "other_task",
+        active_task="task",
+        position=(index, -index),
+        size_state="maximized",
+    )
+
+
+class TestLayoutValues(unittest.TestCase):
+    def test_plain_values(self):
+        value = [
+            None, True, False, 0, -1, 2 ** 80, -(2 ** 80), 1.5, "é",
+            b"\x00\xff", (1, (2,)), {"a": [1], 2: None},
+        ]
+        self.assertEqual(loads(dumps(value)), value)
+
+    def test_tuple_and_list_kept_apart(self):
+        self.assertEqual(loads(dumps((1, 2))), (1, 2))
+        self.assertEqual(loads(dumps([1, 2])), [1, 2])
+
+    def test_task_window_layout(self):
+        layout = window_layout(3)
+
+        result = loads(dumps(layout))
+
+        self.assertIsInstance(result, TaskWindowLayout)
+        self.assertEqual(result.pformat(), layout.pformat())
+        self.assertIsInstance(result.items[0].left, Tabbed)
+        self.assertEqual(result.position, (3, -3))
+
+    def test_workbench_memento(self):
+        memento = WorkbenchWindowMemento(
+            active_perspective_id="p",
+            perspective_mementos={"p": ((0, (["v"], b"state")), None, True)},
+            position=(1, 2),
+            size=(3, 4),
+            toolkit_data=(0, {"geometry": b"geometry"}),
+        )
+
+        result = loads(dumps(memento))
+
+        self.assertEqual(
+            result.trait_get(
+                "active_perspective_id", "perspective_mementos", "position",
+                "size", "toolkit_data",
+            ),
+            memento.trait_get(
+                "active_perspective_id", "perspective_mementos", "position",
+                "size", "toolkit_data",
+            ),
+        )
+
+    def test_smaller_than_pickle(self):
+        import pickle
+
+        layout = window_layout()
+
+        self.assertLess(len(dumps(layout)), len(pickle.dumps(layout)))
+
+    def test_unregistered_type(self):
+        with self.assertRaises(LayoutFormatError):
+            dumps(UnregisteredPoint())
+
+    def test_unknown_type(self):
+        data = dumps(Point(x=1))
+
+        with self.assertRaises(LayoutFormatError):
+            loads(data.replace(b"test.Point", b"test.Pxint"))
+
+    def test_changed_fields(self):
+        data = dumps(Point(x=1, y=2))
+        register_layout_type(RenamedPoint, name="test.Renamed")
+        data = data.replace(b"\x0atest.Point", b"\x0ctest.Renamed")
+
+        with self.assertLogs("pyface.util.layout_format", "WARNING"):
+            result = loads(data)
+
+        # y no longer exists and label takes its default
+        self.assertIsInstance(result, RenamedPoint)
+        self.assertEqual(result.x, 1)
+        self.assertEqual(result.label, "default")
+
+    def test_newer_version(self):
+        data = MAGIC + bytes([FORMAT_VERSION + 1]) + dumps(None)[-1:]
+
+        with self.assertRaises(LayoutFormatError):
+            loads(data)
+
+    def test_not_layout_data(self):
+        with self.assertRaises(LayoutFormatError):
+            loads(b"\x80\x04N.")
+
+    def test_truncated(self):
+        data = dumps(window_layout())
+
+        with self.assertRaises(LayoutFormatError):
+            loads(data[:-5])
+
+
+class TestLayoutStreams(unittest.TestCase):
+    def test_write_and_read_records(self):
+        stream = io.BytesIO()
+        writer = LayoutWriter(stream)
+        writer.write("a", window_layout(1))
+        writer.write("b", [1, 2])
+        writer.write("a", window_layout(2))
+        writer.delete("b")
+
+        stream.seek(0)
+        records = list(LayoutReader(stream))
+
+        self.assertEqual([key for key, _ in records], ["a", "b", "a", "b"])
+        self.assertIs(records[3][1], DELETED)
+        stream.seek(0)
+        result = LayoutReader(stream).read_all()
+        self.assertEqual(list(result), ["a"])
+        self.assertEqual(result["a"].position, (2, -2))
+
+    def test_truncated_record_ignored(self):
+        stream = io.BytesIO()
+        writer = LayoutWriter(stream)
+        writer.write("a", 1)
+        writer.write("b", window_layout())
+        data = stream.getvalue()
+
+        with self.assertLogs("pyface.util.layout_format", "WARNING"):
+            result = LayoutReader(io.BytesIO(data[:-3])).read_all()
+
+        self.assertEqual(result, {"a": 1})
+
+
+class TestLayoutStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "layouts")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_missing_file(self):
+        self.assertEqual(LayoutStore(self.path).load(), {})
+
+    def test_save_and_load(self):
+        layouts = {str(i): window_layout(i) for i in range(5)}
+
+        count = LayoutStore(self.path).save(layouts)
+
+        self.assertEqual(count, 5)
+        result = LayoutStore(self.path).load()
+        self.assertEqual(sorted(result), sorted(layouts))
+        self.assertEqual(result["3"].pformat(), layouts["3"].pformat())
+
+    def test_only_changes_are_written(self):
+        store = LayoutStore(self.path)
+        layouts = {str(i): window_layout(i) for i in range(5)}
+        store.save(layouts)
+        size = os.path.getsize(self.path)
+
+        self.assertEqual(store.save(layouts), 0)
+        self.assertEqual(os.path.getsize(self.path), size)
+
+        layouts["2"] = window_layout(20)
+        del layouts["4"]
+        self.assertEqual(store.save(layouts), 2)
+
+        # a new store compares against the contents of the file
+        store = LayoutStore(self.path)
+        self.assertEqual(store.save(layouts), 0)
+        result = store.load()
+        self.assertEqual(sorted(result), ["0", "1", "2", "3"])
+        self.assertEqual(result["2"].position, (20, -20))
+
+    def test_compaction(self):
+        store = LayoutStore(self.path, min_compact_size=0)
+        store.save({"a": window_layout(0), "b": window_layout(1)})
+        size = os.path.getsize(self.path)
+
+        for i in range(10):
+            store.save({"a": window_layout(i), "b": window_layout(1)})
+
+        self.assertLess(os.path.getsize(self.path), 2 * size)
+        self.assertEqual(LayoutStore(self.path).load()["a"].position, (9, -9))
+
+    def test_truncated_tail_is_rewritten(self):
+        store = LayoutStore(self.path)
+        store.save({"a": 1})
+        with open(self.path, "ab") as f:
+            f.write(b"\x50\x01")
+
+        store = LayoutStore(self.path)
+        with self.assertLogs("pyface.util.layout_format", "WARNING"):
+            store.save({"a": 1, "b": 2})
+
+        self.assertEqual(LayoutStore(self.path).load(), {"a": 1, "b": 2})
+
+    def test_unreadable_file_replaced(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a layout")
+
+        store = LayoutStore(self.path)
+        with self.assertRaises(LayoutFormatError):
+            store.load()
+        with self.assertLogs("pyface.util.layout_format", "WARNING"):
+            store = LayoutStore(self.path)
+            store.save({"a": 1})
+
+        self.assertEqual(LayoutStore(self.path).load(), {"a": 1})
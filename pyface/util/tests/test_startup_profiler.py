@@ -0,0 +1,148 @@
+# (C) Copyright 2005-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from pyface.util.startup_profiler import (
+    PROFILE_ENV_VAR,
+    StartupProfiler,
+)
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def test_disabled_records_nothing(self):
+        profiler = StartupProfiler()
+
+        with profiler.phase("phase"):
+            pass
+        profiler.mark("mark")
+
+        self.assertEqual(profiler.events, [])
+
+    def test_phase(self):
+        profiler = StartupProfiler(enabled=True)
+
+        with profiler.phase("outer", "task", {"id": "task1"}):
+            with profiler.phase("inner", "pane"):
+                pass
+
+        (inner, outer) = profiler.events
+        self.assertEqual(inner[:2], ("inner", "pane"))
+        self.assertEqual(outer[:2], ("outer", "task"))
+        self.assertEqual(outer[5], {"id": "task1"})
+        # the inner phase is within the outer phase
+        self.assertGreaterEqual(inner[2], outer[2])
+        self.assertLessEqual(inner[2] + inner[3], outer[2] + outer[3])
+
+    def test_phase_with_exception(self):
+        profiler = StartupProfiler(enabled=True)
+
+        with self.assertRaises(ZeroDivisionError):
+            with profiler.phase("failed"):
+                1 / 0
+
+        self.assertEqual([event[0] for event in profiler.events], ["failed"])
+
+    def test_mark(self):
+        profiler = StartupProfiler(enabled=True)
+
+        profiler.mark("started", "application")
+
+        (event,) = profiler.events
+        self.assertEqual(event[:2], ("started", "application"))
+        self.assertIsNone(event[3])
+
+    def test_chrome_trace(self):
+        profiler = StartupProfiler(enabled=True)
+        with profiler.phase("create_task", "task", {"id": 1}):
+            pass
+        profiler.mark("started", "application")
+
+        trace = profiler.chrome_trace()
+
+        json.dumps(trace)
+        phase, mark = trace["traceEvents"]
+        self.assertEqual(phase["ph"], "X")
+        self.assertEqual(phase["cat"], "task")
+        self.assertEqual(phase["args"], {"id": "1"})
+        self.assertGreaterEqual(phase["dur"], 0)
+        self.assertEqual(mark["ph"], "i")
+        self.assertEqual(mark["pid"], os.getpid())
+
+    def test_summary(self):
+        profiler = StartupProfiler(enabled=True)
+        for i in range(3):
+            with profiler.phase("load_image", "image", {"name": str(i)}):
+                pass
+        with profiler.phase("create_pane", "pane"):
+            pass
+
+        lines = profiler.summary().splitlines()
+
+        self.assertTrue(lines[0].startswith("Startup profile:"))
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[2].endswith("image:load_image"))
+        self.assertEqual(lines[2].split()[1], "3")
+        self.assertTrue(lines[3].endswith("pane:create_pane"))
+
+    def test_finish_writes_chrome_trace(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "startup.json")
+        profiler = StartupProfiler(enabled=True, output=path)
+        with profiler.phase("start"):
+            pass
+
+        profiler.finish()
+
+        self.assertFalse(profiler.enabled)
+        with open(path, encoding="utf-8") as f:
+            trace = json.load(f)
+        names = [event["name"] for event in trace["traceEvents"]]
+        self.assertEqual(names, ["start", "finished"])
+
+        # nothing more is recorded
+        with profiler.phase("late"):
+            pass
+        self.assertEqual(len(profiler.events), 2)
+
+    def test_finish_prints_summary(self):
+        profiler = StartupProfiler(enabled=True, output="summary")
+        with profiler.phase("start"):
+            pass
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            profiler.finish()
+
+        self.assertIn("startup:start", stderr.getvalue())
+
+    def test_from_environment(self):
+        profiler = StartupProfiler.from_environment({})
+        self.assertFalse(profiler.enabled)
+
+        profiler = StartupProfiler.from_environment({PROFILE_ENV_VAR: "0"})
+        self.assertFalse(profiler.enabled)
+
+        profiler = StartupProfiler.from_environment({PROFILE_ENV_VAR: "1"})
+        self.assertTrue(profiler.enabled)
+        self.assertEqual(profiler.output, "summary")
+
+        profiler = StartupProfiler.from_environment(
+            {PROFILE_ENV_VAR: "trace.json"}
+        )
+        self.assertTrue(profiler.enabled)
+        self.assertEqual(profiler.output, "trace.json")
@@ -17,6 +17,7 @@ import os
 
 from traits.etsconfig.api import ETSConfig
 from pyface.api import NO
+from pyface.util.layout_format import LayoutFormatError, LayoutStore
 from traits.api import Bool, Callable, Event, HasTraits, provides
 from traits.api import Instance, List, Str, Vetoable
 from traits.api import VetoableEvent
@@ -318,6 +319,23 @@ class Workbench(HasTraits):
     def _restore_window_layout(self, window):
         """ Restore the window layout. """
 
+        filename = os.path.join(self.state_location, "window_memento.layout")
+        if os.path.exists(filename):
+            try:
+                memento = LayoutStore(filename).load().get("window")
+
+            # If *anything* goes wrong then simply log the error and carry on
+            # with no memento!
+            except Exception:
+                logger.exception("restoring window layout from %s", filename)
+
+            else:
+                if memento is not None:
+                    window.set_memento(memento)
+                return
+
+        # Fall back to a memento pickled by an earlier version, or for a
+        # toolkit whose mementos can't be stored in a layout file.
         filename = os.path.join(self.state_location, "window_memento")
         if os.path.exists(filename):
             try:
@@ -340,10 +358,24 @@ class Workbench(HasTraits):
     def _save_window_layout(self, window):
         """ Save the window layout. """
 
-        # Save the window layout.
-        f = open(os.path.join(self.state_location, "window_memento"), "wb")
-        pickle.dump(window.get_memento(), f)
-        f.close()
+        memento = window.get_memento()
+        filename = os.path.join(self.state_location, "window_memento.layout")
+        legacy_filename = os.path.join(self.state_location, "window_memento")
+        try:
+            LayoutStore(filename).save({"window": memento})
+
+        except LayoutFormatError:
+            # The memento holds toolkit objects which can only be pickled.
+            f = open(legacy_filename, "wb")
+            pickle.dump(memento, f)
+            f.close()
+            stale_filename = filename
+
+        else:
+            stale_filename = legacy_filename
+
+        if os.path.exists(stale_filename):
+            os.remove(stale_filename)
 
         return
 